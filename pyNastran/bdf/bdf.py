@@ -25,7 +25,7 @@ else:
 import numpy as np
 
 from pyNastran.bdf.utils import _parse_pynastran_header
-from pyNastran.utils import object_attributes, print_bad_path
+from pyNastran.utils import object_attributes, print_bad_path, get_pool_context
 from pyNastran.bdf.utils import (to_fields, get_include_filename,
                                  parse_executive_control_deck)
 from pyNastran.bdf.field_writer_8 import print_card_8
@@ -38,88 +38,7 @@ from pyNastran.utils.log import get_logger2
 from pyNastran.bdf.bdf_interface.assign_type import (integer,
                                                      integer_or_string, string)
 
-from pyNastran.bdf.cards.elements.elements import CFAST, CGAP, CRAC2D, CRAC3D, PLOTEL
-from pyNastran.bdf.cards.properties.properties import (PFAST, PGAP, PLSOLID, PSOLID,
-                                                       PRAC2D, PRAC3D, PCONEAX, PIHEX)
-
-from pyNastran.bdf.cards.elements.springs import (CELAS1, CELAS2, CELAS3, CELAS4,)
-from pyNastran.bdf.cards.properties.springs import PELAS, PELAST
-
-from pyNastran.bdf.cards.elements.solid import (CTETRA4, CTETRA10, CPYRAM5, CPYRAM13,
-                                                CPENTA6, CPENTA15,
-                                                CHEXA8, CHEXA20, CIHEX1)
-from pyNastran.bdf.cards.elements.rigid import RBAR, RBAR1, RBE1, RBE2, RBE3, RROD
-
-from pyNastran.bdf.cards.elements.shell import (CQUAD, CQUAD4, CQUAD8, CQUADR, CQUADX,
-                                                CSHEAR, CTRIA3, CTRIA6, CTRIAX,
-                                                CTRIAX6, CTRIAR)
-from pyNastran.bdf.cards.properties.shell import PSHELL, PCOMP, PCOMPG, PSHEAR, PLPLANE
-from pyNastran.bdf.cards.elements.bush import CBUSH, CBUSH1D, CBUSH2D
-from pyNastran.bdf.cards.properties.bush import PBUSH, PBUSH1D, PBUSHT
-from pyNastran.bdf.cards.elements.damper import (CVISC, CDAMP1, CDAMP2, CDAMP3, CDAMP4,
-                                                 CDAMP5)
-from pyNastran.bdf.cards.properties.damper import PVISC, PDAMP, PDAMP5, PDAMPT
-from pyNastran.bdf.cards.elements.rods import CROD, CONROD, CTUBE
-from pyNastran.bdf.cards.elements.bars import CBAR, CBEAM3, CBEND
-from pyNastran.bdf.cards.elements.beam import CBEAM
-from pyNastran.bdf.cards.properties.rods import PROD, PTUBE
-from pyNastran.bdf.cards.properties.bars import PBAR, PBARL  # PBEND
-from pyNastran.bdf.cards.properties.beam import PBEAM, PBEAML, PBCOMP
-# CMASS5
-from pyNastran.bdf.cards.elements.mass import CONM1, CONM2, CMASS1, CMASS2, CMASS3, CMASS4
-from pyNastran.bdf.cards.properties.mass import PMASS, NSM
-from pyNastran.bdf.cards.aero import (AECOMP, AEFACT, AELINK, AELIST, AEPARM, AESTAT,
-                                      AESURF, AESURFS, AERO, AEROS, CSSCHD,
-                                      CAERO1, CAERO2, CAERO3, CAERO4, CAERO5,
-                                      PAERO1, PAERO2, PAERO3, PAERO5, # PAERO4
-                                      MONPNT1,
-                                      FLFACT, FLUTTER, GUST, MKAERO1,
-                                      MKAERO2, SPLINE1, SPLINE2, SPLINE3, SPLINE4,
-                                      SPLINE5, TRIM)
-from pyNastran.bdf.cards.constraints import (SPC, SPCADD, SPCAX, SPC1,
-                                             MPC, MPCADD, SUPORT1, SUPORT, SESUP,
-                                             GMSPC)
-from pyNastran.bdf.cards.coordinate_systems import (CORD1R, CORD1C, CORD1S,
-                                                    CORD2R, CORD2C, CORD2S, CORD3G,
-                                                    GMCORD)
-from pyNastran.bdf.cards.dmig import DMIG, DMI, DMIJ, DMIK, DMIJI
-from pyNastran.bdf.cards.deqatn import DEQATN
-from pyNastran.bdf.cards.dynamic import (DELAY, DPHASE, FREQ, FREQ1, FREQ2, FREQ4, TSTEP,
-                                         TSTEPNL, NLPARM, NLPCI, TF)
-from pyNastran.bdf.cards.loads.loads import LSEQ, SLOAD, DAREA, RANDPS, RFORCE, SPCD
-from pyNastran.bdf.cards.loads.dloads import DLOAD, TLOAD1, TLOAD2, RLOAD1, RLOAD2
-from pyNastran.bdf.cards.loads.static_loads import (LOAD, GRAV, ACCEL, ACCEL1, FORCE,
-                                                    FORCE1, FORCE2, MOMENT, MOMENT1, MOMENT2,
-                                                    PLOAD, PLOAD1, PLOAD2, PLOAD4, PLOADX1,
-                                                    GMLOAD)
-
-from pyNastran.bdf.cards.materials import (MAT1, MAT2, MAT3, MAT4, MAT5,
-                                           MAT8, MAT9, MAT10, MAT11,
-                                           MATHP, CREEP, EQUIV)
-# TODO: add MATT3, MATT8, MATT9
-from pyNastran.bdf.cards.material_deps import MATT1, MATT2, MATT4, MATT5, MATS1
-
-from pyNastran.bdf.cards.methods import EIGB, EIGC, EIGR, EIGP, EIGRL
-from pyNastran.bdf.cards.nodes import GRID, GRDSET, SPOINTs, EPOINTs
-from pyNastran.bdf.cards.optimization import (DCONADD, DCONSTR, DESVAR, DDVAL, DOPTPRM, DLINK,
-                                              DRESP1, DRESP2, DRESP3,
-                                              DVMREL1,
-                                              DVPREL1, DVPREL2)
-from pyNastran.bdf.cards.params import PARAM
-from pyNastran.bdf.cards.bdf_sets import (ASET, BSET, CSET, QSET, USET,
-                                          ASET1, BSET1, CSET1, QSET1, USET1,
-                                          SET1, SET3, RADSET,
-                                          SEBSET, SECSET, SEQSET, # SEUSET
-                                          SEBSET1, SECSET1, SEQSET1, # SEUSET1
-                                          SESET, SEQSEP)
-from pyNastran.bdf.cards.thermal.loads import QBDY1, QBDY2, QBDY3, QHBDY, TEMP, TEMPD, QVOL
-from pyNastran.bdf.cards.thermal.thermal import (CHBDYE, CHBDYG, CHBDYP, PCONV, PCONVM,
-                                                 PHBDY, CONV, RADM, RADBC)
-from pyNastran.bdf.cards.bdf_tables import (TABLED1, TABLED2, TABLED3, TABLED4,
-                                            TABLEM1, TABLEM2, TABLEM3, TABLEM4,
-                                            TABLES1, TABDMP1, TABLEST, TABRND1, TABRNDG, TIC,
-                                            DTABLE)
-from pyNastran.bdf.cards.contact import BCRPARA, BCTADD, BCTSET, BSURF, BSURFS, BCTPARA
+from pyNastran.bdf.bdf_interface.card_registry import CARD_CLASS_MODULES, get_card_class
 from pyNastran.bdf.case_control_deck import CaseControlDeck
 from pyNastran.bdf.bdf_methods import BDFMethods
 from pyNastran.bdf.bdf_interface.get_card import GetMethods
@@ -127,14 +46,35 @@ from pyNastran.bdf.bdf_interface.add_card import AddMethods
 from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
 from pyNastran.bdf.bdf_interface.write_mesh import WriteMesh
 from pyNastran.bdf.bdf_interface.cross_reference import XrefMesh
+from pyNastran.bdf.bdf_interface.grid_array import GridArray
+from pyNastran.bdf.bdf_interface.bulk_cards import BULK_CARDS, get_bulk_cards
+from pyNastran.bdf.bdf_interface.snapshot import (
+    save_snapshot, load_snapshot, materialize_snapshot, is_snapshot_stale)
+from pyNastran.bdf.bdf_interface.coord_transforms import CoordTransforms
 from pyNastran.bdf.errors import CrossReferenceError, DuplicateIDsError, CardParseSyntaxError
 from pyNastran.bdf.field_writer_16 import print_field_16
 
 
+def __getattr__(name):
+    """
+    Gets a card class (e.g., ``from pyNastran.bdf.bdf import GRID``),
+    which is imported the first time it's used
+    """
+    if name in CARD_CLASS_MODULES:
+        return get_card_class(name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # there is no module __getattr__, so the card classes are imported now
+    globals().update({class_name : get_card_class(class_name)
+                      for class_name in CARD_CLASS_MODULES})
+
 
 def read_bdf(bdf_filename=None,
              xref=True, punch=False, encoding=None,
-             log=None, debug=True, mode='msc'):
+             log=None, debug=True, mode='msc', vectorize_grids=False,
+             snapshot_filename=None, num_workers=1):
     """
     Creates the BDF object
 
@@ -156,6 +96,15 @@ def read_bdf(bdf_filename=None,
         indicates whether the file is a punch file (default=False)
     encoding : str
         the unicode encoding (default=None; system default)
+    vectorize_grids : bool; default=False
+        parse the GRID cards into ``model.grid_array`` instead of
+        GRID objects (see ``BDF.read_bdf``)
+    snapshot_filename : str; default=None
+        a binary snapshot of the model that's used instead of parsing
+        the BDF if it's up to date (see ``BDF.read_bdf``)
+    num_workers : int; default=1
+        the number of processes used to parse the bulk data deck
+        (see ``BDF.read_bdf``)
 
     Returns
     -------
@@ -183,7 +132,9 @@ def read_bdf(bdf_filename=None,
     .. todo:: finish this
     """
     model = BDF(log=log, debug=debug)
-    model.read_bdf(bdf_filename=bdf_filename, xref=xref, punch=punch, encoding=encoding)
+    model.read_bdf(bdf_filename=bdf_filename, xref=xref, punch=punch, encoding=encoding,
+                   vectorize_grids=vectorize_grids, snapshot_filename=snapshot_filename,
+                   num_workers=num_workers)
 
     if 0:
         ## TODO: remove all the extra methods
@@ -270,6 +221,13 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         self._encoding = None
         self.punch = None
         self.dumplines = False
+        self.line_sources = []
+        self._line_source_ilines = np.zeros(0, dtype='int64')
+        self._ibulk_data_line0 = 0
+        self._card_sources = None
+        self._card_source_index = None
+        self._vectorize_grids = False
+        self._num_workers = 1
 
         # this flag will be flipped to True someday (and then removed), but
         # doesn't support 100% of cards yet.  It enables a new method for card
@@ -677,7 +635,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         self._stop_on_xref_error = stop_on_xref_error
 
     def read_bdf(self, bdf_filename=None,
-                 xref=True, punch=False, encoding=None):
+                 xref=True, punch=False, encoding=None, vectorize_grids=False,
+                 snapshot_filename=None, num_workers=1):
         """
         Read method for the bdf files
 
@@ -691,6 +650,23 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             indicates whether the file is a punch file (default=False)
         encoding : str
             the unicode encoding (default=None; system default)
+        vectorize_grids : bool; default=False
+            parse the GRID cards in batches into ``self.grid_array``
+            instead of creating a GRID object for each node.  GRID
+            objects are created (and moved to ``self.nodes``) when
+            they're requested by ``self.Node(nid)``.
+        snapshot_filename : str; default=None
+            a binary snapshot of the model (see ``save_snapshot``).  If
+            the snapshot is up to date (the BDF and INCLUDE files haven't
+            changed and the same read options were used), it's loaded
+            instead of parsing the BDF; otherwise, the BDF is parsed and
+            the snapshot is written.
+        num_workers : int; default=1
+            the number of processes used to parse the bulk data deck.
+            The cards that are created by a class (e.g., GRID, CQUAD4,
+            PSHELL, MAT1) are split into chunks by card name and parsed
+            in a process pool.  The card objects are added to the model
+            by the main process in the same order as the serial reader.
 
         .. code-block:: python
 
@@ -709,10 +685,20 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             etc.
         """
         self._read_bdf_helper(bdf_filename, encoding, punch)
-
+        self._vectorize_grids = vectorize_grids
+        self._num_workers = num_workers
 
         if bdf_filename.lower().endswith('.pch'):  # .. todo:: should this be removed???
             self.punch = True
+
+        if snapshot_filename is not None:
+            read_options = self._get_snapshot_read_options()
+            if not is_snapshot_stale(snapshot_filename, self.bdf_filename, read_options):
+                self.log.debug('---loading the snapshot %s of %s---' % (
+                    snapshot_filename, self.bdf_filename))
+                self.load_snapshot(snapshot_filename, xref=xref,
+                                   vectorize_grids=vectorize_grids)
+                return
         self._parse_primary_file_header(bdf_filename)
 
         try:
@@ -731,10 +717,21 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             self.case_control_deck.rsolmap_toStr = self.rsolmap_toStr
 
             if self._is_cards_dict:
-                cards, card_count = self.get_bdf_cards_dict(bulk_data_lines)
+                card_ilines = defaultdict(list)
+                cards, card_count = self.get_bdf_cards_dict(
+                    bulk_data_lines, card_ilines=card_ilines)
             else:
-                cards, card_count = self.get_bdf_cards(bulk_data_lines)
-            self._parse_cards(cards, card_count)
+                card_ilines = []
+                cards, card_count = self.get_bdf_cards(
+                    bulk_data_lines, card_ilines=card_ilines)
+
+            # the file/line of a card is only looked up if it has an error
+            self._card_sources = (cards, card_ilines)
+            try:
+                self._parse_cards(cards, card_count)
+            finally:
+                self._card_sources = None
+                self._card_source_index = None
             self.pop_parse_errors()
             self.fill_dmigs()
 
@@ -744,6 +741,75 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             raise
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
         self.pop_xref_errors()
+        if snapshot_filename is not None:
+            self.save_snapshot(snapshot_filename, read_options=read_options)
+
+    def _get_snapshot_read_options(self):
+        """gets the options that change how the BDF is parsed"""
+        return {
+            'punch' : self.punch,
+            'encoding' : self._encoding,
+            'mode' : self._nastran_format,
+            'cards_to_read' : sorted(self.cards_to_read),
+        }
+
+    def save_snapshot(self, snapshot_filename, read_options=None):
+        """
+        Writes a binary snapshot of the model, which is much faster to
+        load than parsing the BDF
+
+        Parameters
+        ----------
+        snapshot_filename : str
+            the snapshot filename
+        read_options : dict; default=None
+            the read_bdf options the snapshot was made with, which are
+            checked by ``is_snapshot_stale``
+        """
+        save_snapshot(self, snapshot_filename, read_options=read_options)
+
+    def load_snapshot(self, snapshot_filename, xref=None, card_types=None,
+                      vectorize_grids=False):
+        """
+        Loads a binary snapshot made by ``save_snapshot``
+
+        Parameters
+        ----------
+        snapshot_filename : str
+            the snapshot filename
+        xref : bool; default=None -> the state the snapshot was saved in
+            should the model be cross referenced
+        card_types : List[str]; default=None -> all
+            the card types to create; the remaining cards are created
+            by ``materialize_snapshot``
+        vectorize_grids : bool; default=False
+            load the GRID cards into ``self.grid_array``
+        """
+        load_snapshot(self, snapshot_filename, xref=xref, card_types=card_types,
+                      vectorize_grids=vectorize_grids)
+        if self._snapshot is None:
+            self.pop_xref_errors()
+
+    def materialize_snapshot(self, card_types=None, xref=None):
+        """
+        Creates the cards that weren't created by ``load_snapshot``
+
+        Parameters
+        ----------
+        card_types : List[str]; default=None -> all
+            the card types to create
+        xref : bool; default=None -> the state the snapshot was saved in
+            should the model be cross referenced once all the cards
+            are created
+        """
+        header = getattr(self, '_snapshot_header', None)
+        materialize_snapshot(self, card_types=card_types)
+        if header is not None and getattr(self, '_snapshot', None) is None:
+            if xref is None:
+                xref = header['xref']
+            self.cross_reference(xref=xref)
+            self._xref = xref
+        self.pop_xref_errors()
 
     def _read_bdf_helper(self, bdf_filename, encoding, punch):
         """creates the file loading if bdf_filename is None"""
@@ -913,14 +979,32 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 if is_error and self._stop_on_xref_error:
                     raise CrossReferenceError(msg.rstrip())
 
-    def get_bdf_cards(self, bulk_data_lines):
-        """Parses the BDF lines into a list of card_lines"""
+    def get_bdf_cards(self, bulk_data_lines, card_ilines=None):
+        """
+        Parses the BDF lines into a list of card_lines
+
+        Parameters
+        ----------
+        bulk_data_lines : List[str]
+            the bulk data lines
+        card_ilines : List[int]; default=None
+            the index of the first line of each card is appended to
+            this list (None -> skip)
+
+        Returns
+        -------
+        cards : List[[card_name, comment, card_lines]]
+            the cards
+        card_count : dict[card_name] = int
+            the number of each card
+        """
         cards = []
         #cards = defaultdict(list)
         card_count = defaultdict(int)
         full_comment = ''
         card_lines = []
         old_card_name = None
+        icard_line = 0
         backup_comment = ''
         nlines = len(bulk_data_lines)
         for i, line in enumerate(bulk_data_lines):
@@ -940,6 +1024,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
                     # new list version
                     cards.append([old_card_name, full_comment, card_lines])
+                    if card_ilines is not None:
+                        card_ilines.append(icard_line)
 
                     card_count[old_card_name] += 1
                     card_lines = []
@@ -950,6 +1036,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                     elif old_card_name == 'ECHOOFF':
                         self.echo = False
                 old_card_name = card_name.rstrip(' *')
+                icard_line = i
                 if old_card_name == 'ENDDATA':
                     self.card_count['ENDDATA'] = 1
                     if nlines - i > 1:
@@ -988,16 +1075,36 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
             # new list version
             cards.append([old_card_name, backup_comment + full_comment, card_lines])
+            if card_ilines is not None:
+                card_ilines.append(icard_line)
             card_count[old_card_name] += 1
         return cards, card_count
 
-    def get_bdf_cards_dict(self, bulk_data_lines):
-        """Parses the BDF lines into a list of card_lines"""
+    def get_bdf_cards_dict(self, bulk_data_lines, card_ilines=None):
+        """
+        Parses the BDF lines into a dictionary of card_lines
+
+        Parameters
+        ----------
+        bulk_data_lines : List[str]
+            the bulk data lines
+        card_ilines : dict[card_name] = List[int]; default=None
+            the index of the first line of each card is appended to
+            this defaultdict(list) (None -> skip)
+
+        Returns
+        -------
+        cards : dict[card_name] = List[[comment, card_lines]]
+            the cards
+        card_count : dict[card_name] = int
+            the number of each card
+        """
         cards = defaultdict(list)
         card_count = defaultdict(int)
         full_comment = ''
         card_lines = []
         old_card_name = None
+        icard_line = 0
         backup_comment = ''
         nlines = len(bulk_data_lines)
         for i, line in enumerate(bulk_data_lines):
@@ -1014,6 +1121,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
                     # old dictionary version
                     cards[old_card_name].append([full_comment, card_lines])
+                    if card_ilines is not None:
+                        card_ilines[old_card_name].append(icard_line)
 
                     # new list version
                     #cards.append([old_card_name, full_comment, card_lines])
@@ -1027,6 +1136,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                     elif old_card_name == 'ECHOOFF':
                         self.echo = False
                 old_card_name = card_name.rstrip(' *')
+                icard_line = i
                 if old_card_name == 'ENDDATA':
                     self.card_count['ENDDATA'] = 1
                     if nlines - i > 1:
@@ -1062,6 +1172,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
             # old dictionary version
             cards[old_card_name].append([backup_comment + full_comment, card_lines])
+            if card_ilines is not None:
+                card_ilines[old_card_name].append(icard_line)
 
             # new list version
             #cards.append([old_card_name, backup_comment + full_comment, card_lines])
@@ -1283,390 +1395,395 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         return card_obj, card
 
     def _make_card_parser(self):
-        """creates the card parser variables that are used by add_card"""
+        """
+        creates the card parser variables that are used by add_card
+
+        The card classes are stored by name (see ``get_card_class``), so
+        a card module is only imported when one of its cards is added.
+        """
         self._card_parser = {
-            'GRID' : (GRID, self.add_node),
-            'SPOINT' : (SPOINTs, self.add_spoint),
-            'EPOINT' : (EPOINTs, self.add_epoint),
-
-            'CORD2R' : (CORD2R, self.add_coord),
-            'CORD2C' : (CORD2C, self.add_coord),
-            'CORD2S' : (CORD2S, self.add_coord),
-            'GMCORD' : (GMCORD, self.add_coord),
-
-            'PLOTEL' : (PLOTEL, self.add_plotel),
-
-            'CONROD' : (CONROD, self.add_element),
-            'CROD' : (CROD, self.add_element),
-            'PROD' : (PROD, self.add_property),
-            'CTUBE' : (CTUBE, self.add_element),
-            'PTUBE' : (PTUBE, self.add_property),
-
-            'CBAR' : (CBAR, self.add_element),
-            'PBAR' : (PBAR, self.add_property),
-            'PBARL' : (PBARL, self.add_property),
-
-            'CBEAM' : (CBEAM, self.add_element),
-            #'PBEAM' : (PBEAM, self.add_property),
-            #'PBEAML' : (PBEAML, self.add_property),
-            #'PBCOMP' : (PBCOMP, self.add_property),
-
-            'CBEAM3' : (CBEAM3, self.add_element),
-            #'PBEAM3' : (PBEAM3, self.add_property),
-
-            'CBEND' : (CBEND, self.add_element),
-            #'PBEND' : (PBEND, self.add_property),
-
-            'CTRIA3' : (CTRIA3, self.add_element),
-            'CQUAD4' : (CQUAD4, self.add_element),
-            'CQUAD' : (CQUAD, self.add_element),
-            'CQUAD8' : (CQUAD8, self.add_element),
-            'CQUADX' : (CQUADX, self.add_element),
-            'CQUADR' : (CQUADR, self.add_element),
-            'CTRIA6' : (CTRIA6, self.add_element),
-            'CTRIAR' : (CTRIAR, self.add_element),
-            'CTRIAX' : (CTRIAX, self.add_element),
-            'CTRIAX6' : (CTRIAX6, self.add_element),
-            'PCOMP' : (PCOMP, self.add_property),
-            'PCOMPG' : (PCOMPG, self.add_property),
-            'PSHELL' : (PSHELL, self.add_property),
-            'PLPLANE' : (PLPLANE, self.add_property),
-
-            'CSHEAR' : (CSHEAR, self.add_element),
-            'PSHEAR' : (PSHEAR, self.add_property),
-
-            'PSOLID' : (PSOLID, self.add_property),
-            'PLSOLID' : (PLSOLID, self.add_property),
-
-            'CELAS1' : (CELAS1, self.add_element),
-            'CELAS2' : (CELAS2, self.add_element),
-            'CELAS3' : (CELAS3, self.add_element),
-            'CELAS4' : (CELAS4, self.add_element),
-            'CVISC' : (CVISC, self.add_element),
-            'PELAST' : (PELAST, self.add_PELAST),
-
-            'CDAMP1' : (CDAMP1, self.add_damper),
-            'CDAMP2' : (CDAMP2, self.add_damper),
-            'CDAMP3' : (CDAMP3, self.add_damper),
+            'GRID' : ('GRID', self.add_node),
+            'SPOINT' : ('SPOINTs', self.add_spoint),
+            'EPOINT' : ('EPOINTs', self.add_epoint),
+
+            'CORD2R' : ('CORD2R', self.add_coord),
+            'CORD2C' : ('CORD2C', self.add_coord),
+            'CORD2S' : ('CORD2S', self.add_coord),
+            'GMCORD' : ('GMCORD', self.add_coord),
+
+            'PLOTEL' : ('PLOTEL', self.add_plotel),
+
+            'CONROD' : ('CONROD', self.add_element),
+            'CROD' : ('CROD', self.add_element),
+            'PROD' : ('PROD', self.add_property),
+            'CTUBE' : ('CTUBE', self.add_element),
+            'PTUBE' : ('PTUBE', self.add_property),
+
+            'CBAR' : ('CBAR', self.add_element),
+            'PBAR' : ('PBAR', self.add_property),
+            'PBARL' : ('PBARL', self.add_property),
+
+            'CBEAM' : ('CBEAM', self.add_element),
+            #'PBEAM' : ('PBEAM', self.add_property),
+            #'PBEAML' : ('PBEAML', self.add_property),
+            #'PBCOMP' : ('PBCOMP', self.add_property),
+
+            'CBEAM3' : ('CBEAM3', self.add_element),
+            #'PBEAM3' : ('PBEAM3', self.add_property),
+
+            'CBEND' : ('CBEND', self.add_element),
+            #'PBEND' : ('PBEND', self.add_property),
+
+            'CTRIA3' : ('CTRIA3', self.add_element),
+            'CQUAD4' : ('CQUAD4', self.add_element),
+            'CQUAD' : ('CQUAD', self.add_element),
+            'CQUAD8' : ('CQUAD8', self.add_element),
+            'CQUADX' : ('CQUADX', self.add_element),
+            'CQUADR' : ('CQUADR', self.add_element),
+            'CTRIA6' : ('CTRIA6', self.add_element),
+            'CTRIAR' : ('CTRIAR', self.add_element),
+            'CTRIAX' : ('CTRIAX', self.add_element),
+            'CTRIAX6' : ('CTRIAX6', self.add_element),
+            'PCOMP' : ('PCOMP', self.add_property),
+            'PCOMPG' : ('PCOMPG', self.add_property),
+            'PSHELL' : ('PSHELL', self.add_property),
+            'PLPLANE' : ('PLPLANE', self.add_property),
+
+            'CSHEAR' : ('CSHEAR', self.add_element),
+            'PSHEAR' : ('PSHEAR', self.add_property),
+
+            'PSOLID' : ('PSOLID', self.add_property),
+            'PLSOLID' : ('PLSOLID', self.add_property),
+
+            'CELAS1' : ('CELAS1', self.add_element),
+            'CELAS2' : ('CELAS2', self.add_element),
+            'CELAS3' : ('CELAS3', self.add_element),
+            'CELAS4' : ('CELAS4', self.add_element),
+            'CVISC' : ('CVISC', self.add_element),
+            'PELAST' : ('PELAST', self.add_PELAST),
+
+            'CDAMP1' : ('CDAMP1', self.add_damper),
+            'CDAMP2' : ('CDAMP2', self.add_damper),
+            'CDAMP3' : ('CDAMP3', self.add_damper),
             # CDAMP4 added later because the documentation is wrong
-            'CDAMP5' : (CDAMP5, self.add_damper),
-            'PDAMP5' : (PDAMP5, self.add_property),
+            'CDAMP5' : ('CDAMP5', self.add_damper),
+            'PDAMP5' : ('PDAMP5', self.add_property),
 
-            'CFAST' : (CFAST, self.add_damper),
-            'PFAST' : (PFAST, self.add_property),
+            'CFAST' : ('CFAST', self.add_damper),
+            'PFAST' : ('PFAST', self.add_property),
 
-            'CGAP' : (CGAP, self.add_element),
-            'PGAP' : (PGAP, self.add_property),
+            'CGAP' : ('CGAP', self.add_element),
+            'PGAP' : ('PGAP', self.add_property),
 
-            'CBUSH' : (CBUSH, self.add_damper),
-            'PBUSH' : (PBUSH, self.add_property),
-            'CBUSH1D' : (CBUSH1D, self.add_damper),
-            'CBUSH2D' : (CBUSH2D, self.add_damper),
+            'CBUSH' : ('CBUSH', self.add_damper),
+            'PBUSH' : ('PBUSH', self.add_property),
+            'CBUSH1D' : ('CBUSH1D', self.add_damper),
+            'CBUSH2D' : ('CBUSH2D', self.add_damper),
 
-            'CRAC2D' : (CRAC2D, self.add_element),
-            'PRAC2D' : (PRAC2D, self.add_property),
+            'CRAC2D' : ('CRAC2D', self.add_element),
+            'PRAC2D' : ('PRAC2D', self.add_property),
 
-            'CRAC3D' : (CRAC3D, self.add_element),
-            'PRAC3D' : (PRAC3D, self.add_property),
+            'CRAC3D' : ('CRAC3D', self.add_element),
+            'PRAC3D' : ('PRAC3D', self.add_property),
 
-            'PDAMPT' : (PDAMPT, self.add_PDAMPT),
-            'PBUSHT' : (PBUSHT, self.add_PBUSHT),
+            'PDAMPT' : ('PDAMPT', self.add_PDAMPT),
+            'PBUSHT' : ('PBUSHT', self.add_PBUSHT),
 
-            'PCONEAX' : (PCONEAX, self.add_property),
+            'PCONEAX' : ('PCONEAX', self.add_property),
 
-            'RBAR' : (RBAR, self.add_rigid_element),
-            'RBAR1' : (RBAR1, self.add_rigid_element),
-            'RBE1' : (RBE1, self.add_rigid_element),
-            'RBE2' : (RBE2, self.add_rigid_element),
-            'RBE3' : (RBE3, self.add_rigid_element),
-            'RROD' : (RROD, self.add_rigid_element),
+            'RBAR' : ('RBAR', self.add_rigid_element),
+            'RBAR1' : ('RBAR1', self.add_rigid_element),
+            'RBE1' : ('RBE1', self.add_rigid_element),
+            'RBE2' : ('RBE2', self.add_rigid_element),
+            'RBE3' : ('RBE3', self.add_rigid_element),
+            'RROD' : ('RROD', self.add_rigid_element),
 
 
             ## there is no MAT6 or MAT7
-            'MAT1' : (MAT1, self.add_structural_material),
-            'MAT2' : (MAT2, self.add_structural_material),
-            'MAT3' : (MAT3, self.add_structural_material),
-            'MAT8' : (MAT8, self.add_structural_material),
-            'MAT9' : (MAT9, self.add_structural_material),
-            'MAT10' : (MAT10, self.add_structural_material),
-            'MAT11' : (MAT11, self.add_structural_material),
-            'EQUIV' : (EQUIV, self.add_structural_material),
-
-            ##'MATHE' : (MATHE, self.add_hyperelastic_material),
-            'MATHP' : (MATHP, self.add_hyperelastic_material),
-            'MAT4' : (MAT4, self.add_thermal_material),
-            'MAT5' : (MAT5, self.add_thermal_material),
+            'MAT1' : ('MAT1', self.add_structural_material),
+            'MAT2' : ('MAT2', self.add_structural_material),
+            'MAT3' : ('MAT3', self.add_structural_material),
+            'MAT8' : ('MAT8', self.add_structural_material),
+            'MAT9' : ('MAT9', self.add_structural_material),
+            'MAT10' : ('MAT10', self.add_structural_material),
+            'MAT11' : ('MAT11', self.add_structural_material),
+            'EQUIV' : ('EQUIV', self.add_structural_material),
+
+            ##'MATHE' : ('MATHE', self.add_hyperelastic_material),
+            'MATHP' : ('MATHP', self.add_hyperelastic_material),
+            'MAT4' : ('MAT4', self.add_thermal_material),
+            'MAT5' : ('MAT5', self.add_thermal_material),
 
             ## hasnt been verified, links up to MAT1, MAT2, MAT9 w/ same MID
-            'CREEP' : (CREEP, self.add_creep_material),
+            'CREEP' : ('CREEP', self.add_creep_material),
 
-            #'CONM1' : (CONM1, self.add_mass),
-            'CONM2' : (CONM2, self.add_mass),
-            'CMASS1' : (CMASS1, self.add_mass),
-            'CMASS2' : (CMASS2, self.add_mass),
-            'CMASS3' : (CMASS3, self.add_mass),
+            #'CONM1' : ('CONM1', self.add_mass),
+            'CONM2' : ('CONM2', self.add_mass),
+            'CMASS1' : ('CMASS1', self.add_mass),
+            'CMASS2' : ('CMASS2', self.add_mass),
+            'CMASS3' : ('CMASS3', self.add_mass),
             ## CMASS4 - added later because documentation is wrong
 
-            'MPC' : (MPC, self.add_constraint_MPC),
-            'MPCADD' : (MPCADD, self.add_constraint_MPC),
-
-            'SPC' : (SPC, self.add_constraint_SPC),
-            'SPC1' : (SPC1, self.add_constraint_SPC),
-            'SPCAX' : (SPCAX, self.add_constraint_SPC),
-            'SPCADD' : (SPCADD, self.add_constraint_SPC),
-            'GMSPC' : (GMSPC, self.add_constraint_SPC),
-
-            'SUPORT' : (SUPORT, self.add_suport), # pseudo-constraint
-            'SUPORT1' : (SUPORT1, self.add_suport1),  # pseudo-constraint
-
-            'FORCE' : (FORCE, self.add_load),
-            'FORCE1' : (FORCE1, self.add_load),
-            'FORCE2' : (FORCE2, self.add_load),
-            'MOMENT' : (MOMENT, self.add_load),
-            'MOMENT1' : (MOMENT1, self.add_load),
-            'MOMENT2' : (MOMENT2, self.add_load),
-
-            'GRAV' : (GRAV, self.add_load),
-            'ACCEL' : (ACCEL, self.add_load),
-            'ACCEL1' : (ACCEL1, self.add_load),
-            'LOAD' : (LOAD, self.add_load),
-            'PLOAD' : (PLOAD, self.add_load),
-            'PLOAD1' : (PLOAD1, self.add_load),
-            'PLOAD2' : (PLOAD2, self.add_load),
-            'PLOAD4' : (PLOAD4, self.add_load),
-            'PLOADX1' : (PLOADX1, self.add_load),
-            'RFORCE' : (RFORCE, self.add_load),
-            'SLOAD' : (SLOAD, self.add_load),
-            'RANDPS' : (RANDPS, self.add_load),
-            'GMLOAD' : (GMLOAD, self.add_load),
-            'SPCD' : (SPCD, self.add_load),  # enforced displacement
-            'QVOL' : (QVOL, self.add_load),  # thermal
-
-            'DLOAD' : (DLOAD, self.add_dload),
-            'TLOAD1' : (TLOAD1, self.add_dload_entry),
-            'TLOAD2' : (TLOAD2, self.add_dload_entry),
-            'RLOAD1' : (RLOAD1, self.add_dload_entry),
-            'RLOAD2' : (RLOAD2, self.add_dload_entry),
-
-            'DOPTPRM' : (DOPTPRM, self._add_doptprm),
-            'DESVAR' : (DESVAR, self.add_DESVAR),
+            'MPC' : ('MPC', self.add_constraint_MPC),
+            'MPCADD' : ('MPCADD', self.add_constraint_MPC),
+
+            'SPC' : ('SPC', self.add_constraint_SPC),
+            'SPC1' : ('SPC1', self.add_constraint_SPC),
+            'SPCAX' : ('SPCAX', self.add_constraint_SPC),
+            'SPCADD' : ('SPCADD', self.add_constraint_SPC),
+            'GMSPC' : ('GMSPC', self.add_constraint_SPC),
+
+            'SUPORT' : ('SUPORT', self.add_suport), # pseudo-constraint
+            'SUPORT1' : ('SUPORT1', self.add_suport1),  # pseudo-constraint
+
+            'FORCE' : ('FORCE', self.add_load),
+            'FORCE1' : ('FORCE1', self.add_load),
+            'FORCE2' : ('FORCE2', self.add_load),
+            'MOMENT' : ('MOMENT', self.add_load),
+            'MOMENT1' : ('MOMENT1', self.add_load),
+            'MOMENT2' : ('MOMENT2', self.add_load),
+
+            'GRAV' : ('GRAV', self.add_load),
+            'ACCEL' : ('ACCEL', self.add_load),
+            'ACCEL1' : ('ACCEL1', self.add_load),
+            'LOAD' : ('LOAD', self.add_load),
+            'PLOAD' : ('PLOAD', self.add_load),
+            'PLOAD1' : ('PLOAD1', self.add_load),
+            'PLOAD2' : ('PLOAD2', self.add_load),
+            'PLOAD4' : ('PLOAD4', self.add_load),
+            'PLOADX1' : ('PLOADX1', self.add_load),
+            'RFORCE' : ('RFORCE', self.add_load),
+            'SLOAD' : ('SLOAD', self.add_load),
+            'RANDPS' : ('RANDPS', self.add_load),
+            'GMLOAD' : ('GMLOAD', self.add_load),
+            'SPCD' : ('SPCD', self.add_load),  # enforced displacement
+            'QVOL' : ('QVOL', self.add_load),  # thermal
+
+            'DLOAD' : ('DLOAD', self.add_dload),
+            'TLOAD1' : ('TLOAD1', self.add_dload_entry),
+            'TLOAD2' : ('TLOAD2', self.add_dload_entry),
+            'RLOAD1' : ('RLOAD1', self.add_dload_entry),
+            'RLOAD2' : ('RLOAD2', self.add_dload_entry),
+
+            'DOPTPRM' : ('DOPTPRM', self._add_doptprm),
+            'DESVAR' : ('DESVAR', self.add_DESVAR),
             # BCTSET
 
-            #'PHBDY' : (PHBDY, self.add_PHBDY),
-            'AERO' : (AERO, self.add_AERO),
-            'AEROS' : (AEROS, self.add_AEROS),
-            'AECOMP' : (AECOMP, self.add_AECOMP),
-            'AEFACT' : (AEFACT, self.add_AEFACT),
-            'AELINK' : (AELINK, self.add_AELINK),
-            'AELIST' : (AELIST, self.add_AELIST),
-            'AEPARM' : (AEPARM, self.add_AEPARM),
-            'AESTAT' : (AESTAT, self.add_AESTAT),
-            'AESURF' : (AESURF, self.add_AESURF),
-            #'AESURFS' : (AESURFS, self.add_AESURF),
-
-            #'TRIM' : (TRIM, self.add_TRIM),
-            #'FLUTTER' : (FLUTTER, self.add_FLUTTER),
-            #'FLFACT' : (FLFACT, self.add_FLFACT),
-            #'GUST' : (GUST, self.add_GUST),
-            #'CSSCHD' : (CSSCHD, self.add_CSSCHD),
-            #'NLPARM' : (NLPARM, self.add_NLPARM),
-            #'NLPCI' : (NLPCI, self.add_NLPCI),
-            #'TSTEP' : (TSTEP, self.add_TSTEP),
-            #'TSTEPNL' : (TSTEPNL, self.add_TSTEPNL),
-
-            #'CAERO1' : (CAERO1, self.add_CAERO),
-            #'CAERO2' : (CAERO2, self.add_CAERO),
-            #'CAERO3' : (CAERO3, self.add_CAERO),
-            #'CAERO4' : (CAERO4, self.add_CAERO),
-            #'CAERO5' : (CAERO5, self.add_CAERO),
-
-            #'PAERO1' : (PAERO1, self.add_PAERO),
-            #'PAERO2' : (PAERO2, self.add_PAERO),
-            #'PAERO3' : (PAERO3, self.add_PAERO),
-            ##'PAERO4' : (PAERO4, self.add_PAERO),
-            'PAERO5' : (PAERO5, self.add_PAERO),
-
-            #'SPLINE1' : (SPLINE1, self.add_SPLINE),
-            #'SPLINE2' : (SPLINE2, self.add_SPLINE),
-            #'SPLINE3' : (SPLINE3, self.add_SPLINE),
-            #'SPLINE4' : (SPLINE4, self.add_SPLINE),
-            #'SPLINE5' : (SPLINE5, self.add_SPLINE),
+            #'PHBDY' : ('PHBDY', self.add_PHBDY),
+            'AERO' : ('AERO', self.add_AERO),
+            'AEROS' : ('AEROS', self.add_AEROS),
+            'AECOMP' : ('AECOMP', self.add_AECOMP),
+            'AEFACT' : ('AEFACT', self.add_AEFACT),
+            'AELINK' : ('AELINK', self.add_AELINK),
+            'AELIST' : ('AELIST', self.add_AELIST),
+            'AEPARM' : ('AEPARM', self.add_AEPARM),
+            'AESTAT' : ('AESTAT', self.add_AESTAT),
+            'AESURF' : ('AESURF', self.add_AESURF),
+            #'AESURFS' : ('AESURFS', self.add_AESURF),
+
+            #'TRIM' : ('TRIM', self.add_TRIM),
+            #'FLUTTER' : ('FLUTTER', self.add_FLUTTER),
+            #'FLFACT' : ('FLFACT', self.add_FLFACT),
+            #'GUST' : ('GUST', self.add_GUST),
+            #'CSSCHD' : ('CSSCHD', self.add_CSSCHD),
+            #'NLPARM' : ('NLPARM', self.add_NLPARM),
+            #'NLPCI' : ('NLPCI', self.add_NLPCI),
+            #'TSTEP' : ('TSTEP', self.add_TSTEP),
+            #'TSTEPNL' : ('TSTEPNL', self.add_TSTEPNL),
+
+            #'CAERO1' : ('CAERO1', self.add_CAERO),
+            #'CAERO2' : ('CAERO2', self.add_CAERO),
+            #'CAERO3' : ('CAERO3', self.add_CAERO),
+            #'CAERO4' : ('CAERO4', self.add_CAERO),
+            #'CAERO5' : ('CAERO5', self.add_CAERO),
+
+            #'PAERO1' : ('PAERO1', self.add_PAERO),
+            #'PAERO2' : ('PAERO2', self.add_PAERO),
+            #'PAERO3' : ('PAERO3', self.add_PAERO),
+            ##'PAERO4' : ('PAERO4', self.add_PAERO),
+            'PAERO5' : ('PAERO5', self.add_PAERO),
+
+            #'SPLINE1' : ('SPLINE1', self.add_SPLINE),
+            #'SPLINE2' : ('SPLINE2', self.add_SPLINE),
+            #'SPLINE3' : ('SPLINE3', self.add_SPLINE),
+            #'SPLINE4' : ('SPLINE4', self.add_SPLINE),
+            #'SPLINE5' : ('SPLINE5', self.add_SPLINE),
 
         }
         self._card_parser_a = {
-            'PBEAM' : (PBEAM, self.add_property),
-            'PBEAML' : (PBEAML, self.add_property),
-            'PBCOMP' : (PBCOMP, self.add_property),
+            'PBEAM' : ('PBEAM', self.add_property),
+            'PBEAML' : ('PBEAML', self.add_property),
+            'PBCOMP' : ('PBCOMP', self.add_property),
 
-            'CBEAM3' : (CBEAM3, self.add_element),
-            #'PBEAM3' : (PBEAM3, self.add_property),
-            #'PBEND' : (PBEND, self.add_property),
+            'CBEAM3' : ('CBEAM3', self.add_element),
+            #'PBEAM3' : ('PBEAM3', self.add_property),
+            #'PBEND' : ('PBEND', self.add_property),
 
-            'PBUSH1D' : (PBUSH1D, self.add_property),
+            'PBUSH1D' : ('PBUSH1D', self.add_property),
 
             # there is no MAT6 or MAT7
-            #'MATHE' : (MATHE, self.add_hyperelastic_material),
+            #'MATHE' : ('MATHE', self.add_hyperelastic_material),
 
-            'CONM1' : (CONM1, self.add_mass),
+            'CONM1' : ('CONM1', self.add_mass),
             # BCTSET
 
             # not added to new
-            'LSEQ' : (LSEQ, self.add_LSEQ),
+            'LSEQ' : ('LSEQ', self.add_LSEQ),
         }
         self._card_parser_b = {
             # CTETRA - added later
             # CHEXA  - added later
             # CPENTA - added later
             # CPYRAM - added later
-            'CIHEX1' : (CIHEX1, self.add_element),
-            'PIHEX' : (PIHEX, self.add_property),
-
-            'PHBDY' : (PHBDY, self.add_PHBDY),
-            'AESURFS' : (AESURFS, self.add_AESURF),
-
-            'TRIM' : (TRIM, self.add_TRIM),
-            'FLUTTER' : (FLUTTER, self.add_FLUTTER),
-            'FLFACT' : (FLFACT, self.add_FLFACT),
-            'GUST' : (GUST, self.add_GUST),
-            'CSSCHD' : (CSSCHD, self.add_CSSCHD),
-            'NLPARM' : (NLPARM, self.add_NLPARM),
-            'NLPCI' : (NLPCI, self.add_NLPCI),
-            'TSTEP' : (TSTEP, self.add_TSTEP),
-            'TSTEPNL' : (TSTEPNL, self.add_TSTEPNL),
-
-            'SESET' : (SESET, self.add_SESET),
-            'DCONSTR' : (DCONSTR, self.add_DCONSTR),
-            'DDVAL' : (DDVAL, self.add_DDVAL),
-            'DLINK' : (DLINK, self.add_DLINK),
-            'PARAM' : (PARAM, self.add_PARAM),
-
-            'TF' : (TF, self.add_TF),
-            'DELAY' : (DELAY, self.add_DELAY),
-            'DCONADD' : (DCONADD, self.add_DCONADD),
-
-            'MATS1' : (MATS1, self.add_material_dependence),
-            #'MATS3' : (MATS3, self.add_material_dependence),
-            #'MATS8' : (MATS8, self.add_material_dependence),
-            'MATT1' : (MATT1, self.add_material_dependence),
-            'MATT2' : (MATT2, self.add_material_dependence),
-            #'MATT3' : (MATT3, self.add_material_dependence),
-            'MATT4' : (MATT4, self.add_material_dependence),
-            'MATT5' : (MATT5, self.add_material_dependence),
-            #'MATT8' : (MATT8, self.add_material_dependence),
-            #'MATT9' : (MATT9, self.add_material_dependence),
-
-            'TEMP' : (TEMP, self.add_thermal_load),
-            'QBDY1' : (QBDY1, self.add_thermal_load),
-            'QBDY2' : (QBDY2, self.add_thermal_load),
-            'QBDY3' : (QBDY3, self.add_thermal_load),
-            'QHBDY' : (QHBDY, self.add_thermal_load),
-
-            'CHBDYE' : (CHBDYE, self.add_thermal_element),
-            'CHBDYG' : (CHBDYG, self.add_thermal_element),
-            'CHBDYP' : (CHBDYP, self.add_thermal_element),
-
-            'PCONV' : (PCONV, self.add_convection_property),
-            'PCONVM' : (PCONVM, self.add_convection_property),
-
-            'CAERO1' : (CAERO1, self.add_CAERO),
-            'CAERO2' : (CAERO2, self.add_CAERO),
-            'CAERO3' : (CAERO3, self.add_CAERO),
-            'CAERO4' : (CAERO4, self.add_CAERO),
-            'CAERO5' : (CAERO5, self.add_CAERO),
-
-            'PAERO1' : (PAERO1, self.add_PAERO),
-            'PAERO2' : (PAERO2, self.add_PAERO),
-            'PAERO3' : (PAERO3, self.add_PAERO),
-            #'PAERO4' : (PAERO4, self.add_PAERO),
-
-            'SPLINE1' : (SPLINE1, self.add_SPLINE),
-            'SPLINE2' : (SPLINE2, self.add_SPLINE),
-            'SPLINE3' : (SPLINE3, self.add_SPLINE),
-            'SPLINE4' : (SPLINE4, self.add_SPLINE),
-            'SPLINE5' : (SPLINE5, self.add_SPLINE),
-
-            'MONPNT1' : (MONPNT1, self.add_MONPNT),
-            'MKAERO1' : (MKAERO1, self.add_MKAERO),
-            'MKAERO2' : (MKAERO2, self.add_MKAERO),
-
-            #'SESUP' : (SESUP, self.add_SESUP),  # pseudo-constraint
-
-            'FREQ' : (FREQ, self.add_FREQ),
-            'FREQ1' : (FREQ1, self.add_FREQ),
-            'FREQ2' : (FREQ2, self.add_FREQ),
-            'FREQ4' : (FREQ4, self.add_FREQ),
-
-            'ASET' : (ASET, self.add_ASET),
-            'ASET1' : (ASET1, self.add_ASET),
-
-            'BSET' : (BSET, self.add_BSET),
-            'BSET1' : (BSET1, self.add_BSET),
-
-            'CSET' : (CSET, self.add_CSET),
-            'CSET1' : (CSET1, self.add_CSET),
-
-            'QSET' : (QSET, self.add_QSET),
-            'QSET1' : (QSET1, self.add_QSET),
-
-            'USET' : (USET, self.add_USET),
-            'USET1' : (USET1, self.add_USET),
-
-            'SET1' : (SET1, self.add_SET),
-            'SET3' : (SET3, self.add_SET),
-
-            'SEBSET' : (SEBSET, self.add_SEBSET),
-            'SEBSET1' : (SEBSET1, self.add_SEBSET),
-
-            'SECSET' : (SECSET, self.add_SECSET),
-            'SECSET1' : (SECSET1, self.add_SECSET),
-
-            'SEQSET' : (SEQSET, self.add_SEQSET),
-            'SEQSET1' : (SEQSET1, self.add_SEQSET),
-
-            #'SEUSET' : (SEUSET, self.add_SEUSET),
-            #'SEUSET1' : (SEUSET1, self.add_SEUSET),
-
-            'DTABLE' : (DTABLE, self.add_DTABLE),
-
-            'DRESP1' : (DRESP1, self.add_DRESP),
-            'DRESP2' : (DRESP2, self.add_DRESP), # deqatn
-            'DRESP3' : (DRESP3, self.add_DRESP),
+            'CIHEX1' : ('CIHEX1', self.add_element),
+            'PIHEX' : ('PIHEX', self.add_property),
+
+            'PHBDY' : ('PHBDY', self.add_PHBDY),
+            'AESURFS' : ('AESURFS', self.add_AESURF),
+
+            'TRIM' : ('TRIM', self.add_TRIM),
+            'FLUTTER' : ('FLUTTER', self.add_FLUTTER),
+            'FLFACT' : ('FLFACT', self.add_FLFACT),
+            'GUST' : ('GUST', self.add_GUST),
+            'CSSCHD' : ('CSSCHD', self.add_CSSCHD),
+            'NLPARM' : ('NLPARM', self.add_NLPARM),
+            'NLPCI' : ('NLPCI', self.add_NLPCI),
+            'TSTEP' : ('TSTEP', self.add_TSTEP),
+            'TSTEPNL' : ('TSTEPNL', self.add_TSTEPNL),
+
+            'SESET' : ('SESET', self.add_SESET),
+            'DCONSTR' : ('DCONSTR', self.add_DCONSTR),
+            'DDVAL' : ('DDVAL', self.add_DDVAL),
+            'DLINK' : ('DLINK', self.add_DLINK),
+            'PARAM' : ('PARAM', self.add_PARAM),
+
+            'TF' : ('TF', self.add_TF),
+            'DELAY' : ('DELAY', self.add_DELAY),
+            'DCONADD' : ('DCONADD', self.add_DCONADD),
+
+            'MATS1' : ('MATS1', self.add_material_dependence),
+            #'MATS3' : ('MATS3', self.add_material_dependence),
+            #'MATS8' : ('MATS8', self.add_material_dependence),
+            'MATT1' : ('MATT1', self.add_material_dependence),
+            'MATT2' : ('MATT2', self.add_material_dependence),
+            #'MATT3' : ('MATT3', self.add_material_dependence),
+            'MATT4' : ('MATT4', self.add_material_dependence),
+            'MATT5' : ('MATT5', self.add_material_dependence),
+            #'MATT8' : ('MATT8', self.add_material_dependence),
+            #'MATT9' : ('MATT9', self.add_material_dependence),
+
+            'TEMP' : ('TEMP', self.add_thermal_load),
+            'QBDY1' : ('QBDY1', self.add_thermal_load),
+            'QBDY2' : ('QBDY2', self.add_thermal_load),
+            'QBDY3' : ('QBDY3', self.add_thermal_load),
+            'QHBDY' : ('QHBDY', self.add_thermal_load),
+
+            'CHBDYE' : ('CHBDYE', self.add_thermal_element),
+            'CHBDYG' : ('CHBDYG', self.add_thermal_element),
+            'CHBDYP' : ('CHBDYP', self.add_thermal_element),
+
+            'PCONV' : ('PCONV', self.add_convection_property),
+            'PCONVM' : ('PCONVM', self.add_convection_property),
+
+            'CAERO1' : ('CAERO1', self.add_CAERO),
+            'CAERO2' : ('CAERO2', self.add_CAERO),
+            'CAERO3' : ('CAERO3', self.add_CAERO),
+            'CAERO4' : ('CAERO4', self.add_CAERO),
+            'CAERO5' : ('CAERO5', self.add_CAERO),
+
+            'PAERO1' : ('PAERO1', self.add_PAERO),
+            'PAERO2' : ('PAERO2', self.add_PAERO),
+            'PAERO3' : ('PAERO3', self.add_PAERO),
+            #'PAERO4' : ('PAERO4', self.add_PAERO),
+
+            'SPLINE1' : ('SPLINE1', self.add_SPLINE),
+            'SPLINE2' : ('SPLINE2', self.add_SPLINE),
+            'SPLINE3' : ('SPLINE3', self.add_SPLINE),
+            'SPLINE4' : ('SPLINE4', self.add_SPLINE),
+            'SPLINE5' : ('SPLINE5', self.add_SPLINE),
+
+            'MONPNT1' : ('MONPNT1', self.add_MONPNT),
+            'MKAERO1' : ('MKAERO1', self.add_MKAERO),
+            'MKAERO2' : ('MKAERO2', self.add_MKAERO),
+
+            #'SESUP' : ('SESUP', self.add_SESUP),  # pseudo-constraint
+
+            'FREQ' : ('FREQ', self.add_FREQ),
+            'FREQ1' : ('FREQ1', self.add_FREQ),
+            'FREQ2' : ('FREQ2', self.add_FREQ),
+            'FREQ4' : ('FREQ4', self.add_FREQ),
+
+            'ASET' : ('ASET', self.add_ASET),
+            'ASET1' : ('ASET1', self.add_ASET),
+
+            'BSET' : ('BSET', self.add_BSET),
+            'BSET1' : ('BSET1', self.add_BSET),
+
+            'CSET' : ('CSET', self.add_CSET),
+            'CSET1' : ('CSET1', self.add_CSET),
+
+            'QSET' : ('QSET', self.add_QSET),
+            'QSET1' : ('QSET1', self.add_QSET),
+
+            'USET' : ('USET', self.add_USET),
+            'USET1' : ('USET1', self.add_USET),
+
+            'SET1' : ('SET1', self.add_SET),
+            'SET3' : ('SET3', self.add_SET),
+
+            'SEBSET' : ('SEBSET', self.add_SEBSET),
+            'SEBSET1' : ('SEBSET1', self.add_SEBSET),
+
+            'SECSET' : ('SECSET', self.add_SECSET),
+            'SECSET1' : ('SECSET1', self.add_SECSET),
+
+            'SEQSET' : ('SEQSET', self.add_SEQSET),
+            'SEQSET1' : ('SEQSET1', self.add_SEQSET),
+
+            #'SEUSET' : ('SEUSET', self.add_SEUSET),
+            #'SEUSET1' : ('SEUSET1', self.add_SEUSET),
+
+            'DTABLE' : ('DTABLE', self.add_DTABLE),
+
+            'DRESP1' : ('DRESP1', self.add_DRESP),
+            'DRESP2' : ('DRESP2', self.add_DRESP), # deqatn
+            'DRESP3' : ('DRESP3', self.add_DRESP),
 
-            'DVPREL1' : (DVPREL1, self.add_DVPREL),
-            'DVPREL2' : (DVPREL2, self.add_DVPREL), # deqatn
+            'DVPREL1' : ('DVPREL1', self.add_DVPREL),
+            'DVPREL2' : ('DVPREL2', self.add_DVPREL), # deqatn
 
-            'DVMREL1' : (DVMREL1, self.add_DVMREL),
-            #'DVMREL2' : (DVMREL2, self.add_DVMREL), # deqatn
+            'DVMREL1' : ('DVMREL1', self.add_DVMREL),
+            #'DVMREL2' : ('DVMREL2', self.add_DVMREL), # deqatn
             #DVCREL1
             # DVCREL2 - deqatn
 
-            'TABLED1' : (TABLED1, self.add_table),
-            'TABLED2' : (TABLED2, self.add_table),
-            'TABLED3' : (TABLED3, self.add_table),
-            'TABLED4' : (TABLED4, self.add_table),
-            'TABLEM1' : (TABLEM1, self.add_table),
-            'TABLEM2' : (TABLEM2, self.add_table),
-            'TABLEM3' : (TABLEM3, self.add_table),
-            'TABLEM4' : (TABLEM4, self.add_table),
-
-            'TABLES1' : (TABLES1, self.add_table),
-            'TABLEST' : (TABLEST, self.add_table),
-
-            'TABDMP1' : (TABDMP1, self.add_table_sdamping),
-            'TABRND1' : (TABRND1, self.add_random_table),
-            'TABRNDG' : (TABRNDG, self.add_random_table),
-
-            'EIGB' : (EIGB, self.add_method),
-            'EIGR' : (EIGR, self.add_method),
-            'EIGRL' : (EIGRL, self.add_method),
-            'EIGC' : (EIGC, self.add_cmethod),
-            'EIGP' : (EIGP, self.add_cmethod),
-
-            'BCRPARA' : (BCRPARA, self.add_BCRPARA),
-            'BCTADD' : (BCTADD, self.add_BCTADD),
-            'BCTPARA' : (BCTPARA, self.add_BCTPARA),
-            'BSURF' : (BSURF, self.add_BSURF),
-            'BSURFS' : (BSURFS, self.add_BSURFS),
+            'TABLED1' : ('TABLED1', self.add_table),
+            'TABLED2' : ('TABLED2', self.add_table),
+            'TABLED3' : ('TABLED3', self.add_table),
+            'TABLED4' : ('TABLED4', self.add_table),
+            'TABLEM1' : ('TABLEM1', self.add_table),
+            'TABLEM2' : ('TABLEM2', self.add_table),
+            'TABLEM3' : ('TABLEM3', self.add_table),
+            'TABLEM4' : ('TABLEM4', self.add_table),
+
+            'TABLES1' : ('TABLES1', self.add_table),
+            'TABLEST' : ('TABLEST', self.add_table),
+
+            'TABDMP1' : ('TABDMP1', self.add_table_sdamping),
+            'TABRND1' : ('TABRND1', self.add_random_table),
+            'TABRNDG' : ('TABRNDG', self.add_random_table),
+
+            'EIGB' : ('EIGB', self.add_method),
+            'EIGR' : ('EIGR', self.add_method),
+            'EIGRL' : ('EIGRL', self.add_method),
+            'EIGC' : ('EIGC', self.add_cmethod),
+            'EIGP' : ('EIGP', self.add_cmethod),
+
+            'BCRPARA' : ('BCRPARA', self.add_BCRPARA),
+            'BCTADD' : ('BCTADD', self.add_BCTADD),
+            'BCTPARA' : ('BCTPARA', self.add_BCTPARA),
+            'BSURF' : ('BSURF', self.add_BSURF),
+            'BSURFS' : ('BSURFS', self.add_BSURFS),
         }
         self._card_parser_prepare = {
             'CTETRA' : self._prepare_ctetra,
@@ -1709,15 +1826,18 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_bctset(self, card, card_obj, comment=''):
         """adds a GRDSET"""
+        from pyNastran.bdf.cards.contact import BCTSET
         card = BCTSET(card_obj, comment=comment, sol=self.sol)
         self.add_BCTSET(card)
 
     def _prepare_grdset(self, card, card_obj, comment=''):
         """adds a GRDSET"""
+        from pyNastran.bdf.cards.nodes import GRDSET
         self.gridSet = GRDSET(card_obj, comment=comment)
 
     def _prepare_cdamp4(self, card, card_obj, comment=''):
         """adds a CDAMP4"""
+        from pyNastran.bdf.cards.elements.damper import CDAMP4
         self.add_damper(CDAMP4(card_obj, comment=comment))
         if card_obj.field(5):
             self.add_damper(CDAMP4(card_obj, 1, comment=''))
@@ -1725,21 +1845,25 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_conv(self, card, card_obj, comment=''):
         """adds a CONV"""
+        from pyNastran.bdf.cards.thermal.thermal import CONV
         boundary_condition = CONV(card_obj, comment=comment)
         self.add_thermal_BC(boundary_condition, boundary_condition.eid)
 
     def _prepare_radm(self, card, card_obj, comment=''):
         """adds a RADM"""
+        from pyNastran.bdf.cards.thermal.thermal import RADM
         boundary_condition = RADM(card_obj, comment=comment)
         self.add_thermal_BC(boundary_condition, boundary_condition.radmid)
 
     def _prepare_radbc(self, card, card_obj, comment=''):
         """adds a RADBC"""
+        from pyNastran.bdf.cards.thermal.thermal import RADBC
         boundary_condition = RADBC(card_obj, comment=comment)
         self.add_thermal_BC(boundary_condition, boundary_condition.nodamb)
 
     def _prepare_tempd(self, card, card_obj, comment=''):
         """adds a TEMPD"""
+        from pyNastran.bdf.cards.thermal.loads import TEMPD
         self.add_TEMPD(TEMPD(card_obj, 0, comment=comment))
         if card_obj.field(3):
             self.add_TEMPD(TEMPD(card_obj, 1, comment=''))
@@ -1754,6 +1878,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_dequatn(self, card, card_obj, comment=''):
         """adds a DEQATN"""
+        from pyNastran.bdf.cards.deqatn import DEQATN
         if hasattr(self, 'test_deqatn') or 1:
             self.add_DEQATN(DEQATN(card_obj, comment=comment))
         else:
@@ -1763,6 +1888,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_dmig(self, card, card_obj, comment=''):
         """adds a DMIG"""
+        from pyNastran.bdf.cards.dmig import DMIG
         # not done...
         field2 = integer_or_string(card_obj, 2, 'flag')
         if field2 == 0:
@@ -1787,22 +1913,27 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_dmi(self, card, card_obj, comment=''):
         """adds a DMI"""
+        from pyNastran.bdf.cards.dmig import DMI
         self._prepare_dmix(DMI, self.add_DMI, card_obj, comment=comment)
 
     def _prepare_dmij(self, card, card_obj, comment=''):
         """adds a DMIJ"""
+        from pyNastran.bdf.cards.dmig import DMIJ
         self._prepare_dmix(DMIJ, self.add_DMIJ, card_obj, comment=comment)
 
     def _prepare_dmik(self, card, card_obj, comment=''):
         """adds a DMIK"""
+        from pyNastran.bdf.cards.dmig import DMIK
         self._prepare_dmix(DMIK, self.add_DMIK, card_obj, comment=comment)
 
     def _prepare_dmiji(self, card, card_obj, comment=''):
         """adds a DMIJI"""
+        from pyNastran.bdf.cards.dmig import DMIJI
         self._prepare_dmix(DMIJI, self.add_DMIJI, card_obj, comment=comment)
 
     def _prepare_cmass4(self, card, card_obj, comment=''):
         """adds a CMASS4"""
+        from pyNastran.bdf.cards.elements.mass import CMASS4
         class_instance = CMASS4.add_card(card_obj, icard=0, comment=comment)
         self.add_mass(class_instance)
         if card_obj.field(5):
@@ -1811,6 +1942,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_pelas(self, card, card_obj, comment=''):
         """adds a PELAS"""
+        from pyNastran.bdf.cards.properties.springs import PELAS
         class_instance = PELAS.add_card(card_obj, icard=0, comment=comment)
         self.add_property(class_instance)
         if card_obj.field(5):
@@ -1819,6 +1951,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_pvisc(self, card, card_obj, comment=''):
         """adds a PVISC"""
+        from pyNastran.bdf.cards.properties.damper import PVISC
         class_instance = PVISC.add_card(card_obj, icard=0, comment=comment)
         self.add_property(class_instance)
         if card_obj.field(5):
@@ -1827,6 +1960,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_pdamp(self, card, card_obj, comment=''):
         """adds a PDAMP"""
+        from pyNastran.bdf.cards.properties.damper import PDAMP
         class_instance = PDAMP.add_card(card_obj, icard=0, comment=comment)
         self.add_property(class_instance)
         if card_obj.field(3):
@@ -1841,6 +1975,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_pmass(self, card, card_obj, comment=''):
         """adds a PMASS"""
+        from pyNastran.bdf.cards.properties.mass import PMASS
         card_instance = PMASS(card_obj, icard=0, comment=comment)
         self.add_property_mass(card_instance)
         for (i, j) in enumerate([3, 5, 7]):
@@ -1850,6 +1985,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_darea(self, card, card_obj, comment=''):
         """adds a DAREA"""
+        from pyNastran.bdf.cards.loads.loads import DAREA
         class_instance = DAREA.add_card(card_obj, comment=comment)
         self.add_DAREA(class_instance)
         if card_obj.field(5):
@@ -1858,6 +1994,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_dphase(self, card, card_obj, comment=''):
         """adds a DPHASE"""
+        from pyNastran.bdf.cards.dynamic import DPHASE
         class_instance = DPHASE(card_obj, comment=comment)
         self.add_DPHASE(class_instance)
         # if card_obj.field(5):
@@ -1866,6 +2003,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_cord1r(self, card, card_obj, comment=''):
         """adds a CORD1R"""
+        from pyNastran.bdf.cards.coordinate_systems import CORD1R
         class_instance = CORD1R.add_card(card_obj, comment=comment)
         self.add_coord(class_instance)
         if card_obj.field(5):
@@ -1874,6 +2012,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_cord1c(self, card, card_obj, comment=''):
         """adds a CORD1C"""
+        from pyNastran.bdf.cards.coordinate_systems import CORD1C
         class_instance = CORD1C.add_card(card_obj, comment=comment)
         if card_obj.field(5):
             class_instance = CORD1C.add_card(card_obj, icard=1, comment=comment)
@@ -1881,6 +2020,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_cord1s(self, card, card_obj, comment=''):
         """adds a CORD1S"""
+        from pyNastran.bdf.cards.coordinate_systems import CORD1S
         class_instance = CORD1S.add_card(card_obj, comment=comment)
         if card_obj.field(5):
             class_instance = CORD1S.add_card(card_obj, icard=1, comment=comment)
@@ -1888,24 +2028,28 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
     def _prepare_ctetra(self, card, card_obj, comment=''):
         """adds a CTETRA"""
+        from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10
         card_class = CTETRA4 if card_obj.nfields == 7 else CTETRA10
         class_instance = card_class(card_obj, comment=comment)
         self.add_element(class_instance)
 
     def _prepare_cpyram(self, card, card_obj, comment=''):
         """adds a CPYRAM"""
+        from pyNastran.bdf.cards.elements.solid import CPYRAM5, CPYRAM13
         card_class = CPYRAM5 if card_obj.nfields == 8 else CPYRAM13
         class_instance = card_class(card_obj, comment=comment)
         self.add_element(class_instance)
 
     def _prepare_cpenta(self, card, card_obj, comment=''):
         """adds a CPENTA"""
+        from pyNastran.bdf.cards.elements.solid import CPENTA6, CPENTA15
         card_class = CPENTA6 if card_obj.nfields == 9 else CPENTA15
         class_instance = card_class(card_obj, comment=comment)
         self.add_element(class_instance)
 
     def _prepare_chexa(self, card, card_obj, comment=''):
         """adds a CHEXA"""
+        from pyNastran.bdf.cards.elements.solid import CHEXA8, CHEXA20
         card_class = CHEXA8 if card_obj.nfields == 11 else CHEXA20
         class_instance = card_class(card_obj, comment=comment)
         self.add_element(class_instance)
@@ -1976,7 +2120,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         card_name = card_name.upper()
         card_obj, card = self.create_card_object(card_lines, card_name,
                                                  is_list=is_list, has_none=has_none)
-        self._add_card_helper(card_obj, card_name, card_name, comment)
+        self._add_card_helper(card_obj, card_name, card_name, comment,
+                              card_lines=card_lines)
         return card_obj
 
     def add_card_fields(self, card_lines, card_name, comment='', has_none=True):
@@ -2027,37 +2172,94 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                                                  is_list=False, has_none=has_none)
         self._add_card_helper(card_obj, card_name, card_name, comment)
 
+    def get_coord_transforms(self):
+        """
+        Gets the resolved coordinate systems, which are reused until a
+        coordinate card changes
+
+        Returns
+        -------
+        coord_transforms : CoordTransforms()
+            the beta/origin of every coordinate system
+        """
+        coord_transforms = self._coord_transforms
+        if coord_transforms is None or coord_transforms.is_stale(self.coords):
+            coord_transforms = CoordTransforms(self.coords)
+            self._coord_transforms = coord_transforms
+        return coord_transforms
+
+    def get_node_positions(self, cid=0):
+        """
+        Gets the GRID locations in the desired coordinate frame
+
+        Parameters
+        ----------
+        cid : int; default=0
+            the coordinate system to get the positions in
+
+        Returns
+        -------
+        nids : (nnodes, ) int ndarray
+            the sorted node ids
+        xyz : (nnodes, 3) float ndarray
+            the positions in the cid frame (e.g., R, theta, z for a
+            cylindrical system)
+        """
+        nids = []
+        cps = []
+        xyz = []
+        if self.nodes:
+            nids_nodes = np.array(sorted(self.nodes), dtype='int32')
+            nodes = [self.nodes[nid] for nid in nids_nodes]
+            nids.append(nids_nodes)
+            cps.append(np.array([node.Cp() for node in nodes], dtype='int32'))
+            xyz.append(np.array([node.xyz for node in nodes],
+                                dtype='float64').reshape(len(nodes), 3))
+        if self.grid_array is not None:
+            nids_array, cp_array, xyz_array = self.grid_array.get_local_position()
+            nids.append(nids_array)
+            cps.append(cp_array)
+            xyz.append(xyz_array)
+        if not nids:
+            return np.zeros(0, dtype='int32'), np.zeros((0, 3), dtype='float64')
+
+        nids = np.hstack(nids)
+        isort = np.argsort(nids)
+        coord_transforms = self.get_coord_transforms()
+        xyz_cid0 = coord_transforms.transform_to_global(np.vstack(xyz)[isort, :],
+                                                        np.hstack(cps)[isort])
+        return nids[isort], coord_transforms.transform_to_local(xyz_cid0, cid)
+
     def get_xyz_in_coord(self, cid=0, dtype='float32'):
         """
         Gets the xyz points (including SPOINTS) in the desired coordinate frame
 
-        .. warning:: Only suppoprt cid=0
+        Parameters
+        ----------
+        cid : int; default=0
+            the coordinate system to get the points in
+        dtype : str; default='float32'
+            the type of xyz
+
+        Returns
+        -------
+        xyz : (npoints, 3) ndarray
+            the points sorted by node id; SPOINTs are <0., 0., 0.>
         """
-        assert cid == 0, cid
-        nnodes = len(self.nodes)
-        nspoints = 0
-        spoints = None
+        nids, xyz = self.get_node_positions(cid)
         if self.spoints:
-            spoints = self.spoints.points
-            nspoints = len(spoints)
-
-        assert nnodes + nspoints > 0, 'nnodes=%s nspoints=%s' % (nnodes, nspoints)
-        xyz_cid0 = np.zeros((nnodes + nspoints, 3), dtype=dtype)
-        if nspoints:
-            nids = self.nodes.keys()
-            newpoints = nids + list(spoints)
-            newpoints.sort()
-            for i, nid in enumerate(newpoints):
-                if nid not in spoints:
-                    node = self.nodes[nid]
-                    xyz_cid0[i, :] = node.get_position()
-        else:
-            for i, (nid, node) in enumerate(sorted(iteritems(self.nodes))):
-                xyz = node.get_position()
-                xyz_cid0[i, :] = xyz
-        return xyz_cid0
-
-    def _add_card_helper(self, card_obj, card, card_name, comment=''):
+            spoints = np.array(sorted(self.spoints.points), dtype='int32')
+            nids = np.hstack([nids, spoints])
+            xyz = np.vstack([xyz, np.zeros((len(spoints), 3), dtype='float64')])
+
+        npoints = len(nids)
+        assert npoints > 0, 'nnodes=%s nspoints=%s' % (
+            self.nnodes, len(self.spoints.points) if self.spoints else 0)
+        isort = np.argsort(nids)
+        xyz_cid = xyz[isort, :].astype(dtype)
+        return xyz_cid
+
+    def _add_card_helper(self, card_obj, card, card_name, comment='', card_lines=None):
         """
         Adds a card object to the BDF object.
 
@@ -2071,6 +2273,9 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             the card_name -> 'GRID'
         comment : str
             an optional the comment for the card
+        card_lines : List[str]; default=None
+            the lines of the card, which are used to find the file/line
+            of a card with an error (see ``_get_card_source``)
         """
         if self._auto_reject:
             self.reject_cards.append(card)
@@ -2091,7 +2296,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
         if card_name in self._card_parser:
             #print(card_name)
-            card_class, add_card_function = self._card_parser[card_name]
+            class_name, add_card_function = self._card_parser[card_name]
+            card_class = get_card_class(class_name)
             try:
                 class_instance = card_class.add_card(card_obj, comment=comment)
                 add_card_function(class_instance)
@@ -2104,15 +2310,12 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 #tpl/cc451.bdf
                 #raise
                 # NameErrors should be caught
-                self._iparse_errors += 1
-                var = traceback.format_exception_only(type(exception), exception)
-                self._stored_parse_errors.append((card, var))
-                if self._iparse_errors > self._nparse_errors:
-                    self.pop_parse_errors()
+                self._store_parse_error(card, exception, card_lines)
 
         elif card_name in self._card_parser_a:
             #print('*', card_name)
-            card_class, add_card_function = self._card_parser_a[card_name]
+            class_name, add_card_function = self._card_parser_a[card_name]
+            card_class = get_card_class(class_name)
             try:
                 class_instance = card_class()
             except TypeError:
@@ -2128,14 +2331,11 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 #tpl/cc451.bdf
                 #raise
                 # NameErrors should be caught
-                self._iparse_errors += 1
-                var = traceback.format_exception_only(type(exception), exception)
-                self._stored_parse_errors.append((card, var))
-                if self._iparse_errors > self._nparse_errors:
-                    self.pop_parse_errors()
+                self._store_parse_error(card, exception, card_lines)
 
         elif card_name in self._card_parser_b:
-            card_class, add_card_function = self._card_parser_b[card_name]
+            class_name, add_card_function = self._card_parser_b[card_name]
+            card_class = get_card_class(class_name)
             #print('b', card_name)
             try:
                 class_instance = card_class(card_obj, comment=comment)
@@ -2149,11 +2349,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 #tpl/cc451.bdf
                 #raise
                 # NameErrors should be caught
-                self._iparse_errors += 1
-                var = traceback.format_exception_only(type(exception), exception)
-                self._stored_parse_errors.append((card, var))
-                if self._iparse_errors > self._nparse_errors:
-                    self.pop_parse_errors()
+                self._store_parse_error(card, exception, card_lines)
                 return
             add_card_function(class_instance)
 
@@ -2167,15 +2363,74 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 #tpl/cc451.bdf
                 #raise
                 # NameErrors should be caught
-                self._iparse_errors += 1
-                var = traceback.format_exception_only(type(exception), exception)
-                self._stored_parse_errors.append((card, var))
-                if self._iparse_errors > self._nparse_errors:
-                    self.pop_parse_errors()
+                self._store_parse_error(card, exception, card_lines)
         else:
             #raise RuntimeError(card_obj)
             self.reject_cards.append(card_obj)
 
+    def _store_parse_error(self, card, exception, card_lines=None):
+        """
+        Stores a card that couldn't be parsed and raises the errors when
+        there are too many.  The file/line of the card is added to the
+        message when it's known.
+
+        Parameters
+        ----------
+        card : str
+            the card_name
+        exception : Exception
+            the parsing error
+        card_lines : List[str]; default=None
+            the lines of the card
+        """
+        self._iparse_errors += 1
+        var = traceback.format_exception_only(type(exception), exception)
+        source = self._get_card_source(card_lines)
+        if source is not None:
+            source_msg = 'line %i of %r' % (source[1], source[0])
+            var[0] = '%s%s\n' % (var[0], source_msg)
+        self._stored_parse_errors.append((card, var))
+        if self._iparse_errors > self._nparse_errors:
+            if (source is not None and self._stop_on_parsing_error and
+                    self._iparse_errors == 1 and self._nparse_errors == 0 and
+                    type(exception) in (SyntaxError, AssertionError, KeyError, ValueError)):
+                # pop_parse_errors would reraise the error without the file/line
+                raise type(exception)('%s\n%s' % (exception, source_msg))
+            self.pop_parse_errors()
+
+    def _get_card_source(self, card_lines):
+        """
+        Gets the file and line number of a card from ``read_bdf``
+
+        Parameters
+        ----------
+        card_lines : List[str] / None
+            the lines of the card from ``get_bdf_cards``/``get_bdf_cards_dict``
+
+        Returns
+        -------
+        source : (filename, lineno) / None
+            the file and the 1-based line number of the first line of the
+            card (None -> the card isn't from read_bdf)
+        """
+        if card_lines is None or self._card_sources is None:
+            return None
+        if self._card_source_index is None:
+            # the index is only made when there's an error
+            cards, card_ilines = self._card_sources
+            if isinstance(cards, dict):
+                self._card_source_index = {
+                    id(card[1]) : iline
+                    for card_name, cardsi in iteritems(cards)
+                    for card, iline in zip(cardsi, card_ilines[card_name])}
+            else:
+                self._card_source_index = {
+                    id(card[2]) : iline for card, iline in zip(cards, card_ilines)}
+        iline = self._card_source_index.get(id(card_lines))
+        if iline is None:
+            return None
+        return self.get_line_source(iline)
+
     def get_bdf_stats(self, return_type='string'):
         """
         Print statistics for the BDF
@@ -2493,88 +2748,153 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         #: the directory of the 1st BDF (include BDFs are relative to this one)
         self.include_dir = os.path.dirname(os.path.abspath(bdf_filename))
 
+        #: the run-length encoded source of the processed lines as
+        #: [(iline, filename, lineno), ...]; see ``get_line_source``
+        self.line_sources = []
+
+        lines = self._record_line_sources(self._stream_lines(bdf_filename))
+        if self.dumplines:
+            lines = self._dump_lines('pyNastran_dump.bdf', lines)
+
+        executive_control_lines, case_control_lines, bulk_data_lines = _lines_to_decks(
+            lines, punch)
+        self._line_source_ilines = np.array(
+            [source[0] for source in self.line_sources], dtype='int64')
+
+        #: the index of the first bulk data line in the processed lines
+        self._ibulk_data_line0 = len(executive_control_lines) + len(case_control_lines)
+        return executive_control_lines, case_control_lines, bulk_data_lines
+
+    def _stream_lines(self, bdf_filename):
+        """
+        Reads the main bdf and splices in the INCLUDE files in a single
+        pass using a stack of (filename, lines, iline) sources, so the
+        processed deck is never copied.
+
+        Parameters
+        ----------
+        bdf_filename : str
+            the main bdf_filename
+
+        Yields
+        ------
+        filename : str
+            the file the line came from
+        lineno : int
+            the 1-based line number in filename
+        line : str
+            the raw line (including the endline)
+        """
         with self._open_file(bdf_filename, basename=True) as bdf_file:
             try:
                 lines = bdf_file.readlines()
             except:
                 self._show_bad_file(bdf_filename)
+        stack = [[self.active_filenames[-1], lines, 0]]
+
+        while stack:
+            source = stack[-1]
+            filename, lines, i0 = source
+            nlines = len(lines)
+            for i in range(i0, nlines):
+                line = lines[i]
+                if line[:7].upper() == 'INCLUDE':
+                    break
+                yield filename, i + 1, line
+            else:
+                stack.pop()
+                continue
 
-        nlines = len(lines)
+            line = line.rstrip('\r\n\t')
+            j = i + 1
+            line_base = line.split('$')[0]
+            include_lines = [line_base.strip()]
+
+            line_base = line_base[8:].strip()
+            if not(line_base.startswith("'") and line_base.endswith("'")):
+                while not line.split('$')[0].endswith("'") and j < nlines:
+                    line = lines[j].split('$')[0].strip()
+                    include_lines.append(line.strip())
+                    j += 1
+            bdf_filename2 = get_include_filename(include_lines, include_dir=self.include_dir)
 
-        i = 0
-        while i < nlines:
             try:
-                line = lines[i].rstrip('\r\n\t')
-            except IndexError:
-                break
-            uline = line.upper()
-            if uline.startswith('INCLUDE'):
-                j = i + 1
-                line_base = line.split('$')[0]
-                include_lines = [line_base.strip()]
-                # print('----------------------')
-
-                line_base = line_base[8:].strip()
-                if line_base.startswith("'") and line_base.endswith("'"):
-                    pass
-                else:
-                    while not line.split('$')[0].endswith("'") and j < nlines:
-                        # print('j=%s nlines=%s less?=%s'  % (j, nlines, j < nlines))
-                        try:
-                            line = lines[j].split('$')[0].strip()
-                        except IndexError:
-                            # print('bdf_filename=%r' % bdf_filename)
-                            crash_name = 'pyNastran_crash.bdf'
-                            self._dump_file(crash_name, lines, i+1)
-                            msg = 'There was an invalid filename found while parsing (index).\n'
-                            msg += 'Check the end of %r\n' % crash_name
-                            msg += 'bdf_filename2 = %r' % bdf_filename
-                            raise IndexError(msg)
-                        # print('endswith_quote=%s; %r' % (line.split('$')[0].strip().endswith(""), line.strip()))
-                        include_lines.append(line.strip())
-                        j += 1
-                    # print('j=%s nlines=%s less?=%s'  % (j, nlines, j < nlines))
-
-                    #print('*** %s' % line)
-                    #bdf_filename2 = line[7:].strip(" '")
-                    #include_lines = [line] + lines[i+1:j]
-                #print(include_lines)
-                bdf_filename2 = get_include_filename(include_lines, include_dir=self.include_dir)
+                self._open_file_checks(bdf_filename2)
+            except IOError:
+                msg = 'There was an invalid filename found while parsing.\n'
+                msg += 'Check line %i of %r\n' % (i + 1, filename)
+                msg += 'bdf_filename2 = %r' % bdf_filename2
+                raise IOError(msg)
 
+            with self._open_file(bdf_filename2, basename=False) as bdf_file:
                 try:
-                    self._open_file_checks(bdf_filename2)
-                except IOError:
-                    crash_name = 'pyNastran_crash.bdf'
-                    self._dump_file(crash_name, lines, j)
-                    msg = 'There was an invalid filename found while parsing.\n'
-                    msg += 'Check the end of %r\n' % crash_name
-                    msg += 'bdf_filename2 = %r' % bdf_filename2
-                    #msg += 'len(bdf_filename2) = %s' % len(bdf_filename2)
-                    raise IOError(msg)
-
-                with self._open_file(bdf_filename2, basename=False) as bdf_file:
-                    #print('bdf_file.name = %s' % bdf_file.name)
                     lines2 = bdf_file.readlines()
+                except UnicodeDecodeError:
+                    self._show_bad_file(self.active_filenames[-1])
 
-                #print('lines2 = %s' % lines2)
-                nlines += len(lines2)
+            # resume the current file after the INCLUDE card
+            source[2] = j
+            yield filename, i + 1, '\n$ INCLUDE processed:  %s\n' % bdf_filename2
+            stack.append([self.active_filenames[-1], lines2, 0])
 
-                #line2 = lines[j].split('$')
-                #if not line2[0].isalpha():
-                    #print('** %s' % line2)
+    def _record_line_sources(self, stream):
+        """
+        Strips the (filename, lineno) off a ``_stream_lines`` stream and
+        stores it in ``self.line_sources`` when the source changes.
+        """
+        line_sources = self.line_sources
+        filename0 = None
+        lineno0 = -1
+        for iline, (filename, lineno, line) in enumerate(stream):
+            if lineno != lineno0 + 1 or filename != filename0:
+                line_sources.append((iline, filename, lineno))
+            filename0 = filename
+            lineno0 = lineno
+            yield line
+
+    def get_line_source(self, iline, bulk=True):
+        """
+        Gets the file and line number a processed line came from
 
-                include_comment = '\n$ INCLUDE processed:  %s\n' % bdf_filename2
-                #for line in lines2:
-                    #print("  ?%s" % line.rstrip())
-                lines = lines[:i] + [include_comment] + lines2 + lines[j:]
-                #for line in lines:
-                    #print("  *%s" % line.rstrip())
-            i += 1
+        Parameters
+        ----------
+        iline : int
+            the 0-based index of the line
+        bulk : bool; default=True
+            is iline an index into the bulk data lines (or into the
+            full processed deck)
 
-        if self.dumplines:
-            self._dump_file('pyNastran_dump.bdf', lines, i)
+        Returns
+        -------
+        filename : str
+            the file the line came from
+        lineno : int
+            the 1-based line number in filename
+        """
+        if bulk:
+            iline += self._ibulk_data_line0
+        isource = np.searchsorted(self._line_source_ilines, iline, side='right') - 1
+        if isource < 0:
+            raise IndexError('iline=%s is not a valid line index' % iline)
+        iline0, filename, lineno = self.line_sources[isource]
+        return filename, lineno + iline - iline0
+
+    def _dump_lines(self, bdf_dump_filename, lines):
+        """
+        Writes the processed lines to a file as they're passed through
 
-        return _lines_to_decks(lines, i, punch)
+        Parameters
+        ----------
+        bdf_dump_filename : str
+            the bdf filename to dump
+        lines : iterable[str]
+            the processed lines
+        """
+        with codec_open(_filename(bdf_dump_filename),
+                        'w', encoding=self._encoding) as dump_file:
+            for line in lines:
+                dump_file.write(line)
+                yield line
 
     def _dump_file(self, bdf_dump_filename, lines, i):
         """
@@ -2727,9 +3047,23 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
     def _parse_cards(self, cards, card_count):
         """creates card objects and adds the parsed cards to the deck"""
         #print('card_count = %s' % card_count)
+        is_grid_array = self._vectorize_grids and 'GRID' in self.cards_to_read
+        parsed_objs = {}
+        if self._num_workers > 1 and not (self.echo or self._is_dynamic_syntax
+                                          or self._auto_reject):
+            parsed_objs = self._parse_cards_parallel(cards, is_grid_array)
+        is_bulk = not self.echo
         if isinstance(cards, dict): # self._is_cards_dict = True
             for card_name, card in sorted(iteritems(cards)):
-                if self.is_reject(card_name):
+                if card_name in parsed_objs:
+                    card_objs = parsed_objs[card_name]
+                    for comment, card_lines in card:
+                        self._add_parsed_card(card_name, comment, card_lines, next(card_objs))
+                elif is_grid_array and card_name == 'GRID':
+                    self._add_grid_cards(card)
+                elif is_bulk and card_name in BULK_CARDS and not self.is_reject(card_name):
+                    self._add_bulk_cards(card_name, card)
+                elif self.is_reject(card_name):
                     self.log.info('    rejecting card_name = %s' % card_name)
                     for cardi in card:
                         self._increase_card_count(card_name)
@@ -2739,8 +3073,20 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                         self.add_card(card_lines, card_name, comment=comment,
                                       is_list=False, has_none=False)
         else:
+            grid_cards = []
+            bulk_cards = defaultdict(list)
             for card in cards:
                 card_name, comment, card_lines = card
+                if card_name in parsed_objs:
+                    self._add_parsed_card(card_name, comment, card_lines,
+                                          next(parsed_objs[card_name]))
+                    continue
+                if is_grid_array and card_name == 'GRID':
+                    grid_cards.append([comment, card_lines])
+                    continue
+                if is_bulk and card_name in BULK_CARDS and not self.is_reject(card_name):
+                    bulk_cards[card_name].append([comment, card_lines])
+                    continue
                 if card_name is None:
                     msg = 'card_name = %r\n' % card_name
                     msg += 'card_lines = %s' % card_lines
@@ -2758,6 +3104,164 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 else:
                     self.add_card(card_lines, card_name, comment=comment,
                                   is_list=False, has_none=False)
+            if grid_cards:
+                self._add_grid_cards(grid_cards)
+            for card_name, cardsi in sorted(iteritems(bulk_cards)):
+                self._add_bulk_cards(card_name, cardsi)
+
+    def _parse_cards_parallel(self, cards, is_grid_array):
+        """
+        Creates the objects of the cards that are made by a class (see
+        ``_card_parser``, ``_card_parser_b`` and ``BULK_CARDS``) in a
+        process pool.  The cards are split into chunks by card name.
+
+        Parameters
+        ----------
+        cards : dict[card_name] = List[[comment, card_lines]] or
+                List[[card_name, comment, card_lines]]
+            the cards from ``get_bdf_cards_dict``/``get_bdf_cards``
+        is_grid_array : bool
+            the GRID cards are vectorized by the main process
+
+        Returns
+        -------
+        card_objs : dict[card_name] = iterator
+            the card objects in the order of the cards (None for a card
+            that should be parsed with ``add_card``); see
+            ``_add_parsed_card``
+        """
+        is_cards_dict = isinstance(cards, dict)
+        if is_cards_dict:
+            card_names = set(cards.keys())
+        else:
+            card_names = set([card[0] for card in cards])
+        if 'ECHOON' in card_names:
+            return {}
+
+        parallel_names = [
+            card_name for card_name in card_names
+            if card_name is not None and (
+                card_name in self._card_parser or card_name in self._card_parser_b or
+                card_name in BULK_CARDS)
+            and not (is_grid_array and card_name == 'GRID')
+            and not self.is_reject(card_name)]
+        if not parallel_names:
+            return {}
+
+        if is_cards_dict:
+            parallel_cards = {card_name : cards[card_name] for card_name in parallel_names}
+        else:
+            parallel_cards = {card_name : [] for card_name in parallel_names}
+            for card_name, comment, card_lines in cards:
+                if card_name in parallel_cards:
+                    parallel_cards[card_name].append([comment, card_lines])
+
+        # a few chunks per worker, so the workers stay busy
+        ncards = sum([len(cardsi) for cardsi in itervalues(parallel_cards)])
+        chunk_size = max(ncards // (4 * self._num_workers), 500)
+        tasks = []
+        for card_name, cardsi in sorted(iteritems(parallel_cards)):
+            for icard0 in range(0, len(cardsi), chunk_size):
+                tasks.append((card_name, cardsi[icard0:icard0 + chunk_size]))
+
+        card_objs = {card_name : [] for card_name in parallel_names}
+        num_workers = min(self._num_workers, len(tasks))
+        if num_workers > 1:
+            context = get_pool_context()[0]
+            self.log.debug('-------- parsing %i cards in %i chunks with %i processes --------' % (
+                ncards, len(tasks), num_workers))
+            pool = context.Pool(num_workers, initializer=_init_bdf_worker,
+                                initargs=(self._nastran_format,))
+            try:
+                for (card_name, unused_cards), card_objsi in zip(
+                        tasks, pool.imap(_parse_card_chunk, tasks)):
+                    card_objs[card_name].extend(card_objsi)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            _init_bdf_worker(self._nastran_format)
+            for task in tasks:
+                card_objs[task[0]].extend(_parse_card_chunk(task))
+        return {card_name : iter(card_objsi) for card_name, card_objsi in iteritems(card_objs)}
+
+    def _add_parsed_card(self, card_name, comment, card_lines, card_obj):
+        """
+        Adds a card object from a worker process (see
+        ``_parse_cards_parallel``) with the same duplicate id checks and
+        ``card_count`` bookkeeping as ``add_card``.  A card that failed
+        is sent through ``add_card``, so the error is stored the same way.
+
+        Parameters
+        ----------
+        card_name : str
+            the name of the card
+        comment : str
+            the comment of the card
+        card_lines : List[str]
+            the lines of the card
+        card_obj : BaseCard / None
+            the card (None -> parse it with ``add_card``)
+        """
+        if card_obj is not None:
+            if card_name in self._card_parser:
+                add_card_function = self._card_parser[card_name][1]
+            elif card_name in self._card_parser_b:
+                add_card_function = self._card_parser_b[card_name][1]
+            else:
+                add_card_function = self.add_element
+
+            try:
+                add_card_function(card_obj)
+            except (SyntaxError, AssertionError, KeyError, ValueError):
+                pass
+            else:
+                self._increase_card_count(card_name)
+                return
+        self.add_card(card_lines, card_name, comment=comment,
+                      is_list=False, has_none=False)
+
+    def _add_bulk_cards(self, card_name, cards):
+        """
+        Creates cards of a single type in bulk (see ``BULK_CARDS``).
+        Cards that can't be created in bulk (e.g., tabs, invalid values)
+        are sent through add_card.
+
+        Parameters
+        ----------
+        card_name : str
+            the name of the card
+        cards : List[[comment, card_lines]]
+            the cards
+        """
+        elements, icards_failed = get_bulk_cards(card_name, cards)
+        if elements:
+            for elem in elements:
+                self.add_element(elem)
+            self._increase_card_count(card_name, len(elements))
+        for icard in icards_failed:
+            comment, card_lines = cards[icard]
+            self.add_card(card_lines, card_name, comment=comment,
+                          is_list=False, has_none=False)
+
+    def _add_grid_cards(self, cards):
+        """
+        Adds the GRID cards to ``self.grid_array``.  Cards that can't be
+        vectorized (e.g., tabs, duplicate ids) are sent through add_card.
+
+        Parameters
+        ----------
+        cards : List[[comment, card_lines]]
+            the GRID cards
+        """
+        if self.grid_array is None:
+            self.grid_array = GridArray()
+        icards_failed = self.grid_array.add_cards(cards, self.nodes)
+        self._increase_card_count('GRID', len(cards) - len(icards_failed))
+        for icard in icards_failed:
+            comment, card_lines = cards[icard]
+            self.add_card(card_lines, 'GRID', comment=comment,
+                          is_list=False, has_none=False)
 
     def _parse_dynamic_syntax(self, key):
         """
@@ -2919,6 +3423,65 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 print(str(card))
                 raise
 
+#: the model of a BDF worker process
+_BDF_WORKER = {}
+
+
+def _init_bdf_worker(mode):
+    """
+    Sets up a process for ``BDF.read_bdf(..., num_workers=N)``
+
+    Parameters
+    ----------
+    mode : str
+        the Nastran format (msc, nx)
+    """
+    _BDF_WORKER['model'] = BDF(debug=None, mode=mode)
+
+
+def _parse_card_chunk(task):
+    """
+    Creates the card objects of a chunk of cards in a BDF worker process
+
+    Parameters
+    ----------
+    task : (card_name, cards)
+        the name of the card and the List[[comment, card_lines]]
+
+    Returns
+    -------
+    card_objs : List[BaseCard / None]
+        the card for each card (None -> the card should be parsed with
+        ``BDF.add_card`` (e.g., invalid values))
+    """
+    card_name, cards = task
+    model = _BDF_WORKER['model']
+    if card_name in BULK_CARDS:
+        card_objs = [None] * len(cards)
+        bulk_objs, icards_failed = get_bulk_cards(card_name, cards)
+        failed = set(icards_failed)
+        icards = [icard for icard in range(len(cards)) if icard not in failed]
+        for icard, card_obj in zip(icards, bulk_objs):
+            card_objs[icard] = card_obj
+        return card_objs
+
+    if card_name in model._card_parser:
+        card_class = get_card_class(model._card_parser[card_name][0])
+        create_card = card_class.add_card
+    else:
+        create_card = get_card_class(model._card_parser_b[card_name][0])
+
+    card_objs = []
+    for comment, card_lines in cards:
+        try:
+            card_obj = model.create_card_object(card_lines, card_name,
+                                                is_list=False, has_none=False)[0]
+            card_objs.append(create_card(card_obj, comment=comment))
+        except (SyntaxError, AssertionError, KeyError, ValueError, TypeError):
+            card_objs.append(None)
+    return card_objs
+
+
 IGNORE_COMMENTS = (
     '$EXECUTIVE CONTROL DECK',
     '$CASE CONTROL DECK',
@@ -2960,19 +3523,37 @@ def _clean_comment(comment):
         #print(comment)
     return comment
 
-def _lines_to_decks(lines, i, punch):
+def _lines_to_decks(lines, punch):
     """
-    Splits the lines into their deck.
+    Splits the lines into their deck in a single pass.
+
+    Parameters
+    ----------
+    lines : iterable[str]
+        the processed lines
+    punch : bool
+        is this a punch file (no executive/case control decks)
+
+    Returns
+    -------
+    executive_control_lines : list[str]
+        the executive control deck as a list of strings
+    case_control_lines : list[str]
+        the case control deck as a list of strings
+    bulk_data_lines : list[str]
+        the bulk data deck as a list of strings
     """
     executive_control_lines = []
     case_control_lines = []
     bulk_data_lines = []
 
     if punch:
-        bulk_data_lines = lines
+        bulk_data_lines = list(lines)
     else:
+        lines = iter(lines)
+        line = None
         flag = 1
-        for i, line in enumerate(lines):
+        for line in lines:
             if flag == 1:
                 #line = line.upper()
                 if line.upper().startswith('CEND'):
@@ -2986,10 +3567,14 @@ def _lines_to_decks(lines, i, punch):
                     flag = 3
                 case_control_lines.append(line.rstrip())
             else:
+                bulk_data_lines.append(line.rstrip())
                 break
-        for line in lines[i:]:
-            bulk_data_lines.append(line.rstrip())
-    del lines
+        else:
+            # the bulk data deck starts with the last line when no bulk
+            # data line was found
+            if line is not None:
+                bulk_data_lines.append(line.rstrip())
+        bulk_data_lines.extend(line.rstrip() for line in lines)
     #for line in bulk_data_lines:
         #print(line)
 
@@ -188,6 +188,13 @@ class BDFAttributes(object):
         self.epoints = None
         #: stores GRIDSET card
         self.gridSet = None
+        #: stores the GRID cards that were read with vectorize_grids=True
+        #: and haven't been requested as GRID objects (GridArray)
+        self.grid_array = None
+
+        #: the resolved coordinate systems used by get_xyz_in_coord
+        #: (CoordTransforms)
+        self._coord_transforms = None
 
         #: stores elements (CQUAD4, CTRIA3, CHEXA8, CTETRA4, CROD, CONROD,
         #: etc.)
@@ -671,10 +678,14 @@ class BDFAttributes(object):
 
     @property
     def nnodes(self):
+        if self.grid_array is not None:
+            return len(self.nodes) + len(self.grid_array)
         return len(self.nodes)
 
     @property
     def node_ids(self):
+        if self.grid_array is not None:
+            return list(self.nodes.keys()) + self.grid_array.node_ids.tolist()
         return self.nodes.keys()
 
     @property
@@ -0,0 +1,204 @@
+"""
+Creates the common element cards from a group of cards in bulk (see
+``bulk_tokenizer``) instead of making a ``BDFCard`` and calling
+``assign_type`` for every field.  The cards get the same validated values
+as ``add_card``.  Defines:
+  - BULK_CARDS
+  - get_bulk_cards(card_name, cards)
+"""
+from __future__ import print_function, unicode_literals
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.card_registry import get_card_class
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import (
+    group_cards, split_cards, is_blank, to_integers, to_doubles, to_integers_or_doubles)
+
+
+def get_bulk_cards(card_name, cards):
+    """
+    Creates the cards of a single type in bulk
+
+    Parameters
+    ----------
+    card_name : str
+        the name of the card (a key in ``BULK_CARDS``)
+    cards : List[[comment, card_lines]]
+        the cards (as made by ``BDF.get_bdf_cards``)
+
+    Returns
+    -------
+    card_objs : List[BaseCard]
+        the cards that were created in the order of ``cards``
+    icards_failed : List[int]
+        the indices of the cards that weren't created (e.g., tabs,
+        invalid values, higher order solids) and should be parsed with
+        ``BDF.add_card``
+    """
+    class_name, build_cards = BULK_CARDS[card_name]
+    card_class = get_card_class(class_name)
+    groups, icards_failed = group_cards(cards)
+
+    icard_objs = []
+    for (card_format, nlines), icards in sorted(groups.items()):
+        fields = split_cards(cards, icards, card_format, nlines)
+        comments = [cards[icard][0] for icard in icards]
+
+        # a bad field fails the whole batch, so the batch is split until
+        # the bad cards are found
+        batches = [np.arange(len(icards))]
+        icards = np.array(icards, dtype='int32')
+        while batches:
+            ibatch = batches.pop()
+            try:
+                is_valid, card_objs = build_cards(
+                    card_class, fields[ibatch, :], [comments[i] for i in ibatch])
+            except SyntaxError:
+                if len(ibatch) == 1:
+                    icards_failed.append(int(icards[ibatch[0]]))
+                else:
+                    batches.extend(np.array_split(ibatch, min(len(ibatch), 16)))
+                continue
+            icards_failed.extend(icards[ibatch[~is_valid]].tolist())
+            icard_objs.extend(zip(icards[ibatch[is_valid]].tolist(), card_objs))
+
+    icard_objs.sort(key=lambda icard_obj: icard_obj[0])
+    card_objs = [card_obj for unused_icard, card_obj in icard_objs]
+    return card_objs, sorted(icards_failed)
+
+
+def _get_fields(fields, nfields):
+    """
+    Pads the fields with blanks to nfields and finds the cards that only
+    have blank fields after nfields
+
+    Returns
+    -------
+    fields : (nvalid, nfields) unicode ndarray
+        the fields of the valid cards
+    is_valid : (ncards, ) bool ndarray
+        the cards that may be created in bulk
+    """
+    ncards, nfields_card = fields.shape
+    is_valid = np.ones(ncards, dtype='bool')
+    if nfields_card > nfields:
+        is_valid = is_blank(fields[:, nfields:]).all(axis=1)
+        fields = fields[is_valid, :nfields]
+    elif nfields_card < nfields:
+        blanks = np.zeros((ncards, nfields - nfields_card), dtype=fields.dtype)
+        fields = np.hstack([fields, blanks])
+    return fields, is_valid
+
+
+def _get_eid_pid(fields, is_valid, pid_default_eid):
+    """
+    Gets the element and property ids, where a blank property id may
+    default to the element id
+
+    The cards with a non-positive element id are flagged, so
+    ``add_card`` can report them.
+    """
+    eid = to_integers(fields[:, 0], 'eid')
+    if pid_default_eid:
+        pid = to_integers(fields[:, 1], 'pid', 0)
+        iblank = is_blank(fields[:, 1])
+        pid[iblank] = eid[iblank]
+    else:
+        pid = to_integers(fields[:, 1], 'pid')
+
+    is_positive = eid > 0
+    if not is_positive.all():
+        is_valid[np.where(is_valid)[0][~is_positive]] = False
+    return eid[is_positive], pid[is_positive], is_positive
+
+
+def _get_nids(fields, nnodes):
+    """gets the required node ids that follow the element/property ids"""
+    return np.column_stack([
+        to_integers(fields[:, 2 + inode], 'n%i' % (inode + 1))
+        for inode in range(nnodes)])
+
+
+def _build_shells(nnodes, card_class, fields, comments):
+    """
+    Creates CTRIA3/CQUAD4 cards::
+
+      +--------+-------+-----+----+----+----+----+------------+---------+
+      | CQUAD4 |  EID  | PID | N1 | N2 | N3 | N4 | THETA/MCID | ZOFFSET |
+      +--------+-------+-----+----+----+----+----+------------+---------+
+      |        |       |TFLAG| T1 | T2 | T3 | T4 |            |         |
+      +--------+-------+-----+----+----+----+----+------------+---------+
+    """
+    ntflag = 9
+    fields, is_valid = _get_fields(fields, ntflag + nnodes + 1)
+
+    # the CQUAD4 has 1 blank field and the CTRIA3 has 2
+    is_blanks = is_blank(fields[:, nnodes + 4:ntflag]).all(axis=1)
+    is_valid[np.where(is_valid)[0][~is_blanks]] = False
+    fields = fields[is_blanks, :]
+
+    eid, pid, is_positive = _get_eid_pid(fields, is_valid, pid_default_eid=True)
+    fields = fields[is_positive, :]
+    nids = _get_nids(fields, nnodes)
+    theta_mcid = to_integers_or_doubles(fields[:, nnodes + 2], 'thetaMcid', 0.0)
+    zoffset = to_doubles(fields[:, nnodes + 3], 'zOffset', 0.0)
+    tflag = to_integers(fields[:, ntflag], 'TFlag', 0)
+    thickness = np.column_stack([
+        to_doubles(fields[:, ntflag + 1 + inode], 'T%i' % (inode + 1), 1.0)
+        for inode in range(nnodes)])
+
+    comments = [comment for comment, is_validi in zip(comments, is_valid) if is_validi]
+    rows = zip(eid.tolist(), pid.tolist(), nids.tolist(), theta_mcid.tolist(),
+               zoffset.tolist(), tflag.tolist(), thickness.tolist(), comments)
+    if card_class.type == 'CTRIA3':
+        card_objs = [
+            card_class(eidi, pidi, nidsi, zoffseti, theta_mcidi, tflagi, *ti, comment=comment)
+            for eidi, pidi, nidsi, theta_mcidi, zoffseti, tflagi, ti, comment in rows]
+    else:
+        card_objs = [
+            card_class(eidi, pidi, nidsi, theta_mcidi, zoffseti, tflagi, *ti, comment=comment)
+            for eidi, pidi, nidsi, theta_mcidi, zoffseti, tflagi, ti, comment in rows]
+    return is_valid, card_objs
+
+
+def _build_solids(nnodes, card_class, fields, unused_comments):
+    """
+    Creates CTETRA4/CPENTA6/CHEXA8 cards; cards with mid-side nodes are
+    left to ``add_card``
+    """
+    fields, is_valid = _get_fields(fields, nnodes + 2)
+    eid, pid, is_positive = _get_eid_pid(fields, is_valid, pid_default_eid=False)
+    nids = _get_nids(fields[is_positive, :], nnodes)
+
+    # the comments are dropped the same as BDF._prepare_chexa
+    card_objs = [
+        card_class(data=[eidi, pidi] + nidsi)
+        for eidi, pidi, nidsi in zip(eid.tolist(), pid.tolist(), nids.tolist())]
+    return is_valid, card_objs
+
+
+def _build_rods(card_class, fields, comments):
+    """Creates CROD/CTUBE cards"""
+    fields, is_valid = _get_fields(fields, 4)
+    eid, pid, is_positive = _get_eid_pid(fields, is_valid, pid_default_eid=True)
+    nids = _get_nids(fields[is_positive, :], 2)
+
+    comments = [comment for comment, is_validi in zip(comments, is_valid) if is_validi]
+    card_objs = [
+        card_class(eidi, pidi, nidsi, comment=comment)
+        for eidi, pidi, nidsi, comment in zip(eid.tolist(), pid.tolist(), nids.tolist(),
+                                              comments)]
+    return is_valid, card_objs
+
+
+#: the cards that may be created in bulk
+#: BULK_CARDS[card_name] = (class_name, build_cards)
+#: build_cards(card_class, fields, comments) = (is_valid, card_objs)
+BULK_CARDS = {
+    'CQUAD4' : ('CQUAD4', lambda *args: _build_shells(4, *args)),
+    'CTRIA3' : ('CTRIA3', lambda *args: _build_shells(3, *args)),
+    'CTETRA' : ('CTETRA4', lambda *args: _build_solids(4, *args)),
+    'CPENTA' : ('CPENTA6', lambda *args: _build_solids(6, *args)),
+    'CHEXA' : ('CHEXA8', lambda *args: _build_solids(8, *args)),
+    'CROD' : ('CROD', _build_rods),
+    'CTUBE' : ('CTUBE', _build_rods),
+}
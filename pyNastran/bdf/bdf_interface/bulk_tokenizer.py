@@ -0,0 +1,405 @@
+"""
+Splits groups of bulk data lines into fields and converts the fields
+with numpy instead of going through ``to_fields``/``BDFCard`` one card
+at a time.  Defines:
+  - group_cards(cards)
+  - split_cards(cards, icards, card_format, nlines)
+  - split_fixed_width(lines, width, nfields)
+  - split_csv(lines, nfields)
+  - is_blank(svalues)
+  - to_integers(svalues, fieldname, default=None)
+  - to_doubles(svalues, fieldname, default=None)
+  - to_integers_or_doubles(svalues, fieldname, default=None)
+
+The conversions follow the rules in ``assign_type`` (e.g., a float
+field can't be an integer and ``1.0-5`` is ``1.0E-5``), but raise a
+SyntaxError for the whole column, so the caller can fall back to the
+card-by-card parser and get the standard error message.
+"""
+from __future__ import print_function, unicode_literals
+import re
+import numpy as np
+
+#: the integer/float fields that ``to_integers_or_doubles`` converts;
+#: anything else (e.g., ``1_0``, ``1D2``) is left to ``integer_or_double``
+INTEGER_PATTERN = re.compile(r'[+-]?[0-9]+$')
+FLOAT_PATTERN = re.compile(r'[+-]?([0-9]+\.[0-9]*|\.[0-9]+)([ED][+-]?[0-9]+|[+-][0-9]+)?$')
+
+
+def group_cards(cards):
+    """
+    Groups cards with the same format and number of lines, so their
+    fields can be split together
+
+    Parameters
+    ----------
+    cards : List[[comment, card_lines]]
+        the cards (as made by ``BDF.get_bdf_cards``)
+
+    Returns
+    -------
+    groups : dict[(card_format, nlines)] = List[int]
+        the indices of the cards in each group, where card_format is
+        'small', 'large' or 'csv'
+    icards_failed : List[int]
+        the indices of the cards that can't be split in bulk (e.g.,
+        tabs, duplication, csv continuations, mixed formats)
+    """
+    groups = {}
+    icards_failed = []
+    for icard, (unused_comment, card_lines) in enumerate(cards):
+        nlines = len(card_lines)
+        line = card_lines[0]
+        if nlines == 1:
+            lines = line
+        else:
+            lines = ''.join(card_lines)
+
+        if '\t' in lines or '=' in lines or '%' in lines:
+            icards_failed.append(icard)
+            continue
+        elif ',' in lines:
+            if nlines == 1 and '*' not in line and line.count(',') <= 8:
+                key = ('csv', 1)
+            else:
+                icards_failed.append(icard)
+                continue
+        elif '*' in line[:8]:
+            if all(['*' in linei[:8] for linei in card_lines[1:]]):
+                key = ('large', nlines)
+            else:
+                icards_failed.append(icard)
+                continue
+        elif nlines == 1 or not any(['*' in linei[:8] for linei in card_lines[1:]]):
+            key = ('small', nlines)
+        else:
+            icards_failed.append(icard)
+            continue
+
+        if key in groups:
+            groups[key].append(icard)
+        else:
+            groups[key] = [icard]
+    return groups, icards_failed
+
+
+def split_cards(cards, icards, card_format, nlines):
+    """
+    Splits a group of cards (see ``group_cards``) into fields
+
+    Parameters
+    ----------
+    cards : List[[comment, card_lines]]
+        the cards
+    icards : List[int]
+        the indices of the cards in the group
+    card_format : str
+        'small', 'large', 'csv'
+    nlines : int
+        the number of lines of the cards
+
+    Returns
+    -------
+    fields : (ncards, nfields) unicode ndarray
+        the unstripped fields after the card name, where nfields is
+        8 per small field line, 4 per large field line and 8 for csv
+    """
+    if card_format == 'csv':
+        return split_csv([cards[icard][1][0] for icard in icards], 8)
+
+    width, nfields = (8, 8) if card_format == 'small' else (16, 4)
+    return np.hstack([
+        split_fixed_width([cards[icard][1][iline] for icard in icards], width, nfields)
+        for iline in range(nlines)])
+
+
+def split_fixed_width(lines, width, nfields):
+    """
+    Splits small (width=8) or large (width=16) field lines into fields
+
+    Parameters
+    ----------
+    lines : List[str]
+        the lines to split; all lines are treated as having the same
+        format (e.g., the first line of a GRID card)
+    width : int
+        the field width (8/16)
+    nfields : int
+        the number of fields after the card name/continuation marker
+
+    Returns
+    -------
+    fields : (nlines, nfields) unicode ndarray
+        the unstripped fields
+    """
+    nchars = 8 + width * nfields
+    nlines = len(lines)
+    if nlines == 0:
+        return np.zeros((0, nfields), dtype='U%i' % width)
+    lines = np.array(lines, dtype='U%i' % nchars)
+    chars = lines.view('U1').reshape(nlines, nchars)
+    fields = np.ascontiguousarray(chars[:, 8:]).view('U%i' % width)
+    return fields.reshape(nlines, nfields)
+
+
+def split_csv(lines, nfields):
+    """
+    Splits comma separated lines into fields
+
+    Parameters
+    ----------
+    lines : List[str]
+        the lines to split
+    nfields : int
+        the number of fields after the card name/continuation marker;
+        extra fields are ignored and missing fields are blank
+
+    Returns
+    -------
+    fields : (nlines, nfields) unicode ndarray
+        the unstripped fields
+    """
+    rows = []
+    nfields1 = nfields + 1
+    blanks = [''] * nfields1
+    for line in lines:
+        sline = line.split(',', nfields1)[:nfields1]
+        if len(sline) < nfields1:
+            sline += blanks[len(sline):]
+        rows.append(sline[1:])
+    if not rows:
+        return np.zeros((0, nfields), dtype='U8')
+    return np.array(rows, dtype='unicode')
+
+
+def _strip_upper(svalues):
+    """strips and uppercases a field column"""
+    return np.char.upper(np.char.strip(svalues))
+
+
+def is_blank(svalues):
+    """finds the blank fields in a field column (or a 2D array of fields)"""
+    nchars = svalues.dtype.itemsize // 4
+    if nchars == 0:
+        return np.ones(svalues.shape, dtype='bool')
+    chars = np.ascontiguousarray(svalues).view('U1').reshape(svalues.shape + (nchars,))
+    return ((chars == ' ') | (chars == '')).all(axis=-1)
+
+
+def to_integers(svalues, fieldname, default=None):
+    """
+    Converts a column of integer fields
+
+    Parameters
+    ----------
+    svalues : (n, ) unicode ndarray
+        the fields
+    fieldname : str
+        the name of the field for error messages
+    default : int / None; default=None
+        the value for blank fields (None -> blanks aren't allowed)
+
+    Returns
+    -------
+    values : (n, ) int64 ndarray
+        the integers
+    """
+    values = _digits_to_integers(svalues)
+    if values is not None:
+        return values
+    try:
+        # int() ignores the padding
+        return svalues.astype('int64')
+    except ValueError:
+        pass
+    is_blank_value = is_blank(svalues)
+    if is_blank_value.any():
+        if default is None:
+            raise SyntaxError('%s must be an integer (not blank)' % fieldname)
+        values = np.full(len(svalues), default, dtype='int64')
+        inonblank = np.where(~is_blank_value)[0]
+        if len(inonblank):
+            values[inonblank] = _to_integers(np.char.strip(svalues[inonblank]), fieldname)
+        return values
+    return _to_integers(np.char.strip(svalues), fieldname)
+
+
+def _digits_to_integers(svalues):
+    """
+    Converts a column of padded, unsigned integer fields from the
+    character codes, which is much faster than parsing each string
+
+    Returns None if a field isn't a single run of digits.
+    """
+    nchars = svalues.dtype.itemsize // 4
+    if nchars == 0 or nchars > 18 or len(svalues) == 0:
+        return None
+    codes = np.ascontiguousarray(svalues).view('uint32').reshape(len(svalues), nchars)
+    is_digit = (codes >= 48) & (codes <= 57)
+    if not (is_digit | (codes == 32) | (codes == 0)).all():
+        return None
+
+    # Horner's rule over the character columns; a digit after the
+    # trailing blanks (e.g., '1 2') isn't an integer
+    values = np.zeros(len(svalues), dtype='int64')
+    is_started = np.zeros(len(svalues), dtype='bool')
+    is_ended = np.zeros(len(svalues), dtype='bool')
+    for ichar in range(nchars):
+        is_digiti = is_digit[:, ichar]
+        if (is_ended & is_digiti).any():
+            return None
+        is_ended |= is_started & ~is_digiti
+        is_started |= is_digiti
+        values = np.where(is_digiti, values * 10 + codes[:, ichar] - 48, values)
+    if not is_started.all():
+        return None
+    return values
+
+
+def _to_integers(svalues, fieldname):
+    """converts a column of non-blank integer fields"""
+    if (np.char.find(svalues, '.') >= 0).any():
+        raise SyntaxError('%s must be an integer (not a float)' % fieldname)
+    try:
+        return svalues.astype('int64')
+    except ValueError:
+        raise SyntaxError('%s must be an integer' % fieldname)
+
+
+def to_doubles(svalues, fieldname, default=None):
+    """
+    Converts a column of float fields, including the ``1.0-5``
+    (``1.0E-5``) and ``1.0D-5`` forms
+
+    Parameters
+    ----------
+    svalues : (n, ) unicode ndarray
+        the fields
+    fieldname : str
+        the name of the field for error messages
+    default : float / None; default=None
+        the value for blank fields (None -> blanks aren't allowed)
+
+    Returns
+    -------
+    values : (n, ) float64 ndarray
+        the floats
+    """
+    try:
+        # fast path; float() ignores the padding
+        values = svalues.astype('float64')
+    except ValueError:
+        pass
+    else:
+        # only whole numbers can be written as an integer
+        iwhole = np.where(values == np.floor(values))[0]
+        if len(iwhole) and np.char.isdigit(np.char.strip(svalues[iwhole])).any():
+            raise SyntaxError('%s must be a float (not an integer)' % fieldname)
+        return _check_finite(values, fieldname)
+
+    is_blank_value = is_blank(svalues)
+    if is_blank_value.any():
+        if default is None:
+            raise SyntaxError('%s must be a float (not blank)' % fieldname)
+        values = np.full(len(svalues), default, dtype='float64')
+        inonblank = np.where(~is_blank_value)[0]
+        if len(inonblank):
+            values[inonblank] = _to_doubles(_strip_upper(svalues[inonblank]), fieldname)
+        return values
+    return _to_doubles(_strip_upper(svalues), fieldname)
+
+
+def _to_doubles(svalues, fieldname):
+    """converts a column of stripped, uppercased, non-blank float fields"""
+    if len(svalues) == 0:
+        return np.zeros(0, dtype='float64')
+    if np.char.isdigit(svalues).any():
+        raise SyntaxError('%s must be a float (not an integer)' % fieldname)
+
+    try:
+        return _check_finite(svalues.astype('float64'), fieldname)
+    except ValueError:
+        pass
+
+    # 1.0D+3 -> 1.0E+3
+    svalues = np.char.replace(svalues, 'D', 'E')
+
+    # 1.0+3 -> 1.0E+3; the mantissa sign is split off first
+    is_negative = np.char.startswith(svalues, '-')
+    unsigned = np.char.lstrip(svalues, '+-')
+    is_implicit = (
+        (np.char.find(unsigned, 'E') < 0) &
+        ((np.char.find(unsigned, '+') > 0) | (np.char.find(unsigned, '-') > 0))
+    )
+    if is_implicit.any():
+        iimplicit = np.where(is_implicit)[0]
+        width = svalues.dtype.itemsize // 4 + 1
+        svalues = svalues.astype('U%i' % width)
+        exponent = unsigned[iimplicit]
+        exponent = np.char.replace(np.char.replace(exponent, '+', 'E+'), '-', 'E-')
+        sign = np.where(is_negative[iimplicit], '-', '')
+        svalues[iimplicit] = np.char.add(sign, exponent)
+    try:
+        values = svalues.astype('float64')
+    except ValueError:
+        raise SyntaxError('%s must be a float' % fieldname)
+    return _check_finite(values, fieldname)
+
+
+def _check_finite(values, fieldname):
+    """numpy accepts nan/inf, which ``double`` doesn't"""
+    if (~np.isfinite(values)).any():
+        raise SyntaxError('%s must be a finite float' % fieldname)
+    return values
+
+
+def to_integers_or_doubles(svalues, fieldname, default=None):
+    """
+    Converts a column of integer/float fields (e.g., the THETA/MCID
+    field of a CQUAD4)
+
+    Parameters
+    ----------
+    svalues : (n, ) unicode ndarray
+        the fields
+    fieldname : str
+        the name of the field for error messages
+    default : int / float / None; default=None
+        the value for blank fields (None -> blanks aren't allowed)
+
+    Returns
+    -------
+    values : (n, ) object ndarray
+        the ints/floats
+
+    Only the plain ``[+-]digits`` integers and ``[+-]digits.digits``
+    floats (with an optional E, D or implicit exponent) are converted;
+    the other forms raise a SyntaxError, so ``integer_or_double`` decides
+    what they are.
+    """
+    is_blank_value = is_blank(svalues)
+    if default is None and is_blank_value.any():
+        raise SyntaxError('%s must be an integer/float (not blank)' % fieldname)
+
+    values = np.full(len(svalues), default, dtype='object')
+    inonblank = np.where(~is_blank_value)[0]
+    if len(inonblank) == 0:
+        return values
+    svalues = _strip_upper(svalues[inonblank])
+
+    # the column usually has a few distinct values
+    svalues_unique, iunique = np.unique(svalues, return_inverse=True)
+    is_integer_unique = np.array(
+        [INTEGER_PATTERN.match(svalue) is not None for svalue in svalues_unique.tolist()],
+        dtype='bool')
+    for svalue in svalues_unique[~is_integer_unique].tolist():
+        if FLOAT_PATTERN.match(svalue) is None:
+            raise SyntaxError('%s = %r must be an integer/float' % (fieldname, svalue))
+    is_integer = is_integer_unique[iunique]
+    iinteger = inonblank[is_integer]
+    ifloat = inonblank[~is_integer]
+    if len(iinteger):
+        values[iinteger] = _to_integers(svalues[is_integer], fieldname).astype('object')
+    if len(ifloat):
+        values[ifloat] = _to_doubles(svalues[~is_integer], fieldname).astype('object')
+    return values
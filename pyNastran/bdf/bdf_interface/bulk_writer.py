@@ -0,0 +1,302 @@
+"""
+Writes the common cards in chunks, so the floats of a chunk are printed
+in bulk (see ``print_float_8_array``) instead of one field at a time.
+The cards are the same as ``card.write_card(size, is_double)``.  Defines:
+  - BULK_WRITERS
+  - CHUNK_SIZE
+  - iter_bulk_cards(id_cards, size, is_double)
+  - write_bulk_cards(cards, size, is_double)
+  - write_grids(nid, cp, xyz, cd, ps, seid, size, is_double)
+"""
+from __future__ import print_function, unicode_literals
+from collections import defaultdict
+from six import iteritems
+from six.moves import range
+
+import numpy as np
+
+from pyNastran.utils import integer_types
+from pyNastran.bdf.bdf_interface.card_registry import get_card_class
+from pyNastran.bdf.field_writer_8 import (
+    print_float_8_array, print_field_8, print_card_8, set_string8_blank_if_default)
+from pyNastran.bdf.field_writer_16 import (
+    print_float_16_array, print_field_16, print_card_16, set_string16_blank_if_default)
+from pyNastran.bdf.field_writer_double import print_scientific_double
+
+#: the number of cards that are written at once
+CHUNK_SIZE = 1000
+
+
+def iter_bulk_cards(id_cards, size=8, is_double=False, chunk_size=CHUNK_SIZE):
+    """
+    Writes the cards in chunks
+
+    Parameters
+    ----------
+    id_cards : List[(key, card)]
+        the cards in the order they're written
+    size : int; default=8
+        the size of the card (8/16)
+    is_double : bool; default=False
+        should this card be written with double precision
+    chunk_size : int; default=CHUNK_SIZE
+        the number of cards in a chunk
+
+    Yields
+    ------
+    chunk : List[(key, card, msg)]
+        the cards of the chunk, where msg is None for the cards that
+        should be written with ``card.write_card``
+    """
+    for i in range(0, len(id_cards), chunk_size):
+        chunk = id_cards[i:i + chunk_size]
+        msgs = write_bulk_cards([card for unused_key, card in chunk], size, is_double)
+        yield [(key, card, msg) for (key, card), msg in zip(chunk, msgs)]
+
+
+def write_bulk_cards(cards, size=8, is_double=False):
+    """
+    Writes the cards that have a bulk writer
+
+    Parameters
+    ----------
+    cards : List[BaseCard]
+        the cards to write
+    size : int; default=8
+        the size of the card (8/16)
+    is_double : bool; default=False
+        should this card be written with double precision
+
+    Returns
+    -------
+    msgs : List[str/None]
+        the cards as strings (in the order of ``cards``), where None is
+        used for the cards that should be written with ``card.write_card``
+    """
+    icards_by_class = defaultdict(list)
+    for icard, card in enumerate(cards):
+        icards_by_class[card.__class__].append(icard)
+
+    msgs = [None] * len(cards)
+    for card_class, icards in iteritems(icards_by_class):
+        class_name = card_class.__name__
+        if class_name not in BULK_WRITERS or card_class is not get_card_class(class_name):
+            continue
+        try:
+            card_msgs = BULK_WRITERS[class_name](
+                [cards[icard] for icard in icards], size, is_double)
+        except Exception:
+            # write_card reports the card that failed
+            continue
+        for icard, msg in zip(icards, card_msgs):
+            msgs[icard] = msg
+    return msgs
+
+
+def _print_float_array(values, size):
+    """prints the floats with print_float_8_array/print_float_16_array"""
+    if size == 8:
+        return print_float_8_array(values)
+    return print_float_16_array(values)
+
+
+def _print_fields(rows, size):
+    """
+    Prints rows of fields the same as ``print_field_8``/``print_field_16``
+    with the floats printed in bulk.  Nans are left to the scalar
+    function, which keeps them out of ``wipe_empty_fields_typed``.
+
+    Returns
+    -------
+    rows : List[List[str]]
+        the printed fields
+    """
+    print_field = print_field_8 if size == 8 else print_field_16
+    fields = [value for row in rows for value in row]
+    ifloats = [ifield for ifield, value in enumerate(fields)
+               if isinstance(value, float) and value == value]
+    floats = _print_float_array([fields[ifield] for ifield in ifloats], size)
+
+    strings = [None] * len(fields)
+    for ifield, string in zip(ifloats, floats):
+        strings[ifield] = string
+    strings = [print_field(value) if string is None else string
+               for value, string in zip(fields, strings)]
+
+    nfields = len(rows[0]) if rows else 0
+    return [strings[i:i + nfields] for i in range(0, len(strings), nfields)]
+
+
+def write_grids(nid, cp, xyz, cd, ps, seid, size=8, is_double=False):
+    """
+    Writes GRID cards in the same form as ``GRID.write_card``
+
+    Parameters
+    ----------
+    nid / cp / cd / seid : List[int]
+        the node ids, coordinate systems and superelement ids
+    xyz : (n, 3) float ndarray
+        the positions in the cp frames
+    ps : List[int/str]
+        the permanent single point constraints ('' for blank)
+    size : int; default=8
+        the size of the card (8/16)
+    is_double : bool; default=False
+        should this card be written with double precision
+
+    Returns
+    -------
+    msgs : List[str]
+        the cards (without comments)
+    """
+    xyz = np.asarray(xyz, dtype='float64').reshape(len(nid), 3)
+    if size == 16 and is_double:
+        xyzs = [print_scientific_double(value) for value in xyz.ravel().tolist()]
+    else:
+        xyzs = _print_float_array(xyz, size)
+
+    if size == 8:
+        return [_write_grid_8(*args) for args in zip(
+            nid, cp, xyzs[0::3], xyzs[1::3], xyzs[2::3], cd, ps, seid)]
+    return [_write_grid_16(*args) for args in zip(
+        nid, cp, xyzs[0::3], xyzs[1::3], xyzs[2::3], cd, ps, seid)]
+
+
+def _write_grid_8(nid, cp, x, y, z, cd, ps, seid):
+    """see ``GRID.write_card_8``"""
+    cps = set_string8_blank_if_default(cp, 0)
+    if [cd, ps, seid] == [0, '', 0]:
+        return 'GRID    %8i%8s%s%s%s\n' % (nid, cps, x, y, z)
+    cds = set_string8_blank_if_default(cd, 0)
+    seids = set_string8_blank_if_default(seid, 0)
+    return 'GRID    %8i%8s%s%s%s%s%8s%s\n' % (
+        nid, cps, x, y, z, cds, ps, seids)
+
+
+def _write_grid_16(nid, cp, x, y, z, cd, ps, seid):
+    """see ``GRID.write_card_16``"""
+    cps = set_string16_blank_if_default(cp, 0)
+    cds = set_string16_blank_if_default(cd, 0)
+    seids = set_string16_blank_if_default(seid, 0)
+    return ('GRID*   %16i%16s%16s%16s\n'
+            '*       %16s%16s%16s%16s\n' % (
+                nid, cps, x, y, z, cds, ps, seids))
+
+
+def _write_grid_cards(grids, size, is_double):
+    """Writes GRID objects; a GRID with a cross-referenced SEID is skipped"""
+    msgs = [None] * len(grids)
+    igrids = [igrid for igrid, grid in enumerate(grids)
+              if isinstance(grid.seid, integer_types)]
+    grids = [grids[igrid] for igrid in igrids]
+    grid_msgs = write_grids(
+        [grid.nid for grid in grids], [grid.Cp() for grid in grids],
+        [grid.xyz for grid in grids], [grid.Cd() for grid in grids],
+        [grid.ps for grid in grids], [grid.seid for grid in grids],
+        size, is_double)
+    for igrid, grid, msg in zip(igrids, grids, grid_msgs):
+        msgs[igrid] = grid.comment + msg
+    return msgs
+
+
+def _blank_if_default(values, defaults):
+    """
+    ``set_blank_if_default`` for the numeric fields of a card; a nan is
+    kept, but it's still printed as a blank field by ``print_field_8``
+    """
+    return [None if value == default else value
+            for value, default in zip(values, defaults)]
+
+
+_CQUAD4_DEFAULTS = [0.0, 0.0, 0, 1.0, 1.0, 1.0, 1.0]
+_CTRIA3_DEFAULTS = [0.0, 0.0, 0, 1.0, 1.0, 1.0]
+
+
+def _write_cquad4s(quads, unused_size, unused_is_double):
+    """see ``CQUAD4.write_card``"""
+    msgs = []
+    rows = []
+    iquads = []
+    for quad in quads:
+        data = [quad.eid, quad.Pid()] + quad.node_ids
+        row2_data = [quad.thetaMcid, quad.zOffset,
+                     quad.TFlag, quad.T1, quad.T2, quad.T3, quad.T4]
+        if row2_data == _CQUAD4_DEFAULTS:
+            msgs.append(quad.comment + 'CQUAD4  %8i%8i%8i%8i%8i%8i\n' % tuple(data))
+            continue
+        iquads.append(len(msgs))
+        msgs.append(data)
+        rows.append(_blank_if_default(row2_data, _CQUAD4_DEFAULTS))
+
+    for iquad, row2 in zip(iquads, _print_fields(rows, 8)):
+        msg = ('CQUAD4  %8i%8i%8i%8i%8i%8i%8s%8s\n'
+               '                %8s%8s%8s%8s%8s\n' % tuple(msgs[iquad] + row2))
+        msgs[iquad] = quads[iquad].comment + msg.rstrip() + '\n'
+    return msgs
+
+
+def _write_ctria3s(trias, unused_size, unused_is_double):
+    """see ``CTRIA3.write_card``"""
+    rows = [_blank_if_default([tria.thetaMcid, tria.zOffset,
+                               tria.TFlag, tria.T1, tria.T2, tria.T3], _CTRIA3_DEFAULTS)
+            for tria in trias]
+
+    msgs = []
+    for tria, row2 in zip(trias, _print_fields(rows, 8)):
+        data = [tria.eid, tria.Pid()] + tria.node_ids + row2
+        msg = ('CTRIA3  %8i%8i%8i%8i%8i%8s%8s\n'
+               '                %8s%8s%8s%8s\n' % tuple(data))
+        msgs.append(tria.comment + msg.rstrip() + '\n')
+    return msgs
+
+
+def _write_chexas(hexas, unused_size, unused_is_double):
+    """see ``CHEXA8.write_card``"""
+    return [hexa.comment + (
+        'CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
+        '        %8i%8i\n' % tuple([hexa.eid, hexa.Pid()] + hexa.node_ids))
+            for hexa in hexas]
+
+
+def _write_cbars(bars, size, unused_is_double):
+    """see ``CBAR.write_card``"""
+    rows = [bar.repr_fields()[1:] for bar in bars]
+    if size == 8:
+        return [bar.comment + print_card_8(['CBAR'] + row)
+                for bar, row in zip(bars, _print_fields(rows, 8))]
+    return [bar.comment + print_card_16(['CBAR'] + row)
+            for bar, row in zip(bars, _print_fields(rows, 16))]
+
+
+def _write_forces(forces, size, is_double):
+    """see ``FORCE.write_card``"""
+    if size == 16 and is_double:
+        return [None] * len(forces)
+
+    values = _print_float_array([[force.mag] + list(force.xyz) for force in forces], size)
+    msgs = []
+    for iforce, force in enumerate(forces):
+        mag, x, y, z = values[4 * iforce:4 * iforce + 4]
+        if size == 8:
+            cids = set_string8_blank_if_default(force.Cid(), 0)
+            msg = 'FORCE   %8i%8i%8s%8s%8s%8s%8s\n' % (
+                force.sid, force.node, cids, mag, x, y, z)
+        else:
+            cids = set_string16_blank_if_default(force.Cid(), 0)
+            msg = ('FORCE*  %16i%16i%16s%s\n'
+                   '*       %16s%16s%16s\n') % (
+                       force.sid, force.node, cids, mag, x, y, z)
+        msgs.append(force.comment + msg)
+    return msgs
+
+
+#: the cards that may be written in bulk
+#: BULK_WRITERS[class_name](cards, size, is_double) = msgs
+BULK_WRITERS = {
+    'GRID' : _write_grid_cards,
+    'CQUAD4' : _write_cquad4s,
+    'CTRIA3' : _write_ctria3s,
+    'CHEXA8' : _write_chexas,
+    'CBAR' : _write_cbars,
+    'FORCE' : _write_forces,
+}
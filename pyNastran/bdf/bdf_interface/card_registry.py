@@ -0,0 +1,125 @@
+"""
+Maps the card classes to the modules that define them, so a card module
+is imported the first time one of its cards is used instead of when
+``pyNastran.bdf.bdf`` is imported.  Defines:
+  - CARD_CLASS_MODULES
+  - get_card_class(class_name)
+"""
+from __future__ import print_function, unicode_literals
+import importlib
+
+#: the card classes that are defined by each module
+_CARD_CLASS_NAMES = [
+    ('pyNastran.bdf.cards.elements.elements', [
+        'CFAST', 'CGAP', 'CRAC2D', 'CRAC3D', 'PLOTEL']),
+    ('pyNastran.bdf.cards.properties.properties', [
+        'PFAST', 'PGAP', 'PLSOLID', 'PSOLID', 'PRAC2D', 'PRAC3D', 'PCONEAX', 'PIHEX']),
+    ('pyNastran.bdf.cards.elements.springs', ['CELAS1', 'CELAS2', 'CELAS3', 'CELAS4']),
+    ('pyNastran.bdf.cards.properties.springs', ['PELAS', 'PELAST']),
+    ('pyNastran.bdf.cards.elements.solid', [
+        'CTETRA4', 'CTETRA10', 'CPYRAM5', 'CPYRAM13', 'CPENTA6', 'CPENTA15', 'CHEXA8',
+        'CHEXA20', 'CIHEX1']),
+    ('pyNastran.bdf.cards.elements.rigid', [
+        'RBAR', 'RBAR1', 'RBE1', 'RBE2', 'RBE3', 'RROD']),
+    ('pyNastran.bdf.cards.elements.shell', [
+        'CQUAD', 'CQUAD4', 'CQUAD8', 'CQUADR', 'CQUADX', 'CSHEAR', 'CTRIA3', 'CTRIA6',
+        'CTRIAX', 'CTRIAX6', 'CTRIAR']),
+    ('pyNastran.bdf.cards.properties.shell', [
+        'PSHELL', 'PCOMP', 'PCOMPG', 'PSHEAR', 'PLPLANE']),
+    ('pyNastran.bdf.cards.elements.bush', ['CBUSH', 'CBUSH1D', 'CBUSH2D']),
+    ('pyNastran.bdf.cards.properties.bush', ['PBUSH', 'PBUSH1D', 'PBUSHT']),
+    ('pyNastran.bdf.cards.elements.damper', [
+        'CVISC', 'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5']),
+    ('pyNastran.bdf.cards.properties.damper', ['PVISC', 'PDAMP', 'PDAMP5', 'PDAMPT']),
+    ('pyNastran.bdf.cards.elements.rods', ['CROD', 'CONROD', 'CTUBE']),
+    ('pyNastran.bdf.cards.elements.bars', ['CBAR', 'CBEAM3', 'CBEND']),
+    ('pyNastran.bdf.cards.elements.beam', ['CBEAM']),
+    ('pyNastran.bdf.cards.properties.rods', ['PROD', 'PTUBE']),
+    ('pyNastran.bdf.cards.properties.bars', ['PBAR', 'PBARL']),
+    ('pyNastran.bdf.cards.properties.beam', ['PBEAM', 'PBEAML', 'PBCOMP']),
+    ('pyNastran.bdf.cards.elements.mass', [
+        'CONM1', 'CONM2', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4']),
+    ('pyNastran.bdf.cards.properties.mass', ['PMASS', 'NSM']),
+    ('pyNastran.bdf.cards.aero', [
+        'AECOMP', 'AEFACT', 'AELINK', 'AELIST', 'AEPARM', 'AESTAT', 'AESURF', 'AESURFS',
+        'AERO', 'AEROS', 'CSSCHD', 'CAERO1', 'CAERO2', 'CAERO3', 'CAERO4', 'CAERO5',
+        'PAERO1', 'PAERO2', 'PAERO3', 'PAERO5', 'MONPNT1', 'FLFACT', 'FLUTTER', 'GUST',
+        'MKAERO1', 'MKAERO2', 'SPLINE1', 'SPLINE2', 'SPLINE3', 'SPLINE4', 'SPLINE5',
+        'TRIM']),
+    ('pyNastran.bdf.cards.constraints', [
+        'SPC', 'SPCADD', 'SPCAX', 'SPC1', 'MPC', 'MPCADD', 'SUPORT1', 'SUPORT', 'SESUP',
+        'GMSPC']),
+    ('pyNastran.bdf.cards.coordinate_systems', [
+        'CORD1R', 'CORD1C', 'CORD1S', 'CORD2R', 'CORD2C', 'CORD2S', 'CORD3G', 'GMCORD']),
+    ('pyNastran.bdf.cards.dmig', ['DMIG', 'DMI', 'DMIJ', 'DMIK', 'DMIJI']),
+    ('pyNastran.bdf.cards.deqatn', ['DEQATN']),
+    ('pyNastran.bdf.cards.dynamic', [
+        'DELAY', 'DPHASE', 'FREQ', 'FREQ1', 'FREQ2', 'FREQ4', 'TSTEP', 'TSTEPNL',
+        'NLPARM', 'NLPCI', 'TF']),
+    ('pyNastran.bdf.cards.loads.loads', [
+        'LSEQ', 'SLOAD', 'DAREA', 'RANDPS', 'RFORCE', 'SPCD']),
+    ('pyNastran.bdf.cards.loads.dloads', ['DLOAD', 'TLOAD1', 'TLOAD2', 'RLOAD1', 'RLOAD2']),
+    ('pyNastran.bdf.cards.loads.static_loads', [
+        'LOAD', 'GRAV', 'ACCEL', 'ACCEL1', 'FORCE', 'FORCE1', 'FORCE2', 'MOMENT',
+        'MOMENT1', 'MOMENT2', 'PLOAD', 'PLOAD1', 'PLOAD2', 'PLOAD4', 'PLOADX1', 'GMLOAD']),
+    ('pyNastran.bdf.cards.materials', [
+        'MAT1', 'MAT2', 'MAT3', 'MAT4', 'MAT5', 'MAT8', 'MAT9', 'MAT10', 'MAT11',
+        'MATHP', 'CREEP', 'EQUIV']),
+    ('pyNastran.bdf.cards.material_deps', ['MATT1', 'MATT2', 'MATT4', 'MATT5', 'MATS1']),
+    ('pyNastran.bdf.cards.methods', ['EIGB', 'EIGC', 'EIGR', 'EIGP', 'EIGRL']),
+    ('pyNastran.bdf.cards.nodes', ['GRID', 'GRDSET', 'SPOINTs', 'EPOINTs']),
+    ('pyNastran.bdf.cards.optimization', [
+        'DCONADD', 'DCONSTR', 'DESVAR', 'DDVAL', 'DOPTPRM', 'DLINK', 'DRESP1', 'DRESP2',
+        'DRESP3', 'DVMREL1', 'DVPREL1', 'DVPREL2']),
+    ('pyNastran.bdf.cards.params', ['PARAM']),
+    ('pyNastran.bdf.cards.bdf_sets', [
+        'ASET', 'BSET', 'CSET', 'QSET', 'USET', 'ASET1', 'BSET1', 'CSET1', 'QSET1',
+        'USET1', 'SET1', 'SET3', 'RADSET', 'SEBSET', 'SECSET', 'SEQSET', 'SEBSET1',
+        'SECSET1', 'SEQSET1', 'SESET', 'SEQSEP']),
+    ('pyNastran.bdf.cards.thermal.loads', [
+        'QBDY1', 'QBDY2', 'QBDY3', 'QHBDY', 'TEMP', 'TEMPD', 'QVOL']),
+    ('pyNastran.bdf.cards.thermal.thermal', [
+        'CHBDYE', 'CHBDYG', 'CHBDYP', 'PCONV', 'PCONVM', 'PHBDY', 'CONV', 'RADM',
+        'RADBC']),
+    ('pyNastran.bdf.cards.bdf_tables', [
+        'TABLED1', 'TABLED2', 'TABLED3', 'TABLED4', 'TABLEM1', 'TABLEM2', 'TABLEM3',
+        'TABLEM4', 'TABLES1', 'TABDMP1', 'TABLEST', 'TABRND1', 'TABRNDG', 'TIC',
+        'DTABLE']),
+    ('pyNastran.bdf.cards.contact', [
+        'BCRPARA', 'BCTADD', 'BCTSET', 'BSURF', 'BSURFS', 'BCTPARA']),
+]
+
+#: the module that defines each card class
+#: CARD_CLASS_MODULES[class_name] = module_name
+CARD_CLASS_MODULES = {
+    class_name : module_name
+    for module_name, class_names in _CARD_CLASS_NAMES
+    for class_name in class_names}
+
+#: the card classes that have been imported
+_CARD_CLASSES = {}
+
+
+def get_card_class(class_name):
+    """
+    Gets a card class, which imports its module on the first call
+
+    Parameters
+    ----------
+    class_name : str
+        the name of the class (a key in ``CARD_CLASS_MODULES``), which
+        isn't always the card name (e.g., 'CHEXA8' for a CHEXA)
+
+    Returns
+    -------
+    card_class : BaseCard
+        the card class
+    """
+    try:
+        return _CARD_CLASSES[class_name]
+    except KeyError:
+        pass
+    module = importlib.import_module(CARD_CLASS_MODULES[class_name])
+    card_class = getattr(module, class_name)
+    _CARD_CLASSES[class_name] = card_class
+    return card_class
@@ -0,0 +1,199 @@
+"""
+Defines CoordTransforms, which transforms groups of points between
+coordinate systems with a few array operations instead of calling
+``Coord.transform_node_to_global`` one node at a time.
+
+The CORD2x chains are resolved once in dependency order (a CORD2x is
+defined in its RID, so the RID is resolved first) and the beta/origin
+of every coordinate system is stored, so the transforms can be reused
+until the coordinate cards change (see ``is_stale``).
+"""
+from __future__ import print_function, unicode_literals
+from six import iteritems
+
+import numpy as np
+
+from pyNastran.bdf.cards.coordinate_systems import RectangularCoord
+
+CORD2_TYPES = ('CORD2R', 'CORD2C', 'CORD2S')
+
+
+class CoordTransforms(object):
+    r"""
+    Stores the resolved beta/origin of the coordinate systems in a model
+
+    .. math:: p_{global} = (p_{coord})[\beta] + p_{origin}
+    """
+    def __init__(self, coords):
+        """
+        Resolves the coordinate systems
+
+        Parameters
+        ----------
+        coords : Dict[int] = Coord
+            the coordinate systems (e.g., ``model.coords``)
+        """
+        self.key = self.get_key(coords)
+
+        #: cid -> (3, 3) ndarray
+        self.betas = {0 : np.eye(3, dtype='float64')}
+        #: cid -> (3, ) ndarray
+        self.origins = {0 : np.zeros(3, dtype='float64')}
+        #: cid -> RectangularCoord/CylindricalCoord/SphericalCoord
+        self.coord_types = {0 : RectangularCoord}
+        #: cid -> error message for systems that can't be resolved
+        self.errors = {}
+
+        for cid in self._get_resolution_order(coords):
+            self._resolve(coords, cid)
+
+    @staticmethod
+    def get_key(coords):
+        """
+        Gets the values that define the coordinate systems, so a change
+        in any of the CORDxx cards can be detected
+        """
+        key = []
+        for cid, coord in sorted(iteritems(coords)):
+            if coord.type in CORD2_TYPES:
+                values = (coord.Rid(), np.hstack([coord.e1, coord.e2, coord.e3]).tobytes())
+            elif coord.i is not None:
+                values = (np.hstack([coord.origin, coord.i, coord.j, coord.k]).tobytes(), )
+            else:
+                values = ()
+            key.append((cid, id(coord), coord.type) + values)
+        return tuple(key)
+
+    def is_stale(self, coords):
+        """has a coordinate system changed since the transforms were made?"""
+        return self.key != self.get_key(coords)
+
+    @staticmethod
+    def _get_resolution_order(coords):
+        """
+        Sorts the coordinate systems, so the RID of a CORD2x is before it
+        """
+        order = []
+        is_visited = set([0])
+        for cid0 in sorted(coords):
+            chain = []
+            cid = cid0
+            while cid not in is_visited:
+                if cid in chain:
+                    raise RuntimeError('cyclic coordinate system reference; cids=%s' % (
+                        chain + [cid]))
+                chain.append(cid)
+                coord = coords.get(cid)
+                if coord is None or coord.type not in CORD2_TYPES:
+                    break
+                cid = coord.Rid()
+            for cid in reversed(chain):
+                if cid not in is_visited:
+                    order.append(cid)
+                    is_visited.add(cid)
+        return order
+
+    def _resolve(self, coords, cid):
+        """gets the beta/origin for a coordinate system"""
+        coord = coords.get(cid)
+        if coord is None:
+            self.errors[cid] = 'cid=%s does not exist' % cid
+            return
+
+        if coord.type in CORD2_TYPES:
+            rid = coord.Rid()
+            if rid in self.errors:
+                self.errors[cid] = 'rid=%s for cid=%s is invalid; %s' % (
+                    rid, cid, self.errors[rid])
+                return
+            e123 = self._to_global(np.vstack([coord.e1, coord.e2, coord.e3]), rid)
+            e1, e2, e3 = e123
+            k = e2 - e1
+            j = np.cross(k, e3 - e1)
+            normk = np.linalg.norm(k)
+            normj = np.linalg.norm(j)
+            if not (normk > 0. and normj > 0.):
+                self.errors[cid] = 'cid=%s has colinear points; e1=%s e2=%s e3=%s' % (
+                    cid, e1, e2, e3)
+                return
+            k /= normk
+            j /= normj
+            beta = np.vstack([np.cross(j, k), j, k])
+            origin = e1
+        elif coord.i is not None:
+            # CORD1x systems are defined by nodes and are set up during
+            # cross referencing
+            beta = coord.beta()
+            origin = coord.origin
+        else:
+            self.errors[cid] = '%s cid=%s has not been cross referenced' % (
+                coord.type, cid)
+            return
+
+        self.betas[cid] = beta
+        self.origins[cid] = np.asarray(origin, dtype='float64')
+        self.coord_types[cid] = type(coord)
+
+    def _get(self, cid):
+        """gets the beta, origin, and coordinate type"""
+        try:
+            return self.betas[cid], self.origins[cid], self.coord_types[cid]
+        except KeyError:
+            msg = self.errors.get(cid, 'cid=%s does not exist' % cid)
+            raise RuntimeError('cannot transform points; %s' % msg)
+
+    def _to_global(self, xyz, cid):
+        """transforms points in a single coordinate system to the global frame"""
+        beta, origin, coord_type = self._get(cid)
+        if cid == 0:
+            return xyz
+        return np.dot(coord_type.coord_to_xyz_array(xyz), beta) + origin
+
+    def transform_to_global(self, xyz, cp):
+        """
+        Transforms points in their local coordinate systems to the
+        global frame
+
+        Parameters
+        ----------
+        xyz : (n, 3) float ndarray
+            the points in the local frames (e.g., GRID x1, x2, x3)
+        cp : (n, ) int ndarray
+            the coordinate system of each point
+
+        Returns
+        -------
+        xyz_cid0 : (n, 3) float ndarray
+            the points in the global frame
+        """
+        xyz = np.asarray(xyz, dtype='float64').reshape(len(cp), 3)
+        cp = np.asarray(cp)
+        xyz_cid0 = xyz.copy()
+        for cid in np.unique(cp).tolist():
+            if cid == 0:
+                continue
+            i = np.where(cp == cid)[0]
+            xyz_cid0[i, :] = self._to_global(xyz[i, :], cid)
+        return xyz_cid0
+
+    def transform_to_local(self, xyz_cid0, cid):
+        """
+        Transforms points in the global frame to a coordinate system
+
+        Parameters
+        ----------
+        xyz_cid0 : (n, 3) float ndarray
+            the points in the global frame
+        cid : int
+            the coordinate system to transform the points to
+
+        Returns
+        -------
+        xyz : (n, 3) float ndarray
+            the points in the local frame (e.g., R, theta, z for a
+            cylindrical system)
+        """
+        beta, origin, coord_type = self._get(cid)
+        if cid == 0:
+            return xyz_cid0
+        return coord_type.xyz_to_coord_array(np.dot(xyz_cid0 - origin, beta.T))
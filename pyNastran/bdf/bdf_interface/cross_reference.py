@@ -108,30 +108,35 @@ class XrefMesh(BDFAttributes):
 
         .. warning:: not fully implemented
         """
-        self._cross_reference_nodes()
-        self._cross_reference_coordinates()
-
-        if xref_elements:
-            self._safe_cross_reference_elements()
-        if xref_properties:
-            self._cross_reference_properties()
-        if xref_masses:
-            self._cross_reference_masses()
-        if xref_materials:
-            self._cross_reference_materials()
-
-        if xref_aero:
-            self._cross_reference_aero()
-        if xref_constraints:
-            self._cross_reference_constraints()
-        if xref_loads:
-            self._safe_cross_reference_loads(debug=debug)
-        if xref_sets:
-            self._cross_reference_sets()
-        if xref_optimization:
-            self._cross_reference_optimization()
-        if xref_nodes_with_elements:
-            self._cross_reference_nodes_with_elements()
+        # the elements reference the vectorized GRIDs without creating them
+        self._set_grid_refs(True)
+        try:
+            self._cross_reference_nodes()
+            self._cross_reference_coordinates()
+
+            if xref_elements:
+                self._safe_cross_reference_elements()
+            if xref_properties:
+                self._cross_reference_properties()
+            if xref_masses:
+                self._cross_reference_masses()
+            if xref_materials:
+                self._cross_reference_materials()
+
+            if xref_aero:
+                self._cross_reference_aero()
+            if xref_constraints:
+                self._cross_reference_constraints()
+            if xref_loads:
+                self._safe_cross_reference_loads(debug=debug)
+            if xref_sets:
+                self._cross_reference_sets()
+            if xref_optimization:
+                self._cross_reference_optimization()
+            if xref_nodes_with_elements:
+                self._cross_reference_nodes_with_elements()
+        finally:
+            self._set_grid_refs(False)
 
 
     def _safe_cross_reference_elements(self):
@@ -174,6 +179,8 @@ class XrefMesh(BDFAttributes):
         """cross references the GRID objects"""
         for node in itervalues(self.nodes):
             node.uncross_reference()
+        if self.grid_array is not None:
+            self.grid_array.uncross_reference()
 
     def _uncross_reference_coords(self):
         """cross references the CORDx objects"""
@@ -525,30 +532,34 @@ class XrefMesh(BDFAttributes):
         """
         if xref:
             self.log.debug("Cross Referencing...")
-            self._cross_reference_nodes()
-            self._cross_reference_coordinates()
-
-            if xref_elements:
-                self._cross_reference_elements()
-            if xref_properties:
-                self._cross_reference_properties()
-            if xref_masses:
-                self._cross_reference_masses()
-            if xref_materials:
-                self._cross_reference_materials()
-
-            if xref_aero:
-                self._cross_reference_aero()
-            if xref_constraints:
-                self._cross_reference_constraints()
-            if xref_loads:
-                self._cross_reference_loads()
-            if xref_sets:
-                self._cross_reference_sets()
-            if xref_optimization:
-                self._cross_reference_optimization()
-            if xref_nodes_with_elements:
-                self._cross_reference_nodes_with_elements()
+            self._set_grid_refs(True)
+            try:
+                self._cross_reference_nodes()
+                self._cross_reference_coordinates()
+
+                if xref_elements:
+                    self._cross_reference_elements()
+                if xref_properties:
+                    self._cross_reference_properties()
+                if xref_masses:
+                    self._cross_reference_masses()
+                if xref_materials:
+                    self._cross_reference_materials()
+
+                if xref_aero:
+                    self._cross_reference_aero()
+                if xref_constraints:
+                    self._cross_reference_constraints()
+                if xref_loads:
+                    self._cross_reference_loads()
+                if xref_sets:
+                    self._cross_reference_sets()
+                if xref_optimization:
+                    self._cross_reference_optimization()
+                if xref_nodes_with_elements:
+                    self._cross_reference_nodes_with_elements()
+            finally:
+                self._set_grid_refs(False)
             #self.case_control_deck.cross_reference(self)
 
     def _cross_reference_constraints(self):
@@ -662,6 +673,8 @@ class XrefMesh(BDFAttributes):
             except:
                 self.log.error("Couldn't cross reference GRID.\n%s" % (str(n)))
                 raise
+        if self.grid_array is not None:
+            self.grid_array.cross_reference(self, gridSet)
 
         if self.spoints:
             self.spointi = self.spoints.create_spointi()
@@ -706,6 +719,14 @@ class XrefMesh(BDFAttributes):
                 if self._ixref_errors > self._nxref_errors:
                     self.pop_xref_errors()
 
+    def _set_grid_refs(self, use_refs):
+        """
+        Sets whether ``Node`` returns references to the nodes in
+        ``grid_array`` instead of creating their GRID objects
+        """
+        if self.grid_array is not None:
+            self.grid_array.use_refs = use_refs
+
     def _cross_reference_nodes_with_elements(self):
         """
         Links the nodes to all connected elements
@@ -724,6 +745,8 @@ class XrefMesh(BDFAttributes):
                         raise
         for node in itervalues(self.nodes):
             node.elements = nodes[node.nid]
+        if self.grid_array is not None:
+            self.grid_array.set_node_elements(nodes)
 
     def _cross_reference_masses(self):
         """
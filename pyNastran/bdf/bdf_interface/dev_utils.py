@@ -8,9 +8,12 @@ from math import ceil
 from collections import defaultdict
 
 from numpy import (array, unique, where, arange, hstack, searchsorted,
-                   setdiff1d, intersect1d, asarray)
+                   setdiff1d, intersect1d, asarray, ones, full, minimum, maximum, in1d)
 from numpy.linalg import norm
 import scipy
+from scipy.spatial import cKDTree
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 from pyNastran.utils import integer_types
 from pyNastran.bdf.bdf import BDF
@@ -84,7 +87,7 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
                           node_set=None,
                           size=8, is_double=False,
                           remove_collapsed_elements=False, avoid_collapsed_elements=False,
-                          crash_on_collapse=False, debug=True):
+                          crash_on_collapse=False, debug=True, num_threads=1):
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -116,14 +119,16 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
            True: rereads the BDF which catches doubled nodes (temporary);
                  in the future collapse=True won't need to double read;
                  an alternative is to do Patran's method of avoiding collapse)
-    remove_collapsed_elements : bool; default=False (unsupported)
-        True  : 1D/2D/3D elements will not be collapsed;
+    remove_collapsed_elements : bool; default=False
+        True  : 1D/2D/3D elements that are collapsed are removed;
                 CELASx/CDAMP/MPC/etc. are not considered
         False : no elements will be removed
-    avoid_collapsed_elements : bool; default=False (unsupported)
+    avoid_collapsed_elements : bool; default=False
         True  : only collapses that don't break 1D/2D/3D elements will be considered;
                 CELASx/CDAMP/MPC/etc. are considered
         False : element can be collapsed
+    num_threads : int; default=1
+        the number of threads used to query the kdtree (-1 uses all the CPUs)
 
     Returns
     -------
@@ -131,26 +136,10 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
         The BDF model corresponding to bdf_filename_out
 
     .. warning:: I doubt SPOINTs/EPOINTs work correctly
-    .. warning:: xref not fully implemented (assumes cid=0)
-
-    .. todo:: node_set stil does work on the all the nodes in the big
-               kdtree loop, which is very inefficient
-    .. todo:: remove_collapsed_elements is not supported
-    .. todo:: avoid_collapsed_elements is not supported
     """
     assert isinstance(tol, float), tol
-    if node_set is not None:
-
-        if renumber_nodes:
-            raise NotImplementedError('node_set is not None & renumber_nodes=True')
-
-        #print(type(node_set))
-        #print('*node_set', node_set)
-        assert len(node_set) > 0, node_set
-        if isinstance(node_set, set):
-            node_set = asarray(list(node_set), dtype='int32')
-        else:
-            node_set = asarray(node_set, dtype='int32')
+    if node_set is not None and renumber_nodes:
+        raise NotImplementedError('node_set is not None & renumber_nodes=True')
 
     if isinstance(bdf_filename, string_types):
         xref = True
@@ -160,191 +149,288 @@ def bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
         model = bdf_filename
         model.cross_reference(xref=xref)
 
-    coord_ids = model.coord_ids
-    needs_get_position = True if coord_ids == [0] else False
+    nid_map = get_equivalence_nid_map(
+        model, tol, neq_max=neq_max, node_set=node_set,
+        avoid_collapsed_elements=avoid_collapsed_elements, num_threads=num_threads)
+
+    for nid2, nid1 in sorted(iteritems(nid_map)):
+        node1 = model.Node(nid1)
+        node2 = model.Node(nid2)
+        node2.nid = node1.nid
+        node2.xyz = node1.xyz
+        node2.cp = node1.cp
+        assert node2.cd == node1.cd
+        assert node2.ps == node1.ps
+        assert node2.seid == node1.seid
+        del model.nodes[nid2]
+
+    if remove_collapsed_elements and nid_map:
+        eids_collapsed = _get_collapsed_elements(model, nid_map, _COLLAPSE_ELEMENT_TYPES)
+        for eid in eids_collapsed:
+            del model.elements[eid]
+        model.log.info('removed %s collapsed elements' % len(eids_collapsed))
 
-    # quads / tris
-    nids_quads = []
-    eids_quads = []
-    nids_tris = []
-    eids_tris = []
+    if bdf_filename_out is not None:
+        model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
+    if crash_on_collapse:
+        # lazy way to make sure there aren't any collapsed nodes
+        model2 = BDF(debug=debug)
+        model2.read_bdf(bdf_filename_out)
+    return model
 
-    # map the node ids to the slot in the nids array
-    renumber_nodes = False
 
-    inode = 0
-    nid_map = {}
+#: the 1D/2D/3D elements that are removed by remove_collapsed_elements
+_COLLAPSE_ELEMENT_TYPES = set([
+    'CROD', 'CONROD', 'CTUBE', 'CBAR', 'CBEAM', 'CBEND',
+    'CTRIA3', 'CTRIA6', 'CTRIAR', 'CQUAD4', 'CQUAD8', 'CQUADR', 'CQUAD', 'CSHEAR',
+    'CTRIAX', 'CTRIAX6', 'CQUADX',
+    'CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM',
+])
+
+
+def get_equivalence_nid_map(model, tol, neq_max=4, node_set=None,
+                            avoid_collapsed_elements=False, num_threads=1):
+    """
+    Finds the nodes that should be equivalenced; the lower node id is kept
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    tol : float
+        the spherical tolerance
+    neq_max : int; default=4
+        the number of "close" points to check for each node
+    node_set : List[int] / Set[int] / (n, ) ndarray; default=None -> all
+        the nodes to consider; only nodes in the set are equivalenced
+    avoid_collapsed_elements : bool; default=False
+        True  : collapses that would put 2 nodes of an element at the
+                same node are skipped (the closest nodes are merged first)
+        False : element can be collapsed
+    num_threads : int; default=1
+        the number of threads used to query the kdtree (-1 uses all the CPUs)
+
+    Returns
+    -------
+    nid_map : Dict[int] = int
+        the old node id -> new node id for the nodes that are equivalenced
+    """
+    nids, nodes_xyz = model.get_node_positions()
     if node_set is not None:
-        if PY2:
-            all_nids = array(model.nodes.keys(), dtype='int32')
-        else:
-            all_nids = array(list(model.nodes.keys()), dtype='int32')
+        assert len(node_set) > 0, node_set
+        if isinstance(node_set, set):
+            node_set = asarray(list(node_set), dtype='int32')
+        node_set = unique(asarray(node_set, dtype='int32'))
 
         # B - A
         # these are all the nodes that are requested from node_set that are missing
         #   thus len(diff_nodes) == 0
-        diff_nodes = setdiff1d(node_set, all_nids)
+        diff_nodes = setdiff1d(node_set, nids)
         assert len(diff_nodes) == 0, 'The following nodes cannot be found, but are included in the reduced set; nids=%s' % diff_nodes
 
-        # A & B
-        # the nodes to analyze are the union of all the nodes and the desired set
-        # which is basically the same as:
-        #   nids = unique(node_set)
-        nids = intersect1d(all_nids, node_set, assume_unique=True)  # the new values
+        # only the requested nodes go in the kdtree
+        inode = searchsorted(nids, node_set)
+        nids = nids[inode]
+        nodes_xyz = nodes_xyz[inode, :]
 
-        if renumber_nodes:
-            raise NotImplementedError('node_set is not None & renumber_nodes=True')
-        else:
-            for nid in all_nids:
-                nid_map[inode] = nid
-                inode += 1
-        #nids = array([node.nid for nid, node in sorted(iteritems(model.nodes)) if nid in node_set], dtype='int32')
+    if len(nids) < 2:
+        return {}
+    inid1, inid2, distance = _eq_nodes_find_pairs(nodes_xyz, tol, neq_max, num_threads)
+    if len(inid1) == 0:
+        return {}
 
-    else:
-        if renumber_nodes:
-            for nid, node in sorted(iteritems(model.nodes)):
-                node.nid = inode + 1
-                nid_map[inode] = nid
-                inode += 1
-            nnodes = len(model.nodes)
-            nids = arange(1, inode + 1, dtype='int32')
-            assert nids[-1] == nnodes
-        else:
-            for nid, node in sorted(iteritems(model.nodes)):
-                nid_map[inode] = nid
-                inode += 1
-            nids = array([node.nid for nid, node in sorted(iteritems(model.nodes))], dtype='int32')
-        all_nids = nids
-
-    if needs_get_position:
-        nodes_xyz = array([model.nodes[nid].get_position()
-                           for nid in nids], dtype='float32')
-    else:
-        nodes_xyz = array([model.nodes[nid].xyz
-                           for nid in nids], dtype='float32')
+    # the node groups are the connected components of the pairs; nids
+    # is sorted, so the first node in a group has the lowest id
+    nnodes = len(nids)
+    graph = coo_matrix((ones(len(inid1), dtype='int8'), (inid1, inid2)),
+                       shape=(nnodes, nnodes))
+    ncomponents, icomponent = connected_components(graph, directed=False)
+    iroot = full(ncomponents, nnodes, dtype=icomponent.dtype)
+    minimum.at(iroot, icomponent, arange(nnodes))
+    inid_new = iroot[icomponent]
 
-    if node_set is not None:
-        assert nodes_xyz.shape[0] == len(nids)
-
-    if 0:
-        # I forget entirely what this block of code is for, but my general
-        # recollection was that it checked that all the nodes that were
-        # referenced were included in the nids list.  I'd rather break that
-        # check in order to support nodes_set.
-        #
-        # It's also possible that it's here, so you only consider nodes that
-        # are associated...
-
-        # there is some set of points that are used on the elements that
-        # will be considered.
-        #
-        # Presumably this is enough to capture all the node ids and NOT
-        # spoints, but I doubt it...
-        spoint_epoint_nid_set = set([])
-        for eid, element in sorted(iteritems(model.elements)):
-            spoint_epoint_nid_set.update(element.node_ids)
-        for eid, element in sorted(iteritems(model.masses)):
-            spoint_epoint_nid_set.update(element.node_ids)
-
-        if model.spoints and model.epoints:
-            nids_new = spoint_epoint_nid_set - model.spoints.points - model.epoints.points
-        elif model.spoints:
-            nids_new = spoint_epoint_nid_set - model.spoints.points
-        elif model.epoints:
-            nids_new = spoint_epoint_nid_set - model.epoints.points
-        else:
-            nids_new = spoint_epoint_nid_set
+    if avoid_collapsed_elements:
+        inid_new = _eq_nodes_avoid_collapse(
+            model, nids, inid1, inid2, distance, icomponent, inid_new)
 
-        if None in nids_new:
-            nids_new.remove(None)
+    imerged = where(inid_new != arange(nnodes))[0]
+    return dict(zip(nids[imerged].tolist(), nids[inid_new[imerged]].tolist()))
 
-        # autosorts the data
-        nids_new = unique(list(nids_new))
-        assert isinstance(nids_new[0], integer_types), type(nids_new[0])
 
-        missing_nids = list(set(nids_new) - set(all_nids))
-        if missing_nids:
-            missing_nids.sort()
-            msg = 'There are missing nodes...\n'  # TODO: in what???
-            msg = 'missing nids=%s' % str(missing_nids)
-            raise RuntimeError(msg)
+def _eq_nodes_find_pairs(nodes_xyz, tol, neq_max, num_threads):
+    """
+    Finds the pairs of nodes that are within tol
 
-        # get the node_id mapping for the kdtree
-        inew = searchsorted(nids, nids_new, side='left')
-        # print('nids_new =', nids_new)
+    Returns
+    -------
+    inid1, inid2 : (npairs, ) int ndarray
+        the unique pairs of node indices (inid1 < inid2)
+    distance : (npairs, ) float ndarray
+        the distance between the nodes
+    """
+    nnodes = nodes_xyz.shape[0]
+    kdt = cKDTree(nodes_xyz)
+
+    # check the closest neq_max nodes for equality
+    if num_threads == 1:
+        deq, ieq = kdt.query(nodes_xyz, k=neq_max, distance_upper_bound=tol)
     else:
-        inew = slice(None)
-    #assert np.array_equal(nids[inew], nids_new), 'some nodes are not defined'
-
-    # build the kdtree
-    try:
-        kdt = scipy.spatial.cKDTree(nodes_xyz)
-    except RuntimeError:
-        print(nodes_xyz)
-        raise RuntimeError(nodes_xyz)
-
-    # check the closest 10 nodes for equality
-    deq, ieq = kdt.query(nodes_xyz[inew, :], k=neq_max, distance_upper_bound=tol)
-    if node_set is not None:
-        assert len(deq) == len(nids)
-    nnodes = len(nids)
+        try:
+            deq, ieq = kdt.query(nodes_xyz, k=neq_max, distance_upper_bound=tol,
+                                 workers=num_threads)
+        except TypeError:
+            # scipy < 1.6
+            deq, ieq = kdt.query(nodes_xyz, k=neq_max, distance_upper_bound=tol,
+                                 n_jobs=num_threads)
+    deq = deq.reshape(nnodes, -1)
+    ieq = ieq.reshape(nnodes, -1)
+
+    irows, icols = where((ieq < nnodes) & (deq <= tol))
+    inid_a = irows
+    inid_b = ieq[irows, icols]
+
+    # the neighbors aren't symmetric when more than neq_max nodes are
+    # close, so sort the pairs and get the unique ones
+    inid1 = minimum(inid_a, inid_b).astype('int64')
+    inid2 = maximum(inid_a, inid_b).astype('int64')
+    keys = unique((inid1 * nnodes + inid2)[inid1 != inid2])
+    inid1 = keys // nnodes
+    inid2 = keys % nnodes
+    distance = norm(nodes_xyz[inid1, :] - nodes_xyz[inid2, :], axis=1)
+    return inid1, inid2, distance
+
+
+def _get_element_node_arrays(model, element_types=None):
+    """
+    Gets the node ids of the elements grouped by the number of nodes
 
-    # get the ids of the duplicate nodes
-    slots = where(ieq[:, :] < nnodes)
-    irows, icols = slots
-    #replacer = unique(ieq[slots])  ## TODO: turn this back on?
-
-    skip_nodes = []
-    for (irow, icol) in zip(irows, icols):
-        inid2 = ieq[irow, icol]
-        nid1 = nids[irow]
-        nid2 = nids[inid2]
-        if nid1 == nid2:
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    element_types : Set[str]; default=None -> all
+        the element types to consider
+
+    Returns
+    -------
+    element_nodes : List[(eids, node_ids)]
+        eids : (nelements, ) int ndarray
+            the element ids
+        node_ids : (nelements, nnodes) int ndarray
+            the node ids; blank nodes are 0
+    """
+    eids_by_nnodes = defaultdict(list)
+    nids_by_nnodes = defaultdict(list)
+    for eid, element in iteritems(model.elements):
+        if element_types is not None and element.type not in element_types:
             continue
-        if node_set is not None:
-            if nid1 not in node_set and nid2 not in node_set:
-                continue
-        node1 = model.nodes[nid1]
-        node2 = model.nodes[nid2]
-
-        # TODO: doesn't use get position...
-        distance = norm(node1.xyz - node2.xyz)
-
-        #print('  irow=%s->n1=%s icol=%s->n2=%s' % (irow, nid1, icol, nid2))
-        if distance > tol:
-            #print('  *n1=%-4s xyz=%s\n  *n2=%-4s xyz=%s\n  *distance=%s\n' % (
-            #    nid1, list_print(node1.xyz),
-            #    nid2, list_print(node2.xyz),
-            #    distance))
+        node_ids = [nid if nid is not None else 0 for nid in element.node_ids]
+        nnodes = len(node_ids)
+        if nnodes < 2:
             continue
+        eids_by_nnodes[nnodes].append(eid)
+        nids_by_nnodes[nnodes].append(node_ids)
 
-        if node_set is not None:
-            assert nid1 in node_set, 'nid1=%s node_set=%s' % (nid1, node_set)
-            assert nid2 in node_set, 'nid2=%s node_set=%s' % (nid2, node_set)
-            #print('  n1=%-4s xyz=%s\n  n2=%-4s xyz=%s\n  distance=%s\n' % (
-                #nid1, str(node1.xyz),
-                #nid2, str(node2.xyz),
-                #distance))
+    element_nodes = []
+    for nnodes, eids in sorted(iteritems(eids_by_nnodes)):
+        element_nodes.append((array(eids, dtype='int32'),
+                              array(nids_by_nnodes[nnodes], dtype='int32')))
+    return element_nodes
 
-        # if hasattr(node2, 'new_node_id'):
 
-        # else:
-        node2.nid = node1.nid
-        node2.xyz = node1.xyz
-        node2.cp = node1.cp
-        assert node2.cd == node1.cd
-        assert node2.ps == node1.ps
-        assert node2.seid == node1.seid
-        # node2.new_nid = node1.nid
-        skip_nodes.append(nid2)
+def _get_collapsed_elements(model, nid_map, element_types=None):
+    """
+    Finds the elements that have 2 or more nodes at the same node after
+    the nodes are equivalenced
 
-    if bdf_filename_out is not None:
-        model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
-    if crash_on_collapse:
-        # lazy way to make sure there aren't any collapsed nodes
-        model2 = BDF(debug=debug)
-        model2.read_bdf(bdf_filename_out)
-    return model
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    nid_map : Dict[int] = int
+        the old node id -> new node id
+    element_types : Set[str]; default=None -> all
+        the element types to consider
+
+    Returns
+    -------
+    eids : List[int]
+        the collapsed element ids
+    """
+    nids_old = array(sorted(nid_map), dtype='int32')
+    nids_new = array([nid_map[nid] for nid in nids_old], dtype='int32')
+
+    eids_collapsed = []
+    for eids, node_ids in _get_element_node_arrays(model, element_types):
+        # map the node ids to the new ids
+        i = searchsorted(nids_old, node_ids).clip(max=len(nids_old) - 1)
+        node_ids = where(nids_old[i] == node_ids, nids_new[i], node_ids)
+
+        node_ids.sort(axis=1)
+        is_collapsed = ((node_ids[:, 1:] == node_ids[:, :-1]) & (node_ids[:, 1:] != 0)).any(axis=1)
+        eids_collapsed.extend(eids[is_collapsed].tolist())
+    return eids_collapsed
+
+
+def _eq_nodes_avoid_collapse(model, nids, inid1, inid2, distance, icomponent, inid_new):
+    """
+    Redoes the node groups that collapse an element, so the closest
+    nodes are merged first and merges that collapse an element are
+    skipped
+
+    Returns
+    -------
+    inid_new : (nnodes, ) int ndarray
+        the index of the node each node is equivalenced to
+    """
+    imerged = where(inid_new != arange(len(nids)))[0]
+    nid_map = dict(zip(nids[imerged].tolist(), nids[inid_new[imerged]].tolist()))
+    element_nodes = _get_element_node_arrays(model)
+    eids_collapsed = _get_collapsed_elements(model, nid_map)
+    if not eids_collapsed:
+        return inid_new
+
+    # the groups with a collapsed element
+    eids_collapsed = array(sorted(eids_collapsed), dtype='int32')
+    bad_components = set([])
+    for eids, node_ids in element_nodes:
+        node_ids = node_ids[in1d(eids, eids_collapsed), :].ravel()
+        node_ids = node_ids[in1d(node_ids, nids)]
+        bad_components.update(icomponent[searchsorted(nids, node_ids)].tolist())
+    is_bad_node = in1d(icomponent, list(bad_components))
+    inodes_bad = where(is_bad_node)[0]
+
+    # the elements that each node in a bad group is in
+    node_eids = dict([(inode, set([])) for inode in inodes_bad.tolist()])
+    nids_bad = nids[inodes_bad]
+    for eids, node_ids in element_nodes:
+        irows, icols = where(in1d(node_ids, nids_bad).reshape(node_ids.shape))
+        inodes = searchsorted(nids, node_ids[irows, icols])
+        for inode, eid in zip(inodes.tolist(), eids[irows].tolist()):
+            node_eids[inode].add(eid)
+
+    # union-find, where the closest pairs are merged first
+    parent = dict([(inode, inode) for inode in inodes_bad.tolist()])
+    def find(inode):
+        while parent[inode] != inode:
+            parent[inode] = parent[parent[inode]]
+            inode = parent[inode]
+        return inode
+
+    ipairs = where(is_bad_node[inid1])[0]
+    ipairs = ipairs[distance[ipairs].argsort(kind='mergesort')]
+    for inode1, inode2 in zip(inid1[ipairs].tolist(), inid2[ipairs].tolist()):
+        root1 = find(inode1)
+        root2 = find(inode2)
+        if root1 == root2 or node_eids[root1] & node_eids[root2]:
+            continue
+        root1, root2 = min(root1, root2), max(root1, root2)
+        parent[root2] = root1
+        node_eids[root1] |= node_eids.pop(root2)
+
+    inid_new = inid_new.copy()
+    inid_new[inodes_bad] = [find(inode) for inode in inodes_bad.tolist()]
+    return inid_new
 
 
 #def slice_model(model):
@@ -7,7 +7,6 @@ from collections import defaultdict
 import numpy as np
 from pyNastran.utils import integer_types
 from pyNastran.bdf.deprecated import GetMethodsDeprecated
-from pyNastran.bdf.cards.nodes import SPOINT, EPOINT
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 
 
@@ -284,13 +283,19 @@ class GetMethods(GetMethodsDeprecated, BDFAttributes):
             return None
         elif nid in self.nodes:
             return self.nodes[nid]
+        elif self.grid_array is not None and nid in self.grid_array:
+            if self.grid_array.use_refs:
+                return self.grid_array.get_ref(nid, self)
+            return self.grid_array.materialize(nid, self)
         elif self.spoints and nid in self.spoints.points:
+            from pyNastran.bdf.cards.nodes import SPOINT
             return SPOINT(nid)
         elif self.epoints and nid in self.epoints.points:
+            from pyNastran.bdf.cards.nodes import EPOINT
             return EPOINT(nid)
         else:
             assert isinstance(nid, integer_types), 'nid should be an integer; not %s' % type(nid)
-            nid_list = np.unique(list(self.nodes.keys()))
+            nid_list = np.unique(list(self.node_ids))
             raise RuntimeError('nid=%s is not a GRID, SPOINT, or EPOINT%s\n%s' % (nid, msg, nid_list))
 
     def Nodes(self, nids, allow_empty_nodes=False, msg=''):
@@ -0,0 +1,374 @@
+"""
+Defines the GridArray class, which stores GRID cards as columns of
+numpy arrays instead of GRID objects.
+
+It's used by ``read_bdf(..., vectorize_grids=True)``.  GRID objects are
+only created (and moved to ``model.nodes``) when they're requested
+through ``model.Node(nid)``.
+"""
+from __future__ import print_function, unicode_literals
+from six import PY2
+from six.moves import range
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.card_registry import get_card_class
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import (
+    group_cards, split_cards, to_integers, to_doubles)
+from pyNastran.bdf.bdf_interface.bulk_writer import CHUNK_SIZE, write_grids
+
+if PY2:
+    u = unicode
+else:
+    u = str
+
+#: the number of lines of a GRID that's split in bulk
+_GRID_NLINES = {'small' : 1, 'large' : 2, 'csv' : 1}
+
+
+class GridArray(object):
+    """
+    Stores GRID cards in a columnar form::
+
+      +------+-----+----+----+----+----+----+----+------+
+      |   1  |  2  | 3  | 4  | 5  | 6  |  7 | 8  |  9   |
+      +======+=====+====+====+====+====+====+====+======+
+      | GRID | NID | CP | X1 | X2 | X3 | CD | PS | SEID |
+      +------+-----+----+----+----+----+----+----+------+
+
+    The arrays are sorted by node id.  A blank PS is stored as -1.
+    Nodes that have been converted to GRID objects are flagged in
+    ``is_materialized`` and are then owned by ``model.nodes``.
+    """
+    type = 'GRID'
+
+    def __init__(self):
+        self.nid = np.zeros(0, dtype='int32')
+        self.cp = np.zeros(0, dtype='int32')
+        self.xyz = np.zeros((0, 3), dtype='float64')
+        self.cd = np.zeros(0, dtype='int32')
+        self.ps = np.zeros(0, dtype='int32')
+        self.seid = np.zeros(0, dtype='int32')
+        self.is_materialized = np.zeros(0, dtype='bool')
+
+        #: the comments of the GRIDs that have one
+        self.comments = {}
+        self._xref = False
+
+        #: model.Node returns a GridRef instead of creating the GRID
+        #: (used while the cards are cross referenced)
+        self.use_refs = False
+        self._refs = {}
+
+        #: the elements connected to the unmaterialized nodes
+        self._node_elements = {}
+
+    def __len__(self):
+        """gets the number of GRIDs that haven't been materialized"""
+        return len(self.nid) - self.is_materialized.sum()
+
+    def __contains__(self, nid):
+        return self._index(nid) is not None
+
+    def _index(self, nid):
+        """gets the index of an unmaterialized node or None"""
+        i = np.searchsorted(self.nid, nid)
+        if i < len(self.nid) and self.nid[i] == nid and not self.is_materialized[i]:
+            return i
+        return None
+
+    @property
+    def node_ids(self):
+        """gets the unmaterialized node ids"""
+        return self.nid[~self.is_materialized]
+
+    def add_cards(self, cards, nodes=None):
+        """
+        Parses a series of GRID cards in batches
+
+        Parameters
+        ----------
+        cards : List[[comment, card_lines]]
+            the GRID cards (as made by ``BDF.get_bdf_cards``)
+        nodes : dict[nid] = Node; default=None
+            the existing nodes, which shouldn't be duplicated
+
+        Returns
+        -------
+        icards_failed : List[int]
+            the indices of the cards that weren't added (e.g., tabs,
+            duplicates, invalid values) and should be parsed with
+            ``BDF.add_card``
+        """
+        groups, icards_failed = group_cards(cards)
+        icards = []
+        columns = []
+        for (card_format, nlines), icards_group in sorted(groups.items()):
+            if nlines != _GRID_NLINES[card_format]:
+                icards_failed.extend(icards_group)
+                continue
+            try:
+                fields = split_cards(cards, icards_group, card_format, nlines)
+                columns.append(_fields_to_columns(fields))
+            except SyntaxError:
+                icards_failed.extend(icards_group)
+                continue
+            icards.extend(icards_group)
+
+        if not icards:
+            return sorted(icards_failed)
+
+        icards = np.array(icards, dtype='int32')
+        nid, cp, xyz, cd, ps, seid = [
+            np.concatenate(column) for column in zip(*columns)]
+
+        # invalid cards and duplicate ids are left to the GRID class
+        is_valid = (nid > 0) & (cp >= 0) & (cd >= -1) & (ps >= -1) & (seid >= 0)
+        unused_unique_nids, inverse, counts = np.unique(
+            nid, return_inverse=True, return_counts=True)
+        is_valid &= counts[inverse] == 1
+        if len(self.nid):
+            is_valid &= ~np.in1d(nid, self.nid)
+        if nodes:
+            is_valid &= ~np.in1d(nid, np.array(list(nodes.keys()), dtype='int64'))
+        icards_failed.extend(icards[~is_valid].tolist())
+
+        for icard, nidi in zip(icards[is_valid].tolist(), nid[is_valid].tolist()):
+            comment = cards[icard][0]
+            if comment:
+                self.comments[nidi] = comment
+
+        self._append(nid[is_valid], cp[is_valid], xyz[is_valid, :],
+                     cd[is_valid], ps[is_valid], seid[is_valid])
+        return sorted(icards_failed)
+
+    def _append(self, nid, cp, xyz, cd, ps, seid):
+        """adds and sorts the data"""
+        nid = np.hstack([self.nid, nid])
+        isort = np.argsort(nid, kind='mergesort')
+        self.nid = nid[isort].astype('int32')
+        self.cp = np.hstack([self.cp, cp])[isort].astype('int32')
+        self.xyz = np.vstack([self.xyz, xyz])[isort, :]
+        self.cd = np.hstack([self.cd, cd])[isort].astype('int32')
+        self.ps = np.hstack([self.ps, ps])[isort].astype('int32')
+        self.seid = np.hstack([self.seid, seid])[isort].astype('int32')
+        self.is_materialized = np.hstack([
+            self.is_materialized, np.zeros(len(cp), dtype='bool')])[isort]
+
+    def materialize(self, nid, model):
+        """
+        Creates the GRID object for a node and moves it to ``model.nodes``
+
+        Parameters
+        ----------
+        nid : int
+            the node id
+        model : BDF()
+            the BDF object
+
+        Returns
+        -------
+        node : GRID()
+            the GRID object
+        """
+        i = self._index(nid)
+        if i is None:
+            raise KeyError('nid=%s is not an unmaterialized GRID' % nid)
+        node = self._get_node(i)
+        self.is_materialized[i] = True
+        model.nodes[node.nid] = node
+        if self._xref:
+            node.cross_reference(model)
+        if nid in self._node_elements:
+            node.elements = self._node_elements.pop(nid)
+        return node
+
+    def get_ref(self, nid, model):
+        """
+        Gets a GridRef for an unmaterialized node, which is what the
+        cards are cross referenced to
+
+        Parameters
+        ----------
+        nid : int
+            the node id
+        model : BDF()
+            the BDF object
+
+        Returns
+        -------
+        node : GridRef()
+            the reference to the node
+        """
+        try:
+            return self._refs[nid]
+        except KeyError:
+            ref = GridRef(nid, self, model)
+            self._refs[nid] = ref
+            return ref
+
+    def get_position(self, nid, model):
+        """gets the position of an unmaterialized node in the global frame"""
+        i = self._index(nid)
+        if i is None:
+            return model.nodes[nid].get_position()
+        cp = int(self.cp[i])
+        return model.coords[cp].transform_node_to_global(self.xyz[i, :].copy())
+
+    def set_node_elements(self, node_elements):
+        """
+        Stores the elements of the unmaterialized nodes, which are set
+        as ``GRID.elements`` when the GRID is created
+        """
+        nids = self.node_ids.tolist()
+        self._node_elements = {nid : node_elements[nid] for nid in nids
+                               if nid in node_elements}
+
+    def _get_node(self, i):
+        """creates the GRID object for index i"""
+        nid = int(self.nid[i])
+        ps = int(self.ps[i])
+        ps = '' if ps == -1 else u(ps)
+        return get_card_class('GRID')(nid, int(self.cp[i]), self.xyz[i, :].copy(), int(self.cd[i]),
+                    ps, int(self.seid[i]), comment=self.comments.get(nid, ''))
+
+    def cross_reference(self, model, grdset=None):
+        """
+        Verifies that the CP/CD coordinate systems exist and applies the
+        GRDSET defaults, which is what ``GRID.cross_reference`` does
+        for each node
+
+        Parameters
+        ----------
+        model : BDF()
+            the BDF object
+        grdset : GRDSET / None; default=None
+            a GRDSET if available
+        """
+        if grdset:
+            self.cp[self.cp == 0] = grdset.Cp()
+            self.cd[self.cd == 0] = grdset.Cd()
+            ps = grdset.Ps()
+            if ps:
+                self.ps[self.ps == -1] = int(ps)
+            self.seid[self.seid == 0] = grdset.SEid()
+
+        cids = np.unique(np.hstack([self.cp, self.cd[self.cd != -1]]))
+        missing_cids = [cid for cid in cids.tolist() if cid not in model.coords]
+        if missing_cids:
+            inode = np.where(np.in1d(self.cp, missing_cids) |
+                             np.in1d(self.cd, missing_cids))[0][0]
+            msg = ' which is required by GRID nid=%s' % self.nid[inode]
+            model.Coord(missing_cids[0], msg=msg)
+        self._xref = True
+
+    def uncross_reference(self):
+        self._xref = False
+        self._refs = {}
+        self._node_elements = {}
+
+    def get_local_position(self):
+        """
+        Gets the unmaterialized nodes in their cp coordinate systems
+
+        Returns
+        -------
+        nids : (n, ) int ndarray
+            the node ids
+        cp : (n, ) int ndarray
+            the coordinate systems
+        xyz : (n, 3) float ndarray
+            the positions in the cp frames
+        """
+        i = np.where(~self.is_materialized)[0]
+        return self.nid[i], self.cp[i], self.xyz[i, :]
+
+    def write_cards(self, size=8, is_double=False):
+        """
+        Gets the unmaterialized GRIDs as strings in the same form as
+        ``GRID.write_card``
+
+        Parameters
+        ----------
+        size : int; default=8
+            the size of the card (8/16)
+        is_double : bool; default=False
+            should this card be written with double precision
+
+        Yields
+        ------
+        nid : int
+            the node id
+        msg : str
+            the card
+        """
+        i = np.where(~self.is_materialized)[0]
+        comments = self.comments
+        for ichunk in range(0, len(i), CHUNK_SIZE):
+            j = i[ichunk:ichunk + CHUNK_SIZE]
+            nids = self.nid[j].tolist()
+            pss = ['' if ps == -1 else u(ps) for ps in self.ps[j].tolist()]
+            msgs = write_grids(nids, self.cp[j].tolist(), self.xyz[j, :],
+                               self.cd[j].tolist(), pss, self.seid[j].tolist(),
+                               size, is_double)
+            for nid, msg in zip(nids, msgs):
+                yield nid, comments.get(nid, '') + msg
+
+    def __repr__(self):
+        return 'GridArray(nnodes=%s, nmaterialized=%s)' % (
+            len(self.nid), self.is_materialized.sum())
+
+
+class GridRef(object):
+    """
+    A reference to a node in a GridArray, so elements can be cross
+    referenced without creating a GRID object for each node.  The
+    position comes from the arrays; any other attribute creates the
+    GRID (see ``GridArray.materialize``) and gets it from there.
+    """
+    type = 'GRID'
+
+    def __init__(self, nid, grid_array, model):
+        self.nid = nid
+        self._grid_array = grid_array
+        self._model = model
+
+    def Nid(self):
+        return self.nid
+
+    def get_position(self):
+        """gets the position of the node in the global frame"""
+        return self._grid_array.get_position(self.nid, self._model)
+
+    def _get_grid(self):
+        """gets the GRID, which is created if it doesn't exist"""
+        nodes = self._model.nodes
+        if self.nid in nodes:
+            return nodes[self.nid]
+        return self._grid_array.materialize(self.nid, self._model)
+
+    def __getattr__(self, name):
+        if name.startswith('__') or name in ['nid', '_grid_array', '_model']:
+            raise AttributeError(name)
+        return getattr(self._get_grid(), name)
+
+    def __repr__(self):
+        return 'GridRef(nid=%s)' % self.nid
+
+
+def _fields_to_columns(fields):
+    """
+    Converts the (n, 8) GRID fields into the nid, cp, xyz, cd, ps, seid
+    columns
+    """
+    nid = to_integers(fields[:, 0], 'nid')
+    cp = to_integers(fields[:, 1], 'cp', 0)
+    xyz = np.column_stack([
+        to_doubles(fields[:, 2], 'x1', 0.),
+        to_doubles(fields[:, 3], 'x2', 0.),
+        to_doubles(fields[:, 4], 'x3', 0.),
+    ])
+    cd = to_integers(fields[:, 5], 'cd', 0)
+    ps = to_integers(fields[:, 6], 'ps', -1)
+    seid = to_integers(fields[:, 7], 'seid', 0)
+    return nid, cp, xyz, cd, ps, seid
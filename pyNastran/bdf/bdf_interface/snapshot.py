@@ -0,0 +1,584 @@
+"""
+Defines a binary snapshot of a parsed BDF, so a deck that is read over
+and over again doesn't need to be parsed every time.
+
+The snapshot is an uncompressed ``.npz`` file.  Each card type is stored
+as columnar arrays of the card's ``repr_fields`` (a type code per field
+and the integer, float and string values), as well as the card comments.
+The executive/case control decks, the rejected cards and the source
+files (with their modification times and hashes) are stored in a JSON
+header, so a stale snapshot can be detected.
+
+    >>> model = read_bdf(bdf_filename)
+    >>> save_snapshot(model, 'model.snapshot')
+
+    >>> model = BDF()
+    >>> load_snapshot(model, 'model.snapshot')
+
+Loading a snapshot is bounded by creating the card objects, so the card
+types that aren't needed right away may be left in the snapshot
+(``card_types``) and created later by ``materialize_snapshot``.  With
+``vectorize_grids=True``, the GRID cards are loaded directly into the
+``GridArray``.
+
+``read_bdf(bdf_filename, snapshot_filename='model.snapshot')`` uses the
+snapshot if it's up to date and otherwise reads the BDF and writes the
+snapshot.
+"""
+from __future__ import print_function, unicode_literals
+import os
+import json
+import hashlib
+from collections import OrderedDict
+from six import iteritems, string_types
+
+import numpy as np
+
+from pyNastran.bdf.utils import parse_executive_control_deck
+from pyNastran.bdf.case_control_deck import CaseControlDeck
+from pyNastran.bdf.cards.base_card import BaseCard
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.grid_array import GridArray
+
+SNAPSHOT_VERSION = 1
+
+#: the type code of the raw fields
+KIND_NONE, KIND_INT, KIND_FLOAT, KIND_STRING = 0, 1, 2, 3
+
+#: cards that aren't stored as their repr_fields, but as the written
+#: card, which is parsed on load
+TEXT_CARDS = set(['DEQATN', 'DMIG', 'DMI', 'DMIJ', 'DMIJI', 'DMIK'])
+
+#: model attributes that don't store the parsed cards
+_SKIP_ATTRIBUTES = set(['case_control_deck', 'grid_array', 'reject_cards', 'rejects'])
+
+
+def get_source_files(model):
+    """
+    Gets the files that the model was read from
+
+    Returns
+    -------
+    source_files : List[str]
+        the absolute paths of the main file and the INCLUDE files
+    """
+    filenames = [model.bdf_filename] + list(getattr(model, 'active_filenames', []))
+    source_files = []
+    for filename in filenames:
+        if filename is None:
+            continue
+        filename = os.path.abspath(filename)
+        if filename not in source_files:
+            source_files.append(filename)
+    return source_files
+
+
+def hash_file(filename, chunk_size=2**24):
+    """gets the SHA1 hash of a file"""
+    sha1 = hashlib.sha1()
+    with open(filename, 'rb') as bdf_file:
+        while True:
+            chunk = bdf_file.read(chunk_size)
+            if not chunk:
+                break
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def is_snapshot_stale(snapshot_filename, bdf_filename=None, read_options=None):
+    """
+    Checks that a snapshot exists and that its source files haven't changed
+
+    A source file is up to date if its size and modification time are
+    unchanged or (if only the modification time changed) its hash is
+    unchanged.
+
+    Parameters
+    ----------
+    snapshot_filename : str
+        the snapshot
+    bdf_filename : str; default=None
+        the main BDF the snapshot should have been created from
+    read_options : dict; default=None
+        the read_bdf options (e.g., punch, encoding) the snapshot should
+        have been created with
+
+    Returns
+    -------
+    is_stale : bool
+        the snapshot doesn't exist, is an old version or is out of date
+    """
+    if not os.path.exists(snapshot_filename):
+        return True
+    try:
+        header = _load_header(snapshot_filename)
+    except (IOError, KeyError, ValueError):
+        return True
+
+    if header['version'] != SNAPSHOT_VERSION:
+        return True
+    if read_options is not None and header['read_options'] != read_options:
+        return True
+    source_files = header['source_files']
+    if bdf_filename is not None and (
+            not source_files or source_files[0][0] != os.path.abspath(bdf_filename)):
+        return True
+
+    for filename, mtime, size, sha1 in source_files:
+        if not os.path.exists(filename):
+            return True
+        stat = os.stat(filename)
+        if stat.st_size != size:
+            return True
+        if stat.st_mtime != mtime and hash_file(filename) != sha1:
+            return True
+    return False
+
+
+def save_snapshot(model, snapshot_filename, read_options=None):
+    """
+    Writes a binary snapshot of a model
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    snapshot_filename : str
+        the snapshot filename (the .npz extension isn't added)
+    read_options : dict; default=None
+        the read_bdf options (e.g., punch, encoding) that are checked
+        by ``is_snapshot_stale``
+
+    .. note:: the card types that don't round trip through their
+              repr_fields are stored as the written card
+    """
+    cards_by_type = _get_cards_by_type(model)
+    text_card_types = [card_type for card_type in cards_by_type
+                       if card_type in TEXT_CARDS]
+    arrays, header = _get_snapshot_arrays(model, cards_by_type, text_card_types)
+
+    # load the cards into a scratch model to find the cards that don't
+    # round trip through the arrays
+    model_check = model.__class__(log=model.log, debug=None)
+    model_check.set_error_storage(nparse_errors=0, stop_on_parsing_error=True)
+    failed_card_types = _materialize_cards(model_check, arrays, header['card_types'],
+                                           is_checking=True)
+    cards_by_type_check = _get_cards_by_type(model_check)
+    for card_type in header['card_types']:
+        if card_type in failed_card_types:
+            continue
+        cards = cards_by_type[card_type]
+        cards_check = cards_by_type_check.get(card_type, [])
+        if(len(cards) != len(cards_check) or
+           sorted(_write_cards(cards)) != sorted(_write_cards(cards_check))):
+            failed_card_types.add(card_type)
+    if failed_card_types:
+        model.log.debug('storing the %s cards as text in the snapshot' % (
+            ', '.join(sorted(failed_card_types))))
+        text_card_types += [card_type for card_type in cards_by_type
+                            if card_type in failed_card_types]
+        arrays, header = _get_snapshot_arrays(model, cards_by_type, text_card_types)
+
+    source_files = []
+    for filename in get_source_files(model):
+        if os.path.exists(filename):
+            stat = os.stat(filename)
+            source_files.append((filename, stat.st_mtime, stat.st_size, hash_file(filename)))
+    header['read_options'] = read_options
+    header['source_files'] = source_files
+
+    header_bytes = json.dumps(header).encode('utf8')
+    arrays['header'] = np.frombuffer(header_bytes, dtype='uint8')
+    with open(snapshot_filename, 'wb') as snapshot_file:
+        np.savez(snapshot_file, **arrays)
+
+
+def _get_snapshot_arrays(model, cards_by_type, text_card_types):
+    """
+    Gets the arrays and the header of a snapshot
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    cards_by_type : OrderedDict[card_type] = List[(iorder, card)]
+        the cards
+    text_card_types : List[str]
+        the card types that are stored as the written card
+
+    Returns
+    -------
+    arrays : OrderedDict[name] = ndarray
+        the arrays of the snapshot
+    header : dict
+        the header of the snapshot (without the source files)
+    """
+    arrays = OrderedDict()
+    card_types = []
+    text_lines = []
+    for card_type, cards in iteritems(cards_by_type):
+        if card_type in text_card_types:
+            for unused_iorder, card in cards:
+                text_lines.extend(card.write_card(size=16).rstrip('\n').split('\n'))
+        else:
+            _add_card_arrays(arrays, card_type, cards)
+            card_types.append(card_type)
+
+    grid_array = getattr(model, 'grid_array', None)
+    if grid_array is not None:
+        for name in ['nid', 'cp', 'xyz', 'cd', 'ps', 'seid', 'is_materialized']:
+            arrays['grid_array/' + name] = getattr(grid_array, name)
+        comment_nids = sorted(grid_array.comments)
+        arrays['grid_array/comment_nids'] = np.array(comment_nids, dtype='int32')
+        _add_strings(arrays, 'grid_array/comments',
+                     [grid_array.comments[nid] for nid in comment_nids])
+
+    header = {
+        'version' : SNAPSHOT_VERSION,
+        'bdf_filename' : model.bdf_filename,
+        'mode' : model._nastran_format,
+        'punch' : model.punch,
+        'executive_control_lines' : model.executive_control_lines,
+        'case_control_lines' : model.case_control_lines,
+        'card_count' : model.card_count,
+        'card_types' : card_types,
+        'text_lines' : text_lines,
+        'rejects' : model.rejects,
+        'reject_cards' : [list(card.card) for card in model.reject_cards],
+        'xref' : model._xref,
+    }
+    return arrays, header
+
+
+def _write_cards(cards):
+    """writes the cards, so they can be compared"""
+    return [card.write_card(size=16) for unused_iorder, card in cards]
+
+
+def load_snapshot(model, snapshot_filename, xref=None, card_types=None,
+                  vectorize_grids=False):
+    """
+    Loads a binary snapshot into a model
+
+    Parameters
+    ----------
+    model : BDF()
+        an empty model
+    snapshot_filename : str
+        the snapshot
+    xref : bool; default=None -> the state the snapshot was saved in
+        should the model be cross referenced
+    card_types : List[str]; default=None -> all
+        the card types to create; the remaining cards are created by
+        ``materialize_snapshot`` (the model isn't cross referenced
+        until all the cards are created)
+    vectorize_grids : bool; default=False
+        load the GRID cards into ``model.grid_array`` instead of
+        creating a GRID object for each node (see ``BDF.read_bdf``)
+    """
+    snapshot = np.load(snapshot_filename)
+    header = json.loads(snapshot['header'].tobytes().decode('utf8'))
+    if header['version'] != SNAPSHOT_VERSION:
+        raise RuntimeError('snapshot_filename=%r has version=%s; expected version=%s' % (
+            snapshot_filename, header['version'], SNAPSHOT_VERSION))
+
+    mode = header['mode']
+    if mode == 'nx':
+        model.set_as_nx()
+    else:
+        model.set_as_msc()
+    model.bdf_filename = header['bdf_filename']
+    model.punch = header['punch']
+    model.executive_control_lines = header['executive_control_lines']
+    model.case_control_lines = header['case_control_lines']
+    sol, method, isol_line = parse_executive_control_deck(model.executive_control_lines)
+    model.update_solution(sol, method, isol_line)
+    model.case_control_deck = CaseControlDeck(model.case_control_lines, model.log)
+    model.case_control_deck.solmap_toValue = model._solmap_to_value
+    model.case_control_deck.rsolmap_toStr = model.rsolmap_toStr
+
+    model._snapshot = snapshot
+    model._snapshot_header = header
+    model._snapshot_card_types = list(header['card_types'])
+    if 'grid_array/nid' in snapshot:
+        grid_array = GridArray()
+        for name in ['nid', 'cp', 'xyz', 'cd', 'ps', 'seid', 'is_materialized']:
+            setattr(grid_array, name, snapshot['grid_array/' + name])
+        comment_nids = snapshot['grid_array/comment_nids'].tolist()
+        comments = _get_strings(snapshot, 'grid_array/comments')
+        grid_array.comments = dict(zip(comment_nids, comments))
+        model.grid_array = grid_array
+
+    model._vectorize_grids = vectorize_grids
+    if vectorize_grids and 'GRID' in model._snapshot_card_types:
+        _add_grids_to_grid_array(model, snapshot)
+        model._snapshot_card_types.remove('GRID')
+
+    materialize_snapshot(model, card_types=card_types)
+    if model._snapshot is None:
+        if xref is None:
+            xref = header['xref']
+        model.cross_reference(xref=xref)
+        model._xref = xref
+
+
+def materialize_snapshot(model, card_types=None):
+    """
+    Creates the cards of a model that was loaded with ``load_snapshot``
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    card_types : List[str]; default=None -> all
+        the card types to create
+    """
+    snapshot = getattr(model, '_snapshot', None)
+    if snapshot is None:
+        return
+    header = model._snapshot_header
+    card_types_to_load = model._snapshot_card_types
+    if card_types is not None:
+        card_types_to_load = [card_type for card_type in card_types_to_load
+                              if card_type in card_types]
+
+    _materialize_cards(model, snapshot, card_types_to_load)
+    model._snapshot_card_types = [card_type for card_type in model._snapshot_card_types
+                                  if card_type not in card_types_to_load]
+    if model._snapshot_card_types:
+        return
+
+    text_lines = header['text_lines']
+    if text_lines:
+        cards, card_count = model.get_bdf_cards(text_lines)
+        model._parse_cards(cards, card_count)
+        model.pop_parse_errors()
+        model.fill_dmigs()
+    model.rejects = header['rejects']
+    model.reject_cards = [BDFCard(card, has_none=False) for card in header['reject_cards']]
+    model.card_count = header['card_count']
+    if hasattr(snapshot, 'close'):
+        snapshot.close()
+    model._snapshot = None
+    model._snapshot_header = None
+
+
+def _materialize_cards(model, snapshot, card_types, is_checking=False):
+    """
+    Creates the cards of the card types in the order they were stored
+    in, so the cards in the same slot (e.g. the loads of a load set)
+    stay in order
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    snapshot : NpzFile / dict
+        the arrays of the snapshot
+    card_types : List[str]
+        the card types to create
+    is_checking : bool; default=False
+        skip the cards that can't be created instead of raising an error
+
+    Returns
+    -------
+    failed_card_types : Set[str]
+        the card types that couldn't be created (only for is_checking)
+    """
+    orders = []
+    card_fields = []
+    for card_type in card_types:
+        order, fields_comments = _get_card_fields(snapshot, card_type)
+        orders.append(order)
+        card_fields.extend(fields_comments)
+
+    failed_card_types = set([])
+    if not card_fields:
+        return failed_card_types
+    isort = np.argsort(np.hstack(orders), kind='mergesort')
+    for i in isort.tolist():
+        fields, comment = card_fields[i]
+        card_name = fields[0]
+        if not is_checking:
+            model.add_card_fields(fields, card_name, comment=comment, has_none=False)
+            continue
+        if card_name in failed_card_types:
+            continue
+        try:
+            model.add_card_fields(fields, card_name, comment=comment, has_none=False)
+        except Exception:
+            failed_card_types.add(card_name)
+    return failed_card_types
+
+
+def _add_grids_to_grid_array(model, snapshot):
+    """adds the GRID cards of a snapshot to ``model.grid_array``"""
+    order, fields_comments = _get_card_fields(snapshot, 'GRID')
+    ngrids = len(order)
+    nid = np.zeros(ngrids, dtype='int32')
+    cp = np.zeros(ngrids, dtype='int32')
+    xyz = np.zeros((ngrids, 3), dtype='float64')
+    cd = np.zeros(ngrids, dtype='int32')
+    ps = np.full(ngrids, -1, dtype='int32')
+    seid = np.zeros(ngrids, dtype='int32')
+
+    if model.grid_array is None:
+        model.grid_array = GridArray()
+    comments = model.grid_array.comments
+    for i, (fields, comment) in enumerate(fields_comments):
+        unused_card_name, nid[i], cpi, xyz[i, 0], xyz[i, 1], xyz[i, 2], cdi, psi, seidi = (
+            fields + [None] * (9 - len(fields)))
+        if cpi:
+            cp[i] = cpi
+        if cdi:
+            cd[i] = cdi
+        if psi:
+            ps[i] = int(psi)
+        if seidi:
+            seid[i] = seidi
+        if comment:
+            comments[int(nid[i])] = comment
+    model.grid_array._append(nid, cp, xyz, cd, ps, seid)
+
+
+def _load_header(snapshot_filename):
+    """loads the JSON header of a snapshot"""
+    with np.load(snapshot_filename) as snapshot:
+        return json.loads(snapshot['header'].tobytes().decode('utf8'))
+
+
+def _get_cards_by_type(model):
+    """
+    Gets the card objects of the model
+
+    Returns
+    -------
+    cards_by_type : OrderedDict[card_type] = List[(iorder, card)]
+        the cards and the order they were found in
+    """
+    cards_by_type = OrderedDict()
+    card_ids = set([])
+    iorder = 0
+    for name, slot in sorted(iteritems(model.__dict__)):
+        if name.startswith('_') or name in _SKIP_ATTRIBUTES:
+            continue
+        if isinstance(slot, dict):
+            values = slot.values()
+        elif isinstance(slot, list):
+            values = slot
+        else:
+            values = [slot]
+
+        for value in values:
+            cards = value if isinstance(value, list) else [value]
+            for card in cards:
+                if not isinstance(card, BaseCard) or id(card) in card_ids:
+                    continue
+                card_ids.add(id(card))
+                card_type = card.type
+                if card_type not in cards_by_type:
+                    cards_by_type[card_type] = []
+                cards_by_type[card_type].append((iorder, card))
+                iorder += 1
+    return cards_by_type
+
+
+def _add_card_arrays(arrays, card_type, cards):
+    """
+    Adds the columnar arrays of the raw fields of a card type
+
+    Parameters
+    ----------
+    arrays : OrderedDict
+        the arrays in the snapshot
+    card_type : str
+        the card type (e.g. 'GRID')
+    cards : List[(iorder, card)]
+        the order the cards are created in on load and the cards
+    """
+    orders = []
+    nfields = []
+    kinds = []
+    ints = []
+    floats = []
+    strings = []
+    comments = []
+    for iorder, card in cards:
+        fields = card.repr_fields()
+        orders.append(iorder)
+        nfields.append(len(fields))
+        comments.append(card.comment)
+        for value in fields:
+            if value is None:
+                kinds.append(KIND_NONE)
+            elif isinstance(value, string_types):
+                kinds.append(KIND_STRING)
+                strings.append(value)
+            elif isinstance(value, (int, np.integer)):
+                kinds.append(KIND_INT)
+                ints.append(value)
+            elif isinstance(value, (float, np.floating)):
+                kinds.append(KIND_FLOAT)
+                floats.append(value)
+            else:
+                # e.g. a list; the card is stored as text
+                kinds.append(KIND_NONE)
+
+    key = 'cards/%s/' % card_type
+    arrays[key + 'order'] = np.array(orders, dtype='int64')
+    arrays[key + 'nfields'] = np.array(nfields, dtype='int32')
+    arrays[key + 'kind'] = np.array(kinds, dtype='int8')
+    arrays[key + 'ints'] = np.array(ints, dtype='int64')
+    arrays[key + 'floats'] = np.array(floats, dtype='float64')
+    _add_strings(arrays, key + 'strings', strings)
+    _add_strings(arrays, key + 'comments', comments)
+
+
+def _get_card_fields(snapshot, card_type):
+    """
+    Gets the raw fields of a card type
+
+    Returns
+    -------
+    order : (ncards, ) int ndarray
+        the order the cards are created in
+    fields_comments : List[(fields, comment)]
+        the raw fields and comment of each card
+    """
+    key = 'cards/%s/' % card_type
+    order = snapshot[key + 'order']
+    nfields = snapshot[key + 'nfields']
+    kind = snapshot[key + 'kind']
+
+    values = np.empty(len(kind), dtype='object')
+    values[kind == KIND_INT] = snapshot[key + 'ints'].tolist()
+    values[kind == KIND_FLOAT] = snapshot[key + 'floats'].tolist()
+    strings = _get_strings(snapshot, key + 'strings')
+    if strings:
+        istring = np.where(kind == KIND_STRING)[0]
+        for i, value in zip(istring.tolist(), strings):
+            values[i] = value
+    comments = _get_strings(snapshot, key + 'comments')
+
+    values = values.tolist()
+    istop = np.cumsum(nfields).tolist()
+    istart = [0] + istop[:-1]
+    fields_comments = [(values[i0:i1], comment)
+                       for i0, i1, comment in zip(istart, istop, comments)]
+    return order, fields_comments
+
+
+def _add_strings(arrays, key, strings):
+    """adds a list of strings as utf8 bytes and the length of each string"""
+    strings_bytes = [string.encode('utf8') for string in strings]
+    arrays[key + '_lengths'] = np.array([len(string) for string in strings_bytes], dtype='int64')
+    arrays[key + '_bytes'] = np.frombuffer(b''.join(strings_bytes), dtype='uint8')
+
+
+def _get_strings(snapshot, key):
+    """gets a list of strings stored by ``_add_strings``"""
+    lengths = snapshot[key + '_lengths']
+    data = snapshot[key + '_bytes'].tobytes()
+    istop = np.cumsum(lengths).tolist()
+    istart = [0] + istop[:-1]
+    return [data[i0:i1].decode('utf8') for i0, i1 in zip(istart, istop)]
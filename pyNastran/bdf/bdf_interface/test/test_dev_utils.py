@@ -11,7 +11,8 @@ from numpy import array, intersect1d
 #root_path = pyNastran.__path__[0]
 #test_path = os.path.join(root_path, 'bdf', 'test', 'unit')
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.bdf_interface.dev_utils import bdf_equivalence_nodes
+from pyNastran.bdf.bdf_interface.dev_utils import (
+    bdf_equivalence_nodes, get_equivalence_nid_map)
 from codecs import open as codec_open
 
 
@@ -276,5 +277,52 @@ class DevUtils(unittest.TestCase):
         # os.remove(bdf_filename)
         os.remove(bdf_filename_out)
 
+    def test_eq5(self):
+        """collapsed elements are removed/avoided"""
+        msg = (
+            'CEND\n'
+            'BEGIN BULK\n'
+            'GRID,1, , 0.,   0.,   0.\n'
+            'GRID,2, , 0.1,  0.,   0.\n'
+            'GRID,3, , 0.,   1.,   0.\n'
+            'GRID,4, , 1.,   1.,   0.\n'
+            'GRID,10,, 0.,   0.,   0.01\n'
+            'CTRIA3,1, 100,1,2,3\n'
+            'CTRIA3,2, 100,2,4,3\n'
+            'PSHELL,100,1000,0.1\n'
+            'MAT1,1000,3.0,, 0.3\n'
+            'ENDDATA'
+        )
+        bdf_filename = 'collapse.bdf'
+        bdf_filename_out = 'collapse_out.bdf'
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(msg)
+
+        tol = 0.2
+        model = BDF(debug=False)
+        model.read_bdf(bdf_filename)
+        nid_map = get_equivalence_nid_map(model, tol, num_threads=2)
+        self.assertEqual(nid_map, {2 : 1, 10 : 1})
+
+        # 1/2 collapse CTRIA3 1, so only 10 is merged
+        nid_map = get_equivalence_nid_map(model, tol, avoid_collapsed_elements=True)
+        self.assertEqual(nid_map, {10 : 1})
+
+        model = bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                      avoid_collapsed_elements=True, debug=False)
+        self.assertEqual(sorted(model.nodes), [1, 2, 3, 4])
+        self.assertEqual(sorted(model.elements), [1, 2])
+
+        model = bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                      remove_collapsed_elements=True, debug=False)
+        self.assertEqual(sorted(model.nodes), [1, 3, 4])
+        self.assertEqual(sorted(model.elements), [2])
+        model = BDF(debug=False)
+        model.read_bdf(bdf_filename_out)
+        self.assertEqual(model.elements[2].node_ids, [1, 4, 3])
+
+        os.remove(bdf_filename)
+        os.remove(bdf_filename_out)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
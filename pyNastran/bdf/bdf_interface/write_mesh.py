@@ -7,6 +7,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from six import string_types, iteritems, itervalues, PY2, StringIO
 import sys
+from heapq import merge
 from codecs import open
 import io
 
@@ -16,6 +17,7 @@ from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.field_writer_double import print_card_double
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.bulk_writer import iter_bulk_cards
 
 
 class WriteMesh(BDFAttributes):
@@ -310,7 +312,7 @@ class WriteMesh(BDFAttributes):
             outfile.write('$pyNastran: version=%s\n' % self.nastran_format)
             outfile.write('$pyNastran: punch=%s\n' % self.punch)
             outfile.write('$pyNastran: encoding=%s\n' % encoding)
-            outfile.write('$pyNastran: nnodes=%s\n' % len(self.nodes))
+            outfile.write('$pyNastran: nnodes=%s\n' % self.nnodes)
             outfile.write('$pyNastran: nelements=%s\n' % len(self.elements))
 
         if not self.punch:
@@ -355,13 +357,19 @@ class WriteMesh(BDFAttributes):
                 for (eid, element) in sorted(iteritems(self.elements)):
                     outfile.write(element.write_card_16(is_double))
             else:
-                for (eid, element) in sorted(iteritems(self.elements)):
-                    try:
-                        outfile.write(element.write_card(size, is_double))
-                    except:
-                        print('failed printing element...'
-                              'type=%s eid=%s' % (element.type, eid))
-                        raise
+                for chunk in iter_bulk_cards(sorted(iteritems(self.elements)),
+                                             size, is_double):
+                    msg = []
+                    for (eid, element, card) in chunk:
+                        if card is None:
+                            try:
+                                card = element.write_card(size, is_double)
+                            except:
+                                print('failed printing element...'
+                                      'type=%s eid=%s' % (element.type, eid))
+                                raise
+                        msg.append(card)
+                    outfile.write(''.join(msg))
 
     def _write_elements_symmetric(self, outfile, size=8, is_double=False):
         """
@@ -673,14 +681,18 @@ class WriteMesh(BDFAttributes):
         """Writes the load cards sorted by ID"""
         if self.loads or self.tempds:
             msg = ['$LOADS\n']
-            for (key, loadcase) in sorted(iteritems(self.loads)):
-                for load in loadcase:
-                    try:
-                        msg.append(load.write_card(size, is_double))
-                    except:
-                        print('failed printing load...type=%s key=%r'
-                              % (load.type, key))
-                        raise
+            loads = [(key, load) for (key, loadcase) in sorted(iteritems(self.loads))
+                     for load in loadcase]
+            for chunk in iter_bulk_cards(loads, size, is_double):
+                for (key, load, card) in chunk:
+                    if card is None:
+                        try:
+                            card = load.write_card(size, is_double)
+                        except:
+                            print('failed printing load...type=%s key=%r'
+                                  % (load.type, key))
+                            raise
+                    msg.append(card)
             for key, tempd in sorted(iteritems(self.tempds)):
                 msg.append(tempd.write_card(size, is_double))
             outfile.write(''.join(msg))
@@ -781,18 +793,29 @@ class WriteMesh(BDFAttributes):
             msg.append(self.epoints.write_card(size, is_double))
             outfile.write(''.join(msg))
 
-        if self.nodes:
+        if self.nodes or self.grid_array is not None and len(self.grid_array):
             msg = []
             msg.append('$NODES\n')
             if self.gridSet:
                 msg.append(self.gridSet.print_card(size))
 
             if self.is_long_ids:
-                for (unused_nid, node) in sorted(iteritems(self.nodes)):
-                    msg.append(node.write_card_16(is_double))
+                size = 16
+                cards = ((nid, node.write_card_16(is_double) if card is None else card)
+                         for chunk in iter_bulk_cards(sorted(iteritems(self.nodes)),
+                                                      size, is_double)
+                         for (nid, node, card) in chunk)
             else:
-                for (unused_nid, node) in sorted(iteritems(self.nodes)):
-                    msg.append(node.write_card(size, is_double))
+                cards = ((nid, node.write_card(size, is_double) if card is None else card)
+                         for chunk in iter_bulk_cards(sorted(iteritems(self.nodes)),
+                                                      size, is_double)
+                         for (nid, node, card) in chunk)
+
+            if self.grid_array is not None:
+                # the GRID objects and the unmaterialized GRIDs are merged by id
+                cards = merge(cards, self.grid_array.write_cards(size, is_double))
+            for (unused_nid, card) in cards:
+                msg.append(card)
             outfile.write(''.join(msg))
         #if 0:  # not finished
             #self._write_nodes_associated(outfile, size, is_double)
@@ -16,52 +16,383 @@ reading/writing/accessing of BDF data.  Such methods include:
 """
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
-from six import iteritems, string_types, PY2
+from six import iteritems, itervalues, string_types, PY2
 from six.moves import zip
 from codecs import open
 
 from collections import defaultdict
-from copy import deepcopy
-import multiprocessing as mp
 
+import numpy as np
 from numpy import array, cross, zeros, dot, allclose, mean
 from numpy.linalg import norm
 
 from pyNastran.utils import integer_types
-from pyNastran.bdf.cards.loads.static_loads import Moment, Force, LOAD
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 from pyNastran.bdf.field_writer_8 import print_card_8
 
 
-def _mass_properties_mass_mp_func(element):
-    """helper method for mass properties multiprocessing"""
+#: the element classes that have vectorized mass/centroid calculations
+#: and the number of (corner) nodes that are used
+MASS_ELEMENT_NNODES = {
+    'CTRIA3' : 3, 'CQUAD4' : 4,
+    'CTETRA4' : 4, 'CTETRA10' : 4, 'CPENTA6' : 6, 'CHEXA8' : 8, 'CHEXA20' : 8,
+}
+
+#: the shells that PLOAD4s are applied to by the number of corner nodes
+PRESSURE_TRIA_TYPES = ['CTRIA3', 'CTRIA6', 'CTRIA', 'CTRIAR']
+PRESSURE_QUAD_TYPES = ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR']
+
+#: the shells that PLOAD2s are applied to
+PLOAD2_SHELL_TYPES = ['CTRIA3', 'CQUAD4', 'CSHEAR']
+
+#: the faces of the solid elements as indices into the element nodes
+#: (using the Nastran midside node numbering), where the faces are
+#: ordered so the normal points out of the element
+#: key=(element type, number of nodes)
+SOLID_FACES = {
+    ('CTETRA', 4) : [(0, 1, 2), (0, 1, 3), (1, 2, 3), (2, 0, 3)],
+    ('CTETRA', 10) : [
+        (0, 1, 2, 4, 5, 6), (0, 1, 3, 4, 8, 7),
+        (1, 2, 3, 5, 9, 8), (2, 0, 3, 6, 7, 9)],
+    ('CPYRAM', 5) : [(0, 1, 2, 3), (0, 1, 4), (1, 2, 4), (2, 3, 4), (3, 0, 4)],
+    ('CPYRAM', 13) : [
+        (0, 1, 2, 3, 5, 6, 7, 8), (0, 1, 4, 5, 10, 9), (1, 2, 4, 6, 11, 10),
+        (2, 3, 4, 7, 12, 11), (3, 0, 4, 8, 9, 12)],
+    ('CPENTA', 6) : [(0, 1, 2), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)],
+    ('CPENTA', 15) : [
+        (0, 1, 2, 6, 7, 8), (3, 4, 5, 12, 13, 14),
+        (0, 1, 4, 3, 6, 10, 12, 9), (1, 2, 5, 4, 7, 11, 13, 10),
+        (2, 0, 3, 5, 8, 9, 14, 11)],
+    ('CHEXA', 8) : [
+        (0, 1, 2, 3), (0, 1, 5, 4), (1, 2, 6, 5),
+        (2, 3, 7, 6), (3, 0, 4, 7), (4, 5, 6, 7)],
+    ('CHEXA', 20) : [
+        (0, 1, 2, 3, 8, 9, 10, 11), (0, 1, 5, 4, 8, 13, 16, 12),
+        (1, 2, 6, 5, 9, 14, 17, 13), (2, 3, 7, 6, 10, 15, 18, 14),
+        (3, 0, 4, 7, 11, 12, 19, 15), (4, 5, 6, 7, 16, 17, 18, 19)],
+}
+
+#: the shell element that's written for a skinned face of n nodes
+SKIN_SHELL_TYPES = {3 : 'CTRIA3', 4 : 'CQUAD4', 6 : 'CTRIA6', 8 : 'CQUAD8'}
+
+
+def _is_unique_row(rows):
+    """
+    Finds the rows of an (n, m) int array that aren't repeated
+
+    This is ``np.unique(rows, axis=0, return_counts=True)``, but the
+    rows are sorted with ``np.lexsort``, which is faster than sorting
+    the rows as a structured array.
+    """
+    nrows = rows.shape[0]
+    isort = np.lexsort(rows.T[::-1, :])
+    sorted_rows = rows[isort, :]
+    is_first = np.ones(nrows + 1, dtype='bool')
+    is_first[1:-1] = (sorted_rows[1:, :] != sorted_rows[:-1, :]).any(axis=1)
+    istart = np.where(is_first)[0]
+    counts = np.diff(istart)
+
+    is_unique = np.zeros(nrows, dtype='bool')
+    is_unique[isort[istart[:-1][counts == 1]]] = True
+    return is_unique
+
+
+def _norm(vectors):
+    """gets the length of a set of (n, 3) vectors"""
+    return norm(vectors, axis=1)
+
+
+def _area_centroid(n1, n2, n3, n4):
+    """vectorized version of ``solid.area_centroid``"""
+    area1 = 0.5 * _norm(cross(n1 - n2, n2 - n4))
+    c1 = (n1 + n2 + n4) / 3.
+
+    area2 = 0.5 * _norm(cross(n2 - n4, n2 - n3))
+    c2 = (n2 + n3 + n4) / 3.
+
+    area = area1 + area2
+    centroid = (c1 * area1[:, None] + c2 * area2[:, None]) / area[:, None]
+    return area, centroid
+
+
+def _mass_properties_mass_mp_func(args):
+    """
+    Calculates the mass and centroid of elements of the same class
+    (the worker for the mass properties process pool)
+
+    Parameters
+    ----------
+    args : tuple
+        class_name : str
+            the element class (e.g., CQUAD4, CTETRA10)
+        inode : (nelements, nnodes) int ndarray
+            the index into xyz for each element node
+        xyz : (nnodes_model, 3) float ndarray
+            the nodes in the global frame
+        scale : (nelements, ) float ndarray
+            the mass per area (shells) or density (solids)
+
+    Returns
+    -------
+    mass : (nelements, ) float ndarray
+        the masses
+    centroid : (nelements, 3) float ndarray
+        the centroids
+    """
+    class_name, inode, xyz, scale = args
+    nodes = [xyz[inode[:, i], :] for i in range(inode.shape[1])]
+    if class_name == 'CTRIA3':
+        n1, n2, n3 = nodes
+        area = 0.5 * _norm(cross(n1 - n2, n1 - n3))
+        return scale * area, (n1 + n2 + n3) / 3.
+    elif class_name == 'CQUAD4':
+        n1, n2, n3, n4 = nodes
+        area = 0.5 * _norm(cross(n3 - n1, n4 - n2))
+        return scale * area, (n1 + n2 + n3 + n4) / 4.
+    elif class_name in ['CTETRA4', 'CTETRA10']:
+        n1, n2, n3, n4 = nodes
+        volume = -(
+            (n1 - n4) * cross(n2 - n4, n3 - n4)).sum(axis=1) / 6.
+        centroid = (n1 + n2 + n3 + n4) / 4.
+    elif class_name == 'CPENTA6':
+        n1, n2, n3, n4, n5, n6 = nodes
+        area1 = 0.5 * _norm(cross(n3 - n1, n2 - n1))
+        area2 = 0.5 * _norm(cross(n6 - n4, n5 - n4))
+        c1 = (n1 + n2 + n3) / 3.
+        c2 = (n4 + n5 + n6) / 3.
+        volume = abs((area1 + area2) / 2. * _norm(c1 - c2))
+        centroid = (c1 + c2) / 2.
+    elif class_name in ['CHEXA8', 'CHEXA20']:
+        n1, n2, n3, n4, n5, n6, n7, n8 = nodes
+        (area1, c1) = _area_centroid(n1, n2, n3, n4)
+        (area2, c2) = _area_centroid(n5, n6, n7, n8)
+        volume = abs((area1 + area2) / 2. * _norm(c1 - c2))
+        centroid = (c1 + c2) / 2.
+    else:
+        raise NotImplementedError(class_name)
+    return scale * volume, centroid
+
+
+def _get_objects(objects, ids):
+    """gets the objects (e.g., elements) for a set of ids"""
+    if ids is None:
+        return list(objects.values())
+    return [objects[eid] for eid in np.unique(list(ids)).tolist() if eid in objects]
+
+
+def _get_mass_group_args(class_name, elements, nids):
+    """
+    Gets the node indices and the mass per area/density of elements of
+    the same class
+
+    Parameters
+    ----------
+    class_name : str
+        the element class (e.g., CQUAD4, CTETRA10)
+    elements : List[Element]
+        the elements
+    nids : (nnodes, ) int ndarray
+        the sorted node ids of the model
+
+    Returns
+    -------
+    args : ((nelements, nnodes) int ndarray, (nelements, ) float ndarray) / None
+        the index into nids for each element node and the mass per
+        area (shells) or density (solids); None if the elements can't
+        be vectorized (e.g., not cross referenced, missing nodes/density)
+    """
+    nnodes = MASS_ELEMENT_NNODES[class_name]
+    is_shell = class_name in ['CTRIA3', 'CQUAD4']
+    values = {}
+    scale = zeros(len(elements), dtype='float64')
     try:
-        cg = element.Centroid()
-        mass = element.Mass()
-    except:
+        for i, element in enumerate(elements):
+            prop = element.pid_ref
+            pid = prop.pid
+            if pid not in values:
+                values[pid] = prop.MassPerArea() if is_shell else prop.mid_ref.rho
+            scale[i] = values[pid]
+        node_ids = array([element.node_ids[:nnodes] for element in elements], dtype='int32')
+    except (AttributeError, KeyError, NotImplementedError, RuntimeError, TypeError, ValueError):
+        return None
+
+    inode = np.searchsorted(nids, node_ids)
+    if (inode >= len(nids)).any() or not np.array_equal(nids[inode], node_ids):
+        return None
+    return inode, scale
+
+
+def _mass_properties_arrays(mass, centroid, reference_point):
+    """
+    Sums the mass, cg, and moment of inertia of a set of masses
+
+    Parameters
+    ----------
+    mass : (n, ) float ndarray
+        the masses
+    centroid : (n, 3) float ndarray
+        the mass locations
+    reference_point : (3, ) float ndarray / str
+        the origin of the inertia or 'cg'
+
+    Returns
+    -------
+    mass : float
+        the mass of the model
+    cg : (3, ) float NDARRAY
+        the cg of the model as an array.
+    I : (6, ) float NDARRAY
+        moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
+    """
+    massi = mass.sum()
+    if massi == 0.0:
         cg = array([0., 0., 0.])
-        mass = 0.
-    return mass, cg
+        I = array([0., 0., 0., 0., 0., 0., ])
+        return massi, cg, I
+
+    cg = dot(mass, centroid) / massi
+    if isinstance(reference_point, string_types):
+        if reference_point == 'cg':
+            reference_point = cg
+        else:
+            raise ValueError('reference_point=%r and must be a (3, ) array or "cg"' % (
+                reference_point))
+
+    x = centroid[:, 0] - reference_point[0]
+    y = centroid[:, 1] - reference_point[1]
+    z = centroid[:, 2] - reference_point[2]
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    I = array([
+        dot(mass, y2 + z2),  # Ixx
+        dot(mass, x2 + z2),  # Iyy
+        dot(mass, x2 + y2),  # Izz
+        dot(mass, x * y),    # Ixy
+        dot(mass, x * z),    # Ixz
+        dot(mass, y * z),    # Iyz
+    ])
+    return (massi, cg, I)
+
+
+def _get_node_index(nids, node_ids):
+    """
+    Gets the index into the sorted node ids for a set of node ids
+
+    Parameters
+    ----------
+    nids : (nnodes, ) int ndarray
+        the sorted node ids of the model
+    node_ids : List[int] / List[List[int]]
+        the node ids to find
+
+    Returns
+    -------
+    inode : int ndarray
+        the index into nids (the shape of node_ids)
+    """
+    node_ids = np.asarray(node_ids, dtype=nids.dtype)
+    inode = np.searchsorted(nids, node_ids)
+    is_missing = inode == len(nids)
+    inode[is_missing] = 0
+    is_missing |= nids[inode] != node_ids
+    if is_missing.any():
+        raise KeyError('nids=%s are missing' % np.unique(node_ids[is_missing]).tolist())
+    return inode
+
+
+def _shell_area_centroid(xyz, inode):
+    """
+    Gets the area vector (the area times the normal) and the centroid
+    of shells, which is the vectorized version of ``Area()``,
+    ``Normal()`` and ``Centroid()``
+
+    Parameters
+    ----------
+    xyz : (nnodes, 3) float ndarray
+        the nodes in the global frame
+    inode : (nelements, 3/4) int ndarray
+        the index into xyz for the corner nodes
+
+    Returns
+    -------
+    area : (nelements, 3) float ndarray
+        the area vectors
+    centroid : (nelements, 3) float ndarray
+        the centroids
+    """
+    nodes = [xyz[inode[:, i], :] for i in range(inode.shape[1])]
+    if len(nodes) == 3:
+        n1, n2, n3 = nodes
+        return 0.5 * cross(n1 - n2, n1 - n3), (n1 + n2 + n3) / 3.
+    n1, n2, n3, n4 = nodes
+    return 0.5 * cross(n1 - n3, n2 - n4), (n1 + n2 + n3 + n4) / 4.
+
+
+def _add_shell_pressures(forces, moments, shell_loads, nids, xyz):
+    """
+    Adds the pressures on shells to the forces and moments (about the
+    origin) of the loads.  The area vector and centroid of each element
+    are calculated once, no matter how many loads use it.
+
+    Parameters
+    ----------
+    forces / moments : (nloads, 3) float ndarray
+        the forces and moments of the loads, which are updated
+    shell_loads : List[(iload, element, pressure)]
+        the pressure on a shell and the index of the load
+    nids : (nnodes, ) int ndarray
+        the sorted node ids of the model
+    xyz : (nnodes, 3) float ndarray
+        the nodes in the global frame
+    """
+    for nnodes, element_types in [(3, PRESSURE_TRIA_TYPES), (4, PRESSURE_QUAD_TYPES)]:
+        shell_loadsi = [shell_load for shell_load in shell_loads
+                        if shell_load[1].type in element_types]
+        if not shell_loadsi:
+            continue
+
+        ielements = {}
+        elements = []
+        irows = []
+        for unused_iload, element, unused_pressure in shell_loadsi:
+            if element.eid not in ielements:
+                ielements[element.eid] = len(elements)
+                elements.append(element)
+            irows.append(ielements[element.eid])
+
+        inode = _get_node_index(nids, [element.node_ids[:nnodes] for element in elements])
+        area, centroid = _shell_area_centroid(xyz, inode)
+
+        iloads = array([shell_load[0] for shell_load in shell_loadsi], dtype='int32')
+        pressures = array([shell_load[2] for shell_load in shell_loadsi], dtype='float64')
+        f = pressures[:, None] * area[irows, :]
+        np.add.at(forces, iloads, f)
+        np.add.at(moments, iloads, cross(centroid[irows, :], f))
 
 
 class BDFMethods(BDFAttributes):
     """
     Has the following methods:
         mass_properties(element_ids=None, reference_point=None, sym_axis=None,
-            num_cpus=1, scale=None)
+            num_cpus=1, scale=None, mass_cache=None)
+        get_mass_cache(num_cpus=1)
         resolve_grids(cid=0)
         unresolve_grids(model_old)
         sum_forces_moments_elements(p0, loadcase_id, eids, nids,
             include_grav=False, xyz_cid0=None)
         sum_forces_moments(p0, loadcase_id, include_grav=False,
             xyz_cid0=None)
+        sum_forces_moments_load_cases(p0, loadcase_ids=None,
+            include_grav=False, xyz_cid0=None)
+        get_load_matrix(loadcase_ids=None)
     """
 
     def __init__(self):
         BDFAttributes.__init__(self)
 
     def mass_properties(self, element_ids=None, mass_ids=None, reference_point=None,
-                        sym_axis=None, num_cpus=1, scale=None):
+                        sym_axis=None, num_cpus=1, scale=None, mass_cache=None):
         """
         Caclulates mass properties in the global system about the
         reference point.
@@ -78,10 +409,16 @@ class BDFMethods(BDFAttributes):
         sym_axis : str, optional
             The axis to which the model is symmetric. If AERO cards are used, this can be left blank
             allowed_values = 'x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+        num_cpus : int; default=1
+            the number of processes to use
         scale : float, optional
             The WTMASS scaling value.
             default=None -> PARAM, WTMASS is used
             float > 0.0
+        mass_cache : tuple; default=None
+            the per element masses and centroids from ``get_mass_cache``;
+            the element_ids/mass_ids are selected from the cache instead
+            of being recalculated
 
         Returns
         -------
@@ -125,118 +462,154 @@ class BDFMethods(BDFAttributes):
 
         for pid, eids in sorted(iteritems(pid_eids)):
             mass, cg, I = model.mass_properties(element_ids=eids)
+
+        Example 3
+        ---------
+        # mass properties of many subsets of the model
+        mass_cache = model.get_mass_cache()
+        for pid, eids in sorted(iteritems(pid_eids)):
+            mass, cg, I = model.mass_properties(element_ids=eids, mass_ids=[],
+                                                mass_cache=mass_cache)
         """
         if reference_point is None:
             reference_point = array([0., 0., 0.])
 
-        if element_ids is None:
-            elements = self.elements.values()
-        else:
-            elements = [element for eid, element in self.elements.items() if eid in element_ids]
-
-        if mass_ids is None:
-            masses = self.masses.values()
+        if mass_cache is None:
+            elements = _get_objects(self.elements, element_ids)
+            masses = _get_objects(self.masses, mass_ids)
+            mass_cache = self._get_mass_centroid_arrays(elements, masses, num_cpus=num_cpus)
+            unused_eids, unused_is_mass, mass, centroid = mass_cache
         else:
-            masses = [mass for eid, mass in self.masses.items() if eid in mass_ids]
-        nelements = len(elements) + len(masses)
-
-        num_cpus = 1
-        if num_cpus > 1:
-            mass, cg, I = self._mass_properties_mp(num_cpus, elements, masses,
-                                                   nelements,
-                                                   reference_point=reference_point)
-        else:
-            mass, cg, I = self._mass_properties_sp(elements, masses,
-                                                   reference_point=reference_point)
-
+            eids, is_mass, mass, centroid = mass_cache
+            i = np.ones(len(eids), dtype='bool')
+            if element_ids is not None:
+                i[~is_mass] = np.in1d(eids[~is_mass], list(element_ids))
+            if mass_ids is not None:
+                i[is_mass] = np.in1d(eids[is_mass], list(mass_ids))
+            mass = mass[i]
+            centroid = centroid[i, :]
+
+        mass, cg, I = _mass_properties_arrays(mass, centroid, reference_point)
         mass, cg, I = self._apply_mass_symmetry(sym_axis, scale, mass, cg, I)
         return (mass, cg, I)
 
-    def _mass_properties_sp(self, elements, masses, reference_point):
+    def get_mass_cache(self, num_cpus=1):
         """
-        Caclulates mass properties in the global system about the
-        reference point.
+        Calculates the mass and centroid of every element and mass, so
+        ``mass_properties`` can be called on many subsets of the model
+        (e.g., by property id) without recalculating them.
 
         Parameters
         ----------
-        elements : List[int]; ndarray
-            the element ids to consider
-        masses : List[int]; ndarray
-            the mass ids to consider
-        reference_point : (3, ) ndarray; default = <0,0,0>.
-            an array that defines the origin of the frame.
+        num_cpus : int; default=1
+            the number of processes to use
 
         Returns
         -------
-        mass : float
-            the mass of the model
-        cg : (3, ) float NDARRAY
-            the cg of the model as an array.
-        I : (6, ) float NDARRAY
-            moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
+        mass_cache : tuple
+            eids : (n, ) int ndarray
+                the element/mass ids
+            is_mass : (n, ) bool ndarray
+                is the id a mass id (e.g., CONM2) or element id
+            mass : (n, ) float ndarray
+                the masses (WTMASS isn't applied)
+            centroid : (n, 3) float ndarray
+                the centroids
+        """
+        return self._get_mass_centroid_arrays(
+            list(self.elements.values()), list(self.masses.values()), num_cpus=num_cpus)
 
-        .. seealso:: self.mass_properties
+    def _get_mass_centroid_arrays(self, elements, masses, num_cpus=1):
         """
-        #Ixx Iyy Izz, Ixy, Ixz Iyz
-        # precompute the CG location and make it the reference point
-        I = array([0., 0., 0., 0., 0., 0., ])
-        cg = array([0., 0., 0.])
-        if isinstance(reference_point, string_types):
-            if reference_point == 'cg':
-                mass = 0.
-                for pack in [elements, masses]:
-                    for element in pack:
-                        try:
-                            p = element.Centroid()
-                            m = element.Mass()
-                            mass += m
-                            cg += m * p
-                        except:
-                            pass
-                if mass == 0.0:
-                    return mass, cg, I
+        Calculates the mass and centroid of elements and masses.
 
-                reference_point = cg / mass
-            else:
-                # reference_point = [0.,0.,0.] or user-defined array
-                pass
+        The elements in MASS_ELEMENT_NNODES are grouped by class and
+        calculated with arrays (in a process pool if num_cpus > 1) and
+        the rest are calculated with ``Mass()`` and ``Centroid()``.
 
-        mass = 0.
-        cg = array([0., 0., 0.])
-        for pack in [elements, masses]:
-            for element in pack:
-                try:
-                    p = element.Centroid()
-                except:
-                    continue
+        Parameters
+        ----------
+        elements : List[Element]
+            the elements to consider
+        masses : List[PointMass]
+            the masses to consider
+        num_cpus : int; default=1
+            the number of processes to use
 
-                try:
-                    m = element.Mass()
-                    (x, y, z) = p - reference_point
-                    x2 = x * x
-                    y2 = y * y
-                    z2 = z * z
-                    I[0] += m * (y2 + z2)  # Ixx
-                    I[1] += m * (x2 + z2)  # Iyy
-                    I[2] += m * (x2 + y2)  # Izz
-                    I[3] += m * x * y      # Ixy
-                    I[4] += m * x * z      # Ixz
-                    I[5] += m * y * z      # Iyz
-                    mass += m
-                    cg += m * p
-                except:
-                    # PLPLANE
-                    if element.pid_ref.type == 'PSHELL':
-                        self.log.warning('p=%s reference_point=%s type(reference_point)=%s' % (p, reference_point, type(reference_point)))
-                        raise
-                    self.log.warning("could not get the inertia for element/property\n%s%s" % (
-                        element, element.pid_ref))
+        Returns
+        -------
+        mass_cache : tuple
+            see ``get_mass_cache``
+        """
+        if num_cpus > 20:
+            # the user probably doesn't want 68,000 CPUs; change it if you want...
+            raise RuntimeError('num_proc must be < 20; num_cpus=%s' % num_cpus)
 
-                    continue
+        all_elements = list(elements) + list(masses)
+        nelements = len(all_elements)
+        eids = array([element.eid for element in all_elements], dtype='int32')
+        is_mass = zeros(nelements, dtype='bool')
+        is_mass[len(elements):] = True
+        mass = zeros(nelements, dtype='float64')
+        centroid = zeros((nelements, 3), dtype='float64')
+
+        groups = defaultdict(list)
+        objects = []
+        for i, element in enumerate(elements):
+            class_name = element.__class__.__name__
+            if class_name in MASS_ELEMENT_NNODES:
+                groups[class_name].append(i)
+            else:
+                objects.append(i)
+        objects.extend(range(len(elements), nelements))
+
+        tasks = []
+        itasks = []
+        if groups:
+            nids, xyz = self.get_node_positions()
+        for class_name, igroup in sorted(iteritems(groups)):
+            args = _get_mass_group_args(class_name, [all_elements[i] for i in igroup], nids)
+            if args is None:
+                objects.extend(igroup)
+                continue
+            inode, scale = args
+            tasks.append((class_name, inode, xyz, scale))
+            itasks.append(igroup)
+
+        if num_cpus > 1 and tasks:
+            import multiprocessing as mp
+            self.log.debug("Creating %i-process pool!" % num_cpus)
+            pool = mp.Pool(num_cpus)
+            results = pool.map(_mass_properties_mass_mp_func, tasks)
+            pool.close()
+            pool.join()
+        else:
+            results = [_mass_properties_mass_mp_func(task) for task in tasks]
 
-        if mass:
-            cg /= mass
-        return (mass, cg, I)
+        for igroup, (massi, centroidi) in zip(itasks, results):
+            mass[igroup] = massi
+            centroid[igroup, :] = centroidi
+
+        for i in sorted(objects):
+            element = all_elements[i]
+            try:
+                p = element.Centroid()
+            except:
+                continue
+
+            try:
+                m = element.Mass()
+            except:
+                # PLPLANE
+                if element.pid_ref.type == 'PSHELL':
+                    self.log.warning('p=%s' % p)
+                    raise
+                self.log.warning("could not get the inertia for element/property\n%s%s" % (
+                    element, element.pid_ref))
+                continue
+            mass[i] = m
+            centroid[i, :] = p
+        return eids, is_mass, mass, centroid
 
     def _mass_properties_new(self, elements, masses, reference_point=None,
                              sym_axis=None, scale=None, xyz_cid0=None):
@@ -249,9 +622,8 @@ class BDFMethods(BDFAttributes):
             reference_point = array([0., 0., 0.])
 
         if xyz_cid0 is None:
-            xyz = {}
-            for nid, node in iteritems(self.nodes):
-                xyz[nid] = node.get_position()
+            nids, xyz_nodes = self.get_node_positions()
+            xyz = dict(zip(nids.tolist(), xyz_nodes))
         else:
             xyz = xyz_cid0
 
@@ -478,108 +850,6 @@ class BDFMethods(BDFAttributes):
         I *= scale
         return (mass, cg, I)
 
-
-    def _mass_properties_mp(self, num_cpus, elements, masses, nelements,
-                            reference_point=None):
-        """
-        Caclulates mass properties in the global system about the
-        reference point.
-
-        Parameters
-        ----------
-        num_cpus : int
-            the number of CPUs to use; 2 < num_cpus < 20
-        elements : ???
-            ???
-        masses : ???
-            ???
-        nelements : int
-            the size of the mass array
-        reference_point : (3, ) ndarray; default = <0,0,0>.
-            an array that defines the origin of the frame.
-
-        Returns
-        -------
-        mass : float
-            the mass of the model
-        cg : (3, ) float NDARRAY
-            the cg of the model as an array.
-        I : (6, ) float NDARRAY
-            moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
-
-        .. seealso:: self.mass_properties
-        """
-        if num_cpus <= 1:
-            raise RuntimeError('num_proc must be > 1; num_cpus=%s' % num_cpus)
-        if num_cpus > 20:
-            # the user probably doesn't want 68,000 CPUs; change it if you want...
-            raise RuntimeError('num_proc must be < 20; num_cpus=%s' % num_cpus)
-
-        self.log.debug("Creating %i-process pool!" % num_cpus)
-        pool = mp.Pool(num_cpus)
-        no_mass_elements = [
-            'CBUSH', 'CBUSH1D',
-            'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-            'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-        ]
-        result = pool.imap(_mass_properties_mass_mp_func,
-                           [(element) for element in elements
-                            if element.type not in no_mass_elements])
-        result2 = pool.imap(_mass_properties_mass_mp_func, [(element) for element in masses])
-
-        mass = zeros((nelements), 'float64')
-        xyz = zeros((nelements, 3), 'float64')
-        i = 0
-        for i, return_values in enumerate(result):
-            #self.log.info("%.3f %% Processed" % (i*100./nelements))
-            mass[i] = return_values[0]
-            xyz[i, :] = return_values[1]
-        pool.close()
-        pool.join()
-
-        pool = mp.Pool(num_cpus)
-        for i2, return_values in enumerate(result2):
-            mass[i+i2] = return_values[0]
-            xyz[i+i2, :] = return_values[1]
-        pool.close()
-        pool.join()
-
-        massi = mass.sum()
-        #cg = (mass * xyz) / massi
-        if massi == 0.0:
-            cg = array([0., 0., 0.])
-            I = array([0., 0., 0., 0., 0., 0., ])
-            return massi, cg, I
-
-        cg = dot(mass, xyz) / massi
-        if reference_point is None:
-            x = xyz[:, 0]
-            y = xyz[:, 1]
-            z = xyz[:, 2]
-        elif isinstance(reference_point[0], float):
-            x = xyz[:, 0] - reference_point[0]
-            y = xyz[:, 1] - reference_point[1]
-            z = xyz[:, 2] - reference_point[2]
-        elif reference_point in [u'cg', 'cg']:
-            x = xyz[:, 0] - cg[0]
-            y = xyz[:, 1] - cg[1]
-            z = xyz[:, 2] - cg[2]
-
-        x2 = x ** 2
-        y2 = y ** 2
-        z2 = z ** 2
-
-        I = array([
-            mass * (y2 + z2),  # Ixx
-            mass * (x2 + z2),  # Iyy
-            mass * (x2 + y2),  # Izz
-            mass * (x * y),    # Ixy
-            mass * (x * z),    # Ixz
-            mass * (y * z),    # Iyz
-        ]).sum(axis=1)
-
-        return (massi, cg, I)
-
     def resolve_grids(self, cid=0):
         """
         Puts all nodes in a common coordinate system (mainly for cid testing)
@@ -702,6 +972,7 @@ class BDFMethods(BDFAttributes):
 
         .. todo:: not done...
         """
+        from pyNastran.bdf.cards.loads.static_loads import Moment, Force, LOAD
         if not isinstance(loadcase_id, integer_types):
             raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
         if isinstance(p0, integer_types):
@@ -739,9 +1010,8 @@ class BDFMethods(BDFAttributes):
         M = array([0., 0., 0.])
 
         if xyz_cid0 is None:
-            xyz = {}
-            for nid, node in iteritems(self.nodes):
-                xyz[nid] = node.get_position()
+            nids, xyz_nodes = self.get_node_positions()
+            xyz = dict(zip(nids.tolist(), xyz_nodes))
         else:
             xyz = xyz_cid0
 
@@ -1064,12 +1334,13 @@ class BDFMethods(BDFAttributes):
 
     def sum_forces_moments(self, p0, loadcase_id, include_grav=False, xyz_cid0=None):
         """
-        Sums applied forces & moments about a reference point p0 for all
-        load cases.
+        Sums applied forces & moments about a reference point p0 for a
+        load case (see ``sum_forces_moments_load_cases``).
         Considers:
           - FORCE, FORCE1, FORCE2
           - MOMENT, MOMENT1, MOMENT2
-          - PLOAD, PLOAD2, PLOAD4
+          - PLOAD, PLOAD1, PLOAD2, PLOAD4
+          - GRAV
           - LOAD
 
         Parameters
@@ -1079,7 +1350,7 @@ class BDFMethods(BDFAttributes):
         loadcase_id : int
             the LOAD=ID to analyze
         include_grav : bool; default=False
-            includes gravity in the summation (not supported)
+            includes gravity in the summation
         xyz_cid0 : None / Dict[int] = (3, ) ndarray
             the nodes in the global coordinate system
 
@@ -1091,411 +1362,471 @@ class BDFMethods(BDFAttributes):
             the moments
 
         .. warning:: not full validated
-        .. todo:: It's super slow for cid != 0.   We can speed this up a lot
-                 if we calculate the normal, area, centroid based on
-                 precomputed node locations.
 
         Pressure acts in the normal direction per model/real/loads.bdf and loads.f06
         """
         if not isinstance(loadcase_id, integer_types):
             raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        unused_loadcase_ids, forces, moments = self.sum_forces_moments_load_cases(
+            p0, [loadcase_id], include_grav=include_grav, xyz_cid0=xyz_cid0)
+        return forces[0, :], moments[0, :]
+
+    def sum_forces_moments_load_cases(self, p0, loadcase_ids=None, include_grav=False,
+                                      xyz_cid0=None):
+        """
+        Sums applied forces & moments about a reference point p0 for
+        many load cases at once.
+
+        The force and moment of each load are calculated once (see
+        ``get_load_matrix``), so the resultants of the load cases are
+        found with a sparse matrix product::
 
-        cid = 0
+          F = S * f
+          M = S * (r x f + m) - p0 x F
+
+        Parameters
+        ----------
+        p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+            the reference point
+        loadcase_ids : List[int]; default=None -> all
+            the LOAD=IDs to analyze
+        include_grav : bool; default=False
+            includes gravity in the summation
+        xyz_cid0 : None / Dict[int] = (3, ) ndarray
+            the nodes in the global coordinate system
+
+        Returns
+        -------
+        loadcase_ids : (ncases, ) int ndarray
+            the load cases
+        forces : (ncases, 3) float ndarray
+            the forces
+        moments : (ncases, 3) float ndarray
+            the moments about p0
+        """
         if isinstance(p0, integer_types):
-            if cid == 0:
-                p = self.nodes[p0].get_position()
-            else:
-                p = self.nodes[p0].get_position_wrt(self, cid)
+            p = self.nodes[p0].get_position()
         else:
             p = array(p0)
 
-        try:
-            load_case = self.loads[loadcase_id]
-        except:
-            msg = 'load_case=%s is invalid; ' % loadcase_id
-            msg += 'load_cases = %s\n' % self.loads.keys()
-            for subcase_id, subcase in iteritems(self.subcases):
-                if 'LOAD' in subcase:
-                    load_id = subcase.get_parameter('LOAD')[0]
-                    msg += '  SUBCASE %i; LOAD=%s\n' % (subcase_id, load_id)
-                else:
-                    msg += '  SUBCASE %i has no LOAD\n' % (subcase_id)
-                print(msg)
-            raise KeyError(msg)
-        #for (key, load_case) in iteritems(self.loads):
-            #if key != loadcase_id:
-                #continue
+        loadcase_ids, loads, scale = self.get_load_matrix(loadcase_ids)
+        load_forces, load_moments = self._get_load_forces_moments(
+            loads, include_grav=include_grav, xyz_cid0=xyz_cid0)
+        forces = scale.dot(load_forces)
+        moments = scale.dot(load_moments) - cross(p, forces)
+        return loadcase_ids, forces, moments
 
-        scale_factors2 = []
-        loads2 = []
-        is_grav = True
-        for load in load_case:
-            if isinstance(load, LOAD):
-                scale_factors, loads = load.get_reduced_loads()
-                scale_factors2 += scale_factors
-                loads2 += loads
-            elif load.type in 'GRAV':
-                scale_factors2.append(1.)
-                loads2.append(load)
-                is_grav = True
-            else:
-                scale_factors2.append(1.)
-                loads2.append(load)
+    def get_load_matrix(self, loadcase_ids=None):
+        """
+        Expands the load cases (and the LOAD combinations) into a sparse
+        matrix of scale factors, so a load that's used by many load
+        cases is only considered once.
 
-        F = array([0., 0., 0.])
-        M = array([0., 0., 0.])
+        Parameters
+        ----------
+        loadcase_ids : List[int]; default=None -> all
+            the LOAD=IDs
 
-        if xyz_cid0 is None:
-            xyz = {}
-            for nid, node in iteritems(self.nodes):
-                xyz[nid] = node.get_position()
-        else:
-            xyz = xyz_cid0
+        Returns
+        -------
+        loadcase_ids : (ncases, ) int ndarray
+            the load cases
+        loads : List[Load]
+            the loads (no LOAD cards) that are used by the load cases
+        scale : (ncases, nloads) float csr_matrix
+            the scale factor of each load in each load case
+        """
+        from scipy.sparse import coo_matrix
+        from pyNastran.bdf.cards.loads.static_loads import LOAD
+        if loadcase_ids is None:
+            loadcase_ids = sorted(self.loads)
+
+        iloads = {}
+        loads = []
+        icases = []
+        icolumns = []
+        scale_factors = []
+        for icase, loadcase_id in enumerate(loadcase_ids):
+            try:
+                load_case = self.loads[loadcase_id]
+            except KeyError:
+                msg = 'load_case=%s is invalid; ' % loadcase_id
+                msg += 'load_cases = %s\n' % sorted(self.loads)
+                for subcase_id, subcase in sorted(iteritems(self.subcases)):
+                    if 'LOAD' in subcase:
+                        load_id = subcase.get_parameter('LOAD')[0]
+                        msg += '  SUBCASE %i; LOAD=%s\n' % (subcase_id, load_id)
+                    else:
+                        msg += '  SUBCASE %i has no LOAD\n' % (subcase_id)
+                raise KeyError(msg)
 
-        unsupported_types = set([])
-        for load, scale in zip(loads2, scale_factors2):
-            if load.type in ['FORCE', 'FORCE1']:
-                f = load.mag * load.xyz
-                node = self.Node(load.node_id)
-                r = xyz[node.nid] - p
-                m = cross(r, f)
-                F += f * scale
-                M += m * scale
-            elif load.type == 'FORCE2':
-                f = load.mag * load.xyz * scale
-                node = self.Node(load.node_id)
-                r = xyz[node.nid] - p
-                m = cross(r, f)
-                F += f
-                M += m
-            elif load.type in ['MOMENT', 'MOMENT1', 'MOMENT2']:
-                m = load.mag * load.xyz
-                M += m * scale
-            elif load.type == 'PLOAD':
-                nodes = load.node_ids
-                nnodes = len(nodes)
-                if nnodes == 3:
-                    n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                    axb = cross(n1 - n2, n1 - n3)
-                    centroid = (n1 + n2 + n3) / 3.
-                elif nnodes == 4:
-                    n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                    axb = cross(n1 - n3, n2 - n4)
-                    centroid = (n1 + n2 + n3 + n4) / 4.
+            for load in load_case:
+                if isinstance(load, LOAD):
+                    reduced_scale_factors, reduced_loads = load.get_reduced_loads()
                 else:
-                    msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
-                    raise RuntimeError(msg)
-
-                nunit = norm(axb)
-                area = 0.5 * nunit
-                try:
-                    normal = axb / nunit
-                except FloatingPointError:
-                    msg = ''
-                    for i, nid in enumerate(nodes):
-                        msg += 'nid%i=%i node=%s\n' % (i+1, nid, xyz[nodes[i]])
-                    msg += 'a x b = %s\n' % axb
-                    msg += 'nunit = %s\n' % nunit
-                    raise FloatingPointError(msg)
-                r = centroid - p
-                f = load.p * area * normal * scale
-                m = cross(r, f)
+                    reduced_scale_factors, reduced_loads = [1.], [load]
+
+                for scale, reduced_load in zip(reduced_scale_factors, reduced_loads):
+                    key = id(reduced_load)
+                    if key not in iloads:
+                        iloads[key] = len(loads)
+                        loads.append(reduced_load)
+                    icases.append(icase)
+                    icolumns.append(iloads[key])
+                    scale_factors.append(scale)
+
+        scale = coo_matrix(
+            (array(scale_factors, dtype='float64'),
+             (array(icases, dtype='int32'), array(icolumns, dtype='int32'))),
+            shape=(len(loadcase_ids), len(loads))).tocsr()
+        return array(loadcase_ids, dtype='int32'), loads, scale
+
+    def _get_load_forces_moments(self, loads, include_grav=False, xyz_cid0=None):
+        """
+        Calculates the force and the moment about the origin of each load
 
-                F += f
-                M += m
+        The loads of the same type are calculated with arrays, the shell
+        pressures are calculated with the area/normal/centroid of each
+        element (calculated once), and GRAV uses the total mass and cg
+        of the elements and masses (see ``get_mass_cache``).
 
-            elif load.type == 'PLOAD1':
-                elem = load.eid
+        Parameters
+        ----------
+        loads : List[Load]
+            the loads (no LOAD cards)
+        include_grav : bool; default=False
+            includes gravity in the summation
+        xyz_cid0 : None / Dict[int] = (3, ) ndarray
+            the nodes in the global coordinate system
 
-                p1 = load.p1 * scale
-                p2 = load.p2 * scale
-                if elem.type not in ['CBAR', 'CBEAM', 'CBEND']:
-                    raise RuntimeError('element.type=%r is not a CBAR, CBEAM, or CBEND' % elem.type)
+        Returns
+        -------
+        forces : (nloads, 3) float ndarray
+            the forces
+        moments : (nloads, 3) float ndarray
+            the moments about the origin
+        """
+        if xyz_cid0 is None:
+            nids, xyz = self.get_node_positions()
+        else:
+            nids = array(sorted(xyz_cid0), dtype='int32')
+            xyz = array([xyz_cid0[nid] for nid in nids.tolist()], dtype='float64').reshape(
+                len(nids), 3)
 
-                nodes = elem.node_ids
-                n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-                n1 += elem.wa
-                n2 += elem.wb
+        nloads = len(loads)
+        forces = zeros((nloads, 3), dtype='float64')
+        moments = zeros((nloads, 3), dtype='float64')
 
-                deltaL = n2 - n1
-                L = norm(deltaL)
-                try:
-                    Ldir = deltaL / L
-                except:
-                    msg = 'Length=0.0; nid1=%s nid2=%s\n' % (nodes[0], nodes[1])
-                    msg += '%s%s' % (str(elem.nodes[0]), str(elem.nodes[1]))
-                    raise FloatingPointError(msg)
-                if load.scale == 'FR':  # x1, x2 are fractional lengths
-                    x1 = load.x1
-                    x2 = load.x2
-                    #compute_fx = False
-                elif load.scale == 'LE': # x1, x2 are actual lengths
-                    x1 = load.x1 / L
-                    x2 = load.x2 / L
-                elif load.scale == 'LEPR':
-                    print('PLOAD1 LEPR continue')
-                    continue
-                    #msg = 'scale=%r is not supported.  Use "FR", "LE".' % load.scale
-                    #raise NotImplementedError(msg)
-                elif load.scale == 'FRPR':
-                    print('PLOAD1 FRPR continue')
-                    continue
-                    #msg = 'scale=%r is not supported.  Use "FR", "LE".' % load.scale
-                    #raise NotImplementedError(msg)
-                else:
-                    msg = 'PLOAD1 scale=%r is not supported.  Use "FR", "LE".' % load.scale
-                    raise NotImplementedError(msg)
+        iloads_by_type = defaultdict(list)
+        for iload, load in enumerate(loads):
+            iloads_by_type[load.type].append(iload)
 
-                # FY - force in basic coordinate system
-                # FR - fractional;
-                assert x1 <= x2, 'x1=%s x2=%s' % (x1, x2)
-                if x1 != x2:
-                    # continue
-                    if not load.type in ['FX', 'FY', 'FZ']:
-                        print('PLOAD1 x1 != x2 continue; x1=%s x2=%s; scale=%r\n%s%s'% (x1, x2, load.scale, str(elem), str(load)))
+        shell_loads = []
+        unsupported_types = set([])
+        for load_type, iloads in sorted(iteritems(iloads_by_type)):
+            group = [loads[iload] for iload in iloads]
+            if load_type in ['FORCE', 'FORCE1', 'FORCE2']:
+                f = array([load.mag * load.xyz for load in group], dtype='float64')
+                r = xyz[_get_node_index(nids, [load.node_id for load in group]), :]
+                forces[iloads, :] = f
+                moments[iloads, :] = cross(r, f)
+
+            elif load_type in ['MOMENT', 'MOMENT1', 'MOMENT2']:
+                moments[iloads, :] = array([load.mag * load.xyz for load in group],
+                                           dtype='float64')
+
+            elif load_type == 'PLOAD':
+                for nnodes in [3, 4]:
+                    iloadsi = [iload for iload, load in zip(iloads, group)
+                               if len(load.node_ids) == nnodes]
+                    if not iloadsi:
                         continue
-                    print('check this...PLOAD1 x1 != x2; x1=%s x2=%s; scale=%r\n%s%s'% (x1, x2, load.scale, str(elem), str(load)))
-
-                    # y = (y2-y1)/(x2-x1)*(x-x1) + y1
-                    # y = (y2-y1) * (x-x1)/(x2-x1) + y1
-                    # y = y2*(x-x1)/(x2-x1) + y1*(1-(x-x1)/(x2-x1))
-                    # y = y2 * r + y1 * (1-r)
-                    # r = (x-x1)/(x2-x1)
-                    #
-                    # y = y2 * r + y1 - y1 * r
-                    # yi = y2 * ri + y1 * x + y1 * ri
-                    # yi = y2 * ri + y1 * (x2-x1) + y1 * ri
-                    #
-                    # ri = integral(r)
-                    # ri = 1/(x2-x1) * (0.5) * (x1-x2)**2
-                    #
-                    # yi = integral(y)
-                    # yi = y2 * ri + y1 * (x2-x1) + y1 * ri
-                    # ri = 1./(x2-x1) * (0.5) * (x1-x2)**2
-                    # y1 = p1
-                    # y2 = p2
-                    # yi = y2 * ri + y1 * (x2-x1) + y1 * ri
-                    # F = yi
-                    if allclose(p1, -p2):
-                        Ftotal = p1
-                        x = (x1 + x2) / 2.
-                    else:
-                        Ftotal = L * (x2-x1) * (p1 + p2)/2.
-                        Mx = L * p1 * (x2-x1)/2. + L * (p2-p1) * (2./3. * x2 + 1./3. * x1)
-                        x = Mx / Ftotal
-                    print('L=%s x1=%s x2=%s p1/L=%s p2/L=%s Ftotal=%s Mtotal=%s x=%s' % (L, x1, x2, p1, p2, Ftotal, Mx, x))
-
-                    i = Ldir
-                    if load.Type in ['FX', 'FY', 'FZ']:
-                        r = (1. - x) * n1 + x * n2
-                        # print('r=%s n1=%s n2=%s' % (r, n1, n2))
-                        if load.Type == 'FX':
-                            Fdir = array([1., 0., 0.])
-                        elif load.Type == 'FY':
-                            Fdir = array([0., 1., 0.])
-                        elif load.Type == 'FZ':
-                            Fdir = array([0., 0., 1.])
+                    inode = _get_node_index(nids, [loads[iload].node_ids for iload in iloadsi])
+                    area, centroid = _shell_area_centroid(xyz, inode)
+                    pressures = array([loads[iload].p for iload in iloadsi], dtype='float64')
+                    f = pressures[:, None] * area
+                    forces[iloadsi, :] = f
+                    moments[iloadsi, :] = cross(centroid, f)
+
+            elif load_type == 'PLOAD2':
+                for iload, load in zip(iloads, group):
+                    for eid in load.element_ids:
+                        elem = self.elements[eid]
+                        if elem.type in PLOAD2_SHELL_TYPES:
+                            shell_loads.append((iload, elem, load.pressure))
                         else:
-                            raise NotImplementedError('Type=%r is not supported.  Use "FX", "FY", "FZ".' % load.Type)
+                            self.log.debug('eid=%s etype=%r loadtype=%r not supported' % (
+                                eid, elem.type, load.type))
+
+            elif load_type == 'PLOAD4':
+                for iload, load in zip(iloads, group):
+                    self._add_pload4(forces, moments, shell_loads, iload, load)
+
+            elif load_type == 'GRAV':
+                if include_grav:
+                    unused_eids, unused_is_mass, mass, centroid = self.get_mass_cache()
+                    gravity = array([load.GravityVector() for load in group], dtype='float64')
+                    forces[iloads, :] = mass.sum() * gravity
+                    moments[iloads, :] = cross(dot(mass, centroid), gravity)
+
+            elif load_type == 'PLOAD1':
+                xyz_dict = dict(zip(nids.tolist(), xyz))
+                for iload, load in zip(iloads, group):
+                    forces[iload, :], moments[iload, :] = self._sum_pload1(load, xyz_dict)
+            else:
+                # we collect them so we only get one print
+                unsupported_types.add(load_type)
+
+        if shell_loads:
+            _add_shell_pressures(forces, moments, shell_loads, nids, xyz)
 
-                    Fi = Ftotal * Fdir
-                    Mi = cross(r - p, Fdir * Ftotal)
-                    F += Fi
-                    M += Mi
-                    print('Fi=%s Mi=%s x=%s' % (Fi, Mi, x))
+        for load_type in sorted(unsupported_types):
+            self.log.debug('loadtype=%r not supported' % load_type)
+        return forces, moments
+
+    def _add_pload4(self, forces, moments, shell_loads, iload, load):
+        """
+        Adds a PLOAD4 to the forces and moments (about the origin) of the
+        loads; the shells are added to shell_loads, so they can be
+        calculated together (see ``_add_shell_pressures``)
+        """
+        assert load.Cid() == 0, 'Cid() = %s' % (load.Cid())
+        assert load.sorl == 'SURF', 'sorl = %s' % (load.sorl)
+        assert load.ldir == 'NORM', 'ldir = %s' % (load.ldir)
+        for elem in load.eids:
+            eid = elem.eid
+            if elem.type in PRESSURE_TRIA_TYPES:
+                nface = 3
+            elif elem.type in PRESSURE_QUAD_TYPES:
+                nface = 4
+            elif elem.type == 'CTETRA':
+                unused_face, area, centroid, normal = elem.getFaceAreaCentroidNormal(
+                    load.g1.nid, load.g34.nid)
+                nface = 3
+            elif elem.type == 'CHEXA':
+                unused_face, area, centroid, normal = elem.getFaceAreaCentroidNormal(
+                    load.g34.nid, load.g1.nid)
+                nface = 4
+            elif elem.type == 'CPENTA':
+                g1 = load.g1.nid
+                if load.g34 is None:
+                    unused_face, area, centroid, normal = elem.getFaceAreaCentroidNormal(g1)
+                    nface = 3
                 else:
-                    v = elem.get_orientation_vector(xyz)
-                    i = Ldir
-                    ki = cross(i, v)
-                    k = ki / norm(ki)
-                    j = cross(k, i)
-
-                    if load.Type in ['FX', 'FY', 'FZ']:
-                        r = (1 - x1) * n1 + x1 * n2
-                        if load.Type == 'FX':
-                            if x1 == x2:
-                                Fdir = array([1., 0., 0.])
-                        elif load.Type == 'FY':
-                            if x1 == x2:
-                                Fdir = array([0., 1., 0.])
-                        elif load.Type == 'FZ':
-                            if x1 == x2:
-                                Fdir = array([0., 0., 1.])
-                        F += p1 * Fdir
-                        M += cross(r - p, F)
-                    elif load.Type in ['MX', 'MY', 'MZ']:
-                        if load.Type == 'MX':
-                            if x1 == x2:
-                                Mdir = array([1., 0., 0.])
-                        elif load.Type == 'MY':
-                            if x1 == x2:
-                                Mdir = array([0., 1., 0.])
-                        elif load.Type == 'MZ':
-                            if x1 == x2:
-                                Mdir = array([0., 0., 1.])
-                        M += p1 * Mdir
-                    elif load.Type in ['FXE', 'FYE', 'FZE']:
-                        r = (1 - x1) * n1 + x1 * n2
-                        if load.Type == 'FXE':
-                            if x1 == x2:
-                                Fdir = i
-                        elif load.Type == 'FYE':
-                            if x1 == x2:
-                                Fdir = j
-                        elif load.Type == 'FZE':
-                            if x1 == x2:
-                                Fdir = k
-                        #print('    Fdir =', Fdir, load.Type)
-                        try:
-                            F += p1 * Fdir
-                        except FloatingPointError:
-                            msg = 'eid = %s\n' % elem.eid
-                            msg += 'i = %s\n' % Ldir
-                            msg += 'Fdir = %s\n' % Fdir
-                            msg += 'load = \n%s' % str(load)
-                            raise FloatingPointError(msg)
-                        M += cross(r - p, F)
-                        del Fdir
-
-                    elif load.Type in ['MXE', 'MYE', 'MZE']:
-                        if load.Type == 'MXE':
-                            if x1 == x2:
-                                Mdir = i
-                        elif load.Type == 'MYE':
-                            if x1 == x2:
-                                Mdir = j
-                        elif load.Type == 'MZE':
-                            if x1 == x2:
-                                Mdir = k
-                        try:
-                            M += p1 * Mdir
-                        except FloatingPointError:
-                            msg = 'eid = %s\n' % elem.eid
-                            msg += 'Mdir = %s\n' % Mdir
-                            msg += 'load = \n%s' % str(load)
-                            raise FloatingPointError(msg)
-                        del Mdir
-                    else:
-                        raise NotImplementedError('Type=%r is not supported.  Use "FX", "FXE".' % load.Type)
+                    unused_face, area, centroid, normal = elem.getFaceAreaCentroidNormal(
+                        g1, load.g34.nid)
+                    nface = 4
+            else:
+                self.log.debug('eid=%s etype=%r loadtype=%r not supported' % (
+                    eid, elem.type, load.type))
+                continue
 
-            elif load.type == 'PLOAD2':
-                pressure = load.pressure * scale
-                for eid in load.element_ids:
-                    elem = self.elements[eid]
-                    if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR']:
-                        n = elem.Normal()
-                        area = elem.Area()
-                        f = pressure * n * area
-                        r = elem.Centroid() - p
-                        m = cross(r, f)
-                        F += f
-                        M += m
-                    else:
-                        self.log.debug('case=%s etype=%r loadtype=%r not supported' % (loadcase_id, elem.type, load.type))
-            elif load.type == 'PLOAD4':
-                assert load.Cid() == 0, 'Cid() = %s' % (load.Cid())
-                assert load.sorl == 'SURF', 'sorl = %s' % (load.sorl)
-                assert load.ldir == 'NORM', 'ldir = %s' % (load.ldir)
-                for elem in load.eids:
-                    eid = elem.eid
-                    if elem.type in ['CTRIA3', 'CTRIA6', 'CTRIA', 'CTRIAR',]:
-                        # triangles
-                        nodes = elem.node_ids
-                        n1, n2, n3 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]]
-                        axb = cross(n1 - n2, n1 - n3)
-                        nunit = norm(axb)
-                        area = 0.5 * nunit
-                        try:
-                            normal = axb / nunit
-                        except FloatingPointError:
-                            msg = ''
-                            for i, nid in enumerate(nodes):
-                                msg += 'nid%i=%i node=%s\n' % (i + 1, nid, xyz[nodes[i]])
-                            msg += 'a x b = %s\n' % axb
-                            msg += 'nunit = %s\n' % nunit
-                            raise FloatingPointError(msg)
-                        centroid = (n1 + n2 + n3) / 3.
-                        nface = 3
-                    elif elem.type in ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR']:
-                        # quads
-                        nodes = elem.node_ids
-                        n1, n2, n3, n4 = xyz[nodes[0]], xyz[nodes[1]], xyz[nodes[2]], xyz[nodes[3]]
-                        axb = cross(n1 - n3, n2 - n4)
-                        nunit = norm(axb)
-                        area = 0.5 * nunit
-                        try:
-                            normal = axb / nunit
-                        except FloatingPointError:
-                            msg = ''
-                            for i, nid in enumerate(nodes):
-                                msg += 'nid%i=%i node=%s\n' % (i+1, nid, xyz[nodes[i]])
-                            msg += 'a x b = %s\n' % axb
-                            msg += 'nunit = %s\n' % nunit
-                            raise FloatingPointError(msg)
+            pressures = load.pressures[:nface]
+            assert len(pressures) == nface
+            if min(pressures) != max(pressures):
+                pressure = mean(pressures)
+            else:
+                pressure = load.pressures[0]
 
-                        centroid = (n1 + n2 + n3 + n4) / 4.
-                        nface = 4
-                    elif elem.type == 'CTETRA':
-                        #face1 = elem.get_face(load.g1.nid, load.g34.nid)
-                        face, area, centroid, normal = elem.getFaceAreaCentroidNormal(load.g1.nid, load.g34.nid)
-                        #assert face == face1
-                        nface = 3
-                    elif elem.type == 'CHEXA':
-                        #face1 = elem.get_face(load.g34.nid, load.g1.nid)
-                        face, area, centroid, normal = elem.getFaceAreaCentroidNormal(load.g34.nid, load.g1.nid)
-                        #assert face == face1
-                        nface = 4
-                    elif elem.type == 'CPENTA':
-                        g1 = load.g1.nid
-                        if load.g34 is None:
-                            #face1 = elem.get_face(g1)
-                            face, area, centroid, normal = elem.getFaceAreaCentroidNormal(g1)
-                            nface = 3
-                        else:
-                            #face1 = elem.get_face(g1, load.g34.nid)
-                            face, area, centroid, normal = elem.getFaceAreaCentroidNormal(g1, load.g34.nid)
-                            nface = 4
-                        #assert face == face1
-                    else:
-                        msg = ('case=%s eid=%s etype=%r loadtype=%r not supported'
-                               % (loadcase_id, eid, elem.type, load.type))
-                        self.log.debug(msg)
-                        continue
+            if elem.type in PRESSURE_TRIA_TYPES or elem.type in PRESSURE_QUAD_TYPES:
+                shell_loads.append((iload, elem, pressure))
+                continue
+            f = pressure * area * normal
+            forces[iload, :] += f
+            moments[iload, :] += cross(centroid, f)
 
-                    pressures = load.pressures[:nface]
-                    assert len(pressures) == nface
-                    if min(pressures) != max(pressures):
-                        pressure = mean(pressures)
-                        #msg = '%s%s\npressure.min=%s != pressure.max=%s using average of %%s; load=%s eid=%%s'  % (
-                            #str(load), str(elem), min(pressures), max(pressures), load.sid)
-                        #print(msg % (pressure, eid))
-                    else:
-                        pressure = load.pressures[0]
+    def _sum_pload1(self, load, xyz):
+        """
+        Sums the force and the moment about the origin of a PLOAD1
 
-                    r = centroid - p
-                    f = pressure * area * normal * scale
-                    #load.cid.transformToGlobal()
-                    m = cross(r, f)
-                    F += f
-                    M += m
-            elif load.type == 'GRAV':
-                if include_grav:  # this will be super slow
-                    g = load.GravityVector() * scale
-                    for eid, elem in iteritems(self.elements):
-                        centroid = elem.Centroid()
-                        mass = elem.Mass()
-                        r = centroid - p
-                        f = mass * g
-                        m = cross(r, f)
-                        F += f
-                        M += m
+        Parameters
+        ----------
+        load : PLOAD1
+            the cross referenced PLOAD1
+        xyz : Dict[int] = (3, ) ndarray
+            the nodes in the global coordinate system
+
+        Returns
+        -------
+        F : (3, ) float ndarray
+            the force
+        M : (3, ) float ndarray
+            the moment about the origin
+        """
+        F = array([0., 0., 0.])
+        M = array([0., 0., 0.])
+        elem = load.eid
+
+        p1 = load.p1
+        p2 = load.p2
+        if elem.type not in ['CBAR', 'CBEAM', 'CBEND']:
+            raise RuntimeError('element.type=%r is not a CBAR, CBEAM, or CBEND' % elem.type)
+
+        nodes = elem.node_ids
+        n1 = xyz[nodes[0]] + elem.wa
+        n2 = xyz[nodes[1]] + elem.wb
+
+        deltaL = n2 - n1
+        L = norm(deltaL)
+        try:
+            Ldir = deltaL / L
+        except:
+            msg = 'Length=0.0; nid1=%s nid2=%s\n' % (nodes[0], nodes[1])
+            msg += '%s%s' % (str(elem.nodes[0]), str(elem.nodes[1]))
+            raise FloatingPointError(msg)
+        if load.scale == 'FR':  # x1, x2 are fractional lengths
+            x1 = load.x1
+            x2 = load.x2
+            #compute_fx = False
+        elif load.scale == 'LE': # x1, x2 are actual lengths
+            x1 = load.x1 / L
+            x2 = load.x2 / L
+        elif load.scale == 'LEPR':
+            print('PLOAD1 LEPR continue')
+            return F, M
+            #msg = 'scale=%r is not supported.  Use "FR", "LE".' % load.scale
+            #raise NotImplementedError(msg)
+        elif load.scale == 'FRPR':
+            print('PLOAD1 FRPR continue')
+            return F, M
+            #msg = 'scale=%r is not supported.  Use "FR", "LE".' % load.scale
+            #raise NotImplementedError(msg)
+        else:
+            msg = 'PLOAD1 scale=%r is not supported.  Use "FR", "LE".' % load.scale
+            raise NotImplementedError(msg)
+
+        # FY - force in basic coordinate system
+        # FR - fractional;
+        assert x1 <= x2, 'x1=%s x2=%s' % (x1, x2)
+        if x1 != x2:
+            # continue
+            if not load.type in ['FX', 'FY', 'FZ']:
+                print('PLOAD1 x1 != x2 continue; x1=%s x2=%s; scale=%r\n%s%s'% (x1, x2, load.scale, str(elem), str(load)))
+                return F, M
+            print('check this...PLOAD1 x1 != x2; x1=%s x2=%s; scale=%r\n%s%s'% (x1, x2, load.scale, str(elem), str(load)))
+
+            # y = (y2-y1)/(x2-x1)*(x-x1) + y1
+            # y = (y2-y1) * (x-x1)/(x2-x1) + y1
+            # y = y2*(x-x1)/(x2-x1) + y1*(1-(x-x1)/(x2-x1))
+            # y = y2 * r + y1 * (1-r)
+            # r = (x-x1)/(x2-x1)
+            #
+            # y = y2 * r + y1 - y1 * r
+            # yi = y2 * ri + y1 * x + y1 * ri
+            # yi = y2 * ri + y1 * (x2-x1) + y1 * ri
+            #
+            # ri = integral(r)
+            # ri = 1/(x2-x1) * (0.5) * (x1-x2)**2
+            #
+            # yi = integral(y)
+            # yi = y2 * ri + y1 * (x2-x1) + y1 * ri
+            # ri = 1./(x2-x1) * (0.5) * (x1-x2)**2
+            # y1 = p1
+            # y2 = p2
+            # yi = y2 * ri + y1 * (x2-x1) + y1 * ri
+            # F = yi
+            if allclose(p1, -p2):
+                Ftotal = p1
+                x = (x1 + x2) / 2.
             else:
-                # we collect them so we only get one print
-                unsupported_types.add(load.type)
+                Ftotal = L * (x2-x1) * (p1 + p2)/2.
+                Mx = L * p1 * (x2-x1)/2. + L * (p2-p1) * (2./3. * x2 + 1./3. * x1)
+                x = Mx / Ftotal
+            print('L=%s x1=%s x2=%s p1/L=%s p2/L=%s Ftotal=%s Mtotal=%s x=%s' % (L, x1, x2, p1, p2, Ftotal, Mx, x))
+
+            i = Ldir
+            if load.Type in ['FX', 'FY', 'FZ']:
+                r = (1. - x) * n1 + x * n2
+                # print('r=%s n1=%s n2=%s' % (r, n1, n2))
+                if load.Type == 'FX':
+                    Fdir = array([1., 0., 0.])
+                elif load.Type == 'FY':
+                    Fdir = array([0., 1., 0.])
+                elif load.Type == 'FZ':
+                    Fdir = array([0., 0., 1.])
+                else:
+                    raise NotImplementedError('Type=%r is not supported.  Use "FX", "FY", "FZ".' % load.Type)
 
-        for Type in unsupported_types:
-            self.log.debug('case=%s loadtype=%r not supported' % (loadcase_id, Type))
-        return (F, M)
+            Fi = Ftotal * Fdir
+            Mi = cross(r, Fdir * Ftotal)
+            F += Fi
+            M += Mi
+            print('Fi=%s Mi=%s x=%s' % (Fi, Mi, x))
+        else:
+            v = elem.get_orientation_vector(xyz)
+            i = Ldir
+            ki = cross(i, v)
+            k = ki / norm(ki)
+            j = cross(k, i)
+
+            if load.Type in ['FX', 'FY', 'FZ']:
+                r = (1 - x1) * n1 + x1 * n2
+                if load.Type == 'FX':
+                    if x1 == x2:
+                        Fdir = array([1., 0., 0.])
+                elif load.Type == 'FY':
+                    if x1 == x2:
+                        Fdir = array([0., 1., 0.])
+                elif load.Type == 'FZ':
+                    if x1 == x2:
+                        Fdir = array([0., 0., 1.])
+                F += p1 * Fdir
+                M += cross(r, F)
+            elif load.Type in ['MX', 'MY', 'MZ']:
+                if load.Type == 'MX':
+                    if x1 == x2:
+                        Mdir = array([1., 0., 0.])
+                elif load.Type == 'MY':
+                    if x1 == x2:
+                        Mdir = array([0., 1., 0.])
+                elif load.Type == 'MZ':
+                    if x1 == x2:
+                        Mdir = array([0., 0., 1.])
+                M += p1 * Mdir
+            elif load.Type in ['FXE', 'FYE', 'FZE']:
+                r = (1 - x1) * n1 + x1 * n2
+                if load.Type == 'FXE':
+                    if x1 == x2:
+                        Fdir = i
+                elif load.Type == 'FYE':
+                    if x1 == x2:
+                        Fdir = j
+                elif load.Type == 'FZE':
+                    if x1 == x2:
+                        Fdir = k
+                #print('    Fdir =', Fdir, load.Type)
+                try:
+                    F += p1 * Fdir
+                except FloatingPointError:
+                    msg = 'eid = %s\n' % elem.eid
+                    msg += 'i = %s\n' % Ldir
+                    msg += 'Fdir = %s\n' % Fdir
+                    msg += 'load = \n%s' % str(load)
+                    raise FloatingPointError(msg)
+                M += cross(r, F)
+                del Fdir
+
+            elif load.Type in ['MXE', 'MYE', 'MZE']:
+                if load.Type == 'MXE':
+                    if x1 == x2:
+                        Mdir = i
+                elif load.Type == 'MYE':
+                    if x1 == x2:
+                        Mdir = j
+                elif load.Type == 'MZE':
+                    if x1 == x2:
+                        Mdir = k
+                try:
+                    M += p1 * Mdir
+                except FloatingPointError:
+                    msg = 'eid = %s\n' % elem.eid
+                    msg += 'Mdir = %s\n' % Mdir
+                    msg += 'load = \n%s' % str(load)
+                    raise FloatingPointError(msg)
+                del Mdir
+            else:
+                raise NotImplementedError('Type=%r is not supported.  Use "FX", "FXE".' % load.Type)
+        return F, M
 
     # def MassProperties(self):
         # """
@@ -1696,6 +2027,73 @@ class BDFMethods(BDFAttributes):
                     eid_faces.append((eid, face))
         return eid_faces
 
+    def get_solid_skin_face_arrays(self, element_ids=None):
+        """
+        Gets the faces of the solid elements that aren't shared with
+        another solid element (the skin of the solid mesh)
+
+        The faces of each element type are stacked into (nfaces, nnodes)
+        arrays, the nodes of each face are sorted and the faces that are
+        only found once are found by sorting the faces.
+
+        Parameters
+        ----------
+        element_ids : List[int] / None
+            skin a subset of element faces
+            default=None -> all elements
+
+        Returns
+        -------
+        skin_faces : Dict[nnodes] = (eids, faces)
+            nnodes : int
+                the number of nodes on the face (3, 4, 6, 8)
+            eids : (nfaces, ) int ndarray
+                the solid element of each skinned face
+            faces : (nfaces, nnodes) int ndarray
+                the node ids of the face in the element order, so the
+                normal points out of the element (0 is a blank midside
+                node)
+        """
+        if element_ids is None:
+            element_ids = self.element_ids
+
+        # group the solids by type and number of nodes
+        eids_by_type = defaultdict(list)
+        nodes_by_type = defaultdict(list)
+        for eid in element_ids:
+            elem = self.elements[eid]
+            if elem.type not in ['CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM']:
+                continue
+            node_ids = elem.node_ids
+            key = (elem.type, len(node_ids))
+            eids_by_type[key].append(eid)
+            nodes_by_type[key].append(node_ids)
+
+        eids_by_nnodes = defaultdict(list)
+        faces_by_nnodes = defaultdict(list)
+        for key, node_ids in sorted(iteritems(nodes_by_type)):
+            if key not in SOLID_FACES:
+                raise NotImplementedError('element_type=%r nnodes=%s' % key)
+            try:
+                nodes = np.array(node_ids, dtype='int64')
+            except TypeError:
+                # blank midside nodes
+                nodes = np.array(node_ids, dtype='object')
+                nodes[nodes == None] = 0
+                nodes = nodes.astype('int64')
+            eids = np.array(eids_by_type[key], dtype='int64')
+            for face in SOLID_FACES[key]:
+                eids_by_nnodes[len(face)].append(eids)
+                faces_by_nnodes[len(face)].append(nodes[:, face])
+
+        skin_faces = {}
+        for nnodes, faces in sorted(iteritems(faces_by_nnodes)):
+            eids = np.hstack(eids_by_nnodes[nnodes])
+            faces = np.vstack(faces)
+            is_skin = _is_unique_row(np.sort(faces, axis=1))
+            skin_faces[nnodes] = (eids[is_skin], faces[is_skin, :])
+        return skin_faces
+
     def get_solid_skin_faces(self):
         """
         Gets the elements and faces that are skinned from solid elements
@@ -1708,29 +2106,17 @@ class BDFMethods(BDFAttributes):
         face_map : Dict[tuple(int, int, ...)] = List[int]
            key : sorted face
            value : unsorted face
+
+        .. seealso:: get_solid_skin_face_arrays
         """
-        eid_faces = self.skin_solid_elements()
-        face_set = defaultdict(int)
-        eid_set = defaultdict(list)
+        eid_set = {}
         face_map = {}
-        for eid, face in eid_faces:
-            #print(eid, face)
-            raw_face = deepcopy(face)
-            face.sort()
-            tface = tuple(face)
-            #print(tface)
-            face_set[tface] += 1
-            eid_set[tface].append(eid)
-            face_map[tface] = raw_face
-
-        del_faces = []
-        for face, face_count in iteritems(face_set):
-            if face_count == 2:
-                del_faces.append(face)
-
-        for face in del_faces:
-            del face_set[face]
-            del eid_set[face]
+        for eids, faces in itervalues(self.get_solid_skin_face_arrays()):
+            for eid, face in zip(eids.tolist(), faces.tolist()):
+                raw_face = [nid if nid else None for nid in face]
+                tface = tuple(sorted(face))
+                eid_set[tface] = [eid]
+                face_map[tface] = raw_face
         return eid_set, face_map
 
     def write_skin_solid_faces(self, skin_filename,
@@ -1757,39 +2143,31 @@ class BDFMethods(BDFAttributes):
         if(len(self.element_ids) == 0 or len(self.material_ids) == 0 or
            len(self.property_ids) == 0):
             return
-        eid_set, face_map = self.get_solid_skin_faces()
-        if len(eid_set) == 0:
+        skin_faces = self.get_solid_skin_face_arrays()
+        if len(skin_faces) == 0:
             return
+        if not write_solids and not write_shells:
+            raise RuntimeError('write_solids=False write_shells=False')
 
-        eid_set_to_write = set([])
+        skin_eids = np.hstack([eids for eids, faces in itervalues(skin_faces)])
+        eids_to_write = np.unique(skin_eids).tolist()
+        eid_to_mid = {}
         nid_set_to_write = set([])
-        mid_set_to_write = set([])
-        if write_solids:
-            for face, eids in iteritems(eid_set):
-                eid_set_to_write.update(eids)
-                for eid in eids:
-                    elem = self.elements[eid]
-                    pid = elem.Pid()
-                    prop = self.properties[pid] # PSOLID
-                    mid = prop.Mid()
-                    nid_set_to_write.update(elem.node_ids)
-                    mid_set_to_write.add(mid)
-        elif write_shells:
-            for face, eids in iteritems(eid_set):
-                eid_set_to_write.update(eids)
-                nid_set_to_write.update(face)
-                for eid in eids:
-                    elem = self.elements[eid]
-                    pid = elem.Pid()
-                    prop = self.properties[pid] # PSOLID
-                    mid = prop.Mid()
-                    mid_set_to_write.add(mid)
-        else:
-            raise RuntimeError('write_solids=False write_shells=False')
+        for eid in eids_to_write:
+            elem = self.elements[eid]
+            pid = elem.Pid()
+            prop = self.properties[pid] # PSOLID
+            eid_to_mid[eid] = prop.Mid()
+            if write_solids:
+                nid_set_to_write.update(elem.node_ids)
+
+        if write_shells:
+            for eids, faces in itervalues(skin_faces):
+                nid_set_to_write.update(np.unique(faces).tolist())
+            nid_set_to_write.discard(0)
 
-        eids_to_write = list(eid_set_to_write)
         nids_to_write = list(nid_set_to_write)
-        mids_to_write = list(mid_set_to_write)
+        mids_to_write = list(set(eid_to_mid.values()))
 
         #element_ids_to_delete = set(self.element_ids) - eids_to_write
 
@@ -1835,34 +2213,15 @@ class BDFMethods(BDFAttributes):
                     #bdf_file.write(self.materials[mid].comment)
                     bdf_file.write(print_card_8(card))
 
-                for face, eids in iteritems(eid_set):
-                    face_raw = face_map[face]
-                    nface = len(face)
-                    #assert len(eids) == 1, eids
-                    #for eid in sorted(eids):
-                        #elem = self.elements[eid]
-                        #print(elem)
-                        #break
-
-                    pid = elem.Pid()
-                    prop = self.properties[pid]
-                    mid = prop.Mid()
-                    imid = mids_to_write.index(mid)
-
-                    if nface == 3:
-                        card = ['CTRIA3', eid_shell, pid_shell + imid] + list(face_raw)
-                    elif nface == 4:
-                        card = ['CQUAD4', eid_shell, pid_shell + imid] + list(face_raw)
-                    elif nface == 4:
-                        card = ['CQUAD4', eid_shell, pid_shell + imid] + list(face_raw)
-                    elif nface == 6:
-                        card = ['CTRIA6', eid_shell, pid_shell + imid] + list(face_raw)
-                    elif nface == 8:
-                        card = ['CQUAD8', eid_shell, pid_shell + imid] + list(face_raw)
-                    else:
-                        raise NotImplementedError('face=%s len(face)=%s' % (face, nface))
-                    bdf_file.write(print_card_8(card))
-                    eid_shell += 1
+                imids = dict([(mid, imid) for imid, mid in enumerate(mids_to_write)])
+                for nface, (eids, faces) in sorted(iteritems(skin_faces)):
+                    shell_type = SKIN_SHELL_TYPES[nface]
+                    for eid, face in zip(eids.tolist(), faces.tolist()):
+                        imid = imids[eid_to_mid[eid]]
+                        card = [shell_type, eid_shell, pid_shell + imid] + [
+                            nid if nid else None for nid in face]
+                        bdf_file.write(print_card_8(card))
+                        eid_shell += 1
 
                     #elem = self.elements[eid]
                     #bdf_file.write(elem.write_card(size=size))
@@ -805,7 +805,7 @@ class CylindricalCoord(object):
         """
         x = p[:, 0]
         y = p[:, 1]
-        theta = np.degrees(np.arctan(y, x))
+        theta = np.degrees(np.arctan2(y, x))
         R = np.sqrt(x * x + y * y)
         return np.array([R, theta, p[:, 2]], dtype='float64').T
 
@@ -6,8 +6,10 @@ from math import sin, cos, radians, atan2, sqrt, degrees
 #from math import (sin,sinh,cos,cosh,tan,tanh,sqrt,atan,atan2,acosh,acos,asin,
 #                  asinh,atanh) #,atanh2   # going to be used by DEQATN
 
+from array import array
+
 import numpy as np
-from numpy import array, zeros
+from numpy import zeros
 from scipy.sparse import coo_matrix
 
 from pyNastran.utils import integer_types
@@ -60,13 +62,27 @@ class NastranMatrix(BaseCard):
         self.Real = []
         if self.is_complex():
             self.Complex = []
+        self._init_column_data()
+
+    def _init_column_data(self):
+        """
+        Creates the typed arrays the terms are accumulated in while the
+        columns are read, which are flattened (Grid, Component) pairs
+        """
+        self._gcj = array('i')
+        self._gci = array('i')
+        self._real = array('d')
+        self._complex = array('d')
+        self._index_cache = {}
 
     def finalize(self):
-        self.GCi = np.asarray(self.GCi)
-        self.GCj = np.asarray(self.GCj)
-        self.Real = np.asarray(self.Real)
+        """converts the columns read by ``_add_column`` into numpy arrays"""
+        self.GCi = _append_column_data(self.GCi, self._gci, (-1, 2))
+        self.GCj = _append_column_data(self.GCj, self._gcj, (-1, 2))
+        self.Real = _append_column_data(self.Real, self._real, -1)
         if self.is_complex():
-            self.Complex = np.asarray(self.Complex)
+            self.Complex = _append_column_data(self.Complex, self._complex, -1)
+        self._init_column_data()
 
     @property
     def shape(self):
@@ -127,56 +143,34 @@ class NastranMatrix(BaseCard):
         # print("nloops = %i" % nloops)
         assert nloops > 0, 'nloops=%s' % nloops
 
+        gci = []
+        reals = []
+        complexs = []
+        is_complex = self.is_complex()
+        is_polar = is_complex and self.is_polar()
         for i in range(nloops):
-            self.GCj.append((Gj, Cj))
-
-        if self.is_complex():
-            if self.is_polar():
-                for i in range(nloops):
-                    n = 5 + 4 * i
-                    Gi = integer(card, n, 'Gi')
-                    # Ci = integer(card, n + 1, 'Ci')
-                    Ci = integer_or_blank(card, n + 1, 'Ci', 0)
-                    #Ci = components(card, n + 1, 'Ci')
-                    assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
-                    self.GCi.append((Gi, Ci))
-                    magi = double(card, n + 2, 'ai')
-                    phasei = double(card, n + 3, 'bi')
-                    reali = magi * cos(radians(phasei))
-                    complexi = magi * sin(radians(phasei))
-                    self.Real.append(reali)
-                    self.Complex.append(complexi)
+            n = 5 + 4 * i
+            Gi = integer(card, n, 'Gi')
+            # Ci = integer(card, n + 1, 'Ci')
+            Ci = integer_or_blank(card, n + 1, 'Ci', 0)
+            #Ci = components(card, n + 1, 'Ci')
+            assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
+            gci += [Gi, Ci]
+            if is_polar:
+                magi = double(card, n + 2, 'ai')
+                phasei = double(card, n + 3, 'bi')
+                reals.append(magi * cos(radians(phasei)))
+                complexs.append(magi * sin(radians(phasei)))
+            elif is_complex:
+                reals.append(double(card, n + 2, 'real'))
+                complexs.append(double(card, n + 3, 'complex'))
             else:
-                for i in range(nloops):
-                    n = 5 + 4 * i
-                    Gi = integer(card, n, 'Gi')
-                    # Ci = integer(card, n + 1, 'Ci')
-                    Ci = integer_or_blank(card, n + 1, 'Ci', 0)
-                    #Ci = components(card, n + 1, 'Ci')
-                    assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
-                    self.GCi.append((Gi, Ci))
-                    reali = double(card, n + 2, 'real')
-                    complexi = double(card, n + 3, 'complex')
-                    self.Real.append(reali)
-                    self.Complex.append(complexi)
-        else:
-            # real
-            for i in range(nloops):
-                n = 5 + 4 * i
-                Gi = integer(card, n, 'Gi')
-                # Ci = integer(card, n + 1, 'Ci')
-                Ci = integer_or_blank(card, n + 1, 'Ci', 0)
-                #Ci = components(card, n + 1, 'Ci')
-                assert 0 <= Ci <= 6, 'C%i must be between [0, 6]; Ci=%s' % (i + 1, Ci)
-                reali = double(card, n + 2, 'real')
-                self.GCi.append((Gi, Ci))
-                self.Real.append(reali)
-                #print("GC=%s,%s real=%s" % (Gi, Ci, reali))
-
-        msg = '(len(GCj)=%s len(GCi)=%s' % (len(self.GCj), len(self.GCi))
-        assert len(self.GCj) == len(self.GCi), msg
-        #if self.is_complex():
-            #self.Complex(double(card, v, 'complex')
+                reals.append(double(card, n + 2, 'real'))
+
+        self._gcj.extend([Gj, Cj] * nloops)
+        self._gci.extend(gci)
+        self._real.extend(reals)
+        self._complex.extend(complexs)
 
     def get_matrix(self, is_sparse=False, apply_symmetry=True):
         """
@@ -193,14 +187,14 @@ class NastranMatrix(BaseCard):
 
         Returns
         -------
-        M : numpy.ndarray or scipy.coomatrix
+        M : numpy.ndarray or scipy.sparse.csc_matrix
             the matrix
         rows : dict[int] = [int, int]
             dictionary of keys=rowID, values=(Grid,Component) for the matrix
         cols: dict[int] = [int, int]
             dictionary of keys=columnID, values=(Grid,Component) for the matrix
 
-        .. warning:: is_sparse=True WILL fail
+        The row/column indexing is cached between calls.
         """
         return get_matrix(self, is_sparse=is_sparse, apply_symmetry=apply_symmetry)
 
@@ -384,149 +378,124 @@ def get_matrix(self, is_sparse=False, apply_symmetry=True):
 
     Returns
     -------
-    M : ndarray
+    M : ndarray / csc_matrix
         the matrix
     rows : Dict[(nid, nid)] = float
         dictionary of keys=rowID,    values=(Grid,Component) for the matrix
     cols : Dict[](int, int)] = float
         dictionary of keys=columnID, values=(Grid,Component) for the matrix
 
-    .. warning:: is_sparse=True WILL fail
+    The rows/columns are in the order the (Grid, Component) pairs first
+    appear.  For a symmetric matrix, the rows and columns share the same
+    ordering and the terms off the diagonal are mirrored.
     """
-    i = 0
-    rows = {}
-    rows_reversed = {}
-
-    j = 0
-    cols = {}
-    cols_reversed = {}
-    ndim = len(self.GCi.shape)
-    if ndim == 1:
-        for GCi in self.GCi:
-            if GCi not in rows:
-                rows[GCi] = i
-                rows_reversed[i] = GCi
-                i += 1
-        for GCj in self.GCj:
-            if GCj not in cols:
-                cols[GCj] = j
-                cols_reversed[j] = GCj
-                j += 1
+    is_symmetric = self.ifo == 6 and apply_symmetry
+    (irows, icols, rows_reversed, cols_reversed) = _get_matrix_index(self, is_symmetric)
+    nrows = len(rows_reversed)
+    ncols = len(cols_reversed)
+
+    if self.is_complex():
+        data = self.Real + 1j * self.Complex
     else:
-        for (nid, comp) in self.GCi:
-            GCi = (nid, comp)
-            if GCi not in rows:
-                rows[GCi] = i
-                rows_reversed[i] = GCi
-                i += 1
-        for (nid, comp) in self.GCj:
-            GCj = (nid, comp)
-            if GCj not in cols:
-                cols[GCj] = j
-                cols_reversed[j] = GCj
-                j += 1
-    #nrows = len(rows2)
-    #ncols = len(cols2)
-
-    #A = ss.lil_matrix((3,3), dtype='d') # double precision
-    #rows=[]
-    #cols=[]
-    #data=[]
-    #for i in range(3):
-    #    for j in range(3):
-    #        k = float((i+1)*(j+1))
-    #        rows.append(i)
-    #        cols.append(j)
-    #        data.append(k)
-    #        A[i,j] = k
-
-    #is_sparse = False
+        data = self.Real
+
+    if is_symmetric:
+        # a term is only mirrored if the transposed term isn't defined, so
+        # the dense and sparse (summed) matrices are the same
+        # the keys are int64, so they don't overflow for large matrices
+        irows64 = irows.astype('int64')
+        icols64 = icols.astype('int64')
+        keys = irows64 * nrows + icols64
+        imirror = (irows != icols) & ~np.in1d(icols64 * nrows + irows64, keys)
+        irows, icols = (np.hstack([irows, icols[imirror]]),
+                        np.hstack([icols, irows[imirror]]))
+        data = np.hstack([data, data[imirror]])
+
     if is_sparse:
-        GCj = array(self.GCj, dtype='int32') - 1
-        GCi = array(self.GCi, dtype='int32') - 1
-        reals = array(self.Real, dtype='float32')
+        M = coo_matrix((data, (irows, icols)), shape=(nrows, ncols),
+                       dtype=self._get_dtype(self.tin)).tocsc()
+    else:
+        M = zeros((nrows, ncols), dtype=data.dtype)
+        M[irows, icols] = data
+    return (M, rows_reversed, cols_reversed)
 
-        # TODO: matrix size:  is this correct?
-        nrows = max(GCi) + 1
-        ncols = max(GCj) + 1
 
-        dtype = self._get_dtype(self.tin)
-        # TODO: no check for symmetry
-        # TODO: no check for dtype
-        if self.is_complex():
-            complexs = array(self.Complex, dtype='float32')
-            data = array([reals, complexs]).astype(complex)
-        else:
-            data = reals
-
-        if self.ifo in [1, 6]:
-            nrows = max(nrows, ncols)
-            ncols = nrows
-
-        #A = coo_matrix( (entries,(rows,cols)),shape=(nrows,ncols),dtype=dtype) # test
-        M = coo_matrix((data, (self.GCi, self.GCj)),
-                       shape=(nrows, ncols), dtype=dtype)
-        #M = coo_matrix( (data,(self.GCi,self.GCj)),shape=(i,j)) # old
-        #M = coo_matrix( (data,(self.GCi,self.GCj)),shape=(nrows,ncols))
-        #print(M.todense())
-        #print(M)
+def _get_matrix_index(self, is_symmetric):
+    """
+    Gets the row/column index of the terms of a matrix, which is cached
+    until the matrix is changed by ``finalize``
+
+    Returns
+    -------
+    irows / icols : (nterms, ) int ndarray
+        the row/column index of each term
+    rows_reversed / cols_reversed : Dict[int] = (int, int) / int
+        the (Grid, Component) of each row/column
+    """
+    if is_symmetric in self._index_cache:
+        return self._index_cache[is_symmetric]
+
+    nterms = len(self.GCi)
+    if is_symmetric:
+        # the rows and columns use the same ordering
+        iboth, ukeys = _get_first_index(np.concatenate([self.GCi, self.GCj]))
+        irows = iboth[:nterms]
+        icols = iboth[nterms:]
+        rows_reversed = _get_reversed(ukeys)
+        cols_reversed = rows_reversed.copy()
     else:
-        if ndim == 1:
-            if self.is_complex():
-                M = zeros((i, j), dtype='complex128')
-                if self.ifo == 6 and apply_symmetry:  # symmetric
-                    for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi, self.Real, self.Complex):
-                        i = rows[gci]
-                        j = cols[gcj]
-                        M[i, j] = complex(reali, complexi)
-                        M[j, i] = complex(reali, complexi)
-                else:
-                    for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi, self.Real, self.Complex):
-                        i = rows[gci]
-                        j = cols[gcj]
-            else:
-                M = zeros((i, j), dtype='float64')
-                if self.ifo == 6 and apply_symmetry:  # symmetric
-                    for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                        i = rows[gci]
-                        j = cols[gcj]
-                        M[i, j] = reali
-                        M[j, i] = reali
-                else:
-                    for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                        i = rows[gci]
-                        j = cols[gcj]
-                        M[i, j] = reali
-        else:
-            if self.is_complex():
-                M = zeros((i, j), dtype='complex128')
-                if self.ifo == 6 and apply_symmetry:  # symmetric
-                    for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi, self.Real, self.Complex):
-                        i = rows[(gci[0], gci[1])]
-                        j = cols[(gcj[0], gcj[1])]
-                        M[i, j] = complex(reali, complexi)
-                        M[j, i] = complex(reali, complexi)
-                else:
-                    for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi, self.Real, self.Complex):
-                        i = rows[(gci[0], gci[1])]
-                        j = cols[(gcj[0], gcj[1])]
-                        M[i, j] = complex(reali, complexi)
-            else:
-                M = zeros((i, j), dtype='float64')
-                if self.ifo == 6 and apply_symmetry:  # symmetric
-                    for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                        i = rows[(gci[0], gci[1])]
-                        j = cols[(gcj[0], gcj[1])]
-                        M[i, j] = reali
-                        M[j, i] = reali
-                else:
-                    for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                        i = rows[(gci[0], gci[1])]
-                        j = cols[(gcj[0], gcj[1])]
-                        M[i, j] = reali
-    #print(M)
-    return (M, rows_reversed, cols_reversed)
+        irows, urows = _get_first_index(self.GCi)
+        icols, ucols = _get_first_index(self.GCj)
+        rows_reversed = _get_reversed(urows)
+        cols_reversed = _get_reversed(ucols)
+
+    index = (irows, icols, rows_reversed, cols_reversed)
+    self._index_cache[is_symmetric] = index
+    return index
+
+
+def _get_first_index(keys):
+    """
+    Gets the index of each key, where the keys are numbered in the order
+    they first appear
+
+    Parameters
+    ----------
+    keys : (n, 2) int ndarray / (n, ) int ndarray
+        the (Grid, Component) pairs or the row/column ids
+
+    Returns
+    -------
+    ikeys : (n, ) int ndarray
+        the index of each key
+    ukeys : (nunique, 2) int ndarray / (nunique, ) int ndarray
+        the unique keys in the order they first appear
+    """
+    if keys.ndim == 2:
+        # the component is in [0, 6]
+        packed_keys = keys[:, 0].astype('int64') * 8 + keys[:, 1]
+    else:
+        packed_keys = keys
+    ifirst, inverse = np.unique(packed_keys, return_index=True, return_inverse=True)[1:]
+    iorder = np.argsort(ifirst)
+    ranks = np.empty(len(ifirst), dtype='int32')
+    ranks[iorder] = np.arange(len(ifirst), dtype='int32')
+    return ranks[inverse], keys[ifirst[iorder]]
+
+
+def _get_reversed(ukeys):
+    """gets the index -> (Grid, Component) dictionary"""
+    if ukeys.ndim == 2:
+        return dict(enumerate([tuple(key) for key in ukeys.tolist()]))
+    return dict(enumerate(ukeys.tolist()))
+
 
+def _append_column_data(values, typed_values, shape):
+    """appends the terms accumulated by ``_add_column`` to the finalized terms"""
+    new_values = np.array(typed_values).reshape(shape)
+    if len(values) == 0:
+        return new_values
+    return np.concatenate([values, new_values])
 
 
 class DMIG(NastranMatrix):
@@ -650,13 +619,16 @@ class DMI(NastranMatrix):
 
         if self.is_complex():
             self.Complex = []
+        self._init_column_data()
 
     def finalize(self):
-        self.GCi = np.asarray(self.GCi)
-        self.GCj = np.asarray(self.GCj)
-        self.Real = np.asarray(self.Real)
+        """converts the columns read by ``_add_column`` into numpy arrays"""
+        self.GCi = _append_column_data(self.GCi, self._gci, -1)
+        self.GCj = _append_column_data(self.GCj, self._gcj, -1)
+        self.Real = _append_column_data(self.Real, self._real, -1)
         if self.is_complex():
-            self.Complex = np.asarray(self.Complex)
+            self.Complex = _append_column_data(self.Complex, self._complex, -1)
+        self._init_column_data()
 
     @property
     def shape(self):
@@ -694,19 +666,19 @@ class DMI(NastranMatrix):
                         is_done_reading_floats = True
                     elif isinstance(real_value, float):
                         #print('adding j=%s i1=%s val=%s' % (j, i1, real_value))
-                        self.GCj.append(j)
-                        self.GCi.append(i1)
-                        self.Real.append(real_value)
+                        self._gcj.append(j)
+                        self._gci.append(i1)
+                        self._real.append(real_value)
                         i += 1
                         i1 += 1
                     else:
-                        real_value = self.Real[-1]
+                        real_value = self._real[-1]
                         endI = fields[i + 1]
-                        for ii in range(i1, endI + 1):
-                            #print('adding j=%s i1=%s val=%s' % (j, ii, real_value))
-                            self.GCj.append(j)
-                            self.GCi.append(ii)
-                            self.Real.append(real_value)
+                        nvalues = endI + 1 - i1
+                        #print('adding j=%s i1=%s:%s val=%s' % (j, i1, endI, real_value))
+                        self._gcj.extend([j] * nvalues)
+                        self._gci.extend(range(i1, endI + 1))
+                        self._real.extend([real_value] * nvalues)
                         i += 1
                         is_done_reading_floats = True
 
@@ -594,5 +594,54 @@ class TestCoords(unittest.TestCase):
         cid8 = CORD2R.add_ijk(cid=8, rid=0, origin=origin, i=None, j=yaxis, k=zaxis)
         #cid6.add_ijk(rid=0, origin=origin, i=None, j=None, k=None)
 
+    def test_get_xyz_in_coord(self):
+        """
+        all points are located at <30,40,50>; the CORD2x chains are
+        resolved without cross referencing
+        """
+        model = BDF(debug=False)
+        cards = [
+            ['CORD2C*               21               1             15.            -30.',
+             '*                    12.   14.6565766735  -30.3177805524   12.9355733712*       ',
+             '*          14.6234241583  -26.4257323272   11.9304419665',],
+            ['CORD2C*                1               0              0.              0.',
+             '*                     0.              0.              0.              1.*       ',
+             '*                     1.              0.              1.',],
+            ['CORD2S*                2               0              0.              0.',
+             '*                     0.              0.              0.              1.*       ',
+             '*                     1.              0.              1.',],
+            ['CORD2S*               32               2             22.             14.',
+             '*                    85.   22.1243073983   11.9537753718   77.9978191005*       ',
+             '*          21.0997242967   13.1806120497   88.4824763008',],
+            ['GRID*                 21              21   52.8328862418  -28.8729017195',
+             '*           34.615939507               0',],
+            ['GRID*                 32              32   53.8270847449   95.8215692632',
+             '*          159.097767463               0',],
+            ['GRID,40,,30.,40.,50.'],
+        ]
+        for lines in cards:
+            card = model.process_card(lines)
+            model.add_card(card, card[0])
+
+        xyz_cid0 = model.get_xyz_in_coord(cid=0, dtype='float64')
+        self.assertTrue(allclose(xyz_cid0, [[30., 40., 50.]] * 3), xyz_cid0)
+        coord_transforms = model.get_coord_transforms()
+        self.assertIs(coord_transforms, model.get_coord_transforms())
+
+        model.cross_reference()
+        for cid in [0, 1, 2, 21, 32]:
+            xyz = model.get_xyz_in_coord(cid=cid, dtype='float64')
+            for nid, xyzi in zip([21, 32, 40], xyz):
+                expected = model.nodes[nid].get_position_wrt(model, cid)
+                self.assertTrue(allclose(xyzi, expected), 'cid=%s\n%s\n%s' % (
+                    cid, xyzi, expected))
+
+        # the transforms are updated when a coord changes
+        coord = model.coords[2]
+        coord.e1, coord.e2, coord.e3 = coord.e1 + 1., coord.e2 + 1., coord.e3 + 1.
+        self.assertIsNot(coord_transforms, model.get_coord_transforms())
+        xyz_cid0 = model.get_xyz_in_coord(cid=0, dtype='float64')
+        self.assertTrue(allclose(xyz_cid0[1, :], [31., 41., 51.]), xyz_cid0)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
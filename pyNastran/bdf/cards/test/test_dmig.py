@@ -5,7 +5,7 @@ import os
 import pyNastran
 from pyNastran.bdf.bdf import BDF, BDFCard, DMIG
 
-from numpy import array, array_equal, sqrt, sin, cos, radians
+from numpy import array, array_equal, sqrt, sin, cos, radians, arange, vstack, zeros
 
 root_path = pyNastran.__path__[0]
 test_path = os.path.join(root_path, 'bdf', 'cards', 'test')
@@ -199,6 +199,88 @@ class TestDMIG(unittest.TestCase):
         assert len(a_matrix.GCi) == 3, 'len(GCi)=%s GCi=%s matrix=\n%s' % (len(a_matrix.GCi), a_matrix.GCi, a_matrix)
         assert len(a_matrix.GCj) == 3, 'len(GCj)=%s GCj=%s matrix=\n%s' % (len(a_matrix.GCj), a_matrix.GCj, a_matrix)
 
+    def test_dmig_10(self):
+        """tests the sparse matrix and symmetry"""
+        cards = [
+            ['DMIG, B, 0, 6, 1, 0,  ,    , 3'],
+            ['DMIG, B, 2, 1,  , 1, 1, 1.0,'],
+            ['DMIG, B, 3, 0,  , 1, 1, 2.0,'],
+            ['DMIG, B, 3, 0,  , 2, 1, 4.0,'],
+            ['DMIG, B, 1, 1,  , 1, 1, 3.0,'],
+        ]
+        model = BDF(debug=False)
+        for card_lines in cards:
+            model.add_card(card_lines, 'DMIG', is_list=False)
+        model.fill_dmigs()
+
+        b_matrix = model.dmigs['B']
+        B, rows_reversed, cols_reversed = b_matrix.get_matrix(is_sparse=False)
+        B_expected = [
+            [3.0, 1.0, 2.0],
+            [1.0, 0.0, 4.0],
+            [2.0, 4.0, 0.0],
+        ]
+        self.assertTrue(array_equal(B, B_expected))
+        self.assertEqual(rows_reversed, {0 : (1, 1), 1 : (2, 1), 2 : (3, 0)})
+        self.assertEqual(cols_reversed, rows_reversed)
+
+        B2, rows_reversed, cols_reversed = b_matrix.get_matrix(is_sparse=True)
+        self.assertEqual(B2.format, 'csc')
+        self.assertTrue(array_equal(B2.toarray(), B_expected))
+
+        B3, rows_reversed, cols_reversed = b_matrix.get_matrix(apply_symmetry=False)
+        self.assertEqual(B3.shape, (2, 3))
+        self.assertEqual(rows_reversed, {0 : (1, 1), 1 : (2, 1)})
+        self.assertEqual(cols_reversed, {0 : (2, 1), 1 : (3, 0), 2 : (1, 1)})
+
+        # more columns invalidate the cached indexing
+        model.add_card(['DMIG, B, 3, 0,  , 3, 0, 5.0,'], 'DMIG', is_list=False)
+        model.fill_dmigs()
+        B4 = b_matrix.get_matrix()[0]
+        self.assertEqual(B4[2, 2], 5.0)
+        self.assertEqual(len(b_matrix.GCi), 5)
+
+        # both (i, j) and (j, i) are defined, so neither is mirrored
+        cards = [
+            ['DMIG, C, 0, 6, 1, 0'],
+            ['DMIG, C, 1, 1,  , 2, 1, 1.0,'],
+            ['DMIG, C, 2, 1,  , 1, 1, 1.0,'],
+        ]
+        for card_lines in cards:
+            model.add_card(card_lines, 'DMIG', is_list=False)
+        model.fill_dmigs()
+
+        c_matrix = model.dmigs['C']
+        C = c_matrix.get_matrix(is_sparse=False)[0]
+        C2 = c_matrix.get_matrix(is_sparse=True)[0]
+        C_expected = [
+            [0.0, 1.0],
+            [1.0, 0.0],
+        ]
+        self.assertTrue(array_equal(C, C_expected))
+        self.assertTrue(array_equal(C2.toarray(), C_expected))
+
+    def test_dmig_11(self):
+        """the mirrored terms of a large symmetric matrix are found"""
+        model = BDF(debug=False)
+        model.add_card(['DMIG, D, 0, 6, 1, 0'], 'DMIG', is_list=False)
+        d_matrix = model.dmigs['D']
+
+        # the (row, column) keys are larger than an int32
+        nrows = 100000
+        nids = arange(1, nrows + 1)
+        gc = vstack([nids, zeros(nrows, dtype='int32')]).T.ravel().tolist()
+        d_matrix._gcj.extend(gc + [42950, 0])
+        d_matrix._gci.extend(gc + [67297, 0])
+        d_matrix._real.extend([1.0] * nrows + [-1.0])
+        d_matrix.finalize()
+
+        D = d_matrix.get_matrix(is_sparse=True)[0]
+        self.assertEqual(D.shape, (nrows, nrows))
+        self.assertEqual(D.nnz, nrows + 2)
+        self.assertEqual(D[67296, 42949], -1.0)
+        self.assertEqual(D[42949, 67296], -1.0)
+
     def test_dmi_01(self):
         data = """
 DMI         W2GJ       0       2       1       0            1200       1
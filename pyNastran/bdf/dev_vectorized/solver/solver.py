@@ -12,13 +12,15 @@ from struct import pack
 # 3rd party
 from numpy import (array, zeros, ones, radians, cos, sin, dot, vstack, hstack,
                    eye, searchsorted, array_equal, ndarray, diag, fill_diagonal, argsort,
-                   nan, nan_to_num)
+                   nan, nan_to_num, where, arange)
 from numpy.linalg import solve, norm, eigh, eig
 
-from scipy.sparse import dok_matrix, coo_matrix
+from scipy.sparse.linalg import spsolve, eigsh
 
 # pyNastran
-from pyNastran.bdf.dev_vectorized.solver.utils import triple, reverse_dict, partition_dense_symmetric, partition_dense_vector, remove_dofs
+from pyNastran.bdf.dev_vectorized.solver.utils import (
+    triple, reverse_dict, partition_sparse_symmetric, partition_dense_vector, remove_dofs,
+    element_matrices_to_coo, coo_to_csr)
 from pyNastran.f06.f06_writer import sorted_bulk_data_header
 from pyNastran.utils.dev import list_print
 from pyNastran.utils.mathematics import print_matrix, print_annotated_matrix
@@ -248,54 +250,47 @@ class Solver(F06, OP2):
         self.case_result_flags = {}
 
     def _solve(self, K, F, dofs):  # can be overwritten
-        r"""solves \f$ [K]{x} = {F}\f$ for \f${x}\f$"""
+        r"""solves \f$ [K]{x} = {F}\f$ for \f${x}\f$, where K is sparse"""
         self.log.info("--------------")
-        self.log.info("Kaa_norm / %s = \n" % self.knorm + list_print(K / self.knorm))
+        self.log.info("Kaa.shape=%s nnz=%s" % (str(K.shape), K.nnz))
         self.log.info("--------------")
         self.log.info("Fa/%g = %s" % (self.fnorm, F / self.fnorm))
         if F[0] == 0.0:
             assert max(F) != min(F), 'no load is applied...'
         self.log.info("--------------")
 
-        try:
-            U = solve(K, F)
-        except:
-            failed = []
-            faileds = []
-            for i, iu in enumerate(dofs):
-                absF = abs(F)
-                nid, dof = self.IDtoNidComponents[iu]
-                #if absF[iu] == 0.0 and ??:
-                if K[i, i] == 0.0:
-                    failed.append([nid, dof])
-                    faileds.append(i)
-            msg = self.make_grid_point_singularity_table(failed)
-            self.f06_file.write(msg)
-            self.f06_file.flush()
-
-            #if 'AUTOSPC' in self.model.params:
-            if 1:
-                #autospc = self.model.params['AUTOSPC']
-                #value = autospc.values[0]
-                value = 1
-
-                if value in [1, 'YES']:
-                    # figure out what are the DOFs that are removed
-                    ilist = list(set(range(len(dofs))).difference(set(faileds)))
-                    ilist.sort()
-
-                    # remove the DOFs and solve
-                    K2 = K[ilist, :][:, ilist]
-                    F2 = F[ilist]
-                    U2 = solve(K2, F2)
-
-                    # put the removed DOFs back in and set their displacement to 0.0
-                    U = zeros(len(F), 'float64')
-                    U[ilist] = U2
-            else:
-                self.f06_file.close()
-                raise
+        K = K.tocsc()
+        is_singular = K.diagonal() == 0.0
+        if not is_singular.any():
+            return spsolve(K, F)
+
+        failed = []
+        for i in where(is_singular)[0]:
+            nid, dof = self.IDtoNidComponents[dofs[i]]
+            failed.append([nid, dof])
+        msg = self.make_grid_point_singularity_table(failed)
+        self.f06_file.write(msg)
+        self.f06_file.flush()
 
+        #if 'AUTOSPC' in self.model.params:
+        if 1:
+            #autospc = self.model.params['AUTOSPC']
+            #value = autospc.values[0]
+            value = 1
+
+            if value in [1, 'YES']:
+                # remove the DOFs and solve
+                ilist = where(~is_singular)[0]
+                K2 = K[ilist, :][:, ilist]
+                F2 = F[ilist]
+                U2 = spsolve(K2, F2)
+
+                # put the removed DOFs back in and set their displacement to 0.0
+                U = zeros(len(F), 'float64')
+                U[ilist] = U2
+        else:
+            self.f06_file.close()
+            raise RuntimeError('the stiffness matrix is singular')
         return U
 
     def run_solver(self):
@@ -532,7 +527,7 @@ class Solver(F06, OP2):
     def get_Mgg(self, model, ndofs, force_calcs=False):
         Mgg = None
         if force_calcs:
-            Mgg, Mgg_sparse = self.assemble_global_mass_matrix(model, ndofs, self.nidComponentToID)
+            Mgg = self.assemble_global_mass_matrix(model, ndofs, self.nidComponentToID)
             model.params['GRDPNT'] = 0
 
         if 'GRDPNT' in model.params:
@@ -587,9 +582,9 @@ class Solver(F06, OP2):
             self.eigr[imethod]
             self.eigrl[imethod]
 
-        Mgg = self.get_Mgg(model, ndofs, force_calcs=True)
         # analysis
         (Kgg, Fg, n) = self.setup_sol_101(model, case)
+        Mgg = self.Mgg
 
         self.build_dof_sets()
         Lambda, Ua = self.solve_sol_103(Kgg, Mgg)
@@ -597,17 +592,14 @@ class Solver(F06, OP2):
         dofsAll = {i for i in range(n)}
         dofsA = remove_dofs(dofsAll, self.iUs)
         dofsA.sort()
-        U = zeros(n, 'float64')
 
         # TODO handle MPCs
-        for (i, iu) in enumerate(self.iUs):
-            U[iu] = self.Us[i]
-        for (i, iu) in enumerate(dofsA):
-            U[iu] = Ua[i]
+        U = zeros((n, Ua.shape[1]), 'float64')
+        U[dofsA, :] = Ua
 
-        if self.is_displacement:
-            self._store_displacements(model, U, case)
-        q = U
+        # TODO: store the eigenvectors
+        self.eigenvalues = Lambda
+        self.eigenvectors = U
 
 
     def run_sol_101(self, model, case):
@@ -663,15 +655,12 @@ class Solver(F06, OP2):
             dofsA = remove_dofs(dofsAll, self.iUs)
             dofsA.sort()
             U = zeros(n, 'float64')
-            self.log.info("U   =\n%s" % U)
             self.log.info("iUs =\n%s" % self.iUs)
             #print("iUm = ", self.iUm)
 
             # TODO handle MPCs
-            for (i, iu) in enumerate(self.iUs):
-                U[iu] = self.Us[i]
-            for (i, iu) in enumerate(dofsA):
-                U[iu] = Ua[i]
+            U[self.iUs] = self.Us
+            U[dofsA] = Ua
 
             self.log.info("*U = \n%s" % U)
             self.log.info("dofsA = %s" % dofsA)
@@ -1343,7 +1332,7 @@ class Solver(F06, OP2):
         #mpcDOFs = self.iUm
 
         Mgg = self.get_Mgg(model, ndofs, force_calcs=True)
-        Kgg, Kgg_sparse = self.assemble_global_stiffness_matrix(model, ndofs, self.nidComponentToID)
+        Kgg = self.assemble_global_stiffness_matrix(model, ndofs, self.nidComponentToID)
 
         Fg = self.assemble_forces(model, ndofs, case, self.nidComponentToID)
         return Kgg, Fg, ndofs
@@ -1518,297 +1507,228 @@ class Solver(F06, OP2):
 
 
     def solve_sol_101(self, Kgg, Fg):
-        for (i, j, a) in zip(self.iUm, self.jUm, self.Um):
-            self.log.info("Kgg[%s, %s] = %s" % (i, j, a))
-            Kgg[i, j] = a
+        """
+        Solves for the displacements of the a-set
+
+        Parameters
+        ----------
+        Kgg : (ndofs, ndofs) csr_matrix
+            the global stiffness matrix
+        Fg : (ndofs, ) float ndarray
+            the global load vector
+
+        Returns
+        -------
+        Ua : (na, ) float ndarray
+            the displacements of the dofs that aren't constrained
+        """
+        if self.iUm:
+            Kgg = Kgg.tolil()
+            for (i, j, a) in zip(self.iUm, self.jUm, self.Um):
+                self.log.info("Kgg[%s, %s] = %s" % (i, j, a))
+                Kgg[i, j] = a
+            Kgg = Kgg.tocsr()
 
         (self.IDtoNidComponents) = reverse_dict(self.nidComponentToID)
-        self.log.info("IDtoNidComponents = %s" % self.IDtoNidComponents)
-        self.log.info("Kgg =\n" + print_annotated_matrix(Kgg, self.IDtoNidComponents, self.IDtoNidComponents))
-        #print("Kgg = \n", Kgg)
-        #print("iSize = ", i)
-
-        #(Kaa, Fa) = self.Partition(Kgg)
-        #sys.exit('verify Kgg')
-
-        self.log.info("Kgg/%g = \n%s" % (self.knorm, print_matrix(Kgg / self.knorm)))
-        Kaa, dofs2 = partition_dense_symmetric(Kgg, self.iUs)
-        self.log.info("Kaa/%g = \n%s" % (self.knorm, print_matrix(Kaa / self.knorm)))
-        #print("Kaa.shape = ",Kaa.shape)
+        self.log.info("Kgg.shape=%s nnz=%s" % (str(Kgg.shape), Kgg.nnz))
 
-        #sys.exit('verify Kaa')
+        Kaa, dofs2 = partition_sparse_symmetric(Kgg, self.iUs)
+        self.log.info("Kaa.shape=%s nnz=%s" % (str(Kaa.shape), Kaa.nnz))
         Fa, _dofs2 = partition_dense_vector(Fg, self.iUs)
-        #print("Kaa = \n%s" % (print_matrix(Kaa)))
 
         self.log.info("Fg/%g = \n%s" % (self.fnorm, Fg/self.fnorm))
         self.log.info("Fa/%g = \n%s" % (self.fnorm, Fa/self.fnorm))
-        #print("Us = ", self.Us)
-
-        #self.Us = array(self.Us, 'float64')  # SPC
-        #self.Um = array(self.Um, 'float64')  # MPC
-
-        if 0:
-            zero = array([])
-            MPCgg = zero
-            Ksa = Kas = Kss = Cam = Cma = Kma = Kam = Kmm = Kms = Ksm = zero
-            Kaa1 = Kaa2 = zero
-            Fm = Fs = zero
-
-            #Kaa = partition_dense_matrix(Kgg,iFree)
-            Kaa0 = Kaa
-            Fa0 = Fa
-
-            if isSPC:
-               #Fs  = partition_dense_vector(Fg,self.iUs)
-                Ksa = partition_dense_matrix(Kgg, self.iUs, iFree)
-                Kas = Ksa.transpose()
-                Kss = partition_dense_matrix(Kgg, self.iUs)
-
-            if isMPC:
-                Fm = partition_dense_vector(Fg, self.iUm)
-                Cam = partition_dense_matrix(MPCgg, iFree)
-                Cma = partition_dense_matrix(MPCgg, self.iUm)
-
-                Kaa1 = Cam * Kmm * Cma
-                Kaa2 = Cam * Kma + Kam * Cma
-                assert Cam.transpose() == Cma
-
-                Kma = partition_dense_matrix(Kgg, self.iUm, iFree)
-                Kam = Kma.transpose()
-                Kmm = partition_dense_matrix(Kgg, self.iUm)
-                if isSPC:
-                    Kms = partition_dense_matrix(Kgg, self.iUm, self.iUs)
-                    Ksm = Kms.transpose()
-
-            Fa = Fa0  # + Cam*Fm
-            Kaa = Kaa0  # +Kaa1+Kaa2
 
+        # TODO: MPCs
         Ua = self._solve(Kaa, Fa, dofs2)
         #self.Um = Kma*Ua
-
         return Ua
 
+    def solve_sol_103(self, Kgg, Mgg, nmodes=10):
+        """
+        Solves the eigenvalue problem, [K]{x} = lambda [M]{x}, for the
+        lowest modes of the a-set with a sparse (shift-invert) solver
+
+        Parameters
+        ----------
+        Kgg : (ndofs, ndofs) csr_matrix
+            the global stiffness matrix
+        Mgg : (ndofs, ndofs) csr_matrix
+            the global mass matrix
+        nmodes : int; default=10
+            the number of modes to find
+
+        Returns
+        -------
+        eigenvalues : (nmodes, ) float ndarray
+            the eigenvalues (omega^2)
+        Ua : (na, nmodes) float ndarray
+            the mode shapes of the dofs that aren't constrained
+        """
+        Kaa, dofs2 = partition_sparse_symmetric(Kgg, self.iUs)
+        Maa, _dofs2 = partition_sparse_symmetric(Mgg, self.iUs, tol=0.0)
+        nmodes = min(nmodes, Kaa.shape[0] - 1)
+        eigenvalues, Ua = eigsh(Kaa.tocsc(), k=nmodes, M=Maa.tocsc(), sigma=0.0, which='LM')
+        return eigenvalues, Ua
+
     def element_dof_start(self, elem, nids):
         node_ids = elem.node_ids
         index0s = searchsorted(nids, node_ids)
         index0s *= 6
         return node_ids, index0s
 
-    def add_stiffness(self, K, dofs, nijv):
-        Kgg = self.Kgg
-        #print(type(Kgg))
-        for i, dof1 in enumerate(dofs):
-            #dof1i = self.nidComponentToID[dof1]
-            for j, dof2 in enumerate(dofs):
-                if abs(K[i, j]) > 0.0:
-                    self.log.info('i=%s j=%s dof1=%s dof2=%s Ke[i,j]=%s' % (i, j, dof1, dof2, K[i, j]/self.knorm))
-                    #dof2i = self.nidComponentToID[dof2]
-                    #assert isinstance(dof1i, int), dof1i
-                    #assert isinstance(dof2i, int), dof2i
-                    Kgg[dof1, dof2] += K[i, j]
-                    #Kgg[dof1i, dof2i] += K[i, j]
-                    #print('Kgg[%i,%i]=%d' % (dof1i, dof2i, Kgg[dof1i, dof2i]) )
-        self.log.info('Kggi =\n%s' % Kgg)
-
-    def add_mass(self, M, dofs, nijv):
-        Mgg = self.Mgg
-        Mgg_sparse = self.Mgg_sparse
-        for i, dof1 in enumerate(dofs):
-            for j, dof2 in enumerate(dofs):
-                if abs(M[i, j]) > 0.0:
-                    Mgg[dof1, dof2] += M[i, j]
-                    Mgg_sparse[dof1, dof2] += M[i, j]
-
-    def assemble_global_stiffness_matrix(self, model, i, Dofs):
-        self.Kgg = zeros((i, i), 'float64')
-        self.log.info("Kgg.shape = %s" % str(self.Kgg.shape))
+    def _get_node_index(self, model):
+        """
+        Gets the positions of the nodes and the index of the first dof
+        of each node
+        """
+        self.positions = {}
+        index0s = {}
+        for i in range(model.grid.n):
+            nid = model.grid.node_id[i]
+            self.positions[nid] = model.grid.xyz[i]
+            index0s[nid] = 6 * i
+        return index0s
 
-        dof_mapper = []
+    def _get_element_triplets(self, get_matrix, nelements, model, index0s):
+        """
+        Gets the COO triplets of the stiffness/mass matrices of an
+        element type
+
+        Parameters
+        ----------
+        get_matrix : function
+            the get_stiffness_matrix/get_mass_matrix method of the
+            element type
+        nelements : int
+            the number of elements
+
+        Returns
+        -------
+        rows, cols, values : (nnz, ) ndarray
+            the nonzero terms of the element matrices
+        """
+        matrices = []
+        dofs = []
+        for i in range(nelements):
+            matrix, dofsi, unused_nijv = get_matrix(i, model, self.positions, index0s)
+            matrices.append(matrix)
+            dofs.append(dofsi)
+        return element_matrices_to_coo(matrices, dofs)
+
+    def assemble_global_stiffness_matrix(self, model, ndofs, Dofs):
+        """
+        Assembles the global stiffness matrix from the COO triplets of
+        each element type
 
+        Returns
+        -------
+        Kgg : (ndofs, ndofs) csr_matrix
+            the global stiffness matrix
+        """
+        self.log.info("Kgg.shape = (%s, %s)" % (ndofs, ndofs))
         nnodes = model.grid.n
-        nspoints = model.spoint.n
         assert nnodes > 0
         self.log.info("nnodes = %s" % nnodes)
-        #ndofs = 6 * nnodes + nspoints
-
-        i = 0
-        nids = model.grid.node_id
-        #nids.sort()
-        self.log.info('nids = %s %s' %(nids, i))
-        #dof_ids = arange(0, 6*nnodes, 6)
-
-        #dofs_0 = [nid=2, 1] -> searchsorted(nids, nid)[0]
-
-        #for nid in sorted(self.nodes.iterkeys()):
-            #nid_dof_mapper[]
 
         self.log.info('start calculating xyz_cid0')
-        self.positions = {}
-        index0s = {}
-        for i in range(model.grid.n):
-            nid = model.grid.node_id[i]
-            self.positions[nid] = model.grid.xyz[i]
-            index0s[nid] = 6 * i
+        index0s = self._get_node_index(model)
         self.log.info('end calculating xyz_cid0')
 
-        # spring
-        if model.elements_spring.celas1.n:
-            self.log.info('start calculating Kcelas1')
-            for i in range(model.elements_spring.celas1.n):
-                K, dofs, nijv = model.elements_spring.celas1.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.log.info("Kcelas1 =\n%s" % K)
-                self.add_stiffness(K, dofs, nijv)
-
-        if model.elements_spring.celas2.n:
-            self.log.info('start calculating Kcelas2')
-            for i in range(model.elements_spring.celas2.n):
-                K, dofs, nijv = model.elements_spring.celas2.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        if model.elements_spring.celas3.n:
-            self.log.info('start calculating Kcelas3')
-            for i in range(model.elements_spring.celas3.n):
-                K, dofs, nijv = model.elements_spring.celas3.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        if model.elements_spring.celas4.n:
-            self.log.info('start calculating Kcelas4')
-            for i in range(model.elements_spring.celas4.n):
-                K, dofs, nijv = model.elements_spring.celas4.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        # conrod
-        if model.conrod.n:
-            self.log.info('start calculating Kconrod')
-            for i in range(model.conrod.n):
-                self.conrodStress = {}
-                K, dofs, nijv = model.conrod.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        # crod
-        if model.crod.n:
-            self.log.info('start calculating Kcrod')
-            for i in range(model.crod.n):
-                K, dofs, nijv = model.crod.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        # ctube
-        #if model.ctube.n:
-            #self.log.info('start calculating Kctube')
-
-        # shells
-        if model.elements_shell.ctria3.n:
-            for i in range(model.elements_shell.ctria3.n):
-                K, dofs, nijv = model.elements_shell.ctria3.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        if model.elements_shell.cquad4.n:
-            for i in range(model.elements_shell.cquad4.n):
-                K, dofs, nijv = model.elements_shell.cquad4.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.add_stiffness(K, dofs, nijv)
-
-        #Kgg_sparse = coo_matrix((entries, (rows, cols)), shape=(i, i))
-        Kgg_sparse = None
-        Kgg = self.Kgg
-        return Kgg, Kgg_sparse
+        elements = [
+            # spring
+            ('celas1', model.elements_spring.celas1),
+            ('celas2', model.elements_spring.celas2),
+            ('celas3', model.elements_spring.celas3),
+            ('celas4', model.elements_spring.celas4),
+
+            # rod
+            ('conrod', model.conrod),
+            ('crod', model.crod),
+            #('ctube', model.ctube),
+
+            # shells
+            ('ctria3', model.elements_shell.ctria3),
+            ('cquad4', model.elements_shell.cquad4),
+        ]
+        triplets = []
+        for name, elements_type in elements:
+            if elements_type.n:
+                self.log.info('start calculating K%s' % name)
+                triplets.append(self._get_element_triplets(
+                    elements_type.get_stiffness_matrix, elements_type.n, model, index0s))
+
+        self.Kgg = coo_to_csr(triplets, ndofs)
+        return self.Kgg
 
     #def assemble_global_damping_matrix(self, model, i, Dofs):
 
     def assemble_global_mass_matrix(self, model, ndofs, Dofs):
-        self.Mgg = zeros((ndofs, ndofs), 'float64')
-        self.Mgg_sparse = dok_matrix((ndofs, ndofs), dtype='float64')
-
-        dof_mapper = []
+        """
+        Assembles the global mass matrix from the COO triplets of
+        each element type
 
+        Returns
+        -------
+        Mgg : (ndofs, ndofs) csr_matrix
+            the global mass matrix
+        """
         nnodes = model.grid.n
-        nspoints = model.spoint.n
         assert nnodes > 0
-
-        i = 0
-        nids = model.grid.node_id
-
-        self.positions = {}
-        index0s = {}
-        for i in range(model.grid.n):
-            nid = model.grid.node_id[i]
-            self.positions[nid] = model.grid.xyz[i]
-            index0s[nid] = 6 * i
+        index0s = self._get_node_index(model)
+        triplets = []
 
         # mass
         conm1 = model.mass.conm1
-        for i in range(conm1.n):
-            M = conm1.get_mass_matrix(i)
-            i0 = index[conm1.node_id[i]]
-            coord_id = conm1.coord_id[i]
-            assert coord_id == 0, 'CONM1 doesnt support coord_id != 0 for element %i; coord_id=%i' % (model.conm1.element_id[i], coord_id)
-            # CONM1 doesn't consider coord ID
-            self.Mgg[i0:i0+6, i0:i0+6] += M[:, :]
-            for ii1, i01 in arange(i0, i0+6):
-                for ii2, i02 in arange(i0, i0+6):
-                    self.Mgg_sparse[i01, i02] = M[ii1, ii2]
-        for i in range(model.mass.conm2.n):
-            M, dofs, nijv = model.conm1.get_mass_matrix(i, model, self.positions, index0s)
-            self.add_mass(M, dofs, nijv)
-
-        if 0:
+        if conm1.n:
+            masses = []
+            dofs = []
+            for i in range(conm1.n):
+                M = conm1.get_mass_matrix(i)
+                i0 = index0s[conm1.node_id[i]]
+                coord_id = conm1.coord_id[i]
+                assert coord_id == 0, 'CONM1 doesnt support coord_id != 0 for element %i; coord_id=%i' % (conm1.element_id[i], coord_id)
+                # CONM1 doesn't consider coord ID
+                masses.append(M)
+                dofs.append(arange(i0, i0 + 6))
+            triplets.append(element_matrices_to_coo(masses, dofs))
+        if model.mass.conm2.n:
+            raise NotImplementedError('CONM2 mass matrix')
+
+        solid = model.elements_solid
+        elements = [
             # cmass
-            for i in range(model.cmass1.n):
-                M, dofs, nijv = model.cmass1.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-            for i in range(model.cmass2.n):
-                M, dofs, nijv = model.cmass2.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-            for i in range(model.cmass3.n):
-                M, dofs, nijv = model.cmass3.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-            for i in range(model.cmass4.n):
-                M, dofs, nijv = model.cmass4.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-
-        # conrod
-        for i in range(model.conrod.n):
-            M, dofs, nijv = model.conrod.get_mass_matrix(i, model, self.positions, index0s)
-            self.add_mass(M, dofs, nijv)
-        # crod
-        for i in range(model.crod.n):
-            M, dofs, nijv = model.crod.get_mass_matrix(i, model, self.positions, index0s)
-            self.add_mass(M, dofs, nijv)
-        if 0:
-            # ctube
-            for i in range(model.ctube.n):
-                M, dofs, nijv = model.ctube.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-
-        # shells
-        for i in range(model.elements_shell.ctria3.n):
-            M, dofs, nijv = model.elements_shell.ctria3.get_mass_matrix(i, model, self.positions, index0s)
-            self.add_mass(M, dofs, nijv)
-        for i in range(model.elements_shell.cquad4.n):
-            M, dofs, nijv = model.elements_shell.cquad4.get_mass_matrix(i, model, self.positions, index0s)
-            self.add_mass(M, dofs, nijv)
-
-        # solids
-        nsolids = model.elements_solid.n
-        if nsolids:
-            solid = model.elements_solid
-            for i in range(solid.ctetra4.n):
-                M, dofs, nijv = solid.ctetra4.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-            for i in range(solid.cpenta6.n):
-                M, dofs, nijv = solid.ctetra4.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-            for i in range(solid.chexa8.n):
-                M, dofs, nijv = solid.ctetra4.get_mass_matrix(i, model, self.positions, index0s)
-                self.add_mass(M, dofs, nijv)
-        # ctetra10
-        # cpenta15
-        # chexa20
-
-        #Mgg_sparse = coo_matrix((entries, (rows, cols)), shape=(i, i))
-        Mgg_sparse = None
-        Mgg = self.Mgg
+            #('cmass1', model.cmass1),
+            #('cmass2', model.cmass2),
+            #('cmass3', model.cmass3),
+            #('cmass4', model.cmass4),
+
+            # rod
+            ('conrod', model.conrod),
+            ('crod', model.crod),
+            #('ctube', model.ctube),
+
+            # shells
+            ('ctria3', model.elements_shell.ctria3),
+            ('cquad4', model.elements_shell.cquad4),
+
+            # solids
+            ('ctetra4', solid.ctetra4),
+            ('cpenta6', solid.cpenta6),
+            ('chexa8', solid.chexa8),
+            # ctetra10
+            # cpenta15
+            # chexa20
+        ]
+        for name, elements_type in elements:
+            if elements_type.n:
+                self.log.info('start calculating M%s' % name)
+                triplets.append(self._get_element_triplets(
+                    elements_type.get_mass_matrix, elements_type.n, model, index0s))
+
+        self.Mgg = coo_to_csr(triplets, ndofs)
         self.log.info('returning Mgg')
-        return Mgg, Mgg_sparse
+        return self.Mgg
 
     def apply_SPCs(self, model, case, nidComponentToID):
         has_spcs = False
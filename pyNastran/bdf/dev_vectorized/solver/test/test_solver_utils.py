@@ -0,0 +1,96 @@
+from __future__ import print_function
+import unittest
+
+from numpy import array, zeros, allclose, ix_
+from scipy.sparse import coo_matrix
+
+from pyNastran.bdf.dev_vectorized.solver.utils import (
+    element_matrices_to_coo, coo_to_csr, partition_sparse_symmetric,
+    partition_dense_symmetric)
+
+
+def _dense_assembly(matrices, dofs, n):
+    """scatters the element matrices into a dense matrix"""
+    A = zeros((n, n), 'float64')
+    for matrix, dofsi in zip(matrices, dofs):
+        if len(dofsi):
+            A[ix_(dofsi, dofsi)] += matrix
+    return A
+
+
+class TestSolverUtils(unittest.TestCase):
+
+    def test_element_matrices_to_coo(self):
+        """the element matrices of different sizes are assembled"""
+        k_rod = array([[1., -1.], [-1., 1.]])
+        k_tri = array([
+            [4., -1., 0.],
+            [-1., 4., -1.],
+            [0., -1., 4.],
+        ])
+        matrices = [k_rod, 2. * k_rod, k_tri, k_rod]
+        dofs = [
+            array([0, 1]),
+            array([1, 4]),
+            array([4, 2, 0]),
+            array([], dtype='int64'),  # no stiffness
+        ]
+        rows, cols, values = element_matrices_to_coo(matrices, dofs)
+        self.assertEqual(len(rows), 4 + 4 + 7)  # the zeros are skipped
+
+        A = coo_matrix((values, (rows, cols)), shape=(5, 5)).toarray()
+        A_expected = _dense_assembly(matrices, dofs, 5)
+        self.assertTrue(allclose(A, A_expected))
+
+        rows, cols, values = element_matrices_to_coo([k_rod], [array([], dtype='int64')])
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(rows.dtype.name, 'int64')
+
+    def test_coo_to_csr(self):
+        """the duplicate terms of the element types are summed"""
+        k_rod = array([[1., -1.], [-1., 1.]])
+        k_spring = array([[3.]])
+        triplets = [
+            element_matrices_to_coo([k_rod, k_rod], [array([0, 1]), array([1, 2])]),
+            element_matrices_to_coo([k_spring, k_spring], [array([1]), array([1])]),
+        ]
+        A = coo_to_csr(triplets, 4)
+        self.assertEqual(A.format, 'csr')
+        self.assertEqual(A.shape, (4, 4))
+
+        A_expected = (
+            _dense_assembly([k_rod, k_rod], [[0, 1], [1, 2]], 4) +
+            _dense_assembly([k_spring, k_spring], [[1], [1]], 4))
+        self.assertEqual(A_expected[1, 1], 8.)
+        self.assertTrue(allclose(A.toarray(), A_expected))
+
+        A = coo_to_csr([], 3)
+        self.assertEqual(A.shape, (3, 3))
+        self.assertEqual(A.nnz, 0)
+
+    def test_partition_sparse_symmetric(self):
+        """the sparse partitioning matches the dense one"""
+        A = array([
+            [4., -1., 0., 2e-9, 1.],
+            [-1., 4., -1., 0., 0.],
+            [0., -1., 4., -1., 0.],
+            [2e-9, 0., -1., 4., -1.],
+            [1., 0., 0., -1., 4.],
+        ])
+        dofs_in = [2, 4]
+        A2, dofs = partition_sparse_symmetric(coo_matrix(A), dofs_in)
+        A2_expected, dofs_expected = partition_dense_symmetric(A, dofs_in)
+        self.assertEqual(A2.format, 'csr')
+        self.assertEqual(dofs, [0, 1, 3])
+        self.assertEqual(dofs, dofs_expected)
+        self.assertTrue(allclose(A2.toarray(), A2_expected, atol=0.))
+
+        # the small terms are only dropped with a tolerance
+        self.assertEqual(A2.nnz, 5)
+        A2, dofs = partition_sparse_symmetric(coo_matrix(A), dofs_in, tol=0.0)
+        self.assertEqual(A2.nnz, 7)
+        self.assertTrue(allclose(A2.toarray(), A[ix_(dofs, dofs)], atol=0.))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
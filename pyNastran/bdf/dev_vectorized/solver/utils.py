@@ -1,6 +1,8 @@
+from collections import defaultdict
 from six import iteritems
 from six.moves import zip, range
-from numpy import dot, ndarray, zeros
+from numpy import dot, ndarray, zeros, ones, array, repeat, hstack, where, abs as np_abs
+from scipy.sparse import coo_matrix
 
 def partition_sparse(Is, Js, Vs):
     I2 = []
@@ -41,16 +43,110 @@ def partition_dense_symmetric(A, dofs_in):
 def partition_dense_vector(F, dofs_in):
     nAll = F.shape[0]
     #print("partition_dense_vector:  dofs_in = %s" % sorted(dofs_in))
-    dofs = getDOF_Set(nAll, dofs_in)
-    dofs.sort()
+    dofs = _get_free_dofs(nAll, dofs_in)
     #print("partition_dense_vector:  dofs = %s" % dofs)
-    n = len(dofs)
-    F2 = zeros(n, 'float64')
-    for (i, dofI) in enumerate(dofs):
-        v = F[dofI]
-        if abs(v) >= 1e-8:
-            F2[i] = v
-    return (F2, dofs)
+    F2 = array(F[dofs], dtype='float64')
+    F2[np_abs(F2) < 1e-8] = 0.0
+    return (F2, dofs.tolist())
+
+
+def _get_free_dofs(nAll, dofs_in):
+    """gets the sorted dofs that aren't in dofs_in"""
+    is_free = ones(nAll, dtype='bool')
+    is_free[array(dofs_in, dtype='int64')] = False
+    return where(is_free)[0]
+
+
+def partition_sparse_symmetric(A, dofs_in, tol=1e-8):
+    """
+    Removes the rows/columns of dofs_in from a sparse matrix
+
+    Parameters
+    ----------
+    A : (n, n) sparse matrix
+        the matrix
+    dofs_in : List[int]
+        the dofs to remove
+    tol : float; default=1e-8
+        terms smaller than tol are dropped
+
+    Returns
+    -------
+    A2 : (m, m) csr_matrix
+        the partitioned matrix
+    dofs : List[int]
+        the dofs of A that are kept
+    """
+    dofs = _get_free_dofs(A.shape[0], dofs_in)
+    A2 = A.tocsr()[dofs, :][:, dofs]
+    if tol > 0.0:
+        A2.data[np_abs(A2.data) < tol] = 0.0
+        A2.eliminate_zeros()
+    return (A2, dofs.tolist())
+
+
+def element_matrices_to_coo(matrices, dofs):
+    """
+    Stacks the element matrices of an element type into COO triplets
+
+    Parameters
+    ----------
+    matrices : List[(ndof, ndof) ndarray]
+        the element matrices
+    dofs : List[(ndof, ) int ndarray]
+        the global dofs of the rows/columns of the element matrices;
+        an element without stiffness has no dofs
+
+    Returns
+    -------
+    rows, cols, values : (nnz, ) ndarray
+        the nonzero terms of the element matrices
+    """
+    # the element matrices are stacked by size, as the dofs of an
+    # element depend on the properties (e.g., a CROD without torsion)
+    elements_by_ndof = defaultdict(list)
+    for matrix, dofsi in zip(matrices, dofs):
+        if len(dofsi):
+            elements_by_ndof[len(dofsi)].append((matrix, dofsi))
+
+    rows = []
+    cols = []
+    values = []
+    for ndof, elements in sorted(iteritems(elements_by_ndof)):
+        matrix = array([element[0] for element in elements], dtype='float64')
+        dofsi = array([element[1] for element in elements], dtype='int64')
+        valuesi = matrix.ravel()
+        inonzero = where(valuesi != 0.0)[0]
+        rows.append(repeat(dofsi[:, :, None], ndof, axis=2).ravel()[inonzero])
+        cols.append(repeat(dofsi[:, None, :], ndof, axis=1).ravel()[inonzero])
+        values.append(valuesi[inonzero])
+
+    if not rows:
+        return (zeros(0, 'int64'), zeros(0, 'int64'), zeros(0, 'float64'))
+    return (hstack(rows), hstack(cols), hstack(values))
+
+
+def coo_to_csr(triplets, n):
+    """
+    Sums the COO triplets of the element types into a sparse matrix
+
+    Parameters
+    ----------
+    triplets : List[(rows, cols, values)]
+        the COO triplets (see ``element_matrices_to_coo``)
+    n : int
+        the number of dofs
+
+    Returns
+    -------
+    A : (n, n) csr_matrix
+        the assembled matrix
+    """
+    if triplets:
+        rows, cols, values = [hstack(arrays) for arrays in zip(*triplets)]
+    else:
+        rows, cols, values = zeros(0, 'int64'), zeros(0, 'int64'), zeros(0, 'float64')
+    return coo_matrix((values, (rows, cols)), shape=(n, n)).tocsr()
 
 
 def partition_sparse_vector(F, dofs):
@@ -76,7 +172,7 @@ def departition_dense_vector(n, IsVs):
 
 
 def reverse_dict(A):
-    return {v: k for k, v in A.iteritems()}
+    return {v: k for k, v in iteritems(A)}
 
 
 def triple(A, B):
@@ -88,6 +184,6 @@ def triple(A, B):
     T [m x m] = A.T [m x n] @ B [n x n] @ A [n x m]
     """
     assert isinstance(A, ndarray), type(A)
-    assert isinstance(A, ndarray), type(B)
-    return dot(A.T, dot(B, A))
+    # B may be a sparse matrix
+    return dot(A.T, B.dot(A))
 
@@ -10,7 +10,7 @@ from numpy import float32, isnan
 
 from pyNastran.utils import integer_types
 from pyNastran.bdf.cards.utils import wipe_empty_fields_typed
-from pyNastran.bdf.field_writer_8 import set_blank_if_default
+from pyNastran.bdf.field_writer_8 import set_blank_if_default, _print_float_array
 
 def set_string16_blank_if_default(value, default):
     """helper method for writing BDFs"""
@@ -196,6 +196,26 @@ def print_float_16(value):
     return field
 
 
+def print_float_16_array(values):
+    """
+    Prints an array of floats in nastran 16-character width syntax
+    using the highest precision possible.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print (multi-dimensional arrays are flattened)
+
+    Returns
+    -------
+    fields : List[str]
+        the 16-character strings; the same as ``print_float_16``
+
+    .. seealso:: print_float_8_array
+    """
+    return _print_float_array(values, 16, print_float_16)
+
+
 def print_field_16(value):
     """
     Prints a 16-character width field
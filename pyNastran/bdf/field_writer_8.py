@@ -6,6 +6,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from six import string_types, integer_types
 from six.moves import range
 import sys
+import numpy as np
 from numpy import float32, isnan
 
 
@@ -194,6 +195,75 @@ def print_float_8(value):
     return field
 
 
+def print_float_8_array(values):
+    """
+    Prints an array of floats in nastran 8-character width syntax using
+    the highest precision possible.
+
+    Parameters
+    ----------
+    values : (n, ) float ndarray
+        the values to print (multi-dimensional arrays are flattened)
+
+    Returns
+    -------
+    fields : List[str]
+        the 8-character strings; the same as ``print_float_8``
+
+    .. seealso:: print_float_16_array
+    """
+    return _print_float_array(values, 8, print_float_8)
+
+
+def _print_float_array(values, width, print_float):
+    """
+    Prints an array of floats in the fixed-point form of
+    ``print_float_8``/``print_float_16``.
+
+    The values are grouped by the number of decimal places of their
+    fixed-point branch, so each group is printed with the same '%W.Pf'
+    format as the scalar function.  Zeros, nans, and the values that use
+    scientific notation are left to ``print_float``.
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    abs_values = np.abs(values)
+    is_negative = values < 0.
+
+    # the number of decimal places (negative for negative values) or 0
+    # for the values left to print_float
+    precisions = np.where(
+        is_negative,
+        -_get_float_precisions(abs_values, width - 2, 0.01),
+        _get_float_precisions(abs_values, width - 1, 0.001))
+    precisions[np.isnan(values)] = 0
+
+    fields = np.empty(len(values), dtype='object')
+    for precision in np.unique(precisions).tolist():
+        i = np.where(precisions == precision)[0]
+        valuesi = values[i].tolist()
+        if precision == 0:
+            fields[i] = [print_float(value) for value in valuesi]
+        elif precision > 0:
+            fmt = '%%%i.%if' % (width, precision)
+            fields[i] = [(fmt % value).strip(' 0').rjust(width) for value in valuesi]
+        else:
+            fmt = '%%%i.%if' % (width, -precision)
+            fields[i] = [(fmt % value).replace('-0.', '-.').strip(' 0').rjust(width)
+                         for value in valuesi]
+    return fields.tolist()
+
+
+def _get_float_precisions(abs_values, max_precision, min_value):
+    """
+    Gets the decimal places of the fixed-point branches, which use
+    max_precision places for min_value <= abs_value < 1 and one less place
+    for every power of 10 after that; 0 is used outside of that range.
+    """
+    edges = np.hstack([[min_value], 10. ** np.arange(max_precision)])
+    precisions = np.hstack([[0], np.arange(max_precision, 0, -1), [0]])
+    return precisions[np.searchsorted(edges, abs_values, side='right')]
+
+
 def print_float_or_int_8(value):
     """
     Prints a 8-character width field
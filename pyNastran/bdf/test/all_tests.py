@@ -13,6 +13,10 @@ from pyNastran.bdf.test.unit.test_mass import *
 from pyNastran.bdf.test.unit.test_assign_type import *
 from pyNastran.bdf.test.unit.test_read_write import *
 from pyNastran.bdf.test.unit.test_sum_loads import *
+from pyNastran.bdf.test.unit.test_grid_array import *
+from pyNastran.bdf.test.unit.test_bulk_cards import *
+from pyNastran.bdf.test.unit.test_snapshot import *
+from pyNastran.bdf.test.unit.test_import_time import *
 
 
 if __name__ == "__main__":  # pragma: no cover
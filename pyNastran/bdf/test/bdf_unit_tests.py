@@ -99,6 +99,26 @@ class TestBDF(Tester):
         assert allclose(norm((cg1 - cg2)**2), 0.0), 'cg1-cg2=%s' % (cg1 - cg2)
         assert allclose(norm((I1  -  I2)**2), 0.0), 'I1-I2=%s' % (I1 - I2)
 
+        # half the model from a precomputed cache
+        mass_cache = fem1.get_mass_cache()
+        eids = sorted(fem1.elements)[::2]
+        mass1, cg1, I1 = fem1.mass_properties(element_ids=eids, reference_point=reference_point,
+                                              sym_axis=sym_axis)
+        mass2, cg2, I2 = fem1.mass_properties(element_ids=eids, reference_point=reference_point,
+                                              sym_axis=sym_axis, mass_cache=mass_cache)
+        assert allclose(mass1, mass2), 'mass1=%s mass2_cache=%s' % (mass1, mass2)
+        assert allclose(norm((cg1 - cg2)**2), 0.0), 'cg1-cg2=%s' % (cg1 - cg2)
+        assert allclose(norm((I1  -  I2)**2), 0.0), 'I1-I2=%s' % (I1 - I2)
+
+        # the ids may be a set
+        for mass_cachei in [None, mass_cache]:
+            mass2, cg2, I2 = fem1.mass_properties(
+                element_ids=set(eids), mass_ids=set(fem1.masses), reference_point=reference_point,
+                sym_axis=sym_axis, mass_cache=mass_cachei)
+            assert allclose(mass1, mass2), 'mass1=%s mass2_set=%s' % (mass1, mass2)
+            assert allclose(norm((cg1 - cg2)**2), 0.0), 'cg1-cg2=%s' % (cg1 - cg2)
+            assert allclose(norm((I1  -  I2)**2), 0.0), 'I1-I2=%s' % (I1 - I2)
+
     def test_bdf_02(self):
         bdf_filename = os.path.join('plate_py', 'plate_py.dat')
         folder = os.path.abspath(os.path.join(pkg_path, '..', 'models'))
@@ -206,6 +226,32 @@ class TestBDF(Tester):
         self._compare_mass_cg_I(fem1, reference_point=u'cg')
         self._compare_mass_cg_I(fem1, reference_point='cg')
 
+    def test_bdf_07_skin_solids(self):
+        """the shared face of 2 CHEXA20s isn't skinned"""
+        model = BDF(debug=False)
+        model.add_card(['CHEXA', 1, 1, 1, 2, 3, 4, 5, 6, 7, 8,
+                        101, 102, 103, 104, 105, 106, 107, 108,
+                        109, 110, 111, 112], 'CHEXA')
+        model.add_card(['CHEXA', 2, 1, 5, 6, 7, 8, 9, 10, 11, 12,
+                        109, 110, 111, 112, 113, 114, 115, 116,
+                        117, 118, 119, 120], 'CHEXA')
+        model.add_card(['CTETRA', 3, 1, 21, 22, 23, 24], 'CTETRA')
+        skin_faces = model.get_solid_skin_face_arrays()
+        self.assertEqual(sorted(skin_faces), [3, 8])
+
+        eids, faces = skin_faces[8]
+        self.assertEqual(sorted(eids.tolist()), [1] * 5 + [2] * 5)
+        sorted_faces = [sorted(face) for face in faces.tolist()]
+        self.assertNotIn([5, 6, 7, 8, 109, 110, 111, 112], sorted_faces)
+        self.assertIn([1, 2, 3, 4, 101, 102, 103, 104], sorted_faces)
+        self.assertIn([9, 10, 11, 12, 117, 118, 119, 120], sorted_faces)
+        self.assertEqual(skin_faces[3][0].tolist(), [3] * 4)
+
+        eid_set, face_map = model.get_solid_skin_faces()
+        self.assertEqual(len(eid_set), 14)
+        self.assertEqual(face_map[(1, 2, 3, 4, 101, 102, 103, 104)],
+                         [1, 2, 3, 4, 101, 102, 103, 104])
+
 
 class TestBaseCard(Tester):
     def test_base_card_01_collapse_thru(self):
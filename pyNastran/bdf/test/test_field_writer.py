@@ -5,9 +5,10 @@ import random
 import unittest
 
 from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
-                                          set_default_if_blank,
+                                          set_default_if_blank, print_float_8_array,
                                           set_blank_if_default, is_same, print_card_8)
-from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
+from pyNastran.bdf.field_writer_16 import (print_field_16, print_card_16, print_float_16,
+                                           print_float_16_array, print_scientific_16)
 from pyNastran.bdf.field_writer_double import print_card_double
 
 
@@ -441,6 +442,19 @@ class Testfield_writer_8(unittest.TestCase):
             positive_output = [print_float_16(x) for x in nums]
             negative_output = [print_float_16(-x) for x in nums]
 
+    def test_float_array(self):
+        """the array writers are the same as print_float_8/print_float_16"""
+        nums = (
+            [0., -0., float('nan'), 0.000034, -0.000034, 0.001, -0.01, 0.1, -0.1,
+             1., -1., 0.99999999, -0.99999999, 9.9999999, -9.9999999, 99999.995,
+             1e5, -1e5, 1e6, 1e13, -1e13, 1e14, 0.125, -2.5] +
+            [9./11 * 10**x for x in range(-17, 18)] +
+            [-9./11 * 10**x for x in range(-17, 18)] +
+            [random.uniform(-1000., 1000.) for i in range(1000)])
+        self.assertEqual(print_float_8_array(nums), [print_float_8(x) for x in nums])
+        self.assertEqual(print_float_16_array(nums), [print_float_16(x) for x in nums])
+        self.assertEqual(print_float_8_array([]), [])
+
 def compare(value_in):
     field = print_field_8(value_in)
 
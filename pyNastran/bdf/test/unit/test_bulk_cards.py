@@ -0,0 +1,192 @@
+from __future__ import print_function, unicode_literals
+import os
+import unittest
+from six import StringIO
+
+import pyNastran
+import pyNastran.bdf.bdf as bdf_module
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.bulk_cards import get_bulk_cards
+from pyNastran.bdf.bdf_interface.bulk_writer import write_bulk_cards
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import (
+    group_cards, split_cards, to_integers, to_doubles, to_integers_or_doubles)
+
+model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
+log = None
+
+
+def _small_field(fields):
+    """makes a small field line"""
+    return ''.join(['%-8s' % field for field in fields]).rstrip()
+
+
+def _write_bdf(model):
+    """writes a model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestBulkCards(unittest.TestCase):
+
+    def test_group_cards(self):
+        cards = [
+            ['', [_small_field(['CQUAD4', 1, 1, 1, 2, 3, 4])]],
+            ['', ['CQUAD4,2,1,1,2,3,4']],
+            ['', ['CQUAD4*                 3               1               1               2',
+                  '*                      3               4']],
+            ['', [_small_field(['CQUAD4', 4, 1, 1, 2, 3, 4, '', '0.1']),
+                  _small_field(['', '', '', '0.2'])]],
+            ['', ['CQUAD4\t5\t1\t1\t2\t3\t4']],
+            ['', ['CQUAD4,6,1,1,2,3,4,,', ',,,0.2']],
+        ]
+        groups, icards_failed = group_cards(cards)
+        self.assertEqual(groups, {('small', 1) : [0], ('csv', 1) : [1],
+                                  ('large', 2) : [2], ('small', 2) : [3]})
+        self.assertEqual(icards_failed, [4, 5])
+
+        fields = split_cards(cards, [2], 'large', 2)
+        self.assertEqual(to_integers(fields[:, 5], 'n4').tolist(), [4])
+        fields = split_cards(cards, [3], 'small', 2)
+        self.assertEqual(fields.shape, (1, 16))
+        self.assertEqual(fields[0, 10].strip(), '0.2')
+
+    def test_to_integers_or_doubles(self):
+        fields = split_cards([['', [_small_field(['CQUAD4', 1, '', '3', '-1.-2', '2.5'])]]],
+                             [0], 'small', 1)
+        values = to_integers_or_doubles(fields[0, :5], 'theta', 0.0).tolist()
+        self.assertEqual(values, [1, 0.0, 3, -0.01, 2.5])
+        self.assertIsInstance(values[2], int)
+        with self.assertRaises(SyntaxError):
+            to_integers_or_doubles(fields[0, :2], 'theta')
+
+        # numpy parses nan/inf, but they aren't Nastran floats
+        fields = split_cards([['', [_small_field(['CQUAD4', '1.0', 'nan', 'inf', '-INF'])]]],
+                             [0], 'small', 1)
+        for i in [1, 2, 3]:
+            with self.assertRaises(SyntaxError):
+                to_doubles(fields[0, [0, i]], 'theta')
+            with self.assertRaises(SyntaxError):
+                to_integers_or_doubles(fields[0, [0, i]], 'theta')
+
+        # numpy/float() parse these, but integer_or_double decides what they are
+        fields = split_cards([['', [_small_field(['CQUAD4', '1.0', '1_0', '1D2', '1E5', '1.0.0'])]]],
+                             [0], 'small', 1)
+        for i in [1, 2, 3, 4]:
+            with self.assertRaises(SyntaxError):
+                to_integers_or_doubles(fields[0, [0, i]], 'theta')
+
+        fields = split_cards([['', [_small_field(['CQUAD4', '+5', '1.', '.5', '-1.D2', '2.+1'])]]],
+                             [0], 'small', 1)
+        values = to_integers_or_doubles(fields[0, :5], 'theta').tolist()
+        self.assertEqual(values, [5, 1.0, 0.5, -100.0, 20.0])
+
+    def test_get_bulk_cards(self):
+        """the cards with bad values are left to add_card"""
+        cards = [
+            ['$ quad 1\n', [_small_field(['CQUAD4', 1, '', 1, 2, 3, 4, '1.-5', '0.1'])]],
+            ['', [_small_field(['CQUAD4', 2, 1, 1, 2, 3, 4.5])]],
+            ['', [_small_field(['CQUAD4', 3, 1, 1, 2, 3, 4, 7, 'bad'])]],
+            ['', [_small_field(['CQUAD4', -4, 1, 1, 2, 3, 4])]],
+            ['', [_small_field(['CQUAD4', 5, 1, 1, 2, 3, 4]),
+                  _small_field(['', '', 1, '0.1', '', '0.3'])]],
+            ['', [_small_field(['CQUAD4', 6, 1, 1, 2, 3, 4, 'nan'])]],
+            ['', [_small_field(['CQUAD4', 7, 1, 1, 2, 3, 4, '1_0'])]],
+            ['', [_small_field(['CQUAD4', 8, 1, 1, 2, 3, 4, '1D2'])]],
+        ]
+        quads, icards_failed = get_bulk_cards('CQUAD4', cards)
+        self.assertEqual(icards_failed, [1, 2, 3, 5, 6, 7])
+        self.assertEqual([quad.eid for quad in quads], [1, 5])
+
+        quad = quads[0]
+        self.assertEqual(quad.pid, 1)
+        self.assertEqual(quad.thetaMcid, 1e-5)
+        self.assertEqual(quad.zOffset, 0.1)
+        self.assertEqual(quad.comment, '$ quad 1\n')
+        quad = quads[1]
+        self.assertEqual([quad.TFlag, quad.T1, quad.T2, quad.T3, quad.T4],
+                         [1, 0.1, 1.0, 0.3, 1.0])
+        self.assertIsInstance(quad.thetaMcid, float)
+
+        cards = [
+            ['', [_small_field(['CTETRA', 10, 2, 1, 2, 3, 4])]],
+            ['', [_small_field(['CTETRA', 11, 2, 1, 2, 3, 4, 5, 6]),
+                  _small_field(['', 7, 8, 9, 10])]],
+        ]
+        tets, icards_failed = get_bulk_cards('CTETRA', cards)
+        self.assertEqual(icards_failed, [1])
+        self.assertEqual(tets[0].type, 'CTETRA')
+        self.assertEqual(tets[0].node_ids, [1, 2, 3, 4])
+
+    def test_bulk_cards_theta_mcid(self):
+        """the THETA/MCID field is the same as with add_card"""
+        bdf_filename = 'bulk_theta_mcid.bdf'
+        bulk_cards = bdf_module.BULK_CARDS
+        for svalue, value in [('1_0', 10), ('1.0-2', 0.01), ('3', 3), ('1D2', None)]:
+            with open(bdf_filename, 'w') as bdf_file:
+                bdf_file.write('CEND\nBEGIN BULK\n%s\nENDDATA\n' % _small_field(
+                    ['CQUAD4', 1, 1, 1, 2, 3, 4, svalue]))
+            for bulk_cardsi in [bulk_cards, {}]:
+                bdf_module.BULK_CARDS = bulk_cardsi
+                model = BDF(log=log, debug=False)
+                try:
+                    if value is None:
+                        with self.assertRaises(SyntaxError):
+                            model.read_bdf(bdf_filename, xref=False)
+                        continue
+                    model.read_bdf(bdf_filename, xref=False)
+                finally:
+                    bdf_module.BULK_CARDS = bulk_cards
+                theta_mcid = model.elements[1].thetaMcid
+                self.assertEqual(theta_mcid, value)
+                self.assertIsInstance(theta_mcid, type(value))
+        os.remove(bdf_filename)
+
+    def test_bulk_cards_models(self):
+        """the bulk cards write the same deck as add_card"""
+        bulk_cards = bdf_module.BULK_CARDS
+        for folder, fname in [('solid_bending', 'solid_bending.bdf'),
+                              ('sol_101_elements', 'static_solid_shell_bar.bdf'),
+                              ('iSat', 'ISat_Launch_Sm_4pt.dat')]:
+            bdf_filename = os.path.join(model_path, folder, fname)
+            model1 = read_bdf(bdf_filename, xref=False, log=log, debug=False)
+            try:
+                bdf_module.BULK_CARDS = {}
+                model2 = read_bdf(bdf_filename, xref=False, log=log, debug=False)
+            finally:
+                bdf_module.BULK_CARDS = bulk_cards
+            self.assertEqual(model1.card_count, model2.card_count)
+            self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+
+    def test_write_bulk_cards(self):
+        """the bulk writers write the same cards as write_card"""
+        model = BDF(debug=False)
+        model.add_card(['GRID', 1, None, 0., 1.5, -2.25], 'GRID')
+        model.add_card(['GRID', 2, 1, 1e-9, 12345.678, -0.0123, 2, 123, 0], 'GRID')
+        model.add_card(['GRID', 3, None, 1e8, -99999.99, 0.5, None, None, 1], 'GRID')
+        model.add_card(['CQUAD4', 10, 1, 1, 2, 3, 1], 'CQUAD4')
+        model.add_card(['CQUAD4', 11, 1, 1, 2, 3, 1, 45.5, 0.25, None, 1, 0.5, 1.0],
+                       'CQUAD4', comment='quad')
+        model.add_card(['CQUAD4', 12, 1, 1, 2, 3, 1, 2], 'CQUAD4')
+        model.add_card(['CTRIA3', 20, 1, 1, 2, 3], 'CTRIA3')
+        model.add_card(['CTRIA3', 21, 1, 1, 2, 3, 30., None, None, None, None, 2.5], 'CTRIA3')
+        model.add_card(['CHEXA', 30, 2, 1, 2, 3, 1, 2, 3, 1, 2], 'CHEXA')
+        model.add_card(['CBAR', 40, 3, 1, 2, 0., 1., 0.5, None, None, 5, 0.1], 'CBAR')
+        model.add_card(['CBAR', 41, 3, 1, 2, 3], 'CBAR')
+        model.add_card(['FORCE', 100, 1, None, 1000.5, 0., -1., 1e-6], 'FORCE')
+        model.add_card(['FORCE', 100, 2, 1, -3.25, 0.5, 0.5, 0.], 'FORCE')
+        model.add_card(['CROD', 50, 4, 1, 2], 'CROD')
+
+        cards = (list(model.nodes.values()) + list(model.elements.values()) +
+                 model.loads[100])
+        for size, is_double in [(8, False), (16, False), (16, True)]:
+            msgs = write_bulk_cards(cards, size, is_double)
+            for card, msg in zip(cards, msgs):
+                if card.type == 'CROD' or (card.type == 'FORCE' and is_double):
+                    self.assertIsNone(msg)
+                else:
+                    self.assertEqual(msg, card.write_card(size, is_double))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,160 @@
+from __future__ import print_function, unicode_literals
+import os
+import unittest
+from codecs import open as codec_open
+from six import StringIO
+
+import numpy as np
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import (
+    split_fixed_width, split_csv, to_integers, to_doubles)
+
+model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
+log = None
+
+def _small_field(fields):
+    """makes a small field line"""
+    return ''.join(['%-8s' % field for field in fields]).rstrip() + '\n'
+
+GRID_DECK = ''.join([
+    'CEND\n',
+    'BEGIN BULK\n',
+    'CORD2R,1,0,1.0,2.0,3.0,1.0,2.0,4.0\n',
+    ',2.0,2.0,3.0\n',
+    '$ the first node\n',
+    _small_field(['GRID', 1, '', '1.-5', '2.0', '-3.+2']),
+    '$ the second node\n',
+    _small_field(['GRID', 2, 1, '0.25', '1.0D-3', '4.', 1, 123, 0]),
+    'GRID*                  3               0             1.5             2.5\n',
+    '*                    3.5               0\n',
+    'GRID,4,,4.0,5.0,6.0\n',
+    'GRID,5,1,-1.,,,,456\n',
+    'GRID\t6\t\t6.0\t7.0\t8.0\n',
+    _small_field(['GRID', 1, '', '1.-5', '2.0', '-3.+2']),
+    _small_field(['CONROD', 10, 1, 2, 1, '0.1']),
+    _small_field(['MAT1', 1, '3.+7', '', '0.3']),
+    'ENDDATA\n',
+])
+
+
+class TestGridArray(unittest.TestCase):
+
+    def _read(self, xref=True):
+        bdf_filename = 'grid_array.bdf'
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(GRID_DECK)
+        model1 = BDF(log=log, debug=False)
+        model1.read_bdf(bdf_filename, xref=xref)
+        model2 = BDF(log=log, debug=False)
+        model2.read_bdf(bdf_filename, xref=xref, vectorize_grids=True)
+        os.remove(bdf_filename)
+        return model1, model2
+
+    def test_grid_array_read(self):
+        """the arrays are equivalent to the GRID objects"""
+        model1, model2 = self._read(xref=False)
+        grid_array = model2.grid_array
+
+        # the duplicate and tab cards are parsed by the GRID class
+        self.assertEqual(sorted(model2.nodes), [1, 6])
+        self.assertEqual(grid_array.nid.tolist(), [2, 3, 4, 5])
+        self.assertEqual(model2.nnodes, 6)
+        self.assertEqual(sorted(model2.node_ids), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(model1.card_count['GRID'], model2.card_count['GRID'])
+
+        for nid in range(1, 6):
+            node1 = model1.nodes[nid]
+            node2 = model2.Node(nid)
+            self.assertEqual(node1.raw_fields(), node2.raw_fields())
+            self.assertEqual(node1.comment, node2.comment)
+        self.assertEqual(len(model2.grid_array), 0)
+        self.assertEqual(model2.nodes[1].xyz[0], 1e-5)
+        self.assertEqual(model2.nodes[1].xyz[2], -300.)
+        self.assertEqual(model2.nodes[2].xyz[1], 1e-3)
+
+    def test_grid_array_write(self):
+        """write_bdf is the same for the arrays and GRID objects"""
+        model1, model2 = self._read(xref=False)
+        for size in [8, 16]:
+            for is_double in [False, True]:
+                bdf_file1 = StringIO()
+                bdf_file2 = StringIO()
+                model1.write_bdf(bdf_file1, size=size, is_double=is_double, close=False)
+                model2.write_bdf(bdf_file2, size=size, is_double=is_double, close=False)
+                self.assertEqual(bdf_file1.getvalue(), bdf_file2.getvalue())
+
+        # some of the nodes are GRID objects
+        model2.Node(3)
+        bdf_file1 = StringIO()
+        bdf_file2 = StringIO()
+        model1.write_bdf(bdf_file1, close=False)
+        model2.write_bdf(bdf_file2, close=False)
+        self.assertEqual(bdf_file1.getvalue(), bdf_file2.getvalue())
+
+    def test_grid_array_xref(self):
+        """get_xyz_in_coord and xref'd Nodes"""
+        model1, model2 = self._read(xref=True)
+        # the CONROD references node 2 without creating its GRID
+        self.assertEqual(sorted(model2.nodes), [1, 6])
+        conrod1 = model1.elements[10]
+        conrod2 = model2.elements[10]
+        self.assertEqual(conrod1.node_ids, conrod2.node_ids)
+        self.assertEqual(conrod1.Length(), conrod2.Length())
+        self.assertEqual(sorted(model2.nodes), [1, 6])
+        xyz1 = model1.get_xyz_in_coord(dtype='float64')
+        xyz2 = model2.get_xyz_in_coord(dtype='float64')
+        self.assertTrue(np.allclose(xyz1, xyz2), xyz1 - xyz2)
+
+        node = model2.Node(5)
+        self.assertTrue(np.allclose(node.get_position(), model1.nodes[5].get_position()))
+
+    def test_grid_array_solid_bending(self):
+        bdf_filename = os.path.join(model_path, 'solid_bending', 'solid_bending.bdf')
+        model1 = read_bdf(bdf_filename, xref=False, debug=None)
+        model2 = read_bdf(bdf_filename, xref=False, debug=None, vectorize_grids=True)
+        self.assertEqual(len(model2.nodes), 0)
+        self.assertEqual(model1.nnodes, model2.nnodes)
+
+        model1.cross_reference()
+        model2.cross_reference()
+        self.assertEqual(len(model2.nodes), 0)
+        xyz1 = model1.get_xyz_in_coord(dtype='float64')
+        xyz2 = model2.get_xyz_in_coord(dtype='float64')
+        self.assertTrue(np.array_equal(xyz1, xyz2))
+
+        for eid, elem1 in sorted(model1.elements.items())[:50]:
+            elem2 = model2.elements[eid]
+            self.assertEqual(elem1.node_ids, elem2.node_ids)
+            self.assertTrue(np.array_equal(elem1.Centroid(), elem2.Centroid()))
+            self.assertEqual(elem1.Volume(), elem2.Volume())
+        self.assertEqual(len(model2.nodes), 0)
+
+        bdf_file1 = StringIO()
+        bdf_file2 = StringIO()
+        model1.write_bdf(bdf_file1, close=False)
+        model2.write_bdf(bdf_file2, close=False)
+        self.assertEqual(bdf_file1.getvalue(), bdf_file2.getvalue())
+
+    def test_bulk_tokenizer(self):
+        lines = [_small_field(['GRID', 1, '', '1.-5', '2.0']),
+                 _small_field(['GRID', 12, 3, '-1.2', '-4.5+3', '1.D1'])]
+        fields = split_fixed_width(lines, 8, 5)
+        self.assertEqual(fields.shape, (2, 5))
+        self.assertEqual(to_integers(fields[:, 0], 'nid').tolist(), [1, 12])
+        self.assertEqual(to_integers(fields[:, 1], 'cp', 0).tolist(), [0, 3])
+        self.assertEqual(to_doubles(fields[:, 2], 'x1', 0.).tolist(), [1e-5, -1.2])
+        self.assertEqual(to_doubles(fields[:, 3], 'x2', 0.).tolist(), [2.0, -4500.])
+        self.assertEqual(to_doubles(fields[:, 4], 'x3', 0.).tolist(), [0., 10.])
+        with self.assertRaises(SyntaxError):
+            to_integers(fields[:, 1], 'cp')
+        with self.assertRaises(SyntaxError):
+            to_doubles(fields[:, 0], 'nid')
+
+        fields = split_csv(['GRID,1,,1.0', 'GRID,2,3,4.0,5.0,6.0,7,8,9,10'], 4)
+        self.assertEqual(fields.tolist(), [['1', '', '1.0', ''], ['2', '3', '4.0', '5.0']])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,89 @@
+from __future__ import print_function, unicode_literals
+import os
+import sys
+import json
+import subprocess
+import unittest
+from six import itervalues
+
+import pyNastran
+import pyNastran.bdf.bdf as bdf_module
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.card_registry import CARD_CLASS_MODULES, get_card_class
+
+#: the time budget [sec] for ``import pyNastran.bdf.bdf`` in a new process,
+#: which is ~0.15 sec with compiled files (~0.4 sec when the cards were
+#: imported up front)
+IMPORT_TIME_BUDGET = 2.0
+
+#: the time budget [sec] for ``BDF()``
+INIT_TIME_BUDGET = 0.05
+
+IMPORT_SCRIPT = """
+import sys
+import json
+import time
+t0 = time.time()
+import pyNastran.bdf.bdf
+t1 = time.time()
+model = pyNastran.bdf.bdf.BDF(debug=False)
+t2 = time.time()
+print(json.dumps({
+    'import_time' : t1 - t0,
+    'init_time' : t2 - t1,
+    'modules' : sorted(sys.modules),
+}))
+"""
+
+
+def _run_import_script():
+    """imports pyNastran.bdf.bdf in a new process"""
+    root = os.path.dirname(pyNastran.__path__[0])
+    env = dict(os.environ)
+    paths = [root, env.get('PYTHONPATH', '')]
+    env['PYTHONPATH'] = os.pathsep.join([path for path in paths if path])
+    out = subprocess.check_output([sys.executable, '-W', 'ignore', '-c', IMPORT_SCRIPT], env=env)
+    return json.loads(out.decode('utf-8').strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_import_time(self):
+        """the cards aren't imported by ``import pyNastran.bdf.bdf`` or ``BDF()``"""
+        data = _run_import_script()
+        modules = set(data['modules'])
+        self.assertNotIn('scipy', modules)
+        self.assertNotIn('multiprocessing', modules)
+        for module_name in ['pyNastran.bdf.cards.aero', 'pyNastran.bdf.cards.nodes',
+                            'pyNastran.bdf.cards.elements.shell',
+                            'pyNastran.bdf.cards.elements.solid',
+                            'pyNastran.bdf.cards.loads.static_loads']:
+            self.assertNotIn(module_name, modules)
+
+        # the first import also compiles the modules, so the time is checked
+        # on the second one
+        data = _run_import_script()
+        self.assertLess(data['import_time'], IMPORT_TIME_BUDGET)
+        self.assertLess(data['init_time'], INIT_TIME_BUDGET)
+
+    def test_card_registry(self):
+        """the card parser only uses the card classes in the registry"""
+        model = BDF(debug=False)
+        for card_parser in [model._card_parser, model._card_parser_a, model._card_parser_b]:
+            for class_name, unused_add_card_function in itervalues(card_parser):
+                self.assertIn(class_name, CARD_CLASS_MODULES)
+
+        for class_name, module_name in sorted(CARD_CLASS_MODULES.items()):
+            card_class = get_card_class(class_name)
+            self.assertEqual(card_class.__name__, class_name)
+            self.assertEqual(card_class.__module__, module_name)
+            self.assertIs(getattr(bdf_module, class_name), card_class)
+
+        from pyNastran.bdf.bdf import GRID
+        self.assertIs(GRID, get_card_class('GRID'))
+        with self.assertRaises(AttributeError):
+            bdf_module.GRIDS
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -217,6 +217,80 @@ class TestReadWrite(unittest.TestCase):
         self.assertEqual(len(model.nodes), 5)
         self.assertEqual(model.nnodes, 5, 'nnodes=%s' % model.nnodes)
 
+    def test_include_line_sources(self):
+        """tests the INCLUDE order and line provenance"""
+        with codec_open('a.bdf', 'w') as f:
+            f.write('CEND\n')
+            f.write('BEGIN BULK\n')
+            f.write('GRID,1,,1.0\n')
+            f.write("INCLUDE 'b.bdf'\n")
+            f.write('GRID,4,,4.0\n')
+
+        with codec_open('b.bdf', 'w') as f:
+            f.write('GRID,2,,2.0\n')
+            f.write("INCLUDE 'c.bdf'\n")
+            f.write('GRID,5,,5.0\n')
+
+        with codec_open('c.bdf', 'w') as f:
+            f.write('GRID,3,,3.0\n')
+
+        model = BDF(log=log, debug=False)
+        unused_executive, unused_case, bulk_data_lines = model._get_lines('a.bdf')
+        bulk_data_lines = [line for line in bulk_data_lines
+                           if line.startswith('GRID')]
+        self.assertEqual(bulk_data_lines, [
+            'GRID,1,,1.0', 'GRID,2,,2.0', 'GRID,3,,3.0', 'GRID,5,,5.0', 'GRID,4,,4.0'])
+
+        filename, lineno = model.get_line_source(0)
+        self.assertEqual(os.path.basename(filename), 'a.bdf')
+        self.assertEqual(lineno, 3)
+        filename, lineno = model.get_line_source(4)
+        self.assertEqual(os.path.basename(filename), 'c.bdf')
+        self.assertEqual(lineno, 1)
+        filename, lineno = model.get_line_source(5)
+        self.assertEqual(os.path.basename(filename), 'b.bdf')
+        self.assertEqual(lineno, 3)
+        filename, lineno = model.get_line_source(6)
+        self.assertEqual(os.path.basename(filename), 'a.bdf')
+        self.assertEqual(lineno, 5)
+
+        os.remove('a.bdf')
+        os.remove('b.bdf')
+        os.remove('c.bdf')
+
+    def test_include_parse_error_source(self):
+        """the file/line of a bad card is in the parsing error"""
+        with codec_open('a.bdf', 'w') as f:
+            f.write('CEND\n')
+            f.write('BEGIN BULK\n')
+            f.write('GRID,1,,1.0\n')
+            f.write("INCLUDE 'b.bdf'\n")
+            f.write('GRID,4,,4.0\n')
+
+        with codec_open('b.bdf', 'w') as f:
+            f.write('$ comment\n')
+            f.write('GRID,2,,2.0\n')
+            f.write('GRID,3,,cat\n')
+
+        for is_cards_dict in [False, True]:
+            model = BDF(log=log, debug=False)
+            model._is_cards_dict = is_cards_dict
+            with self.assertRaises(SyntaxError) as context:
+                model.read_bdf('a.bdf', xref=False)
+            self.assertIn("line 3 of '%s'" % os.path.abspath('b.bdf'),
+                          str(context.exception))
+
+            model = BDF(log=log, debug=False)
+            model._is_cards_dict = is_cards_dict
+            model.set_error_storage(nparse_errors=10, stop_on_parsing_error=False)
+            model.read_bdf('a.bdf', xref=False)
+            self.assertEqual(len(model._stored_parse_errors), 1)
+            unused_card_name, var = model._stored_parse_errors[0]
+            self.assertIn("line 3 of '%s'" % os.path.abspath('b.bdf'), var[0])
+
+        os.remove('a.bdf')
+        os.remove('b.bdf')
+
     def test_include_03(self):
         if PY2:
             wb = 'wb'
@@ -373,5 +447,49 @@ class TestReadWrite(unittest.TestCase):
         assert eigb.comment == '$ this is a preload buckling case\n', 'comment=%r\n%s' % (eigb.comment, str(eigb))
         os.remove(bdf_filename2)
 
+    def test_read_bdf_num_workers(self):
+        """the cards parsed in a process pool are added the same way"""
+        for folder, fname in [('sol_101_elements', 'buckling_solid_shell_bar.bdf'),
+                              ('iSat', 'ISat_Launch_Sm_4pt.dat')]:
+            bdf_filename = os.path.join(root_path, '..', 'models', folder, fname)
+            model1 = BDF(debug=False)
+            model1.read_bdf(bdf_filename, xref=False)
+            model2 = BDF(debug=False)
+            model2.read_bdf(bdf_filename, xref=False, num_workers=2)
+            self.assertEqual(model1.card_count, model2.card_count)
+
+            bdf_file1 = StringIO()
+            bdf_file2 = StringIO()
+            model1.write_bdf(bdf_file1, close=False)
+            model2.write_bdf(bdf_file2, close=False)
+            self.assertEqual(bdf_file1.getvalue(), bdf_file2.getvalue())
+
+        # the failed cards are parsed by add_card
+        bdf_filename = os.path.join(test_path, 'test_num_workers.bdf')
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write('CEND\nBEGIN BULK\n')
+            for nid in range(1, 1201):
+                bdf_file.write('GRID,%i,,%i.,0.,0.\n' % (nid, nid))
+            bdf_file.write('GRID,1,,1.,0.,0.\n')
+            bdf_file.write('GRID,3,,cat,0.,0.\n')
+            bdf_file.write('CROD,1,1,1,2\n')
+            bdf_file.write('CROD,1,1,1,3\n')
+            bdf_file.write('MAT1,1,3.0e7,,0.3\n')
+        models = []
+        for num_workers in [1, 2]:
+            model = BDF(debug=False)
+            model.set_error_storage(nparse_errors=10, stop_on_parsing_error=False)
+            model.read_bdf(bdf_filename, xref=False, num_workers=num_workers)
+            models.append(model)
+        os.remove(bdf_filename)
+
+        model1, model2 = models
+        self.assertEqual(model2.card_count, model1.card_count)
+        self.assertEqual(model2.card_count['GRID'], 1202)
+        self.assertEqual(model2._stored_parse_errors, model1._stored_parse_errors)
+        self.assertEqual(len(model2._stored_parse_errors), 1)
+        self.assertEqual(len(model2._duplicate_elements), 1)
+        self.assertEqual(sorted(model2.nodes), sorted(model1.nodes))
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -0,0 +1,148 @@
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import unittest
+from codecs import open as codec_open
+from six import StringIO
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.snapshot import is_snapshot_stale
+from pyNastran.bdf.errors import CrossReferenceError
+
+model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
+log = None
+
+
+def _write_bdf(model):
+    """writes a model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def _copy_model(self, bdf_filename):
+        """copies a model, so its modification time can be changed"""
+        bdf_filename2 = 'snapshot_' + os.path.basename(bdf_filename)
+        shutil.copyfile(bdf_filename, bdf_filename2)
+        return bdf_filename2
+
+    def _remove(self, *filenames):
+        for filename in filenames:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def test_snapshot_round_trip(self):
+        """the snapshot writes the same deck as the BDF"""
+        for folder, fname in [('solid_bending', 'solid_bending.bdf'),
+                              ('beam_modes', 'beam_modes.dat'),
+                              ('sol_101_elements', 'static_solid_shell_bar.bdf')]:
+            bdf_filename = os.path.join(model_path, folder, fname)
+            snapshot_filename = 'snapshot.npz'
+            model1 = read_bdf(bdf_filename, log=log, debug=False)
+            model1.save_snapshot(snapshot_filename)
+
+            model2 = BDF(log=log, debug=False)
+            model2.load_snapshot(snapshot_filename)
+            self._remove(snapshot_filename)
+            self.assertEqual(model1.card_count, model2.card_count)
+            self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+
+    def test_snapshot_read_bdf(self):
+        """read_bdf writes a snapshot and uses it until the BDF changes"""
+        bdf_filename = self._copy_model(
+            os.path.join(model_path, 'solid_bending', 'solid_bending.bdf'))
+        snapshot_filename = 'solid_bending.snapshot'
+        self._remove(snapshot_filename)
+
+        model1 = read_bdf(bdf_filename, log=log, debug=False,
+                          snapshot_filename=snapshot_filename)
+        self.assertTrue(os.path.exists(snapshot_filename))
+        self.assertFalse(is_snapshot_stale(snapshot_filename, bdf_filename,
+                                           model1._get_snapshot_read_options()))
+        self.assertTrue(is_snapshot_stale(snapshot_filename, bdf_filename,
+                                          {'punch' : True}))
+
+        model2 = read_bdf(bdf_filename, log=log, debug=False,
+                          snapshot_filename=snapshot_filename)
+        self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+        self.assertEqual(model2.Node(1).get_position().tolist(),
+                         model1.Node(1).get_position().tolist())
+
+        # touching the file doesn't change the hash
+        stat = os.stat(bdf_filename)
+        os.utime(bdf_filename, (stat.st_atime, stat.st_mtime + 10.))
+        self.assertFalse(is_snapshot_stale(snapshot_filename, bdf_filename))
+
+        # changing the file does
+        with codec_open(bdf_filename, 'a') as bdf_file:
+            bdf_file.write('$ a comment\n')
+        self.assertTrue(is_snapshot_stale(snapshot_filename, bdf_filename))
+        self.assertTrue(is_snapshot_stale('missing.snapshot', bdf_filename))
+        self._remove(bdf_filename, snapshot_filename)
+
+    def test_snapshot_lazy(self):
+        """the card types can be created when they're needed"""
+        bdf_filename = os.path.join(model_path, 'solid_bending', 'solid_bending.bdf')
+        snapshot_filename = 'snapshot_lazy.npz'
+        model1 = read_bdf(bdf_filename, log=log, debug=False)
+        model1.save_snapshot(snapshot_filename)
+
+        model2 = BDF(log=log, debug=False)
+        model2.load_snapshot(snapshot_filename, card_types=['GRID'])
+        self.assertEqual(len(model2.nodes), len(model1.nodes))
+        self.assertEqual(len(model2.elements), 0)
+        self.assertIsNotNone(model2._snapshot)
+
+        model2.materialize_snapshot(card_types=['CTETRA'])
+        self.assertEqual(len(model2.elements), len(model1.elements))
+        model2.materialize_snapshot()
+        self.assertIsNone(model2._snapshot)
+        self.assertTrue(model2._xref)
+        self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+
+        model3 = BDF(log=log, debug=False)
+        model3.load_snapshot(snapshot_filename, vectorize_grids=True, xref=False)
+        self._remove(snapshot_filename)
+        self.assertEqual(model3.grid_array.nid.tolist(), sorted(model1.nodes))
+        self.assertEqual(len(model3.nodes), 0)
+        self.assertEqual(model3.Node(1).xyz.tolist(), model1.Node(1).xyz.tolist())
+
+    def test_snapshot_xref_errors(self):
+        """the cross-reference errors are raised with and without a snapshot"""
+        bdf_filename = 'snapshot_xref_error.bdf'
+        snapshot_filename = 'snapshot_xref_error.npz'
+        with codec_open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.,0.,0.\n'
+                'GRID,2,,1.,0.,0.\n'
+                'GRID,3,,0.,1.,0.\n'
+                'CTRIA3,10,99,1,2,3\n'
+                'ENDDATA\n')
+
+        with self.assertRaises(CrossReferenceError):
+            read_bdf(bdf_filename, xref=True, log=log, debug=False)
+
+        model1 = read_bdf(bdf_filename, xref=False, log=log, debug=False,
+                          snapshot_filename=snapshot_filename)
+        self.assertEqual(len(model1.elements), 1)
+        self._remove(bdf_filename)
+
+        model2 = BDF(log=log, debug=False)
+        with self.assertRaises(CrossReferenceError):
+            model2.load_snapshot(snapshot_filename, xref=True)
+
+        model3 = BDF(log=log, debug=False)
+        model3.load_snapshot(snapshot_filename, card_types=['GRID'])
+        self._remove(snapshot_filename)
+        with self.assertRaises(CrossReferenceError):
+            model3.materialize_snapshot(xref=True)
+
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
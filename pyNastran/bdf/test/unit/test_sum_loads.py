@@ -4,7 +4,7 @@ import unittest
 from numpy import array, allclose, cross
 
 import pyNastran
-from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf import BDF, read_bdf
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 log = None
@@ -267,6 +267,59 @@ class TestLoadSum(unittest.TestCase):
             self.assertTrue(allclose(F802_expected, F), 'loadcase_id=%s F_expected=%s F=%s' % (loadcase_id, F802_expected, F))
             self.assertTrue(allclose(M802_expected, M), 'loadcase_id=%s M_expected=%s M=%s' % (loadcase_id, M802_expected, M))
 
+    def test_loads_sum_load_cases(self):
+        """all the load cases are summed at once"""
+        p0 = array([1., 2., 3.])
+        for folder, fname in [('plate', 'plate.bdf'), ('real/loads', 'loads.bdf'),
+                              ('pload4', 'ctetra.bdf'), ('pload4', 'pload1.bdf')]:
+            bdf_filename = os.path.join(model_path, folder, fname)
+            model = read_bdf(bdf_filename, log=log, debug=False)
+
+            loadcase_ids, F, M = model.sum_forces_moments_load_cases(p0)
+            self.assertEqual(loadcase_ids.tolist(), sorted(model.loads))
+            for loadcase_id, Fi, Mi in zip(loadcase_ids, F, M):
+                F_expected, M_expected = model.sum_forces_moments(p0, int(loadcase_id))
+                self.assertTrue(allclose(F_expected, Fi), 'loadcase_id=%s' % loadcase_id)
+                self.assertTrue(allclose(M_expected, Mi), 'loadcase_id=%s' % loadcase_id)
+
+    def test_loads_sum_grav(self):
+        """GRAV is applied to the elements and masses"""
+        model = BDF(log=log, debug=False)
+        model.add_card(['GRID', 1, None, 1., 0., 0.], 'GRID')
+        model.add_card(['GRID', 2, None, 0., 2., 0.], 'GRID')
+        model.add_card(['CONM2', 10, 1, None, 2.], 'CONM2')
+        model.add_card(['CONM2', 11, 2, None, 3.], 'CONM2')
+        model.add_card(['GRAV', 1, None, 10., 0., 0., -1.], 'GRAV')
+        model.add_card(['FORCE', 2, 1, None, 5., 1., 0., 0.], 'FORCE')
+        model.add_card(['LOAD', 3, 2., 1.5, 1, 4., 2], 'LOAD')
+        model.cross_reference()
+
+        loadcase_ids, loads, scale = model.get_load_matrix()
+        self.assertEqual(loadcase_ids.tolist(), [1, 2, 3])
+        self.assertEqual([load.type for load in loads], ['GRAV', 'FORCE'])
+        self.assertTrue(allclose(scale.toarray(), [[1., 0.], [0., 1.], [3., 8.]]))
+
+        p0 = array([0., 0., 0.])
+        F, M = model.sum_forces_moments(p0, 1, include_grav=False)
+        self.assertTrue(allclose(F, [0., 0., 0.]))
+
+        F1_expected = array([0., 0., -50.])
+        M1_expected = cross([1., 0., 0.], [0., 0., -20.]) + cross([0., 2., 0.], [0., 0., -30.])
+        F2_expected = array([5., 0., 0.])
+        M2_expected = cross([1., 0., 0.], F2_expected)
+        loadcase_ids, F, M = model.sum_forces_moments_load_cases(p0, include_grav=True)
+        self.assertTrue(allclose(F, [F1_expected, F2_expected,
+                                     3. * F1_expected + 8. * F2_expected]))
+        self.assertTrue(allclose(M, [M1_expected, M2_expected,
+                                     3. * M1_expected + 8. * M2_expected]))
+
+        p0 = array([1., 1., 1.])
+        F, M = model.sum_forces_moments(p0, 3, include_grav=True)
+        F3_expected = 3. * F1_expected + 8. * F2_expected
+        M3_expected = 3. * M1_expected + 8. * M2_expected - cross(p0, F3_expected)
+        self.assertTrue(allclose(F, F3_expected))
+        self.assertTrue(allclose(M, M3_expected))
+
     def _test_loads_sum_06(self):
         model = BDF(log=log)
         bdf_filename = os.path.join(model_path, 'real', 'loads', 'bars.bdf')
@@ -30,6 +30,7 @@ import numpy as np
 from numpy.linalg import norm
 
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk, numpy_to_vtkIdTypeArray, ID_TYPE_CODE
 from vtk import (vtkTriangle, vtkQuad, vtkTetra, vtkWedge, vtkHexahedron,
                  vtkQuadraticTriangle, vtkQuadraticQuad, vtkQuadraticTetra,
                  vtkQuadraticWedge, vtkQuadraticHexahedron,
@@ -61,6 +62,38 @@ try:
 except ImportError:
     is_geom = False
 
+#: (element type, number of nodes) -> (linear cell, quadratic cell)
+#: where each cell is (vtk cell type, node indices) and the quadratic
+#: cell is used when all the midside nodes are defined
+ELEMENT_CELL_MAP = {
+    ('CTRIA3', 3) : ((5, [0, 1, 2]), None),
+    ('CTRIAR', 3) : ((5, [0, 1, 2]), None),
+    ('CTRIA6', 6) : ((5, [0, 1, 2]), (22, [0, 1, 2, 3, 4, 5])),
+    # midside nodes are required, nodes out of order
+    ('CTRIAX6', 6) : ((5, [0, 2, 4]), (22, [0, 2, 4, 1, 3, 5])),
+    ('CQUAD4', 4) : ((9, [0, 1, 2, 3]), None),
+    ('CQUADR', 4) : ((9, [0, 1, 2, 3]), None),
+    ('CSHEAR', 4) : ((9, [0, 1, 2, 3]), None),
+    ('CQUAD8', 8) : ((9, [0, 1, 2, 3]), (23, list(range(8)))),
+    ('CTETRA', 4) : ((10, [0, 1, 2, 3]), None),
+    ('CTETRA', 10) : ((10, [0, 1, 2, 3]), (24, list(range(10)))),
+    ('CPENTA', 6) : ((13, list(range(6))), None),
+    ('CPENTA', 15) : ((13, list(range(6))), (26, list(range(15)))),
+    ('CHEXA', 8) : ((12, list(range(8))), None),
+    ('CIHEX1', 8) : ((12, list(range(8))), None),
+    ('CHEXA', 20) : ((12, list(range(8))), (25, list(range(20)))),
+    # TODO: vtkQuadraticPyramid
+    ('CPYRAM', 5) : ((14, list(range(5))), None),
+    ('CPYRAM', 13) : ((14, list(range(5))), None),
+}
+LINE_ELEMENT_TYPES = [
+    'CBUSH', 'CBUSH1D', 'CFAST', 'CROD', 'CONROD',
+    'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
+    'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
+    'CVISC', 'CGAP']
+VTK_LINE = 3
+VTK_VERTEX = 1
+
 
 class NastranIO(object):
     """
@@ -1665,389 +1698,195 @@ class NastranIO(object):
     def _get_sphere_size(self, dim_max):
         return 0.01 * dim_max
 
-    def map_elements(self, points, nid_map, model, j, dim_max,
-                     plot=True, xref_loads=True):
-        sphere_size = self._get_sphere_size(dim_max)
-
-        # :param i: the element id in grid
-        # :param j: the element id in grid2
-        i = 0
-
-        #nids = self.eid_to_nid_map[eid]
-        self.eid_to_nid_map = {}
-
-        # the list of all pids
-        #pids = []
+    def _map_elements_vectorized(self, nid_map, model):
+        """
+        Creates the elements of the grid from connectivity arrays
 
-        # pid = pids_dict[eid]
-        pids_dict = {}
-        nelements = len(model.elements)
-        pids = np.zeros(nelements, 'int32')
-        mids = np.zeros(nelements, 'int32')
+        The elements are grouped by type, the node ids are mapped to
+        the grid points with a single ``searchsorted`` per group and the
+        cells are passed to VTK with a single ``SetCells`` call.
 
-        # pids_good = []
-        # pids_to_keep = []
-        # pids_btm = []
-        # pids_to_drop = []
-        nid_to_pid_map = defaultdict(list)
+        Parameters
+        ----------
+        nid_map : dict[nid] = inid
+            the node id to grid point index map
+        model : BDF()
+            the model
+
+        Returns
+        -------
+        eids : (nelements, ) int ndarray
+            the element ids of the grid cells
+        pids : (nelements, ) int ndarray
+            the property ids of the grid cells (0 for CONROD)
+        nid_to_pid_map : dict[nid] = List[pid]
+            the properties that are attached to a node
+        """
+        # group the elements by type in element id order
+        #   key -> ([ielement], [node_ids], [pid])
+        groups = defaultdict(lambda: ([], [], []))
+        all_eids = []
         for (eid, element) in sorted(iteritems(model.elements)):
-            # if element.Pid() >= 82:
-                # continue
-            # if element.Pid() in pids_to_drop:
-                # continue
-            # if element.Pid() not in pids_to_keep:
-                # continue
-            # if element.pid.type == 'PSOLID':
-                # continue
-            self.eid_map[eid] = i
-            pid = 0
-            if isinstance(element, (CTRIA3, CTRIAR)):
-                elem = vtkTriangle()
-                node_ids = element.node_ids
-                pid = element.Pid()
-                self.eid_to_nid_map[eid] = node_ids
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CTRIA6):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                self.eid_to_nid_map[eid] = node_ids[:3]
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-                if None not in node_ids:
-                    elem = vtkQuadraticTriangle()
-                    elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                    elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                    elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                else:
-                    elem = vtkTriangle()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CTRIAX6):
-                # midside nodes are required, nodes out of order
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-
-                if None not in node_ids:
-                    elem = vtkQuadraticTriangle()
-                    elem.GetPointIds().SetId(3, nid_map[node_ids[1]])
-                    elem.GetPointIds().SetId(4, nid_map[node_ids[3]])
-                    elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                else:
-                    elem = vtkTriangle()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[4]])
-                self.eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4]]
-                #a = [0, 2, 4]
-                #msg = "CTRIAX6 %i %i %i" %(nid_map[node_ids[a[0]]],
-                #                           nid_map[node_ids[a[1]]],
-                #                           nid_map[node_ids[a[2]]])
-                #raise RuntimeError(msg)
-                #sys.stdout.flush()
-
-                #elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                #elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                #elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-
-            elif isinstance(element, (CQUAD4, CSHEAR, CQUADR)):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:4]
-                elem = vtkQuad()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CQUAD8):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:4]
-                if None not in node_ids:
-                    elem = vtkQuadraticQuad()
-                    elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                    elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                    elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
-                    elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
-                else:
-                    elem = vtkQuad()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CTETRA4):
-                elem = vtkTetra()
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:4]
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CTETRA10):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:4]
-                if None not in node_ids:
-                    elem = vtkQuadraticTetra()
-                    elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                    elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                    elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
-                    elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
-                    elem.GetPointIds().SetId(8, nid_map[node_ids[8]])
-                    elem.GetPointIds().SetId(9, nid_map[node_ids[9]])
-                else:
-                    elem = vtkTetra()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CPENTA6):
-                elem = vtkWedge()
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:6]
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                self.grid.InsertNextCell(elem.GetCellType(),
-                                         elem.GetPointIds())
-
-            elif isinstance(element, CPENTA15):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:6]
-                if None not in node_ids:
-                    elem = vtkQuadraticWedge()
-                    elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
-                    elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
-                    elem.GetPointIds().SetId(8, nid_map[node_ids[8]])
-                    elem.GetPointIds().SetId(9, nid_map[node_ids[9]])
-                    elem.GetPointIds().SetId(10, nid_map[node_ids[10]])
-                    elem.GetPointIds().SetId(11, nid_map[node_ids[11]])
-                    elem.GetPointIds().SetId(12, nid_map[node_ids[12]])
-                    elem.GetPointIds().SetId(13, nid_map[node_ids[13]])
-                    elem.GetPointIds().SetId(14, nid_map[node_ids[14]])
-                else:
-                    elem = vtkWedge()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, (CHEXA8, CIHEX1)):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:8]
-                elem = vtkHexahedron()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
-                elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CHEXA20):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-                if None not in node_ids:
-                    elem = vtkQuadraticHexahedron()
-                    elem.GetPointIds().SetId(8, nid_map[node_ids[8]])
-                    elem.GetPointIds().SetId(9, nid_map[node_ids[9]])
-                    elem.GetPointIds().SetId(10, nid_map[node_ids[10]])
-                    elem.GetPointIds().SetId(11, nid_map[node_ids[11]])
-                    elem.GetPointIds().SetId(12, nid_map[node_ids[12]])
-                    elem.GetPointIds().SetId(13, nid_map[node_ids[13]])
-                    elem.GetPointIds().SetId(14, nid_map[node_ids[14]])
-                    elem.GetPointIds().SetId(15, nid_map[node_ids[15]])
-                    elem.GetPointIds().SetId(16, nid_map[node_ids[16]])
-                    elem.GetPointIds().SetId(17, nid_map[node_ids[17]])
-                    elem.GetPointIds().SetId(18, nid_map[node_ids[18]])
-                    elem.GetPointIds().SetId(19, nid_map[node_ids[19]])
-                else:
-                    elem = vtkHexahedron()
-
-                self.eid_to_nid_map[eid] = node_ids[:8]
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
-                elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-
-            elif isinstance(element, CPYRAM5):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                for nid in node_ids:
-                    nid_to_pid_map[nid].append(pid)
-                self.eid_to_nid_map[eid] = node_ids[:5]
-                elem = vtkPyramid()
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            elif isinstance(element, CPYRAM13):
-                node_ids = element.node_ids
-                pid = element.Pid()
-                #if None not in node_ids:
-                    #print(' node_ids =', node_ids)
-                    #elem = vtkQuadraticPyramid()
-                    #elem.GetPointIds().SetId(5, nid_map[node_ids[5]])
-                    #elem.GetPointIds().SetId(6, nid_map[node_ids[6]])
-                    #elem.GetPointIds().SetId(7, nid_map[node_ids[7]])
-                    #elem.GetPointIds().SetId(8, nid_map[node_ids[8]])
-                    #elem.GetPointIds().SetId(9, nid_map[node_ids[9]])
-                    #elem.GetPointIds().SetId(10, nid_map[node_ids[10]])
-                    #elem.GetPointIds().SetId(11, nid_map[node_ids[11]])
-                    #elem.GetPointIds().SetId(12, nid_map[node_ids[12]])
-                #else:
-                elem = vtkPyramid()
-                #print('*node_ids =', node_ids[:5])
-
-                self.eid_to_nid_map[eid] = node_ids[:5]
-
-                elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                elem.GetPointIds().SetId(2, nid_map[node_ids[2]])
-                elem.GetPointIds().SetId(3, nid_map[node_ids[3]])
-                elem.GetPointIds().SetId(4, nid_map[node_ids[4]])
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-
-            elif (isinstance(element, LineElement) or
-                  isinstance(element, SpringElement) or
-                  element.type in ['CBUSH', 'CBUSH1D', 'CFAST', 'CROD', 'CONROD',
-                                   'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-                                   'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-                                   'CVISC', 'CGAP']):
-
-                # TODO: verify
-                # CBUSH, CBUSH1D, CFAST, CROD, CELAS1, CELAS3
-                # CDAMP1, CDAMP2, CDAMP3, CDAMP4, CDAMP5, CVISC
-                if hasattr(element, 'pid'):
-                    pid = element.Pid()
+            node_ids = element.node_ids
+            key = (element.type, len(node_ids))
+            if key not in ELEMENT_CELL_MAP:
+                if(isinstance(element, (LineElement, SpringElement)) or
+                   element.type in LINE_ELEMENT_TYPES):
+                    key = ('line', len(node_ids))
                 else:
-                    # CONROD
-                    # CELAS2, CELAS4?
-                    pid = 0
-                node_ids = element.node_ids
-                for nid in node_ids:
-                    if nid is not None:
-                        nid_to_pid_map[nid].append(pid)
-
-                if node_ids[0] is None and  node_ids[0] is None: # CELAS2
-                    print('removing CELASx eid=%i -> no node %i' % (eid, node_ids[0]))
-                    del self.eid_map[eid]
+                    print('removing eid=%s; %s' % (eid, element.type))
+                    self.log_info("skipping %s" % element.type)
                     continue
-                if None in node_ids:  # used to be 0...
-                    if node_ids[0] is None:
-                        slot = 1
-                    elif node_ids[1] is None:
-                        slot = 0
-                    #print('node_ids=%s slot=%s' % (str(node_ids), slot))
-                    self.eid_to_nid_map[eid] = node_ids[slot]
-                    nid = node_ids[slot]
-                    if nid not in nid_map:
-                        # SPOINT
-                        print('removing CELASx eid=%i -> SPOINT %i' % (eid, nid))
-                        continue
 
-                    #c = nid_map[nid]
-                    elem = vtk.vtkVertex()
-                    elem.GetPointIds().SetId(0, j)
+            if hasattr(element, 'pid'):
+                pid = element.Pid()
+            else:
+                # CONROD
+                # CELAS2, CELAS4?
+                pid = None
+            ielements, nids, pids = groups[key]
+            ielements.append(len(all_eids))
+            nids.append([0 if nid is None else nid for nid in node_ids])
+            pids.append(0 if pid is None else pid)
+            all_eids.append(eid)
+
+        all_eids = np.array(all_eids, dtype='int32')
+        nall = len(all_eids)
+        all_pids = np.zeros(nall, dtype='int32')
+        is_kept = np.zeros(nall, dtype='bool')
+
+        # node ids are mapped to the grid with a searchsorted
+        #   an unmapped node (e.g., an SPOINT or a blank node) is -1
+        nids_map = np.array(sorted(nid_map), dtype='int32')
+        inids_map = np.array([nid_map[nid] for nid in nids_map], dtype=ID_TYPE_CODE)
+        def _map_nodes(nids):
+            index = np.searchsorted(nids_map, nids).clip(max=len(nids_map) - 1)
+            inids = inids_map[index]
+            inids[nids_map[index] != nids] = -1
+            return inids
+
+        # the cells of each group before removing elements
+        #   (ielements, vtk cell type, mapped node ids)
+        cell_groups = []
+        nid_pid_pairs = []
+        for key, (ielements, nids, pids) in iteritems(groups):
+            ielements = np.array(ielements, dtype='int32')
+            nids = np.array(nids, dtype='int32')
+            pids = np.array(pids, dtype='int32')
+            all_pids[ielements] = pids
+
+            is_node = nids > 0
+            nid_pid_pairs.append(np.column_stack([
+                nids[is_node], np.repeat(pids, is_node.sum(axis=1))]))
+            inids = _map_nodes(nids)
+
+            if key[0] == 'line':
+                # 2 points -> line; 1 point -> vertex; 0 points -> removed
+                is_mapped = inids[:, :2] >= 0
+                nmapped = is_mapped.sum(axis=1)
+                iline = np.where(nmapped == 2)[0]
+                ivertex = np.where(nmapped == 1)[0]
+                cell_groups.append((ielements[iline], VTK_LINE, inids[iline, :2]))
+                islot = np.where(is_mapped[ivertex, 0], 0, 1)
+                cell_groups.append((ielements[ivertex], VTK_VERTEX,
+                                    inids[ivertex, islot].reshape(len(ivertex), 1)))
+                for iremove in np.where(nmapped == 0)[0]:
+                    print('removing eid=%i -> no node %s' % (
+                        all_eids[ielements[iremove]], nids[iremove, :2].tolist()))
+                continue
 
-                    elem = vtk.vtkSphere()
-                    #if d == 0.:
-                        #d = sphere_size
-                    elem.SetRadius(sphere_size)
-                else:
-                    # 2 points
-                    #d = norm(element.nodes[0].get_position() - element.nodes[1].get_position())
-                    self.eid_to_nid_map[eid] = node_ids
-                    elem = vtk.vtkLine()
-                    try:
-                        elem.GetPointIds().SetId(0, nid_map[node_ids[0]])
-                        elem.GetPointIds().SetId(1, nid_map[node_ids[1]])
-                    except KeyError:
-                        print("node_ids =", node_ids)
-                        print(str(element))
+            (linear_type, linear_index), quadratic = ELEMENT_CELL_MAP[key]
+            is_linear = (inids[:, linear_index] >= 0).all(axis=1)
+            is_quadratic = np.zeros(len(ielements), dtype='bool')
+            if quadratic is not None:
+                quadratic_type, quadratic_index = quadratic
+                is_quadratic = is_linear & (inids[:, quadratic_index] >= 0).all(axis=1)
+                iquad = np.where(is_quadratic)[0]
+                cell_groups.append((ielements[iquad], quadratic_type,
+                                    inids[iquad, :][:, quadratic_index]))
+            ilinear = np.where(is_linear & ~is_quadratic)[0]
+            cell_groups.append((ielements[ilinear], linear_type,
+                                inids[ilinear, :][:, linear_index]))
+            for ielement in ielements[~is_linear]:
+                print('removing %s eid=%i -> missing nodes' % (
+                    key[0], all_eids[ielement]))
+
+        for ielements, unused_cell_type, unused_inids in cell_groups:
+            is_kept[ielements] = True
+
+        # the grid cells are in element id order
+        icells = np.cumsum(is_kept) - 1
+        eids = all_eids[is_kept]
+        pids = all_pids[is_kept]
+        ncells = len(eids)
+
+        # the legacy vtkCellArray format is [npoints, point_id0, point_id1, ...]
+        cell_types = np.zeros(ncells, dtype='uint8')
+        npoints = np.zeros(ncells, dtype=ID_TYPE_CODE)
+        for ielements, cell_type, inids in cell_groups:
+            icell = icells[ielements]
+            cell_types[icell] = cell_type
+            npoints[icell] = inids.shape[1]
+        cell_offsets = np.zeros(ncells, dtype=ID_TYPE_CODE)
+        cell_offsets[1:] = np.cumsum(npoints + 1)[:-1]
+
+        cells = np.zeros((npoints + 1).sum(), dtype=ID_TYPE_CODE)
+        cells[cell_offsets] = npoints
+        for ielements, cell_type, inids in cell_groups:
+            ipoint = cell_offsets[icells[ielements]]
+            npointsi = inids.shape[1]
+            cells[ipoint[:, np.newaxis] + np.arange(1, npointsi + 1)] = inids
+
+        vtk_cells = vtk.vtkCellArray()
+        vtk_cells.SetCells(ncells, numpy_to_vtkIdTypeArray(cells, deep=1))
+        vtk_cell_types = numpy_to_vtk(cell_types, deep=1,
+                                      array_type=vtk.VTK_UNSIGNED_CHAR)
+        vtk_cell_offsets = numpy_to_vtkIdTypeArray(cell_offsets, deep=1)
+        self.grid.SetCells(vtk_cell_types, vtk_cell_offsets, vtk_cells)
+
+        # the corner nodes of the kept elements
+        self.eid_map = dict(zip(eids.tolist(), range(ncells)))
+        self.eid_to_nid_map = {}
+        for key, (ielements, nids, unused_pids) in iteritems(groups):
+            if key[0] == 'line':
+                for ielement, node_ids in zip(ielements, nids):
+                    if not is_kept[ielement]:
                         continue
-
-                self.grid.InsertNextCell(elem.GetCellType(), elem.GetPointIds())
-            else:
-                print('removing eid=%s; %s' % (eid, elem.type))
-                del self.eid_map[eid]
-                self.log_info("skipping %s" % element.type)
+                    eid = all_eids[ielement]
+                    if 0 in node_ids[:2]:
+                        # 1 point
+                        node_ids = node_ids[1] if node_ids[0] == 0 else node_ids[0]
+                    self.eid_to_nid_map[eid] = node_ids
                 continue
-            # what about MPCs, RBE2s (rigid elements)?
-            #   are they plotted as elements?
-            #   and thus do they need a property?
+            (unused_linear_type, linear_index) = ELEMENT_CELL_MAP[key][0]
+            for ielement, node_ids in zip(ielements, nids):
+                if is_kept[ielement]:
+                    self.eid_to_nid_map[all_eids[ielement]] = [
+                        node_ids[inode] for inode in linear_index]
 
-            if pid is None:
-                # CONROD
-                #print(element)
-                #pids[i] = 0
-                #pids_dict[eid] = 0
-                pass
-            else:
-                pids[i] = pid
-                pids_dict[eid] = pid
-            i += 1
+        # the properties that are attached to a node
+        nid_to_pid_map = defaultdict(list)
+        if nid_pid_pairs:
+            nid_pid_pairs = np.vstack(nid_pid_pairs)
+            isort = np.argsort(nid_pid_pairs[:, 0], kind='mergesort')
+            nids_sorted = nid_pid_pairs[isort, 0]
+            pids_sorted = nid_pid_pairs[isort, 1]
+            unids, istart = np.unique(nids_sorted, return_index=True)
+            for nid, pidsi in zip(unids.tolist(), np.split(pids_sorted, istart[1:])):
+                nid_to_pid_map[nid] = pidsi.tolist()
+        return eids, pids, nid_to_pid_map
+
+    def map_elements(self, points, nid_map, model, j, dim_max,
+                     plot=True, xref_loads=True):
+        sphere_size = self._get_sphere_size(dim_max)
+
+        # :param i: the element id in grid
+        # :param j: the element id in grid2
+        eids, pids, nid_to_pid_map = self._map_elements_vectorized(nid_map, model)
         assert len(self.eid_map) > 0, self.eid_map
 
-        nelements = i
+        nelements = len(eids)
         self.nElements = nelements
-        #print('nelements=%s pids=%s' % (nelements, list(pids)))
-        pids = pids[:nelements]
         self.grid.SetPoints(points)
 
         self.grid.Modified()
@@ -2056,22 +1895,6 @@ class NastranIO(object):
         #self.log_info("updated grid")
 
         cases = OrderedDict()
-        #pids = array(pids, 'int32')
-        #print('eid_map')
-        #for key, value in sorted(iteritems(self.eid_map)):
-            #print('  %s %s' % (key, value))
-
-        if 0:
-            if not len(pids) == len(self.eid_map):
-                msg = 'ERROR:  len(pids)=%s len(eid_map)=%s\n' % (len(pids), len(self.eid_map))
-                for eid, pid in sorted(iteritems(pids_dict)):
-                    #self.eid_map[eid] = i
-                    #pids_dict[eid] = pid
-                    if eid not in self.eid_map:
-                        msg += 'eid=%s %s' % (eid, str(model.elements[eid]))
-                raise RuntimeError(msg)
-        del pids_dict
-
 
         self.iSubcaseNameMap = {1: ['Nastran', '']}
         #nelements = len(self.eid_map)
@@ -2097,10 +1920,6 @@ class NastranIO(object):
         # set to True to enable elementIDs as a result
         eids_set = True
         if eids_set:
-            eids = np.zeros(nelements, dtype='int32')
-            for (eid, eid2) in iteritems(self.eid_map):
-                eids[eid2] = eid
-
             #if new_cases:
             eid_res = GuiResult(0, header='ElementID', title='ElementID',
                                 location='centroid', scalar=eids)
@@ -2196,6 +2015,8 @@ class NastranIO(object):
             zoffset = np.zeros(nelements, dtype='float32')
             element_dim = np.zeros(nelements, dtype='int32')
             for eid, element in sorted(iteritems(model.elements)):
+                if eid not in self.eid_map:
+                    continue
                 if isinstance(element, ShellElement):
                     element_dimi = 2
                     normali = element.Normal()
@@ -1,3 +1,4 @@
+from six import string_types
 from numpy import angle, float32
 from pyNastran.utils import object_attributes
 
@@ -65,6 +66,38 @@ def write_floats_13e(vals):
     return vals2
 
 
+def write_f06_rows(f, fmt, args, nrows_chunk=10000):
+    """
+    Writes the rows of a table in chunks instead of one row at a time
+
+    Parameters
+    ----------
+    f : file
+        the file to write to
+    fmt : str / (nrows, ) ndarray of str
+        the format of every row or of each row; the results are written
+        with '%13.6E' and zeros are written as ' 0.0' (see
+        write_floats_13e), which is padded to 13 characters unless
+        it's at the end of the line
+    args : (nrows, nargs) object ndarray
+        the values of each row
+    nrows_chunk : int; default=10000
+        the number of rows to format at a time
+    """
+    nrows = args.shape[0]
+    for irow in range(0, nrows, nrows_chunk):
+        args_chunk = args[irow:irow + nrows_chunk, :]
+        if isinstance(fmt, string_types):
+            fmt_chunk = fmt * args_chunk.shape[0]
+        else:
+            fmt_chunk = ''.join(fmt[irow:irow + nrows_chunk])
+        msg = fmt_chunk % tuple(args_chunk.ravel().tolist())
+        f.write(msg.replace(' 0.000000E+00\n', ' 0.0\n')
+                .replace('-0.000000E+00\n', ' 0.0\n')
+                .replace(' 0.000000E+00', ' 0.0         ')
+                .replace('-0.000000E+00', ' 0.0         '))
+
+
 def write_imag_floats_13e(vals, is_mag_phase):
     vals2 = []
 
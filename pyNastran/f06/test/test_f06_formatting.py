@@ -1,7 +1,9 @@
 from __future__ import absolute_import
 
 import unittest
-from pyNastran.f06.f06_formatting import writeFloats8p4F
+from six import StringIO
+import numpy as np
+from pyNastran.f06.f06_formatting import writeFloats8p4F, write_floats_13e, write_f06_rows
 
 class TestFormatting(unittest.TestCase):
 
@@ -45,6 +47,29 @@ class TestFormatting(unittest.TestCase):
         expected = '101.2346'
         self.check_float_8p4f(val, expected)
 
+    def test_write_f06_rows(self):
+        """the chunked writer matches write_floats_13e"""
+        data = np.array([
+            [1., 0., -0., 2.5e-12],
+            [0., -1.5, 1e10, 0.],
+            [-0., 3., 0., np.nan],
+        ], dtype='float32')
+        eids = [10, 20, 30]
+
+        expected = ''
+        for eid, row in zip(eids, data):
+            vals = write_floats_13e(row)
+            expected += '0%8i  %-13s  %s\n  %-13s  %s\n' % tuple([eid] + vals)
+
+        args = np.empty((3, 5), dtype='object')
+        args[:, 0] = eids
+        args[:, 1:] = data
+        fmt = '0%8i  %13.6E  %13.6E\n  %13.6E  %13.6E\n'
+        for nrows_chunk in [1, 2, 10]:
+            f = StringIO()
+            write_f06_rows(f, fmt, args, nrows_chunk=nrows_chunk)
+            self.assertEqual(f.getvalue(), expected)
+
     def check_float_8p4f(self, val, expected):
         actual, isAllZero = writeFloats8p4F([val])
         actuali = actual[0]
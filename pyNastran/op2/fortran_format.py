@@ -14,6 +14,37 @@ if sys.version_info < (2, 7, 7):
     #   Issue #19099: The struct module now supports Unicode format strings.
     raise ImportError('Upgrade your Python to >= 2.7.7; version=(%s.%s.%s)' % (imajor, minor1, minor2))
 
+class RecordCache(object):
+    """
+    Wraps an open OP2 file, so the blocks that are read while a table is
+    sized (read_mode=1; the table 3 headers, the markers and the record
+    lengths) aren't read again when the table is filled (read_mode=2).
+    The table 4 results are skipped while the table is sized, so they
+    are only read from the file once.
+    """
+    def __init__(self, f):
+        self.f = f
+        self.blocks = {}
+        self.is_recording = True
+
+    def tell(self):
+        return self.f.tell()
+
+    def seek(self, n, whence=0):
+        return self.f.seek(n, whence)
+
+    def read(self, n):
+        pos = self.f.tell()
+        data = self.blocks.get((pos, n))
+        if data is None:
+            data = self.f.read(n)
+            if self.is_recording:
+                self.blocks[(pos, n)] = data
+        else:
+            self.f.seek(pos + n)
+        return data
+
+
 class FortranFormat(object):
     def __init__(self):
         self.n = 0
@@ -27,6 +58,12 @@ class FortranFormat(object):
         self._endian = None
         self._table_mapper = {}
 
+        #: a memoryview of the memory mapped file (or None)
+        self._mmap_view = None
+
+        #: the table of contents of the results (for lazy reading)
+        self._op2_index = None
+
         #: stores if the user entered [] for iSubcases
         self.isAllSubcases = True
         self.valid_subcases = []
@@ -184,21 +221,32 @@ class FortranFormat(object):
         self.n += 8 + ndata
         return data_out
 
-    def _read_block_ndata(self):
+    def _read_block_ndata(self, zero_copy=False):
         """
         Reads a block following a pattern of:
             [nbytes, data, nbytes]
 
+        Parameters
+        ----------
+        zero_copy : bool; default=False
+            return a memoryview of the memory mapped file instead of
+            copying the block (only used if the file is memory mapped)
+
         Returns
         -------
-        data : bytes
+        data : bytes / memoryview
             the data in binary
         """
         data = self.f.read(4)
         ndata, = self.struct_i.unpack(data)
 
-        data_out = self.f.read(ndata)
-        data = self.f.read(4)
+        if zero_copy and self._mmap_view is not None:
+            n = self.n + 4
+            data_out = self._mmap_view[n:n + ndata]
+            self.f.seek(ndata + 4, 1)
+        else:
+            data_out = self.f.read(ndata)
+            data = self.f.read(4)
         self.n += 8 + ndata
         return data_out, ndata
 
@@ -350,6 +398,7 @@ class FortranFormat(object):
 
     def _read_subtable_3_4(self, table3_parser, table4_parser, passer):
         # this is the length of the current record inside table3/table4
+        n = self.n
         record_len = self._get_record_length()
         if self.is_debug_file:
             self.binary_debug.write('record_length = %s\n' % record_len)
@@ -361,6 +410,7 @@ class FortranFormat(object):
 
             self.data_code = {}
             self.obj = None
+            self._table3_n = n
             data, ndata = self._read_record_ndata()
             if not passer:
                 try:
@@ -373,6 +423,9 @@ class FortranFormat(object):
                         for key, value in iteritems(data_code_old):
                             setattr(self, key, value)
                         table4_parser(data, ndata)
+                        if self._op2_index is not None and self.read_mode == 1:
+                            # the record depends on the previous header
+                            self._op2_index.check_record(None)
                         return False
                     raise RuntimeError(self.code_information())
                 #if hasattr(self, 'isubcase'):
@@ -384,11 +437,12 @@ class FortranFormat(object):
                 if hasattr(self, 'num_wide'):
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
-                    n = self._read_subtable_results(table4_parser, record_len)
+                    self._read_subtable_results(table4_parser, record_len)
                 else:
                     data, ndata = self._read_record_ndata()
-                    n = table4_parser(data, ndata)
-                #del n
+                    table4_parser(data, ndata)
+                if self._op2_index is not None and self.read_mode == 1:
+                    self._op2_index.check_record(n)
 
     def _read_subtable_results(self, table4_parser, record_len):
         """
@@ -417,7 +471,7 @@ class FortranFormat(object):
                     assert isinstance(n, integer_types), self.table_name
                     datai = data[n:]
             else:
-                data, ndata = self._read_record_ndata()
+                data, ndata = self._read_record_ndata(zero_copy=True)
                 n = table4_parser(data, ndata)
                 assert isinstance(n, integer_types), self.table_name
 
@@ -459,7 +513,12 @@ class FortranFormat(object):
                     # For a PCOMP, it's ntotal=sum(nelements*nlayers),
                     # where each element can have a different number
                     # of layers
-                    if self.obj.ntotal == self.obj.data.shape[1]:
+                    #
+                    # For a SORT2 displacement-style table, a record is a
+                    # node with all the times, so ntotal=ntimes, which
+                    # is the first axis of the (ntimes, nnodes, 6) array.
+                    if self.obj.ntotal == self.obj.data.shape[1] or (
+                            self.obj.is_sort2() and self.obj.ntotal == self.obj.data.shape[0]):
                         self.obj._reset_indices()
                         self.obj.words = self.words
                         self.obj.itime += 1
@@ -497,6 +556,7 @@ class FortranFormat(object):
                 #n = record_len
                 #break
             else:
+                n0 = self.n
                 data, ndata = self._skip_record_ndata()
                 n = table4_parser(data, ndata)
                 assert isinstance(n, integer_types), 'table_name=%s n=%s' % (self.table_name, n)
@@ -525,6 +585,10 @@ class FortranFormat(object):
 
                     self.obj.ntotal = ntotal
                     self.obj._ntotals.append(ntotal)
+                    if self._op2_index is not None:
+                        self._op2_index.add_record(self._table3_n, n0, record_len,
+                                                   self._get_code(), self.data_code,
+                                                   self.obj)
 
                     assert isinstance(self.obj.ntotal, integer_types), type(self.obj.ntotal)
                 else:
@@ -678,11 +742,28 @@ class FortranFormat(object):
     def _read_record(self, stream=False, debug=True, macro_rewind=False):
         return self._read_record_ndata(stream, debug, macro_rewind)[0]
 
-    def _read_record_ndata(self, stream=False, debug=True, macro_rewind=False):
+    def _read_record_ndata(self, stream=False, debug=True, macro_rewind=False, zero_copy=False):
+        """
+        Reads a record and its continuation blocks
+
+        Parameters
+        ----------
+        zero_copy : bool; default=False
+            a record that's a single block is a memoryview of the memory
+            mapped file instead of a copy (only used if the file is
+            memory mapped); continuation blocks are always joined
+
+        Returns
+        -------
+        record : bytes / memoryview
+            the data in binary
+        nrecord : int
+            the length of the record
+        """
         markers0 = self.get_nmarkers(1, rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [4, %i, 4]; macro_rewind=%s\n' % (markers0[0], macro_rewind))
-        record, nrecord = self._read_block_ndata()
+        record, nrecord = self._read_block_ndata(zero_copy=zero_copy)
 
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - record = [%i, recordi, %i]; macro_rewind=%s\n' % (nrecord, nrecord, macro_rewind))
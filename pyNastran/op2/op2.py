@@ -114,8 +114,10 @@ import os
 
 from numpy import unique
 
-from pyNastran.utils import object_attributes, object_methods, integer_types
+from pyNastran.utils import (
+    object_attributes, object_methods, integer_types, get_pool_context)
 from pyNastran.op2.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_index import OP2Index
 
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.errors import SortCodeError, DeviceCodeError, FortranMarkerError
@@ -125,7 +127,8 @@ from pyNastran.op2.op2_f06_common import Op2F06Attributes
 
 def read_op2(op2_filename=None, combine=True,
              log=None, debug=True, debug_file=None, build_dataframe=False,
-             skip_undefined_matrices=True, mode='msc'):
+             skip_undefined_matrices=True, mode='msc', single_pass=False, use_mmap=False,
+             lazy=False, num_workers=1):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -148,6 +151,15 @@ def read_op2(op2_filename=None, combine=True,
      (.. seealso:: import logging)
     debug_file : str; default=None (No debug)
         sets the filename that will be written to
+    single_pass : bool; default=False
+        sizes and reads the results one table at a time, so the file is
+        read once instead of twice
+    use_mmap : bool; default=False
+        memory maps the file to reduce the peak memory use
+    lazy : bool; default=False
+        indexes the file and reads the results when they're used
+    num_workers : int; default=1
+        the number of processes used to read the result tables
 
     Returns
     -------
@@ -161,7 +173,9 @@ def read_op2(op2_filename=None, combine=True,
     """
     model = OP2(log=log, debug=debug, debug_file=debug_file, mode=mode)
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
-                   skip_undefined_matrices=skip_undefined_matrices, combine=combine)
+                   skip_undefined_matrices=skip_undefined_matrices, combine=combine,
+                   single_pass=single_pass, use_mmap=use_mmap, lazy=lazy,
+                   num_workers=num_workers)
 
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
@@ -187,6 +201,75 @@ def read_op2(op2_filename=None, combine=True,
 #sys.stdout = CrashObject()
 
 
+#: the model and result groups of an OP2 worker process
+_OP2_WORKER = {}
+
+
+def _init_op2_worker(model, spec):
+    """
+    Sets up a process for ``OP2.read_op2(..., num_workers=N)``
+
+    Parameters
+    ----------
+    model : OP2 / None
+        the indexed model, which is inherited when the process is forked
+    spec : dict / None
+        the settings to index the model with when the process can't be
+        forked (e.g., Windows)
+    """
+    if model is None:
+        model = OP2(debug=False, mode=spec['mode'])
+        model._results = spec['results']
+        model.use_vector = spec['use_vector']
+        model.skip_undefined_matrices = spec['skip_undefined_matrices']
+        model.use_mmap = spec['use_mmap']
+        model.is_vectorized = True
+        model._read_op2_lazy(spec['op2_filename'])
+    _OP2_WORKER['model'] = model
+    _OP2_WORKER['groups'] = model._op2_index.get_groups()
+
+
+def _read_op2_group(igroup):
+    """
+    Reads a group of results in an OP2 worker process
+
+    Returns
+    -------
+    results : List[(result_type, key, obj)]
+        the results that were read
+    unvectorized_tables : dict
+        the records that were read with a Python loop
+    """
+    model = _OP2_WORKER['model']
+    op2_index = model._op2_index
+    objs, tables = _OP2_WORKER['groups'][igroup]
+    result_types = set([op2_index.result_types[id(obj)] for obj in objs])
+    obj_ids = set([])
+    for result_type in result_types:
+        obj_ids.update([id(obj) for obj in itervalues(getattr(model, result_type))])
+
+    model.unvectorized_tables = {}
+    if '_lazy_loader' in objs[0].__dict__:
+        model._load_lazy_result(objs[0])
+
+    results = [(op2_index.result_types[id(obj)], op2_index.codes[id(obj)], obj)
+               for obj in objs]
+    for result_type in result_types:
+        # unvectorized results are created when the tables are read
+        for key, obj in iteritems(getattr(model, result_type)):
+            if id(obj) not in obj_ids:
+                results.append((result_type, key, obj))
+    return results, model.unvectorized_tables
+
+
+#: the result attributes that are set when a result is built
+LAZY_ATTRS = [
+    'data', '_times', 'element', 'element_node', 'element_layer', 'node_gridtype',
+    'element_names', 'is_built', 'is_unique', 'itime', 'ntotal', 'nelements',
+    'nnodes', '_nnodes',
+]
+
+
 #class OP2(OP2_Scalar, OP2Writer):
 class OP2(OP2_Scalar):
 
@@ -332,7 +415,8 @@ class OP2(OP2_Scalar):
         self.ask = ask
 
     def read_op2(self, op2_filename=None, combine=True, build_dataframe=False,
-                 skip_undefined_matrices=False):
+                 skip_undefined_matrices=False, single_pass=False, use_mmap=False,
+                 lazy=False, num_workers=1):
         """
         Starts the OP2 file reading
 
@@ -348,11 +432,48 @@ class OP2(OP2_Scalar):
             builds a pandas DataFrame for op2 objects
         skip_undefined_matrices : bool; default=False
              True : prevents matrix reading crashes
+        single_pass : bool; default=False
+            True : each table is sized and then read before moving on to
+                   the next table, so each byte is read from the file once
+                   instead of twice; a result that spans multiple tables is
+                   grown when the next table is sized
+            False : the whole file is sized and then read
+        use_mmap : bool; default=False
+            memory maps the file, so the result records are parsed from
+            views of the file instead of copies, which reduces the peak
+            memory use for large files
+        lazy : bool; default=False
+            only the headers are read (see ``get_op2_index``); the
+            results are read from the file the first time they're used
+        num_workers : int; default=1
+            the number of processes used to read the result tables;
+            the file is indexed and the independent groups of tables
+            are read in parallel (unused if lazy=True)
         """
         self.skip_undefined_matrices = skip_undefined_matrices
+        self.use_mmap = use_mmap
         assert self.ask in [True, False], self.ask
         self.is_vectorized = True
         self.log.debug('combine=%s' % combine)
+        if lazy:
+            self._read_op2_lazy(op2_filename)
+        elif num_workers > 1:
+            self._read_op2_parallel(op2_filename, num_workers)
+        elif single_pass:
+            self._read_op2_single_pass(op2_filename)
+        else:
+            self._read_op2_two_pass(op2_filename)
+
+        self.finalize()
+        if self.unvectorized_tables:
+            self.log.info(self.get_unvectorized_stats())
+        if build_dataframe:
+            self.build_dataframe()
+        self.combine_results(combine=combine)
+        self.log.debug('finished reading op2')
+
+    def _read_op2_two_pass(self, op2_filename):
+        """sizes the results in the whole file and then reads them"""
         self.log.debug('-------- reading op2 with read_mode=1 --------')
         self.read_mode = 1
         self._close_op2 = False
@@ -368,17 +489,203 @@ class OP2(OP2_Scalar):
         self.log.debug('-------- reading op2 with read_mode=2 --------')
         OP2_Scalar.read_op2(self, op2_filename=self.op2_filename)
 
-        self.finalize()
-        if build_dataframe:
-            self.build_dataframe()
-        self.combine_results(combine=combine)
-        self.log.debug('finished reading op2')
+    def _read_op2_single_pass(self, op2_filename):
+        """
+        Sizes and reads the results one table at a time.  A result that
+        spans multiple tables (e.g., a transient result) is grown when the
+        next table is sized (see ``_grow_single_pass_results``).
+        """
+        self.log.debug('-------- reading op2 with read_mode=1/2 per table --------')
+        self.read_mode = 1
+        self._close_op2 = True
+        self._single_pass = True
+        try:
+            OP2_Scalar.read_op2(self, op2_filename=op2_filename)
+        finally:
+            self._single_pass = False
+            self._single_pass_objs = []
+            self._single_pass_counters = {}
+            self._single_pass_arrays = {}
+        self.read_mode = 2
+
+    def _read_op2_lazy(self, op2_filename):
+        """indexes the results, so they can be read when they're used"""
+        self.log.debug('-------- indexing op2 with read_mode=1 --------')
+        self._op2_index = OP2Index(op2_filename)
+        self._close_op2 = True
+        self.read_mode = 1
+        try:
+            OP2_Scalar.read_op2(self, op2_filename=op2_filename)
+        finally:
+            self.f = None
+        self.read_mode = 2
+        self._op2_index.op2_filename = self.op2_filename
+        self._op2_index.set_result_types(self)
+        for obj in self._op2_index.objs:
+            # the attributes that are set by build are stashed, so using
+            # them will load the result
+            obj._lazy_attrs = {}
+            for name in LAZY_ATTRS:
+                if name in obj.__dict__:
+                    obj._lazy_attrs[name] = obj.__dict__.pop(name)
+            obj._lazy_loader = self._load_lazy_result
+
+    def _read_op2_parallel(self, op2_filename, num_workers):
+        """
+        Indexes the results and reads the independent groups of tables
+        in a pool of processes
+        """
+        self._read_op2_lazy(op2_filename)
+        op2_index = self._op2_index
+        ngroups = len(op2_index.get_groups())
+        num_workers = min(num_workers, ngroups)
+        if num_workers > 1:
+            context, is_fork = get_pool_context()
+            if is_fork:
+                initargs = (self, None)
+            else:
+                spec = {
+                    'op2_filename' : self.op2_filename,
+                    'mode' : 'nx' if self.is_nx else 'msc',
+                    'results' : self._results,
+                    'use_vector' : self.use_vector,
+                    'skip_undefined_matrices' : self.skip_undefined_matrices,
+                    'use_mmap' : self.use_mmap,
+                }
+                initargs = (None, spec)
+
+            self.log.debug('-------- reading %s table groups with %s processes --------' % (
+                ngroups, num_workers))
+            pool = context.Pool(num_workers, initializer=_init_op2_worker, initargs=initargs)
+            try:
+                for results, unvectorized_tables in pool.imap(_read_op2_group, range(ngroups)):
+                    for result_type, key, obj in results:
+                        getattr(self, result_type)[key] = obj
+                    for key, (nrecords, nelements) in iteritems(unvectorized_tables):
+                        counts = self.unvectorized_tables.setdefault(key, [0, 0])
+                        counts[0] += nrecords
+                        counts[1] += nelements
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            self.load_lazy_results()
+        self._op2_index = None
+
+    def get_op2_index(self):
+        """
+        Gets the table of contents of the results
+
+        Returns
+        -------
+        op2_index : OP2Index / None
+            the index (None if the OP2 wasn't read with lazy=True)
+        """
+        return self._op2_index
+
+    def get_unvectorized_stats(self):
+        """
+        Gets the table/element/num_wide combinations that were read with
+        a Python loop (e.g., ``Struct.unpack`` for each element) instead
+        of numpy, either because there is no vectorized reader or because
+        ``use_vector=False``
+
+        The OES/OEF results that are still read with a loop are the ones
+        without an array result object:
+          - OES 139-QUAD4FD hyperelastic strains
+          - OEF 189-VUQUAD, 190-VUTRIA and 191-VUBEAM real/complex forces
+
+        Returns
+        -------
+        msg : str
+            the summary (an empty string if everything was vectorized)
+
+        Example
+        -------
+        >>> print(model.get_unvectorized_stats())
+        unvectorized tables:
+          OES1X1 CBUSH   real    SORT1 num_wide=7:  nrecords=1 nelements=12
+        """
+        if not self.unvectorized_tables:
+            return ''
+        format_codes = {1 : 'real', 2 : 'real/imag', 3 : 'mag/phase'}
+        msg = ['unvectorized tables:\n']
+        for key, (nrecords, nelements) in sorted(iteritems(self.unvectorized_tables)):
+            table_name, element_name, format_code, sort_method, num_wide = key
+            msg.append('  %-8s %-18s %-9s SORT%i num_wide=%-3i: nrecords=%i nelements=%i\n' % (
+                table_name, element_name, format_codes.get(format_code, format_code),
+                sort_method, num_wide, nrecords, nelements))
+        return ''.join(msg)
+
+    def load_lazy_results(self):
+        """reads all the results that haven't been used"""
+        if self._op2_index is None:
+            return
+        for obj in self._op2_index.objs:
+            if '_lazy_loader' in obj.__dict__:
+                self._load_lazy_result(obj)
+
+    def _load_lazy_result(self, obj):
+        """
+        Reads the records of a result that was indexed by
+        ``read_op2(..., lazy=True)``.  The other results in a table are
+        also read if the table isn't seekable (see ``OP2Index.get_group``).
+        """
+        op2_index = self._op2_index
+        objs, tables = op2_index.get_group(obj)
+        self.log.debug('loading %s results from %s tables' % (len(objs), len(tables)))
+        for obji in objs:
+            del obji._lazy_loader
+            obji.__dict__.update(obji.__dict__.pop('_lazy_attrs'))
+
+        # the table parsers look the results up by their original keys,
+        # which combine_results may have changed
+        slots = {}
+        for obji in objs:
+            result_type = op2_index.result_types[id(obji)]
+            if result_type not in slots:
+                slots[result_type] = getattr(self, result_type)
+                setattr(self, result_type, dict(slots[result_type]))
+            getattr(self, result_type)[op2_index.codes[id(obji)]] = obji
+
+        is_debug_file = self.is_debug_file
+        self.is_debug_file = False
+        self._open_op2_file()
+        self.read_mode = 2
+        try:
+            for table in tables:
+                self.table_name = table.table_name
+                records = op2_index.get_table_records(table, objs)
+                if records is None:
+                    self._goto(table.n)
+                    self._count = table.count
+                    self._read_table(table.table_name)
+                else:
+                    self._read_results_records(table, records)
+        finally:
+            self._close_op2_file()
+            self.f = None
+            self.is_debug_file = is_debug_file
+            for result_type, slot in iteritems(slots):
+                # keep any (unvectorized) results that were created
+                obj_ids = set([id(obji) for obji in itervalues(slot)])
+                for key, obji in iteritems(getattr(self, result_type)):
+                    if id(obji) not in obj_ids:
+                        slot[key] = obji
+                setattr(self, result_type, slot)
+
+        for obji in objs:
+            if hasattr(obji, 'finalize'):
+                obji.finalize()
 
     def finalize(self):
         result_types = self.get_table_types()
         for result_type in result_types:
             result = getattr(self, result_type)
             for obj in itervalues(result):
+                if '_lazy_loader' in obj.__dict__:
+                    # finalized when it's loaded
+                    continue
                 if hasattr(obj, 'finalize'):
                     obj.finalize()
 
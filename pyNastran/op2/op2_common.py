@@ -4,7 +4,7 @@ from six.moves import range, zip
 import copy
 from struct import Struct, unpack
 
-from numpy import radians, sin, cos, fromstring, ones, float32, dtype as npdtype
+from numpy import radians, sin, cos, frombuffer, ones, float32, dtype as npdtype
 
 import numpy as np
 #from numba import autojit
@@ -56,6 +56,11 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         self.is_vectorized = None
         self.combine = False
 
+        #: (table_name, element_name, format_code, sort_method, num_wide) ->
+        #: [nrecords, nelements] that were read with a Python loop instead
+        #: of numpy (see ``get_unvectorized_stats``)
+        self.unvectorized_tables = {}
+
         #: the storage dictionary that is passed to OP2 objects (e.g. RealDisplacementArray)
         #: the key-value pairs are extracted and used to generate dynamic self
         #: variables for the OP2 objects
@@ -571,8 +576,8 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             n = nnodes * 4 * 8
             itotal2 = obj.itotal + nnodes
             #print('ndata=%s n=%s nnodes=%s' % (ndata, n, nnodes))
-            ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
             obj._times[obj.itime] = dt
             #self.node_gridtype[self.itotal, :] = [node_id, grid_type]
             #self.data[self.itime, self.itotal, :] = [v1, v2, v3, v4, v5, v6]
@@ -624,7 +629,7 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
 
             is_mask = False
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
                 #ints = floats[:, :2].view('int32')
                 #from numpy import array_equal
                 #assert array_equal(ints, intsB)
@@ -641,9 +646,9 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
                     obj.float_mask = float_mask
 
             if obj.nonlinear_factor is not None and is_mask:
-                results = fromstring(data, dtype=self.fdtype)[obj.float_mask]
+                results = frombuffer(data, dtype=self.fdtype)[obj.float_mask]
             else:
-                floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
                 obj.data[obj.itime, obj.itotal:itotal2, :] = floats[:, 2:]
             obj._times[itime] = dt
             obj.itotal = itotal2
@@ -675,22 +680,23 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         #assert self.obj is not None
 
         obj = self.obj
-        if self.use_vector and is_vectorized and 0:  # TODO: not done....
-            itime = obj.itime
+        if self.use_vector and is_vectorized:
+            # each record is a node with all the times, so the record is
+            # a column of the (ntimes, nnodes, 6) array
             n = nnodes * 4 * 8
+            inode = obj.itime
             itotal = obj.itotal
             itotal2 = itotal + nnodes
-            if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 8)
-                #nids = ints[:, 0] // 10
-                nids = ones(nnodes, dtype='int32') * eid
-                assert nids.min() > 0, nids.min()
-                obj.node_gridtype[itotal:itotal2, 0] = nids
-                obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
+            assert eid > 0, self.code_information()
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 8)
-            obj._times[itime] = floats[:, 0]
-            obj.data[obj.itime, itotal:itotal2, :] = floats[:, 2:]
+            ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 8)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 8)
+            if self._analysis_code_fmt == 'i':
+                obj._times[itotal:itotal2] = ints[:, 0]
+            else:
+                obj._times[itotal:itotal2] = floats[:, 0]
+            obj.node_gridtype[inode, :] = [eid, ints[0, 1]]
+            obj.data[itotal:itotal2, inode, :] = floats[:, 2:]
             obj.itotal = itotal2
         else:
             n = 0
@@ -724,13 +730,13 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = obj.itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 14)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[obj.itotal:itotal2, 0] = nids
                 obj.node_gridtype[obj.itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 14)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
             mag = floats[:, 2:8]
             phase = floats[:, 8:]
             rtheta = radians(phase)
@@ -772,14 +778,14 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             itotal2 = itotal + nnodes
 
             if obj.itime == 0:
-                ints = fromstring(data, dtype=self.idtype).reshape(nnodes, 14)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
                 #print(ints[:, :2])
                 nids = ints[:, 0] // 10
                 assert nids.min() > 0, nids.min()
                 obj.node_gridtype[itotal:itotal2, 0] = nids
                 obj.node_gridtype[itotal:itotal2, 1] = ints[:, 1]
 
-            floats = fromstring(data, dtype=self.fdtype).reshape(nnodes, 14)
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
             real = floats[:, 2:8]
             imag = floats[:, 8:]
             #assert real.shape == imag.shape, 'real.shape=%s imag.shape=%s' % (str(real.shape), str(imag.shape))
@@ -853,8 +859,15 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         assert nnodes > 0
         #assert ndata % ntotal == 0
 
-        if self.use_vector and is_vectorized and 0:
-            pass
+        obj = self.obj
+        if self.use_vector and is_vectorized:
+            n = nnodes * 4 * 14
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
+            mag = floats[:, 2:8]
+            phase = floats[:, 8:]
+            rtheta = radians(phase)
+            real_imag = mag * (cos(rtheta) + 1.j * sin(rtheta))
+            self._add_complex_table_sort2(data, obj, node_id, nnodes, floats, real_imag)
         else:
             n = 0
             s = Struct(self._endian + self._analysis_code_fmt + 'i12f')
@@ -890,8 +903,12 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         flag, flag_type = self.get_oug2_flag()
         node_id = self.nonlinear_factor
 
-        if self.use_vector and is_vectorized and 0:
-            pass
+        obj = self.obj
+        if self.use_vector and is_vectorized:
+            n = nnodes * 4 * 14
+            floats = frombuffer(data, dtype=self.fdtype).reshape(nnodes, 14)
+            real_imag = floats[:, 2:8] + 1.j * floats[:, 8:]
+            self._add_complex_table_sort2(data, obj, node_id, nnodes, floats, real_imag)
         else:
             n = 0
             #ntotal = 56  # 14 * 4
@@ -921,6 +938,23 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
                 n += 56
         return n
 
+    def _add_complex_table_sort2(self, data, obj, node_id, nnodes, floats, real_imag):
+        """
+        Stores a complex SORT2 record (a node with all the frequencies)
+        as a column of the (nfreqs, nnodes, 6) array
+        """
+        inode = obj.itime
+        itotal = obj.itotal
+        itotal2 = itotal + nnodes
+        ints = frombuffer(data, dtype=self.idtype).reshape(nnodes, 14)
+        if self._analysis_code_fmt == 'i':
+            obj._times[itotal:itotal2] = ints[:, 0]
+        else:
+            obj._times[itotal:itotal2] = floats[:, 0]
+        obj.node_gridtype[inode, :] = [node_id, ints[0, 1]]
+        obj.data[itotal:itotal2, inode, :] = real_imag
+        obj.itotal = itotal2
+
     def create_transient_object(self, storage_obj, class_obj, is_cid=False, debug=False):
         """
         Creates a transient object (or None if the subcase should be skippied).
@@ -964,6 +998,9 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
         if hasattr(self, 'isubcase'):
             if self.code in storage_obj:
                 self.obj = storage_obj[code]
+                if self._single_pass and self.read_mode == 1:
+                    # the result may have been built in a previous table
+                    self._start_single_pass_result(self.obj)
                 if self.nonlinear_factor is not None:
                     if self.obj.nonlinear_factor is None:
                         msg = 'The object is flipping from a static (e.g. preload)\n'
@@ -977,6 +1014,8 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             else:
                 class_obj.is_cid = is_cid
                 self.obj = class_obj(self.data_code, self.is_sort1(), self.isubcase, self.nonlinear_factor)
+                if self._single_pass and self.read_mode == 1:
+                    self._start_single_pass_result(self.obj)
             storage_obj[code] = self.obj
         else:
             if code in storage_obj:
@@ -1451,6 +1490,24 @@ class OP2Common(Op2Codes, F06Writer, XlsxWriter):
             auto_return = True
         return auto_return, is_vectorized
 
+    def _add_unvectorized_table(self, nelements):
+        """
+        Tracks a table 4 record that is read with a Python loop (e.g., a
+        Struct.unpack for each element) instead of numpy
+        """
+        if self.read_mode == 1:
+            return
+        table_name = self.table_name
+        if isinstance(table_name, bytes):
+            table_name = table_name.decode('latin1')
+        sort_method = 1 if self.is_sort1() else 2
+        key = (table_name, self.element_name, self.format_code, sort_method, self.num_wide)
+        if key not in self.unvectorized_tables:
+            self.unvectorized_tables[key] = [0, 0]
+        counts = self.unvectorized_tables[key]
+        counts[0] += 1
+        counts[1] += nelements
+
     def _set_structs(self):
         """defines common struct formats"""
         self.fdtype = npdtype(self._endian + 'f4')
@@ -816,7 +816,8 @@ class OP2_F06_Common(object):
                   if isinstance(getattr(self, table), dict)
                   and table not in [
                       'card_count', 'data_code', 'element_mapper', 'iSubcaseNameMap',
-                      'labels', 'subtitles', 'additional_matrices', 'matrices', 'subcase_key']]
+                      'labels', 'subtitles', 'additional_matrices', 'matrices', 'subcase_key',
+                      'unvectorized_tables']]
         for table in tables:
             if self.make_geom:
                 break
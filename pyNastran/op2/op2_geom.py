@@ -14,7 +14,7 @@ from pyNastran.op2.op2 import OP2
 
 def read_op2_geom(op2_filename=None, combine=True,
              log=None, debug=True, debug_file=None, build_dataframe=False,
-             skip_undefined_matrices=True, mode='msc'):
+             skip_undefined_matrices=True, mode='msc', geom_arrays_only=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -37,6 +37,11 @@ def read_op2_geom(op2_filename=None, combine=True,
      (.. seealso:: import logging)
     debug_file : str; default=None (No debug)
         sets the filename that will be written to
+    geom_arrays_only : bool; default=False
+        the GRID, CTETRA, CPENTA, CHEXA, CTRIA3, CQUAD4, CROD, PSHELL,
+        PSOLID, PROD and MAT1 cards are only decoded into arrays
+        (see ``get_geom_array``); the card objects are created by
+        ``build_geom_cards``
 
     Returns
     -------
@@ -48,7 +53,8 @@ def read_op2_geom(op2_filename=None, combine=True,
     .. note :: this method will change in order to return an object that
                does not have so many methods
     """
-    model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
+    model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode,
+                    geom_arrays_only=geom_arrays_only)
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine)
     return model
@@ -56,7 +62,8 @@ def read_op2_geom(op2_filename=None, combine=True,
 class OP2Geom(OP2, BDF,
               GEOM1, GEOM2, GEOM3, GEOM4, EPT, MPT, DIT, DYNAMICS):
     def __init__(self, make_geom=True,
-                 debug=False, log=None, debug_file=None, mode='msc'):
+                 debug=False, log=None, debug_file=None, mode='msc',
+                 geom_arrays_only=False):
         """
         Initializes the OP2 object
 
@@ -73,6 +80,9 @@ class OP2Geom(OP2, BDF,
             sets the filename that will be written to
         mode : str; default='msc'
             {msc, nx}
+        geom_arrays_only : bool; default=False
+            only decode the vectorized cards into arrays
+            (see ``get_geom_array`` and ``build_geom_cards``)
         """
         # make_geom=False, debug=True, log=None, debug_file=None
 
@@ -89,6 +99,7 @@ class OP2Geom(OP2, BDF,
 
         OP2.__init__(self, debug, log=log, debug_file=debug_file, mode=mode)
         self.make_geom = True
+        self.geom_arrays_only = geom_arrays_only
 
     def _get_table_mapper(self):
         table_mapper = OP2._get_table_mapper(self)
@@ -0,0 +1,302 @@
+"""
+Defines OP2Index, which is the table of contents of the results in an
+OP2 file.  The index is built by the header-only scan (read_mode=1) of
+``OP2.read_op2(..., lazy=True)`` and is used to read the tables of a
+result the first time the result is used.
+"""
+from __future__ import print_function, unicode_literals
+import copy
+from collections import Counter
+from six import iteritems
+
+
+class OP2IndexTable(object):
+    """the location of a results table in the file"""
+    def __init__(self, itable, table_name, n, count, is_seekable=True):
+        """
+        Parameters
+        ----------
+        itable : int
+            the index of the table in OP2Index.tables
+        table_name : bytes
+            the name of the table (e.g. OUGV1, OES1X1)
+        n : int
+            the file offset of the start of the table
+        count : int
+            the R1TABRG counter at the start of the table, which is part
+            of the result key
+        is_seekable : bool; default=True
+            can the records of a result be read without reading the rest
+            of the table; False if the table has records that weren't
+            indexed (e.g., unvectorized results)
+        """
+        self.itable = itable
+        self.table_name = table_name
+        self.n = n
+        self.count = count
+        self.is_seekable = is_seekable
+
+    def __repr__(self):
+        return 'OP2IndexTable(itable=%s, table_name=%r, n=%s, is_seekable=%s)' % (
+            self.itable, self.table_name, self.n, self.is_seekable)
+
+
+class OP2IndexRecord(object):
+    """the location of a table 4 record (a time step of a result) in the file"""
+    def __init__(self, itable, n3, n, record_len, code, data_code, obj):
+        """
+        Parameters
+        ----------
+        itable : int
+            the table the record is in
+        n3 : int
+            the file offset of the table 3 header of the record
+        n : int
+            the file offset of the start of the record
+        record_len : int
+            the length of the record in bytes
+        code : tuple
+            the result key (isubcase, analysis_code, sort_method, count, subtitle)
+        data_code : dict
+            the table 3 header of the record
+        obj : ScalarObject
+            the result the record is stored in
+        """
+        self.itable = itable
+        self.n3 = n3
+        self.n = n
+        self.record_len = record_len
+        self.code = code
+        self.data_code = data_code
+        self.obj = obj
+
+    @property
+    def isubcase(self):
+        return self.code[0]
+
+    @property
+    def table_name(self):
+        return self.data_code['table_name']
+
+    @property
+    def element_name(self):
+        return self.data_code.get('element_name')
+
+    @property
+    def nonlinear_factor(self):
+        return self.data_code.get('nonlinear_factor')
+
+    def __repr__(self):
+        return 'OP2IndexRecord(table_name=%r, isubcase=%s, element_name=%r, n=%s, record_len=%s)' % (
+            self.table_name, self.isubcase, self.element_name, self.n, self.record_len)
+
+
+class OP2Index(object):
+    """
+    The table of contents of the results in an OP2
+
+    For every table 4 record (a subcase/time/element type), the file
+    offsets of the record and its table 3 header, the record length and
+    the table 3 header (``data_code``) is stored, as well as the result
+    the record belongs to.  A result is loaded by seeking to its records,
+    so the other results in the table aren't read.
+    """
+    def __init__(self, op2_filename):
+        self.op2_filename = op2_filename
+
+        #: List[OP2IndexTable]
+        self.tables = []
+        #: List[OP2IndexRecord]
+        self.records = []
+
+        #: id(obj) -> the table ids the result is in
+        self._obj_itables = {}
+        #: id(obj) -> obj
+        self._objs = {}
+        #: id(obj) -> result type (e.g. 'displacements', 'cquad4_stress')
+        self.result_types = {}
+        #: id(obj) -> the key of the result when it was read
+        self.codes = {}
+        self._parent = {}
+
+    def start_table(self, table_name, n, count, is_seekable=True):
+        """starts a table; the table is dropped if it doesn't have any records"""
+        self.tables.append(OP2IndexTable(len(self.tables), table_name, n, count,
+                                         is_seekable=is_seekable))
+
+    def finish_table(self):
+        """
+        Drops the current table if no results were found in it
+
+        Returns
+        -------
+        is_indexed : bool
+            the table has results
+        """
+        table = self.tables[-1]
+        if not (self.records and self.records[-1].itable == table.itable):
+            self.tables.pop()
+            return False
+
+        if not table.is_seekable:
+            # the results in the table are loaded together
+            table_key = ('table', table.itable)
+            self._parent[table_key] = table_key
+            for record in self.records:
+                if record.itable == table.itable:
+                    self._union(id(record.obj), table_key)
+        return True
+
+    def add_record(self, n3, n, record_len, code, data_code, obj):
+        """adds a table 4 record to the current table"""
+        itable = self.tables[-1].itable
+        record = OP2IndexRecord(itable, n3, n, record_len, code, copy.copy(data_code), obj)
+        self.records.append(record)
+
+        key = id(obj)
+        if key not in self._objs:
+            self._objs[key] = obj
+            self.codes[key] = code
+            self._obj_itables[key] = set([])
+            self._parent[key] = key
+        self._obj_itables[key].add(itable)
+
+    def check_record(self, n):
+        """
+        Checks that the table 4 record at file offset n that was just
+        read was indexed; if it wasn't (e.g., it's an unvectorized
+        result), the table has to be read in full
+        """
+        table = self.tables[-1]
+        if n is None or not self.records or self.records[-1].n != n or (
+                self.records[-1].itable != table.itable):
+            table.is_seekable = False
+
+    def _find(self, key):
+        """finds the group of tables/results that are read together"""
+        parent = self._parent
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def _union(self, key1, key2):
+        root1 = self._find(key1)
+        root2 = self._find(key2)
+        if root1 != root2:
+            self._parent[root2] = root1
+
+    @property
+    def objs(self):
+        """the results in the index"""
+        return list(self._objs.values())
+
+    def set_result_types(self, model):
+        """finds the result type (e.g. 'displacements') of the indexed results"""
+        for result_type in model.get_table_types():
+            for obj in getattr(model, result_type).values():
+                key = id(obj)
+                if key in self._objs:
+                    self.result_types[key] = result_type
+
+    def get_group(self, obj):
+        """
+        Gets the results and tables that have to be read to load a result
+
+        A result may be in multiple tables (e.g. transient results).  The
+        records of a result are read on their own unless a table isn't
+        seekable, in which case all the results in the table are loaded
+        together.
+
+        Returns
+        -------
+        objs : List[ScalarObject]
+            the results to load
+        tables : List[OP2IndexTable]
+            the tables to read in file order
+        """
+        root = self._find(id(obj))
+        objs = [obji for key, obji in iteritems(self._objs) if self._find(key) == root]
+        itables = set([])
+        for obji in objs:
+            itables.update(self._obj_itables[id(obji)])
+        tables = [self.tables[itable] for itable in sorted(itables)]
+        return objs, tables
+
+    def get_table_records(self, table, objs):
+        """
+        Gets the records of a table that have to be read to load a group
+        of results
+
+        Parameters
+        ----------
+        table : OP2IndexTable
+            the table to read
+        objs : List[ScalarObject]
+            the results to load (see ``get_group``)
+
+        Returns
+        -------
+        records : List[OP2IndexRecord] / None
+            the records in file order; None if the whole table is read
+        """
+        if not table.is_seekable:
+            return None
+        obj_ids = set([id(obj) for obj in objs])
+        return [record for record in self.records
+                if record.itable == table.itable and id(record.obj) in obj_ids]
+
+    def get_groups(self):
+        """
+        Gets the independent groups of results/tables, so they can be
+        read separately (e.g., in different processes)
+
+        Returns
+        -------
+        groups : List[(objs, tables)]
+            the results and tables of each group (see ``get_group``)
+            sorted by the first table in the group
+        """
+        roots = {}
+        for key, obj in iteritems(self._objs):
+            root = self._find(key)
+            if root not in roots:
+                roots[root] = obj
+        groups = [self.get_group(obj) for obj in roots.values()]
+        return sorted(groups, key=lambda group: group[1][0].itable)
+
+    def get_records(self, table_name=None, isubcase=None, element_name=None):
+        """
+        Filters the records
+
+        Parameters
+        ----------
+        table_name : str; default=None -> all
+            the table name (e.g. 'OES1X1')
+        isubcase : int; default=None -> all
+            the subcase id
+        element_name : str; default=None -> all
+            the element name (e.g. 'QUAD4', 'CTETRA')
+
+        Returns
+        -------
+        records : List[OP2IndexRecord]
+            the records in file order
+        """
+        records = []
+        for record in self.records:
+            if table_name is not None and record.table_name != table_name:
+                continue
+            if isubcase is not None and record.isubcase != isubcase:
+                continue
+            if element_name is not None and record.element_name != element_name:
+                continue
+            records.append(record)
+        return records
+
+    def __repr__(self):
+        nrecords = Counter([record.itable for record in self.records])
+        msg = 'OP2Index(op2_filename=%r)\n' % self.op2_filename
+        for table in self.tables:
+            msg += '  %s nrecords=%s\n' % (table, nrecords[table.itable])
+        return msg
@@ -7,6 +7,8 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from six import string_types, iteritems, PY2, b
 from six.moves import range
 import os
+import copy
+import mmap
 from struct import unpack, Struct
 import sys
 
@@ -33,7 +35,7 @@ from pyNastran.op2.tables.opg_appliedLoads.opg import OPG
 from pyNastran.op2.tables.oqg_constraintForces.oqg import OQG
 from pyNastran.op2.tables.oug.oug import OUG
 from pyNastran.op2.tables.ogpwg import OGPWG
-from pyNastran.op2.fortran_format import FortranFormat
+from pyNastran.op2.fortran_format import FortranFormat, RecordCache
 
 from pyNastran.utils import is_binary_file
 from pyNastran.utils.log import get_logger
@@ -350,6 +352,10 @@ AUTODESK_MATRIX_TABLES = [
 RESULT_TABLES = NX_RESULT_TABLES + MSC_RESULT_TABLES
 MATRIX_TABLES = NX_MATRIX_TABLES + MSC_MATRIX_TABLES + AUTODESK_MATRIX_TABLES
 
+#: the attributes of a result that are counted with read_mode=1 and are
+#: used by ``build`` to size the arrays
+RESULT_COUNTERS = ['ntimes', 'ntotal', '_ntotals', 'nelements', '_nnodes', 'nnodes', 'itotal']
+
 class OP2_Scalar(LAMA, ONR, OGPF,
                  OEF, OES, OGS, OPG, OQG, OUG, OGPWG, FortranFormat):
     """
@@ -405,6 +411,19 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.is_vectorized = False
         self._close_op2 = True
 
+        #: size and fill the results one table at a time
+        self._single_pass = False
+        #: the results that are sized in the current table (single_pass)
+        self._single_pass_objs = []
+        #: id(obj) -> (obj, the counters of obj before it was built)
+        self._single_pass_counters = {}
+        #: id(obj) -> (obj, the arrays of obj from the previous tables, itime)
+        self._single_pass_arrays = {}
+
+        #: memory map the OP2, so the result tables are parsed without
+        #: copying the records
+        self.use_mmap = False
+
         self.result_names = set([])
 
         self.grid_point_weight = GridPointWeight()
@@ -1038,8 +1057,7 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.table_name = None
 
         if not hasattr(self, 'f') or self.f is None:
-            #: the OP2 file object
-            self.f = open(self.op2_filename, 'rb')
+            self._open_op2_file()
             self._endian = None
             flag_data = self.f.read(20)
             self.f.seek(0)
@@ -1144,12 +1162,37 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             self.binary_debug.write('f.tell()=%s\ndone...\n' % self.f.tell())
             self.binary_debug.close()
         if self._close_op2:
-            self.f.close()
+            self._close_op2_file()
             del self.binary_debug
             del self.f
         #self.remove_unpickable_data()
         return table_names
 
+    def _open_op2_file(self):
+        """opens the OP2 file (or memory maps it)"""
+        #: the OP2 file object
+        self.f = open(self.op2_filename, 'rb')
+        if self.use_mmap:
+            # the mmap has the same read/seek/tell interface as the file
+            op2_file = self.f
+            self.f = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+            op2_file.close()
+            self._mmap_view = memoryview(self.f)
+
+    def _close_op2_file(self):
+        """closes the OP2 file (and the memory map)"""
+        if self._mmap_view is not None:
+            try:
+                self._mmap_view.release()
+                self.f.close()
+            except BufferError:
+                # an array still points at the memory map; it's unmapped
+                # when the array is deleted
+                pass
+            self._mmap_view = None
+        else:
+            self.f.close()
+
     #def create_unpickable_data(self):
         #raise NotImplementedError()
         ##==== not needed ====
@@ -1207,54 +1250,189 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             self.table_name = table_name
             if 0:
                 self._skip_table(table_name)
+            elif self._single_pass:
+                self._read_table_single_pass(table_name)
+            elif self._op2_index is not None:
+                self._read_table_lazy(table_name)
             else:
-                if table_name in GEOM_TABLES:
-                    self._read_geom_table()  # DIT (agard)
-                elif table_name == b'GPL':
-                    self._read_gpl()
-                #elif table_name == b'MEFF':
-                    #self._read_meff()
-                elif table_name == b'INTMOD':
-                    self._read_intmod()
-                #elif table_name == b'HISADD':
-                    #self._read_hisadd()
-                elif table_name == b'FRL':  # frequency response list
-                    self._skip_table(self.table_name)
-                elif table_name == b'EXTDB':
-                    self._read_extdb()
-                elif table_name == b'OMM2':
-                    self._read_omm2()
-                elif table_name == b'DIT':  # tables
-                    self._read_dit()
-                elif table_name == b'TOL':
-                    self._read_tol()
-                #elif table_name == b'KELM':
-                    #self._read_kelm()
-                elif table_name == b'PCOMPTS': # blade
-                    self._read_pcompts()
-                elif table_name == b'FOL':
-                    self._read_fol()
-                elif table_name in [b'SDF', b'PMRF']:  #, 'PERF'
-                    self._read_sdf()
-                elif table_name in [b'IBULK', b'CDDATA']:
-                    self._read_ibulk()
-                elif table_name in MATRIX_TABLES:
-                    self._read_matrix()
-                elif table_name in RESULT_TABLES:
-                    self._read_results_table()
-                elif self.skip_undefined_matrices:
-                    self._read_matrix()
-                elif table_name.strip() in self.additional_matrices:
-                    self._read_matrix()
-                else:
-                    msg = 'geom/results split: %r\n\n' % table_name
-                    msg += 'If you have matrices that you want to read, see:\n'
-                    msg += '  model.set_additional_matrices(matrices)'
-                    raise NotImplementedError(msg)
+                self._read_table(table_name)
 
             table_name = self._read_table_name(rewind=True, stop_on_failure=False)
         return table_names
 
+    def _read_table(self, table_name):
+        """Reads a geometry/result/matrix table"""
+        if table_name in GEOM_TABLES:
+            self._read_geom_table()  # DIT (agard)
+        elif table_name == b'GPL':
+            self._read_gpl()
+        #elif table_name == b'MEFF':
+            #self._read_meff()
+        elif table_name == b'INTMOD':
+            self._read_intmod()
+        #elif table_name == b'HISADD':
+            #self._read_hisadd()
+        elif table_name == b'FRL':  # frequency response list
+            self._skip_table(self.table_name)
+        elif table_name == b'EXTDB':
+            self._read_extdb()
+        elif table_name == b'OMM2':
+            self._read_omm2()
+        elif table_name == b'DIT':  # tables
+            self._read_dit()
+        elif table_name == b'TOL':
+            self._read_tol()
+        #elif table_name == b'KELM':
+            #self._read_kelm()
+        elif table_name == b'PCOMPTS': # blade
+            self._read_pcompts()
+        elif table_name == b'FOL':
+            self._read_fol()
+        elif table_name in [b'SDF', b'PMRF']:  #, 'PERF'
+            self._read_sdf()
+        elif table_name in [b'IBULK', b'CDDATA']:
+            self._read_ibulk()
+        elif table_name in MATRIX_TABLES:
+            self._read_matrix()
+        elif table_name in RESULT_TABLES:
+            self._read_results_table()
+        elif self.skip_undefined_matrices:
+            self._read_matrix()
+        elif table_name.strip() in self.additional_matrices:
+            self._read_matrix()
+        else:
+            msg = 'geom/results split: %r\n\n' % table_name
+            msg += 'If you have matrices that you want to read, see:\n'
+            msg += '  model.set_additional_matrices(matrices)'
+            raise NotImplementedError(msg)
+
+    def _read_table_single_pass(self, table_name):
+        """
+        Sizes the results in a table (read_mode=1) and then fills them
+        (read_mode=2) before moving on to the next table.  The sizing pass
+        skips the table 4 results and the filling pass reuses the headers
+        and markers read by the sizing pass (see ``RecordCache``), so each
+        byte of the table is read from the file once.
+        """
+        n0 = self.n
+        count0 = self._count
+        op2_file = self.f
+        self.f = RecordCache(op2_file)
+        try:
+            self.read_mode = 1
+            self._single_pass_objs = []
+            self._read_table(table_name)
+            self._grow_single_pass_results()
+
+            self.f.is_recording = False
+            self._goto(n0)
+            self._count = count0
+            self.read_mode = 2
+            self._read_table(table_name)
+        finally:
+            self.f = op2_file
+
+    def _start_single_pass_result(self, obj):
+        """
+        Tracks a result that's being sized (read_mode=1) in the current
+        table.  A result that was built in a previous table (e.g., a
+        transient result that's written as multiple tables) gets the
+        counters it had before it was built, so the current table is
+        added to them as in the two pass read.
+        """
+        if any(obji is obj for obji in self._single_pass_objs):
+            return
+        self._single_pass_objs.append(obj)
+        if not getattr(obj, 'is_built', False):
+            return
+
+        unused_obj, counters = self._single_pass_counters[id(obj)]
+        arrays = {name : value for name, value in iteritems(obj.__dict__)
+                  if isinstance(value, np.ndarray)}
+        self._single_pass_arrays[id(obj)] = (obj, arrays, counters['ntimes'])
+        for name, value in iteritems(counters):
+            setattr(obj, name, copy.copy(value))
+        obj.is_built = False
+
+    def _grow_single_pass_results(self):
+        """
+        Stores the counters of the results that were sized in the current
+        table and rebuilds the results that were started in a previous
+        table with room for the current table
+        """
+        for obj in self._single_pass_objs:
+            counters = {name : copy.copy(obj.__dict__[name]) for name in RESULT_COUNTERS
+                        if name in obj.__dict__}
+            self._single_pass_counters[id(obj)] = (obj, counters)
+
+        for obj in self._single_pass_objs:
+            if id(obj) not in self._single_pass_arrays:
+                continue
+            unused_obj, arrays, itime = self._single_pass_arrays.pop(id(obj))
+            obj.build()
+            for name, array0 in iteritems(arrays):
+                array1 = getattr(obj, name)
+                if array1.ndim != array0.ndim or any(
+                        n1 < n0 for n0, n1 in zip(array0.shape, array1.shape)):
+                    msg = '%s.%s shrunk from %s to %s; table_name=%s' % (
+                        obj.__class__.__name__, name, str(array0.shape), str(array1.shape),
+                        self.table_name)
+                    raise RuntimeError(msg)
+                # the arrays are padded as in the two pass read
+                array1[tuple([slice(0, n0) for n0 in array0.shape])] = array0
+
+            # continue after the records of the previous tables
+            obj.itime = itime
+        self._single_pass_objs = []
+
+    def _read_table_lazy(self, table_name):
+        """
+        Indexes the results in a table (read_mode=1), so they can be read
+        when they're used.  Tables without results (e.g. eigenvalues,
+        matrices) are read (read_mode=2) right away.
+        """
+        n0 = self.n
+        count0 = self._count
+        self.read_mode = 1
+        self._op2_index.start_table(table_name, n0, count0,
+                                    is_seekable=table_name in RESULT_TABLES)
+        self._read_table(table_name)
+        if self._op2_index.finish_table():
+            return
+
+        self._goto(n0)
+        self._count = count0
+        self.read_mode = 2
+        self._read_table(table_name)
+
+    def _read_results_records(self, table, records):
+        """
+        Reads the indexed records (table 3 header and table 4 results) of
+        a results table without reading the other records in the table
+
+        Parameters
+        ----------
+        table : OP2IndexTable
+            the table to read
+        records : List[OP2IndexRecord]
+            the records to read in file order
+        """
+        self._goto(table.n)
+        self._count = table.count
+        self._read_results_table_header()
+
+        table3_parser, table4_parser = self._get_table_mapper()[self.table_name]
+        self._table4_count = 0
+        self.is_table_1 = True
+        self._data_factor = 1
+        for record in records:
+            self._goto(record.n3)
+            self.is_start_of_subtable = True
+            self._read_subtable_3_4(table3_parser, table4_parser, False)
+            self._goto(record.n)
+            self._read_subtable_3_4(table3_parser, table4_parser, False)
+        self.finish()
+
     def _read_tol(self):
         """
         This is probably broken for MSC Nastran
@@ -2245,6 +2423,13 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         """
         Reads a results table
         """
+        self._read_results_table_header()
+        self._read_subtables()
+
+    def _read_results_table_header(self):
+        """
+        Reads the name and date records at the start of a results table
+        """
         if self.is_debug_file:
             self.binary_debug.write('read_results_table - %s\n' % self.table_name)
         self.table_name = self._read_table_name(rewind=False)
@@ -2288,7 +2473,6 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         if hasattr(self, 'subtable_name'):
             raise RuntimeError('the file hasnt been cleaned up; subtable_name_old=%s new=%s' % (self.subtable_name, subtable_name))
         self.subtable_name = subtable_name
-        self._read_subtables()
 
     def _print_month(self, month, day, year, zero, one):
         """
@@ -35,6 +35,18 @@ class BaseScalarObject(Op2Codes):
         #self.ntotal = 0
         #assert isinstance(self.name, (text_type, binary_type)), 'name=%s type=%s' % (self.name, type(self.name))
 
+    def __getattr__(self, name):
+        """
+        Reads the data of a result from an OP2 that was read with
+        ``lazy=True`` the first time a missing attribute (e.g. data) is used
+        """
+        lazy_loader = self.__dict__.get('_lazy_loader')
+        if lazy_loader is None or name.startswith('__'):
+            raise AttributeError("%r object has no attribute %r" % (
+                self.__class__.__name__, name))
+        lazy_loader(self)
+        return getattr(self, name)
+
     def object_attributes(self, mode='public', keys_to_skip=None):
         if keys_to_skip is None:
             keys_to_skip = []
@@ -74,27 +74,25 @@ class TableArray(ScalarObject):  # displacement style table
             msg += '%s\n' % str(self.code_information())
             ntimes = self.data.shape[0]
 
+            # SORT1 and SORT2 results both use (ntimes, nnodes, 6)
             i = 0
-            if self.is_sort1():
-                for itime in range(ntimes):
-                    for inid, nid_gridtype, in enumerate(self.node_gridtype):
-                        (nid, grid_type) = nid_gridtype
-                        t1 = self.data[itime, inid, :]
-                        t2 = table.data[itime, inid, :]
-                        (tx, ty, tz, rx, ry, rz) = t1
-                        (tx2, ty2, tz2, rx2, ry2, rz2) = t2
-                        if not allclose(t1, t2):
-                        #if not np.array_equal(t1, t2):
-                            msg += '(%s, %s)\n  (%s, %s, %s, %s, %s, %s)\n  (%s, %s, %s, %s, %s, %s)\n' % (
-                                nid, grid_type,
-                                tx, ty, tz, rx, ry, rz,
-                                tx2, ty2, tz2, rx2, ry2, rz2)
-                            i += 1
-                        if i > 10:
-                            print(msg)
-                            raise ValueError(msg)
-            else:
-                raise NotImplementedError(self.is_sort2())
+            for itime in range(ntimes):
+                for inid, nid_gridtype, in enumerate(self.node_gridtype):
+                    (nid, grid_type) = nid_gridtype
+                    t1 = self.data[itime, inid, :]
+                    t2 = table.data[itime, inid, :]
+                    (tx, ty, tz, rx, ry, rz) = t1
+                    (tx2, ty2, tz2, rx2, ry2, rz2) = t2
+                    if not allclose(t1, t2):
+                    #if not np.array_equal(t1, t2):
+                        msg += '(%s, %s)\n  (%s, %s, %s, %s, %s, %s)\n  (%s, %s, %s, %s, %s, %s)\n' % (
+                            nid, grid_type,
+                            tx, ty, tz, rx, ry, rz,
+                            tx2, ty2, tz2, rx2, ry2, rz2)
+                        i += 1
+                    if i > 10:
+                        print(msg)
+                        raise ValueError(msg)
             if i > 0:
                 print(msg)
                 raise ValueError(msg)
@@ -106,8 +104,10 @@ class TableArray(ScalarObject):  # displacement style table
         assert self.nonlinear_factor is not None
         assert result.nonlinear_factor is not None
         # self.ntimes += result.ntimes
-        self.ntotal += result.data.shape[0]
-        self.data = append_sort1_sort2(self.data, result.data)
+        self.ntotal += result.data.shape[1]
+        # the SORT2 data is stored as (ntimes, nnodes, 6), so it's
+        # just more nodes
+        self.data = hstack([self.data, result.data])
         #print(self._times)
         #print(result._times)
         # self._times = hstack([self._times, result._times])
@@ -143,7 +143,7 @@ class TableArray(ScalarObject):  # displacement style table
             assert nminor == ntotal, 'ntotal=%s expected=%s' % (nminor, nnodes)
         else:
             assert nmajor == nnodes, 'nnodes=%s expected=%s' % (nmajor, nnodes)
-            assert nminor == ntotal, 'ntotal=%s expected=%s' % (nminor, ntimes)
+            assert nminor == ntimesi, 'ntotal=%s expected=%s' % (nminor, ntimes)
 
         msg.append('  isubcase = %s\n' % self.isubcase)
         if self.nonlinear_factor is not None:  # transient
@@ -195,11 +195,13 @@ class TableArray(ScalarObject):  # displacement style table
             ny = self.ntotal
             #print("ntimes=%s nnodes=%s" % (ntimes, nnodes))
         if self.is_sort2():
+            # each table 4 record is a node with all the times, but the
+            # data is stored in the SORT1 layout
             ntotal = self.ntotal
             nnodes = self.ntimes
             ntimes = self.ntotal
-            nx = nnodes
-            ny = ntimes
+            nx = ntimes
+            ny = nnodes
             #print("ntotal=%s nnodes=%s ntimes=%s" % (ntotal, nnodes, ntimes))
 
         self._times = zeros(ntimes, dtype=self._times_dtype)
@@ -342,18 +344,10 @@ class TableArray(ScalarObject):  # displacement style table
         msg += "                    v4=%s v5=%s v6=%s" % (v4, v5, v6)
         self._times[self.itotal] = dt
 
-        if 1:  # this is needed for SORT1 tables
-            inode = self.itime
-            self.node_gridtype[self.itime, :] = [node_id, grid_type]
-            self.data[self.itime, self.itotal, :] = [v1, v2, v3, v4, v5, v6]
-            # itotal - the node number
-            # itime - the time/frequency step
-        else:
-            self.node_gridtype[self.itime, :] = [node_id, grid_type]
-            self.data[self.itotal, self.itime, :] = [v1, v2, v3, v4, v5, v6]
-            # itotal - the time/frequency step
-            # itime - the node number
-
+        # itotal - the time/frequency step
+        # itime - the node number
+        self.node_gridtype[self.itime, :] = [node_id, grid_type]
+        self.data[self.itotal, self.itime, :] = [v1, v2, v3, v4, v5, v6]
         self.itotal += 1
         #self.itime += 1
 
@@ -631,12 +625,12 @@ class RealTableArray(TableArray):  # displacement style table
         gridtypes = self.node_gridtype[:, 1]
         times = self._times
         for inode, (node_id, gridtypei) in enumerate(zip(nodes, gridtypes)):
-            t1 = self.data[inode, :, 0]
-            t2 = self.data[inode, :, 1]
-            t3 = self.data[inode, :, 2]
-            r1 = self.data[inode, :, 3]
-            r2 = self.data[inode, :, 4]
-            r3 = self.data[inode, :, 5]
+            t1 = self.data[:, inode, 0]
+            t2 = self.data[:, inode, 1]
+            t3 = self.data[:, inode, 2]
+            r1 = self.data[:, inode, 3]
+            r2 = self.data[:, inode, 4]
+            r3 = self.data[:, inode, 5]
 
             header[1] = ' POINT-ID = %10i\n' % node_id
             f.write(''.join(header + words))
@@ -850,12 +844,12 @@ class ComplexTableArray(TableArray):  # displacement style table
         for inode, (node_id, gridtypei) in enumerate(zip(node, gridtype)):
             # TODO: for SORT1 pretending to be SORT2
             #t1 = self.data[:, inode, 0].ravel()
-            t1 = self.data[inode, :, 0]
-            t2 = self.data[inode, :, 1]
-            t3 = self.data[inode, :, 2]
-            r1 = self.data[inode, :, 3]
-            r2 = self.data[inode, :, 4]
-            r3 = self.data[inode, :, 5]
+            t1 = self.data[:, inode, 0]
+            t2 = self.data[:, inode, 1]
+            t3 = self.data[:, inode, 2]
+            r1 = self.data[:, inode, 3]
+            r2 = self.data[:, inode, 4]
+            r3 = self.data[:, inode, 5]
             if len(r3) != len(times):
                 raise RuntimeError('len(d)=%s len(times)=%s' % (len(r3), len(times)))
 
@@ -4,6 +4,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from six import b
 from six.moves import range
 from struct import unpack, Struct
+import numpy as np
 
 from pyNastran.bdf.bdf import (NSM, PBAR, PBARL, PBEAM,
                                PROD, PSHELL, PSHEAR,
@@ -410,20 +411,16 @@ class EPT(GeomCommon):
         """
         PROD(902,9,29) - the marker for Record 49
         """
-        ntotal = 24  # 6*4
-        s = Struct(b(self._endian + '2i4f'))
-        nproperties = (len(data) - n) // ntotal
-        for i in range(nproperties):
-            edata = data[n:n+24]
-            out = s.unpack(edata)
-            (pid, mid, a, j, c, nsm) = out
-            prop = PROD.add_op2_data(out)
-            if self.is_debug_file:
-                self.binary_debug.write('  PROD=%s\n' % str(out))
+        dtype = [('pid', 'i4'), ('mid', 'i4'), ('A', 'f4'), ('j', 'f4'),
+                 ('c', 'f4'), ('nsm', 'f4')]
+        add_cards = lambda props: self._add_op2_properties(props, PROD)
+        return self._read_geom_array('PROD', data, n, dtype, add_cards)
+
+    def _add_op2_properties(self, props, Property):
+        """creates the properties from the decoded entries"""
+        for out in props.tolist():
+            prop = Property.add_op2_data(out)
             self._add_op2_property(prop)
-            n += ntotal
-        self.card_count['PROD'] = nproperties
-        return n
 
     def _read_pshear(self, data, n):
         """
@@ -447,46 +444,31 @@ class EPT(GeomCommon):
         """
         PSHELL(2302,23,283) - the marker for Record 51
         """
-        ntotal = 44  # 11*4
-        s = Struct(b(self._endian + 'iififi4fi'))
-        nproperties = (len(data) - n) // ntotal
-        for i in range(nproperties):
-            edata = data[n:n+44]
-            out = s.unpack(edata)
-            (pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  PSHELL=%s\n' % str(out))
+        dtype = [('pid', 'i4'), ('mid1', 'i4'), ('t', 'f4'), ('mid2', 'i4'),
+                 ('bk', 'f4'), ('mid3', 'i4'), ('ts', 'f4'), ('nsm', 'f4'),
+                 ('z1', 'f4'), ('z2', 'f4'), ('mid4', 'i4')]
+        return self._read_geom_array('PSHELL', data, n, dtype, self._add_pshells)
+
+    def _add_pshells(self, props):
+        """creates the PSHELLs from the decoded entries"""
+        ids = np.column_stack([props['pid'], props['mid1'], props['mid2'],
+                               props['mid3'], props['mid4']])
+        is_big = (ids.max(axis=1) > 1e8).tolist()
+        for out, is_bigi in zip(props.tolist(), is_big):
             prop = PSHELL.add_op2_data(out)
-
-            if max(pid, mid1, mid2, mid3, mid4) > 1e8:
-                #print("PSHELL = ",out)
-                self.bigProperties[pid] = prop
+            if is_bigi:
+                self.bigProperties[prop.pid] = prop
             else:
                 self._add_op2_property(prop)
-            n += ntotal
-        self.card_count['PSHELL'] = nproperties
-        return n
 
     def _read_psolid(self, data, n):
         """
         PSOLID(2402,24,281) - the marker for Record 52
         """
-        #print("reading PSOLID")
-        ntotal = 28  # 7*4
-        s = Struct(b(self._endian + '6i4s'))
-        nproperties = (len(data) - n) // ntotal
-        for i in range(nproperties):
-            edata = data[n:n+28]
-            out = s.unpack(edata)
-            #(pid, mid, cid, inp, stress, isop, fctn) = out
-            #data_in = [pid, mid, cid, inp, stress, isop, fctn]
-            if self.is_debug_file:
-                self.binary_debug.write('  PSOLID=%s\n' % str(out))
-            prop = PSOLID.add_op2_data(out)
-            self._add_op2_property(prop)
-            n += ntotal
-        self.card_count['PSOLID'] = nproperties
-        return n
+        dtype = [('pid', 'i4'), ('mid', 'i4'), ('cid', 'i4'), ('inp', 'i4'),
+                 ('stress', 'i4'), ('isop', 'i4'), ('fctn', 'S4')]
+        add_cards = lambda props: self._add_op2_properties(props, PSOLID)
+        return self._read_geom_array('PSOLID', data, n, dtype, add_cards)
 
 # PSOLIDL
 # PTRIA6
@@ -234,25 +234,26 @@ class GEOM1(GeomCommon):
         self._increase_card_count('CORD3G', nentries)
         return n
 
-    def _read_grid(self, data, n):  # 21.8 sec, 18.9
+    def _read_grid(self, data, n):
         """(4501,45,1) - the marker for Record 17"""
-        s = Struct(b(self._endian + 'ii3f3i'))
-        ntotal = 32
-        nentries = (len(data) - n) // ntotal
-        self._increase_card_count('GRID', nentries)
-        for i in range(nentries):
-            edata = data[n:n + 32]
-            out = s.unpack(edata)
-            (nid, cp, x1, x2, x3, cd, ps, seid) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  GRID=%s\n' % str(out))
-            if cd >= 0 and nid < 10000000:
-                node = GRID(nid, cp, np.array([x1, x2, x3]), cd, ps, seid)
-                self.add_node(node)
-            else:
-                self.log.debug("*nid=%s cp=%s x1=%-5.2f x2=%-5.2f x3=%-5.2f cd=%-2s ps=%s seid=%s" % (nid, cp, x1, x2, x3, cd, ps, seid))
-            n += ntotal
-        return n
+        dtype = [('nid', 'i4'), ('cp', 'i4'), ('xyz', 'f4', (3,)),
+                 ('cd', 'i4'), ('ps', 'i4'), ('seid', 'i4')]
+        return self._read_geom_array('GRID', data, n, dtype, self._add_grids)
+
+    def _add_grids(self, grids):
+        """creates the GRIDs from the decoded GRID entries"""
+        is_valid = (grids['cd'] >= 0) & (grids['nid'] < 10000000)
+        for (nid, cp, xyz, cd, ps, seid) in grids[~is_valid].tolist():
+            x1, x2, x3 = xyz
+            self.log.debug("*nid=%s cp=%s x1=%-5.2f x2=%-5.2f x3=%-5.2f cd=%-2s ps=%s seid=%s" % (nid, cp, x1, x2, x3, cd, ps, seid))
+
+        grids = grids[is_valid]
+        xyzs = grids['xyz'].astype('float64')
+        fields = ['nid', 'cp', 'cd', 'ps', 'seid']
+        for (nid, cp, cd, ps, seid), xyz in zip(
+                zip(*[grids[field].tolist() for field in fields]), xyzs):
+            node = GRID(nid, cp, xyz, cd, ps, seid)
+            self.add_node(node)
 
     def _read_seqgp(self, data, n):
         """(5301,53,4) - the marker for Record 27"""
@@ -597,28 +597,35 @@ class GEOM2(GeomCommon):
         """
         CHEXA(7308,73,253) - the marker for Record 45
         """
-        s = Struct(b(self._endian + '22i'))
-        ntotal = 88  # 22*4
-        nelements = (len(data) - n) // ntotal
-        for i in range(nelements):
-            edata = data[n:n+88]
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CHEXA=%s\n' % str(out))
-            (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
-             g11, g12, g13, g14, g15, g16, g17, g18, g19, g20) = out
-
-            data_in = [eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, ]
-            big_nodes = [g9, g10, g11, g12, g13, g14, g15, g16,
-                         g17, g18, g19, g20]
-            if sum(big_nodes) > 0:
-                elem = CHEXA20(None, data_in + big_nodes)
+        dtype = [('eid', 'i4'), ('pid', 'i4'), ('nodes', 'i4', (20,))]
+        add_cards = lambda elements: self._add_solids(elements, 8, CHEXA8, CHEXA20)
+        return self._read_geom_array('CHEXA', data, n, dtype, add_cards)
+
+    def _add_solids(self, elements, nnodes, Element, ElementMidside):
+        """
+        creates the CTETRA/CPENTA/CHEXA elements from the decoded entries
+
+        Parameters
+        ----------
+        elements : (nelements, ) structured ndarray
+            the eid, pid, nodes of the elements
+        nnodes : int
+            the number of corner nodes
+        Element : class
+            the corner node element (e.g., CTETRA4)
+        ElementMidside : class
+            the midside node element (e.g., CTETRA10)
+        """
+        nodes = elements['nodes']
+        is_midside = nodes[:, nnodes:].sum(axis=1) > 0
+        for eid, pid, nids, is_midsidei in zip(elements['eid'].tolist(),
+                                               elements['pid'].tolist(),
+                                               nodes.tolist(), is_midside.tolist()):
+            if is_midsidei:
+                elem = ElementMidside(None, [eid, pid] + nids)
             else:
-                elem = CHEXA8(None, data_in)
+                elem = Element(None, [eid, pid] + nids[:nnodes])
             self.addOp2Element(elem)
-            n += ntotal
-        self.card_count['CHEXA'] = nelements
-        return n
 
 # CHEXA20F
 # CHEXAFD
@@ -817,26 +824,9 @@ class GEOM2(GeomCommon):
         """
         CPENTA(4108,41,280) - the marker for Record 62
         """
-        s = Struct(b(self._endian + '17i'))
-        nelements = (len(data) - n) // 68
-        for i in range(nelements):
-            edata = data[n:n + 68]  # 17*4
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CPENTA=%s\n' % str(out))
-            (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
-             g11, g12, g13, g14, g15) = out
-
-            data_in = [eid, pid, g1, g2, g3, g4, g5, g6]
-            bigNodes = [g7, g8, g9, g10, g11, g12, g13, g14, g15]
-            if sum(bigNodes) > 0:
-                elem = CPENTA15(None, data_in + bigNodes)
-            else:
-                elem = CPENTA6(None, data_in)
-            self.addOp2Element(elem)
-            n += 68
-        self.card_count['CPENTA'] = nelements
-        return n
+        dtype = [('eid', 'i4'), ('pid', 'i4'), ('nodes', 'i4', (15,))]
+        add_cards = lambda elements: self._add_solids(elements, 6, CPENTA6, CPENTA15)
+        return self._read_geom_array('CPENTA', data, n, dtype, add_cards)
 
 # CPENPR
 # CPENT15F
@@ -882,26 +872,20 @@ class GEOM2(GeomCommon):
         """
         common method for CQUAD4, CQUADR
         """
-        nelements = (len(data) - n) // 56
-        s = Struct(b(self._endian + '6iffii4f'))
-        if self.is_debug_file:
-            self.binary_debug.write('ndata=%s\n' % (nelements * 44))
-        for i in range(nelements):
-            edata = data[n:n + 56]  # 14*4
-            out = s.unpack(edata)
-            (eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag,
-             t1, t2, t3, t4) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  %s=%s\n' % (Element.type, str(out)))
-            #print("eid=%s pid=%s n1=%s n2=%s n3=%s n4=%s theta=%s zoffs=%s blank=%s tflag=%s t1=%s t2=%s t3=%s t4=%s" %(eid,pid,n1,n2,n3,n4,theta,zoffs,blank,tflag,t1,t2,t3,t4))
-            data_init = [
-                eid, pid, n1, n2, n3, n4, theta, zoffs,
-                tflag, t1, t2, t3, t4]
+        dtype = [('eid', 'i4'), ('pid', 'i4'), ('nodes', 'i4', (4,)),
+                 ('theta', 'f4'), ('zoffs', 'f4'), ('blank', 'i4'), ('tflag', 'i4'),
+                 ('T', 'f4', (4,))]
+        add_cards = lambda elements: self._add_shells(elements, Element)
+        return self._read_geom_array(Element.type, data, n, dtype, add_cards)
+
+    def _add_shells(self, elements, Element):
+        """creates the CTRIA3/CQUAD4/CQUADR/CQUADX elements from the decoded entries"""
+        fields = ['eid', 'pid', 'nodes', 'theta', 'zoffs', 'tflag', 'T']
+        for (eid, pid, nids, theta, zoffs, tflag, T) in zip(
+                *[elements[field].tolist() for field in fields]):
+            data_init = [eid, pid] + nids + [theta, zoffs, tflag] + T
             elem = Element.add_op2_data(data_init)
             self.addOp2Element(elem)
-            n += 56
-        self.card_count[Element.type] = nelements
-        return n
 
 # CQUAD4FD
 
@@ -952,19 +936,14 @@ class GEOM2(GeomCommon):
         """
         CROD(3001,30,48)    - the marker for Record 80
         """
-        s = Struct(b(self._endian + '4i'))
-        nelements = (len(data) - n) // 16  # 4*4
-        for i in range(nelements):
-            edata = data[n:n + 16]
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CROD=%s\n' % str(out))
-            (eid, pid, n1, n2) = out
+        dtype = [('eid', 'i4'), ('pid', 'i4'), ('n1', 'i4'), ('n2', 'i4')]
+        return self._read_geom_array('CROD', data, n, dtype, self._add_crods)
+
+    def _add_crods(self, elements):
+        """creates the CRODs from the decoded entries"""
+        for out in elements.tolist():
             elem = CROD.add_op2_data(out)
             self.addOp2Element(elem)
-            n += 16
-        self.card_count['CROD'] = nelements
-        return n
 
 # CRROD
 # CSEAM
@@ -1022,26 +1001,9 @@ class GEOM2(GeomCommon):
         """
         CTETRA(5508,55,217)    - the marker for Record 87
         """
-        s = Struct(b(self._endian + '12i'))
-        nelements = (len(data) - n)// 48  # 12*4
-        for i in range(nelements):
-            edata = data[n:n + 48]
-            out = s.unpack(edata)
-            if self.is_debug_file:
-                self.binary_debug.write('  CTETRA=%s\n' % str(out))
-            (eid, pid, n1, n2, n3, n4, n5, n6, n7, n8, n9, n10) = out
-            #print("out = ",out)
-
-            data_in = [eid, pid, n1, n2, n3, n4]
-            bigNodes = [n5, n6, n7, n8, n9, n10]
-            if sum(bigNodes) > 0:
-                elem = CTETRA10(None, data_in + bigNodes)
-            else:
-                elem = CTETRA4(None, data_in)
-            self.addOp2Element(elem)
-            n += 48
-        self.card_count['CTETRA'] = nelements
-        return n
+        dtype = [('eid', 'i4'), ('pid', 'i4'), ('nodes', 'i4', (10,))]
+        add_cards = lambda elements: self._add_solids(elements, 4, CTETRA4, CTETRA10)
+        return self._read_geom_array('CTETRA', data, n, dtype, add_cards)
 
 # CTETPR
 # CTETR10F
@@ -1053,23 +1015,11 @@ class GEOM2(GeomCommon):
         """
         CTRIA3(5959,59,282)    - the marker for Record 93
         """
-        ntotal = 52  # 13*4
-        s = Struct(b(self._endian + '5iff3i3f'))
-        nelements = (len(data) - n)// 52  # 13*4
-        for i in range(nelements):
-            edata = data[n:n+52]
-            out = s.unpack(edata)
-            #print("eid=%s pid=%s n1=%s n2=%s n3=%s theta=%s zoffs=%s blank1=%s blank2=%s tflag=%s t1=%s t2=%s t3=%s" %(eid,pid,n1,n2,n3,theta,zoffs,blank1,blank2,tflag,t1,t2,t3))
-            (eid, pid, n1, n2, n3, theta, zoffs, blank1,
-             blank2, tflag, t1, t2, t3) = out
-            if self.is_debug_file:
-                self.binary_debug.write('  CTRIA3=%s\n' % str(out))
-            data_in = [eid, pid, n1, n2, n3, theta, zoffs, tflag, t1, t2, t3]
-            elem = CTRIA3.add_op2_data(data_in)
-            self.addOp2Element(elem)
-            n += ntotal
-        self.card_count['CTRIA3'] = nelements
-        return n
+        dtype = [('eid', 'i4'), ('pid', 'i4'), ('nodes', 'i4', (3,)),
+                 ('theta', 'f4'), ('zoffs', 'f4'), ('blank', 'i4', (2,)), ('tflag', 'i4'),
+                 ('T', 'f4', (3,))]
+        add_cards = lambda elements: self._add_shells(elements, CTRIA3)
+        return self._read_geom_array('CTRIA3', data, n, dtype, add_cards)
 
 
 # CTRIAFD
@@ -1,4 +1,8 @@
 
+from collections import defaultdict
+import numpy as np
+
+
 class SuppressLogging(object):
     def __init__(self):
         pass
@@ -29,5 +33,85 @@ class GeomCommon(object):
         self.binary_debug = SuppressFileIO()
         self.log = SuppressLogging()
 
+        #: only decode the vectorized cards (e.g., GRID, CTETRA, PSHELL, MAT1)
+        #: into arrays; the card objects are created by build_geom_cards
+        self.geom_arrays_only = False
+        #: card_name -> List[structured ndarray]
+        self._geom_arrays = defaultdict(list)
+        #: [(add_cards, array)] that haven't been turned into card objects
+        self._geom_arrays_to_build = []
+
     def _read_fake(self, data, n):
         return len(data)
+
+    def _read_geom_array(self, card_name, data, n, dtype, add_cards):
+        """
+        Decodes the fixed length entries of a record with a single
+        ``np.frombuffer`` call
+
+        Parameters
+        ----------
+        card_name : str
+            the card (e.g., 'GRID')
+        data : bytes
+            the record
+        n : int
+            the start of the entries in the record
+        dtype : List[tuple]
+            the (name, type) or (name, type, shape) of the fields, where
+            the type doesn't include the endian (e.g., 'i4', 'f4')
+        add_cards : function
+            add_cards(array) creates the card objects
+
+        Returns
+        -------
+        n : int
+            the end of the decoded entries
+        """
+        dtype = np.dtype([(field[0], self._endian + field[1]) + tuple(field[2:])
+                          for field in dtype])
+        nentries = (len(data) - n) // dtype.itemsize
+        array = np.frombuffer(data, dtype=dtype, count=nentries, offset=n)
+        if self.is_debug_file:
+            for out in array.tolist():
+                self.binary_debug.write('  %s=%s\n' % (card_name, str(out)))
+
+        self._geom_arrays[card_name].append(array)
+        self._increase_card_count(card_name, nentries)
+        if self.geom_arrays_only:
+            self._geom_arrays_to_build.append((add_cards, array))
+        else:
+            add_cards(array)
+        return n + nentries * dtype.itemsize
+
+    def get_geom_array(self, card_name):
+        """
+        Gets the decoded entries of a vectorized card
+
+        Parameters
+        ----------
+        card_name : str
+            the card (e.g., 'GRID', 'CTETRA', 'PSHELL', 'MAT1')
+
+        Returns
+        -------
+        array : (nentries, ) structured ndarray
+            the entries; the fields are the same as the OP2 record
+            (e.g., GRID -> nid, cp, xyz, cd, ps, seid)
+        """
+        if card_name not in self._geom_arrays:
+            raise KeyError('card_name=%r was not decoded; decoded cards=%s' % (
+                card_name, sorted(self._geom_arrays)))
+        arrays = self._geom_arrays[card_name]
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.hstack(arrays)
+
+    def build_geom_cards(self):
+        """
+        Creates the card objects that weren't created because of
+        ``geom_arrays_only``
+        """
+        for add_cards, array in self._geom_arrays_to_build:
+            add_cards(array)
+        self._geom_arrays_to_build = []
@@ -90,18 +90,15 @@ class MPT(GeomCommon):
         """
         MAT1(103,1,77) - record 2
         """
-        #print "reading MAT1"
-        ntotal = 48  # 12*4
-        s = Struct(b(self._endian + 'i10fi'))
-        nmaterials = (len(data) - n) // ntotal
-        for i in range(nmaterials):
-            edata = data[n:n+48]
-            out = s.unpack(edata)
-            (mid, E, G, nu, rho, A, TRef, ge, St, Sc, Ss, mcsid) = out
+        dtype = [('mid', 'i4'), ('E', 'f4'), ('G', 'f4'), ('nu', 'f4'),
+                 ('rho', 'f4'), ('A', 'f4'), ('TRef', 'f4'), ('ge', 'f4'),
+                 ('St', 'f4'), ('Sc', 'f4'), ('Ss', 'f4'), ('mcsid', 'i4')]
+        return self._read_geom_array('MAT1', data, n, dtype, self._add_mat1s)
+
+    def _add_mat1s(self, materials):
+        """creates the MAT1s from the decoded entries"""
+        for out in materials.tolist():
             self.addOp2Material(MAT1.add_op2_data(out))
-            n += ntotal
-        self.card_count['MAT1'] = nmaterials
-        return n
 
     def _read_mat2(self, data, n):
         """
@@ -8,7 +8,7 @@ from six import b
 from six.moves import range
 from struct import Struct
 import numpy as np
-from numpy import fromstring, vstack, sin, cos, radians, array
+from numpy import frombuffer, vstack, sin, cos, radians, array
 from numpy import hstack, zeros
 
 from pyNastran.op2.op2_helper import polar_to_real_imag
@@ -379,16 +379,16 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
 
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 9)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 9)
                     s = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
                     #print(s)
                     #print('itime = ', obj.itime)
                     #print('---------')
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -401,6 +401,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -472,14 +473,14 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                     eids = ints[:, 0] // 10
                     assert eids.min() > 0, eids.min()
                     obj.element[itotal:itotal2] = eids
-                    strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 9)
+                    strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 9)
                     obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                     #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux]
@@ -489,6 +490,7 @@ class OEF(OP2Common):
                 else:
                     # no zed on this element for some reason...
                     s = Struct(b(self._endian + 'i8s6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         n += ntotal
@@ -513,14 +515,14 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
-                        strings = fromstring(data, dtype=self._endian + 'S4').reshape(nelements, 10)
+                        strings = frombuffer(data, dtype=self._endian + 'S4').reshape(nelements, 10)
                         obj.element_data_type[itotal:itotal2] = array([s1+s2 for s1, s2 in zip(strings[:, 1], strings[:, 2])])
 
                     #[etype, xgrad, ygrad, zgrad, xflux, yflux, zflux, zed]
@@ -529,6 +531,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s6fi'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         n += ntotal
@@ -580,10 +583,10 @@ class OEF(OP2Common):
                         ielement2 = obj.itotal + nelements
                         itotal2 = ielement2
 
-                        floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                         obj._times[obj.itime] = dt
                         if obj.itime == 0:
-                            ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                            ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                             eids = ints[:, 0] // 10
                             assert eids.min() > 0, eids.min()
                             obj.element[itotal:itotal2] = eids
@@ -595,6 +598,7 @@ class OEF(OP2Common):
                         obj.ielement = ielement2
                     else:
                         s1 = Struct(b(self._endian + 'i8s5f'))
+                        self._add_unvectorized_table(nelements)
                         for i in range(nelements):
                             edata = data[n:n+32]
                             n += ntotal
@@ -643,10 +647,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                         eids = ints[:, 0] // 10
                         nids = ints[:, 2]
                         assert eids.min() > 0, eids.min()
@@ -660,6 +664,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s1 = Struct(b(self._endian + 'ifif'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]
                         n += 16
@@ -719,11 +724,11 @@ class OEF(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     floats2 = floats[:, 2:].reshape(nelements * nnodes, 7)
                     obj._times[obj.itime] = dt
                     #if obj.itime == 0:
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     ints2 = ints[:, 2:].reshape(nelements * nnodes, 7)
                     eids = ints[:, 0] // 10
                     parent = ints[:, 1]
@@ -740,6 +745,7 @@ class OEF(OP2Common):
                     s1 = self.struct_2i
                     s2 = Struct(b(self._endian + 'i6f'))
                     grad_fluxes = []
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         out = s1.unpack(data[n:n+8])
                         n += 8
@@ -792,8 +798,8 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         eids = ints[:, 0] // 10
@@ -820,6 +826,7 @@ class OEF(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + '3i4s2i'))
                     s2 = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+24]  # 6*4
                         n += 24
@@ -875,8 +882,8 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         eids = ints[:, 0] // 10
@@ -901,6 +908,7 @@ class OEF(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + 'iii4s'))
                     s2 = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]  # 4*4
                         n += 16
@@ -1032,10 +1040,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1052,6 +1060,7 @@ class OEF(OP2Common):
 
                     obj = self.obj
                     s = Struct(b(self._endian + 'iff'))  # 3
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -1084,10 +1093,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1108,6 +1117,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i4f'))  # 5
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+20]
 
@@ -1151,10 +1161,10 @@ class OEF(OP2Common):
                     itotal2 = obj.itotal + nelements
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1172,6 +1182,7 @@ class OEF(OP2Common):
                     ntotal = 36
                     nelements = ndata // ntotal
                     obj = self.obj
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+36]
                         out = s.unpack(edata)
@@ -1198,10 +1209,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 100)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 100)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 100)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 100)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1225,6 +1236,7 @@ class OEF(OP2Common):
                 else:
                     s1 = self.struct_i
                     s2 = Struct(b(self._endian + 'i8f'))  # 36
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+4]
                         eid_device, = s1.unpack(edata)
@@ -1269,10 +1281,10 @@ class OEF(OP2Common):
                     ielement = obj.ielement
                     ielement2 = obj.ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 177)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 177)[:, 1:]
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 177)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 177)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         assert 0 not in eids, eids
@@ -1309,6 +1321,7 @@ class OEF(OP2Common):
                     s2 = Struct(b(self._endian + 'i15f'))
                     ntotal = 708  # (16*11+1)*4 = 177*4
                     nelements = ndata // ntotal
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+4]
                         eid_device, = s1.unpack(edata)
@@ -1432,10 +1445,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 2)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 2)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1446,6 +1459,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'if'))  # 2
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 8]
                         out = s.unpack(edata)
@@ -1477,10 +1491,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1500,6 +1514,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i2f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 12]
                         out = s.unpack(edata)
@@ -1543,10 +1558,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1557,6 +1572,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'iff'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+12]
 
@@ -1589,10 +1605,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1613,6 +1629,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i4f'))  # 5
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+20]
 
@@ -1657,10 +1674,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1671,6 +1688,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8f'))  # 9
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 36]
 
@@ -1683,7 +1701,6 @@ class OEF(OP2Common):
                         obj.add(dt, data_in)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 17: # imag
-                # TODO: vectorize
                 ntotal = 68  # 17*4
                 nelements = ndata // ntotal
 
@@ -1693,41 +1710,66 @@ class OEF(OP2Common):
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
-                s = Struct(b(self._endian + 'i16f'))
-                for i in range(nelements):
-                    edata = data[n:n + 68]
+                if self.use_vector and is_vectorized:
+                    n = nelements * 4 * self.num_wide
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements
 
-                    out = s.unpack(edata)
-                    (eid_device,
-                     bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
-                     bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
-                    eid = eid_device // 10
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element[itotal:itotal2] = eids
+
+                    #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
                     if is_magnitude_phase:
-                        bm1a = polar_to_real_imag(bm1ar, bm1ai)
-                        bm2a = polar_to_real_imag(bm2ar, bm2ai)
-                        bm1b = polar_to_real_imag(bm1br, bm1bi)
-                        bm2b = polar_to_real_imag(bm2br, bm2bi)
-                        ts1 = polar_to_real_imag(ts1r, ts1i)
-                        ts2 = polar_to_real_imag(ts2r, ts2i)
-                        af = polar_to_real_imag(afr, afi)
-                        trq = polar_to_real_imag(trqr, trqi)
+                        # float64 trig, so the values match the Struct path
+                        mag = floats[:, 1:9].astype('float64')
+                        phase = floats[:, 9:].astype('float64')
+                        real_imag = polar_to_real_imag(mag, phase)
                     else:
-                        bm1a = complex(bm1ar, bm1ai)
-                        bm2a = complex(bm2ar, bm2ai)
-                        bm1b = complex(bm1br, bm1bi)
-                        bm2b = complex(bm2br, bm2bi)
-                        ts1 = complex(ts1r, ts1i)
-                        ts2 = complex(ts2r, ts2i)
-                        af = complex(afr, afi)
-                        trq = complex(trqr, trqi)
-
-                    #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-                    #print "%s" % (self.get_element_type(self.element_type)), data_in
-                    #eid = obj.add_new_eid(out)
-                    obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
-                    n += ntotal
+                        real_imag = floats[:, 1:9] + 1.j * floats[:, 9:]
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                else:
+                    s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_table(nelements)
+                    for i in range(nelements):
+                        edata = data[n:n + 68]
+
+                        out = s.unpack(edata)
+                        (eid_device,
+                         bm1ar, bm2ar, bm1br, bm2br, ts1r, ts2r, afr, trqr,
+                         bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi) = out
+                        if self.is_debug_file:
+                            self.binary_debug.write('OEF_CBar - %s\n' % (str(out)))
+                        eid = eid_device // 10
+                        if is_magnitude_phase:
+                            bm1a = polar_to_real_imag(bm1ar, bm1ai)
+                            bm2a = polar_to_real_imag(bm2ar, bm2ai)
+                            bm1b = polar_to_real_imag(bm1br, bm1bi)
+                            bm2b = polar_to_real_imag(bm2br, bm2bi)
+                            ts1 = polar_to_real_imag(ts1r, ts1i)
+                            ts2 = polar_to_real_imag(ts2r, ts2i)
+                            af = polar_to_real_imag(afr, afi)
+                            trq = polar_to_real_imag(trqr, trqi)
+                        else:
+                            bm1a = complex(bm1ar, bm1ai)
+                            bm2a = complex(bm2ar, bm2ai)
+                            bm1b = complex(bm1br, bm1bi)
+                            bm2b = complex(bm2br, bm2bi)
+                            ts1 = complex(ts1r, ts1i)
+                            ts2 = complex(ts2r, ts2i)
+                            af = complex(afr, afi)
+                            trq = complex(trqr, trqi)
+
+                        #data_in = [bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                        #print "%s" % (self.get_element_type(self.element_type)), data_in
+                        #eid = obj.add_new_eid(out)
+                        obj.add_sort1(dt, eid, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)
+                        n += ntotal
             else:
                 msg = self.code_information()
                 return self._not_implemented_or_skip(data, ndata, msg)
@@ -1753,10 +1795,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1767,6 +1809,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i7f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+32]
 
@@ -1804,15 +1847,15 @@ class OEF(OP2Common):
                     return nelements * self.num_wide * 4
 
                 obj = self.obj
-                if is_vectorized:
+                if self.use_vector and is_vectorized:
                     n = nelements * 4 * self.num_wide
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[ielement:ielement2] = eids
@@ -1823,6 +1866,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+36]
                         out = s.unpack(edata)
@@ -1849,10 +1893,10 @@ class OEF(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1872,6 +1916,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+68]
                         out = s.unpack(edata)
@@ -1971,7 +2016,7 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_real)
                         # Nastran makes this a 4 for CQUAD4s instead
                         # of 0 like the bilinear stress element...
                         ints[:, 2] = 0
@@ -1982,7 +2027,7 @@ class OEF(OP2Common):
                         obj.element_node[istart:iend, 0] = eids2
                         obj.element_node[istart:iend, 1] = nids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                     results = floats[:, 2:].reshape(nlayers, 9)[:, 1:]
                     #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
                     obj.data[obj.itime, istart:iend, :] = results
@@ -1990,6 +2035,7 @@ class OEF(OP2Common):
                     s1 = Struct(b(self._endian + 'i4si8f'))  # 8+36
                     s2 = Struct(b(self._endian + 'i8f')) # 36
 
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 44]
 
@@ -2029,10 +2075,10 @@ class OEF(OP2Common):
                     ielement2 = obj.ielement + nelements
                     itotal2 = obj.itotal + nelements * nnodes_all
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_imag)
                         ints[:, 2] = 0
                         ints2 = ints[:, 2:].reshape(nelements * nnodes_all, 17)
 
@@ -2064,6 +2110,7 @@ class OEF(OP2Common):
                     ntotal = 8 + (nnodes + 1) * 68
                     nelements = ndata // ntotal
                     obj = self.obj
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 76]
                         n += 76
@@ -2140,27 +2187,11 @@ class OEF(OP2Common):
                 ntotal = 36
                 nelements = ndata // ntotal
 
-                s1 = Struct(b('i8sifffif'))
-                s2 = Struct(b('i8sifffff'))
-                for i in range(nelements):
-                    edata = data[n:n+ntotal]  # 4*9
-                    out = s1.unpack(edata)
-
-                    # i    8s              i        f
-                    (eid, failure_theory, ply_id, failure_index_for_ply,
-                     six, seven, flag, nine,
-                     #failure_index_for_bonding,
-                     #failure_index_for_element,
-                     #flag,
-                     #direct_stress_or_strain,
-                     #interlaminar_stress,
-                     #max_of_fb_fp_for_all_plies
-                     ) = out
-                    if flag != -1:
-                        out = s2.unpack(edata)
-                    #print(out)
-                    n += 36
-
+                # the composite failure indices aren't stored
+                #   [eid_device, failure_theory, ply_id, failure_index_for_ply,
+                #    failure_index_for_bonding, failure_index_for_element,
+                #    flag, max_of_fb_fp_for_all_plies]
+                n = nelements * ntotal
 
                 ## TODO: add
                 #return ndata
@@ -2255,10 +2286,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2270,6 +2301,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+68]
 
@@ -2313,10 +2345,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 33)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 33)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 33)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 33)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2343,6 +2375,7 @@ class OEF(OP2Common):
                     #self.create_transient_object(self.cshear_force, ComplexCShearForce)
                     s = Struct(b(self._endian + 'i32f'))
 
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+132]
                         n += ntotal
@@ -2421,10 +2454,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2435,6 +2468,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -2471,10 +2505,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2485,6 +2519,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+36]
 
@@ -2521,10 +2556,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 15)
                         eids = ints[:, 0] // 10
                         nids_a = ints[:, 1]
                         nids_b = ints[:, 8]
@@ -2543,6 +2578,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i i6fi6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
 
@@ -2590,10 +2626,10 @@ class OEF(OP2Common):
                     # 21     22     23     24     25    26
                     # bm1Br, bm2Br, ts1Br, ts2Br, afBr, trqBr,
                     # bm1Bi, bm2Bi, ts1Bi, ts2Bi, afBi, trqBi
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 27)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 27)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 27)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 27)
                         eids = ints[:, 0] // 10
                         nids_a = ints[:, 1]
                         nids_b = ints[:, 14]
@@ -2623,6 +2659,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i i12f i12f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+108]
                         n += ntotal
@@ -2717,10 +2754,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2731,6 +2768,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s7f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n : n + 40]
                         n += 40
@@ -2762,10 +2800,10 @@ class OEF(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 16)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 16)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 16)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 16)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -2792,6 +2830,7 @@ class OEF(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i8s13f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+64]
                         n += 64
@@ -2855,15 +2894,16 @@ class OEF(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
-                    results = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    results = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                     #[fx, fy, fz, mx, my, mz]
                     obj.data[obj.itime, istart:iend, :] = results[:, 1:]
                 else:
                     s = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+28]
                         out = s.unpack(edata)
@@ -2874,7 +2914,6 @@ class OEF(OP2Common):
                         obj.add(dt, eid, fx, fy, fz, mx, my, mz)
                         n += ntotal
             elif self.format_code in [2, 3] and self.num_wide == 13:  # imag
-                # TODO: vectorize
                 ntotal = 52  # 13*4
                 nelements = ndata // ntotal
                 result_name = 'cbush_force'
@@ -2883,37 +2922,61 @@ class OEF(OP2Common):
                 if auto_return:
                     return nelements * self.num_wide * 4
 
-                s = Struct(b(self._endian + 'i12f'))
-
                 obj = self.obj
-                for i in range(nelements):
-                    edata = data[n:n + 52]
+                if self.use_vector and is_vectorized:
+                    n = nelements * 4 * self.num_wide
+                    itotal = obj.itotal
+                    itotal2 = itotal + nelements
 
-                    out = s.unpack(edata)
-                    if self.is_debug_file:
-                        self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
-                    (eid_device,
-                     fxr, fyr, fzr, mxr, myr, mzr,
-                     fxi, fyi, fzi, mxi, myi, mzi) = out
-                    eid = eid_device // 10
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        obj.element[itotal:itotal2] = eids
 
+                    #[fx, fy, fz, mx, my, mz]
                     if is_magnitude_phase:
-                        fx = polar_to_real_imag(fxr, fxi)
-                        mx = polar_to_real_imag(mxr, mxi)
-                        fy = polar_to_real_imag(fyr, fyi)
-                        my = polar_to_real_imag(myr, myi)
-                        fz = polar_to_real_imag(fzr, fzi)
-                        mz = polar_to_real_imag(mzr, mzi)
+                        # float64 trig, so the values match the Struct path
+                        mag = floats[:, 1:7].astype('float64')
+                        phase = floats[:, 7:].astype('float64')
+                        real_imag = polar_to_real_imag(mag, phase)
                     else:
-                        fx = complex(fxr, fxi)
-                        mx = complex(mxr, mxi)
-                        fy = complex(fyr, fyi)
-                        my = complex(myr, myi)
-                        fz = complex(fzr, fzi)
-                        mz = complex(mzr, mzi)
-
-                    obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
-                    n += ntotal
+                        real_imag = floats[:, 1:7] + 1.j * floats[:, 7:]
+                    obj.data[obj.itime, itotal:itotal2, :] = real_imag
+                    obj.itotal = itotal2
+                else:
+                    s = Struct(b(self._endian + 'i12f'))
+                    self._add_unvectorized_table(nelements)
+                    for i in range(nelements):
+                        edata = data[n:n + 52]
+
+                        out = s.unpack(edata)
+                        if self.is_debug_file:
+                            self.binary_debug.write('OEF_CBUSH-102 - %s\n' % (str(out)))
+                        (eid_device,
+                         fxr, fyr, fzr, mxr, myr, mzr,
+                         fxi, fyi, fzi, mxi, myi, mzi) = out
+                        eid = eid_device // 10
+
+                        if is_magnitude_phase:
+                            fx = polar_to_real_imag(fxr, fxi)
+                            mx = polar_to_real_imag(mxr, mxi)
+                            fy = polar_to_real_imag(fyr, fyi)
+                            my = polar_to_real_imag(myr, myi)
+                            fz = polar_to_real_imag(fzr, fzi)
+                            mz = polar_to_real_imag(mzr, mzi)
+                        else:
+                            fx = complex(fxr, fxi)
+                            mx = complex(mxr, mxi)
+                            fy = complex(fyr, fyi)
+                            my = complex(myr, myi)
+                            fz = complex(fzr, fzi)
+                            mz = complex(mzr, mzi)
+
+                        obj.add_sort1(dt, eid, fx, fy, fz, mx, my, mz)
+                        n += ntotal
             else:
                 msg = self.code_information()
                 return self._not_implemented_or_skip(data, ndata, msg)
@@ -2953,6 +3016,7 @@ class OEF(OP2Common):
 
                 s1 = Struct(b(self._endian + '3i4s2i'))
                 s2 = Struct(b(self._endian + 'i3f3i5fi'))
+                self._add_unvectorized_table(nelements)
                 for i in range(nelements):
                     edata = data[n:n+24]  # 6*4
                     n += 24
@@ -2988,6 +3052,7 @@ class OEF(OP2Common):
                 s1 = Struct(b(self._endian + 'iii4sii'))
                 s2 = Struct(b(self._endian + 'i3f3i5fi3f3i5fi'))
                 nelements = ndata // ntotal
+                self._add_unvectorized_table(nelements)
                 for i in range(nelements):
                     edata = data[n:n+24]  # 6*4
                     n += 24
@@ -3059,6 +3124,7 @@ class OEF(OP2Common):
 
                 s1 = Struct(b(self._endian + 'iii4s'))
                 s2 = Struct(b(self._endian + 'i7f'))
+                self._add_unvectorized_table(nelements)
                 for i in range(nelements):
                     edata = data[n:n+16]  # 8*4
                     n += 16
@@ -3100,6 +3166,7 @@ class OEF(OP2Common):
                 nelements = ndata // ntotal
                 obj = self.obj
 
+                self._add_unvectorized_table(nelements)
                 for i in range(nelements):
                     edata = data[n:n+16]  # 8*4
                     n += 16
@@ -1423,16 +1423,16 @@ class ComplexCBarForceArray(ScalarObject):
                     for ieid, eid in enumerate(self.element):
                         t1 = self.data[itime, ieid, :]
                         t2 = table.data[itime, ieid, :]
-                        (s1a1, s2a1, s3a1, s4a1, axial1, s2a1, s2b1, s2c1, s2d1) = t1
-                        (s1a2, s2a2, s3a2, s4a2, axial2, s2a2, s2b2, s2c2, s2d2) = t2
+                        (bm1a1, bm2a1, bm1b1, bm2b1, ts11, ts21, af1, trq1) = t1
+                        (bm1a2, bm2a2, bm1b2, bm2b2, ts12, ts22, af2, trq2) = t2
                         #d = t1 - t2
-                        if not allclose([s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real],
-                                        [s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real], atol=0.0001):
+                        if not allclose([bm1a1, bm2a1, bm1b1, bm2b1, ts11, ts21, af1, trq1],
+                                        [bm1a2, bm2a2, bm1b2, bm2b2, ts12, ts22, af2, trq2], atol=0.0001):
                         #if not np.array_equal(t1, t2):
-                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s, %s)\m' % (
+                            msg += '%-4s  (%s, %s, %s, %s, %s, %s, %s, %s)\n      (%s, %s, %s, %s, %s, %s, %s, %s)\n' % (
                                 eid,
-                                s1a1.real, s2a1.real, s3a1.real, s4a1.real, axial1.real, s2a1.real, s2b1.real, s2c1.real, s2d1.real,
-                                s1a2.real, s2a2.real, s3a2.real, s4a2.real, axial2.real, s2a2.real, s2b2.real, s2c2.real, s2d2.real,
+                                bm1a1, bm2a1, bm1b1, bm2b1, ts11, ts21, af1, trq1,
+                                bm1a2, bm2a2, bm1b2, bm2b2, ts12, ts22, af2, trq2,
                                 )
                             i += 1
                         if i > 10:
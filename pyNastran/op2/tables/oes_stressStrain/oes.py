@@ -9,7 +9,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from six import b
 from six.moves import range
 from struct import Struct
-from numpy import fromstring, radians, sin, cos, vstack, repeat, array
+from numpy import frombuffer, radians, sin, cos, vstack, repeat, array
 import numpy as np
 
 from pyNastran.op2.op2_common import OP2Common
@@ -892,10 +892,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -906,6 +906,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i4f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -932,10 +933,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -954,6 +955,7 @@ class OES(OP2Common):
                     obj.itotal = itotal2
                     obj.ielement = ielement2
                 else:
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)
@@ -999,7 +1001,6 @@ class OES(OP2Common):
             slot = getattr(self, result_name)
 
             if self.format_code == 1 and self.num_wide == 111:  # real
-                # TODO: vectorize
                 ntotal = 444 # 44 + 10*40  (11 nodes)
 
                 if self.is_stress():
@@ -1015,39 +1016,67 @@ class OES(OP2Common):
                     self._data_factor = 11
                     return nelements * self.num_wide * 4
                 obj = self.obj
-                s = self.struct_i
-                nnodes = 10  # 11-1
-                ntotal = self.num_wide * 4
-                n1 = 44
-                n2 = 40
-                s1 = Struct(b(self._endian + 'ii9f'))
-                s2 = Struct(b(self._endian + 'i9f'))
-                nelements = ndata // ntotal
-                for i in range(nelements):
-                    edata = data[n:n+n1]
-                    n += n1
+                if self.use_vector and is_vectorized:
+                    n = nelements * 4 * self.num_wide
+                    itotal = obj.itotal
+                    itotal2 = obj.itotal + nelements * 11
+                    ielement = obj.ielement
+                    ielement2 = obj.ielement + nelements
 
-                    out = s1.unpack(edata)
-                    eid_device = out[0]
-                    eid = eid_device // 10
-                    if self.is_debug_file:
-                        self.binary_debug.write('CBEAM-2 - eid=%i out=%s\n' % (eid, str(out)))
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 111)[:, 1:]
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 111)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        eids2 = np.repeat(eids, 11)
 
-                    #(grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
-                    obj.add_new_eid(dt, eid, out[1:])
+                        ints2 = ints[:, 1:].reshape(nelements * 11, 10)
+                        nids = ints2[:, 0]
+                        obj.element_node[itotal:itotal2, 0] = eids2
+                        obj.element_node[itotal:itotal2, 1] = nids
 
-                    for inode in range(nnodes):
-                        edata = data[n:n+n2]
-                        n += n2
-                        out = s2.unpack(edata)
-                        # (grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
-                        obj.add(dt, eid, out)
+                    #[grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc]
+                    floats2 = floats.reshape(nelements * 11, 10)
+                    obj.xxb[itotal:itotal2] = floats2[:, 1]
+                    obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                    obj.itotal = itotal2
+                    obj.ielement = ielement2
+                else:
+                    s = self.struct_i
+                    nnodes = 10  # 11-1
+                    ntotal = self.num_wide * 4
+                    n1 = 44
+                    n2 = 40
+                    s1 = Struct(b(self._endian + 'ii9f'))
+                    s2 = Struct(b(self._endian + 'i9f'))
+                    nelements = ndata // ntotal
+                    self._add_unvectorized_table(nelements)
+                    for i in range(nelements):
+                        edata = data[n:n+n1]
+                        n += n1
+
+                        out = s1.unpack(edata)
+                        eid_device = out[0]
+                        eid = eid_device // 10
+                        if self.is_debug_file:
+                            self.binary_debug.write('CBEAM-2 - eid=%i out=%s\n' % (eid, str(out)))
+
+                        #(grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
+                        obj.add_new_eid(dt, eid, out[1:])
+
+                        for inode in range(nnodes):
+                            edata = data[n:n+n2]
+                            n += n2
+                            out = s2.unpack(edata)
+                            # (grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc) = out
+                            obj.add(dt, eid, out)
             elif self.format_code in [2, 3] and self.num_wide == 111:  # imag and random?
-                # TODO: vectorize
-                if self.read_mode == 1:
+                # the complex CBEAM isn't stored, so it's only unpacked for
+                # the debug file
+                if self.read_mode == 1 or not self.is_debug_file:
                     return ndata
-                if self.is_debug_file:
-                    self.binary_debug.write('skipping imag/random OES-CBEAM\n')
+                self.binary_debug.write('skipping imag/random OES-CBEAM\n')
 
                 ntotal = 444 # 44 + 10*40  (11 nodes)
                 #if self.is_stress():
@@ -1126,11 +1155,11 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 4)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 4)
                     itime = obj.itime
                     obj._times[itime] = dt
                     if itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 4)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 4)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1141,6 +1170,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i3f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)  # num_wide=5
@@ -1166,10 +1196,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 5)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 5)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 5)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 5)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1189,6 +1219,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i4f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)  # num_wide=5
@@ -1263,10 +1294,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 2)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 2)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 2)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 2)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1277,6 +1308,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'if'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -1304,10 +1336,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 3)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 3)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 3)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 3)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1327,6 +1359,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i2f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)
@@ -1396,11 +1429,11 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 16)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 16)
                         eids = ints[:, 0] // 10
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 16)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 16)
 
                     #[s1a, s2a, s3a, s4a, axial, smaxa, smina, margin_tension,
                     # s1b, s2b, s3b, s4b,        smaxb, sminb, margin_compression]
@@ -1409,6 +1442,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i15f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -1449,10 +1483,10 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements
                     ielement2 = itotal2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 19)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 19)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 19)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 19)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -1474,6 +1508,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i18f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         n += ntotal
@@ -1591,7 +1626,7 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
                         # (eid_device, cid, abcd, nnodes)
-                        ints = fromstring(data, dtype=self.idtype)
+                        ints = frombuffer(data, dtype=self.idtype)
                         try:
                             ints1 = ints.reshape(nelements, numwide_real)
                         except ValueError:
@@ -1620,7 +1655,7 @@ class OES(OP2Common):
                         obj.element_cid[itotal:itotali, 0] = eids
                         obj.element_cid[itotal:itotali, 1] = cids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
                     # 1     9    15   2    10   16  3   11  17   8
                     #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
                     #isave = [1, 9, 15, 2, 10, 16, 3, 11, 17, 8]
@@ -1655,6 +1690,7 @@ class OES(OP2Common):
                         msg += '                                 szz, sxz, s3, c1, c2, c3]\n'
                         self.binary_debug.write(msg)
 
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]
                         out = struct1.unpack(edata)
@@ -1720,11 +1756,11 @@ class OES(OP2Common):
                     itotal = obj.itotal
                     itotal2 = itotal + nelements * nnodes_expected
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 4:].reshape(nelements * nnodes_expected, 13)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_imag)
                         ints1 = ints[:, 4:].reshape(nelements * nnodes_expected, 13)
                         eids = ints[:, 0] // 10
                         cids = ints[:, 1]
@@ -1760,6 +1796,7 @@ class OES(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + '2i4si'))
                     s2 = Struct(b(self._endian + 'i12f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+16]
                         n += 16
@@ -1809,36 +1846,8 @@ class OES(OP2Common):
                     #self.num_wide, numwide_real, numwide_imag, numwide_random)
                 #return self._not_implemented_or_skip(data, ndata, msg)
 
-                num_wide_random = 4 + nnodes_expected * (17 - 4)
-                #if self.num_wide ==
-                if self.read_mode == 1:
-                    return ndata
+                # the random solid results aren't stored
                 return ndata
-                print('numwide=%s numwide_random=%s attempt2=%s subcase=%s' % (self.num_wide, numwide_random, num_wide_random, self.isubcase))
-                #msg = self.code_information()
-                ntotal = 130
-                nelements = ndata // ntotal
-
-                # cid, coord_type, nactive_pnts,
-                #      nid, oxx, oyy, ozz, txy, tyz, txz
-                struct1 = Struct(b('2i 4s'))
-                struct2 = Struct(b('i6f'))
-                for i in range(nelements):
-                    edata = data[n:n+12]
-                    out = struct1.unpack(edata)
-                    (eid_device, cid, abcd) = out
-                    eid = eid_device // 10
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s - eid=%i; %s\n' % (preline1, eid, str(out)))
-                    n += 12
-                    for inode in range(nnodes_expected):  # nodes pts, +1 for centroid (???)
-                        out = struct2.unpack(data[n:n + 28]) # 4*7 = 28
-                        if self.is_debug_file:
-                            self.binary_debug.write('%s - %s\n' % (preline2, str(out)))
-                        (grid_device, sxx, syy, sz, txy, tyz, txz) = out
-                #msg = 'OES-CHEXA-random-numwide=%s numwide_real=%s numwide_imag=%s numwide_random=%s' % (
-                    #self.num_wide, numwide_real, numwide_imag, numwide_random)
-                #return self._not_implemented_or_skip(data, ndata, msg)
             else:
                 raise RuntimeError(self.code_information())
 
@@ -1885,14 +1894,14 @@ class OES(OP2Common):
                     itotal2 = itotal + nelements * nnodes_expected
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype)
+                        ints = frombuffer(data, dtype=self.idtype)
                         ints1 = ints.reshape(nelements, numwide_real)
                         eids = ints1[:, 0] // 10
                         eids = np.vstack([eids, eids]).T.ravel()
                         assert eids.min() > 0, eids.min()
                         obj.element_node[itotal:itotal2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 1:]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 1:]
 
                     #fd, sx, sy, txy, angle, major, minor, max_shear
                     floats1 = floats.reshape(nelements * nnodes_expected, 8)
@@ -1902,6 +1911,7 @@ class OES(OP2Common):
                 else:
                     s = Struct(b(self._endian + 'i16f'))
                     cen = 0 # CEN/4
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -1939,11 +1949,11 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15 * nnodes_all)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15 * nnodes_all)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15 * nnodes_all)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, 15 * nnodes_all)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
                         ints1 = ints.reshape(nelements * nnodes_all, 15)
@@ -1978,6 +1988,7 @@ class OES(OP2Common):
                     s2 = Struct(b(self._endian + 'i14f'))
 
                     cen = 0 # 'CEN/4'
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+60]  # 4*15=60
                         n += 60
@@ -2081,7 +2092,7 @@ class OES(OP2Common):
 
                     itime = obj.itime
                     if itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 17)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 17)
                         eids = ints[:, 0] // 10
                         ilayers = ints[:, 1]
                         ints2 = ints[:, 1:].reshape(nlayers, 8)
@@ -2092,7 +2103,7 @@ class OES(OP2Common):
                         #obj.element_node[itotal:iend, 1] = 0
                         #print('obj.element_node\n', obj.element_node)
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 17)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 17)
                     floats1 = floats[:, 1:].reshape(nlayers, 8)
                     obj.data[obj.itime, itotal:iend, :] = floats1
                     obj._times[obj.itime] = dt
@@ -2101,6 +2112,7 @@ class OES(OP2Common):
                 else:
                     cen = 0 # 'CEN/3'
                     s = Struct(b(self._endian + 'i16f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)
@@ -2134,11 +2146,11 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 15)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 15)
                     floats1 = floats[:, 1:].reshape(nelements * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 15)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, 15)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
                         ints1 = ints.reshape(nelements, 15)
@@ -2170,6 +2182,7 @@ class OES(OP2Common):
                 else:
                     s = Struct(b(self._endian + 'i14f'))
                     cen = 0 # CEN/3
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)
@@ -2303,7 +2316,7 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_real)
                         ints1 = ints[:, 2:].reshape(nlayers//2, 17)[:, 0].reshape(nelements, nnodes_all)
                         ints1[:, 0] = 0.
                         nids = ints1.ravel()
@@ -2324,9 +2337,9 @@ class OES(OP2Common):
                             obj.float_mask = float_mask1
 
                     if obj.nonlinear_factor is not None:
-                        results = fromstring(data, dtype=self.fdtype)[obj.float_mask]
+                        results = frombuffer(data, dtype=self.fdtype)[obj.float_mask]
                     else:
-                        floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                        floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                         floats1 = floats[:, 2:].reshape(nlayers // 2, 17)
                         results = floats1[:, 1:].reshape(nlayers, 8)
 
@@ -2350,6 +2363,7 @@ class OES(OP2Common):
                         self.binary_debug.write('  nelements=%i; nnodes=%i # +1 centroid\n' % (nelements, nnodes))
 
                     grid_center = 0
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+76]
 
@@ -2407,12 +2421,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 2:].reshape(nelements * nnodes_all, 15)
                     floats2 = floats1[:, 1:].reshape(nelements * nnodes_all * 2, 7)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_imag)
                         ints[:, 2] = 0  # set center node to 0
                         ints1 = ints[:, 2:].reshape(nelements * nnodes_all, 15)
                         eids = ints[:, 0] // 10
@@ -2444,6 +2458,7 @@ class OES(OP2Common):
                     grid_center = 0
                     s1 = self.struct_2i  # 2
                     s2 = Struct(b(self._endian + 'i14f')) # 15
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         (eid_device, _) = s1.unpack(data[n:n+8])
                         n += 8
@@ -2561,20 +2576,21 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         obj.element_node[ielement:ielement2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
 
                     #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
                     #print(ints)
-                    floats[:, 1] = 0
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
+                    obj.data[obj.itime, ielement:ielement2, 0] = 0.
                     obj.ielement = ielement2
                     obj.itotal = ielement2
                 else:
                     s = Struct(b(self._endian + 'i12f'))  # 1+12=13
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)
@@ -2611,21 +2627,22 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         obj.element_node[ielement:ielement2, 0] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
 
                     #[fiber_distance, oxx, oyy, ozz, txy, exx, eyy, ezz, exy, es, eps, ecs]
                     #print(ints)
-                    floats[:, 1] = 0
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
+                    obj.data[obj.itime, ielement:ielement2, 0] = 0.
                     obj.ielement = ielement2
                     obj.itotal = ielement2
                 else:
                     etype = self.element_type
                     s = Struct(b(self._endian + 'i24f')) # 1+24=25
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)
@@ -2714,13 +2731,13 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 11)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
                         eids = ints[:, 0] // 10
                         nids = ints[:, 1]
                         obj.element_layer[istart:iend, 0] = eids
                         obj.element_layer[istart:iend, 1] = nids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 11)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                     #[o1, o2, t12, t1z, t2z, angle, major, minor, ovm]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 2:]
                 else:
@@ -2729,6 +2746,7 @@ class OES(OP2Common):
                     if hasattr(self, 'eid_old'):
                         eid_old = self.eid_old
 
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+44]  # 4*11
                         out = s.unpack(edata)
@@ -2746,41 +2764,10 @@ class OES(OP2Common):
                         eid_old = eid
                         n += 44
                     self.eid_old = eid_old
-            elif self.format_code in [2, 3] and self.num_wide == 9:  # TODO: imag? - not done...
-                # TODO: vectorize
-                aaa
+            elif self.format_code in [2, 3] and self.num_wide == 9:
+                # there is no complex composite plate result
                 msg = self.code_information()
-                nelements = ndata // ntotal
-                auto_return, is_vectorized = self._create_oes_object4(
-                    nelements, result_name, slot, obj_vector_complex)
-                if auto_return:
-                    return nelements * self.num_wide * 4
-
-                # TODO: this is an OEF result???
-                #    furthermore the actual table is calle dout as
-                #    'i8si4f4s', not 'i8si3fi4s'
-                ntotal = 36
-                nelements = ndata // ntotal
-                s = self.struct_i
-                s2 = Struct(b(self._endian + '8si3fi4s'))
-                s3 = Struct(b(self._endian + '8si4f4s'))
-                for i in range(nelements):
-                    #out = s.unpack(data[n:n + ntotal])
-                    eid_device, = s.unpack(data[n:n+4])
-                    #t, = s.unpack(data[n:n+4])
-
-                    if eid_device > 0:
-                        out = s2.unpack(data[n+4:n+ntotal])
-                    else:
-                        out1 = s2.unpack(data[n+4:n+ntotal])
-                        out = s3.unpack(data[n+4:n+ntotal])
-                    (theory, lamid, fp, fm, fb, fmax, fflag) = out
-
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s-%s - (%s) + %s\n' % (self.element_name, self.element_type, eid_device, str(out)))
-                    obj.add_new_eid(dt, eid, theory, lamid, fp, fm, fb, fmax, fflag)
-                    n += ntotal
-                raise NotImplementedError('this is a really weird case...')
+                return self._not_implemented_or_skip(data, ndata, msg)
             else:
                 #msg = self.code_information()
                 msg = 'OES-COMP-random-numwide=%s numwide_real=11 numwide_imag=9' % (self.num_wide)
@@ -2820,12 +2807,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 33)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 33)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 8)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 33)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, 33)
                         ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 8)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
@@ -2842,6 +2829,7 @@ class OES(OP2Common):
                 else:
                     s1 = Struct(b(self._endian + '2i7f'))  # 36
                     s2 = Struct(b(self._endian + 'i7f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         out = s1.unpack(data[n:n + 36])
                         (eid_device, loc, rs, azs, As, ss, maxp, tmax, octs) = out
@@ -2884,12 +2872,12 @@ class OES(OP2Common):
                     ielement = obj.ielement
                     ielement2 = ielement + nelements
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_imag)
                     floats1 = floats[:, 1:].reshape(nelements * nnodes_all, 9)
 
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_imag)
+                        ints = frombuffer(data, dtype=self.idtype).copy().reshape(nelements, numwide_imag)
                         ints1 = ints[:, 1:].reshape(nelements * nnodes_all, 9)
                         eids = ints[:, 0] // 10
                         ints[:, 0] = 0
@@ -2924,6 +2912,7 @@ class OES(OP2Common):
                     assert num_wide == self.num_wide, num_wide
                     nelements = ndata // ntotal  # (1+8*4)*4 = 33*4 = 132
 
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         out = s1.unpack(data[n:n + 40])
                         (eid_device, loc, rsr, rsi, azsr, azsi, Asr, Asi, ssr, ssi) = out
@@ -3000,15 +2989,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     #[tx, ty, tz, rx, ry, rz]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
                     s = Struct(b(self._endian + 'i6f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)  # num_wide=7
@@ -3040,10 +3030,10 @@ class OES(OP2Common):
                     ielement2 = obj.itotal + nelements
                     itotal2 = ielement2
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 13)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 13)
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 13)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 13)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[itotal:itotal2] = eids
@@ -3063,6 +3053,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i12f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
                         out = s.unpack(edata)  # num_wide=7
@@ -3127,13 +3118,13 @@ class OES(OP2Common):
                     obj._times[itime] = dt
 
                     if 1: #obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 8)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 8)
                         eids = ints[:, 0] // 10
                         fail = ints[:, 7]
                         obj.element[itotal:itotal2] = eids
                         obj.is_failed[itime, itotal:itotal2, 0] = fail
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 8)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 8)
                     #[xxx, fe, ue, ve, ao, ae, ep, xxx]
                     obj.data[itime, itotal:itotal2, :] = floats[:, 1:7]
 
@@ -3141,6 +3132,7 @@ class OES(OP2Common):
                     obj.itotal = itotal2
                 else:
                     s = Struct(b(self._endian + 'i6fi'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + 32]
                         out = s.unpack(edata)  # num_wide=25
@@ -3177,11 +3169,11 @@ class OES(OP2Common):
                     obj._times[itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 9)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 9)
                         eids = ints[:, 0] // 10
                         obj.element[itotal:itotal2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 9)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 9)
                     #[fer, uer, aor, aer,
                     # fei, uei, aoi, aei]
                     isave1 = [1, 3, 5, 7]
@@ -3201,6 +3193,7 @@ class OES(OP2Common):
                     obj.itotal = itotal2
                 else:
                     s = Struct(b(self._endian + 'i8f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
 
@@ -3278,15 +3271,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 7)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 7)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 7)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 7)
                     #[axial_stress, equiv_stress, total_strain,
                     # eff_plastic_creep_strain, eff_creep_strain, linear_torsional_stresss]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
                     s = Struct(b(self._endian + 'i6f'))  # 1+6=7
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -3340,12 +3334,12 @@ class OES(OP2Common):
                     ielement2 = obj.ielement + nelements
                     obj._times[obj.itime] = dt
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                         eids = ints[:, 0] // 10
                         assert eids.min() > 0, eids.min()
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
 
                     #[force, stress]
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:]
@@ -3353,6 +3347,7 @@ class OES(OP2Common):
                     obj.ielement = ielement2
                 else:
                     s = Struct(b(self._endian + 'i2f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)  # num_wide=3
@@ -3406,16 +3401,17 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 11)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 11)
                         eids = ints[:, 0] // 10
                         obj.element[ielement:ielement2] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 11)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 11)
                     # skipping [form1, form2]
                     #[cpx, shy, shz, au, shv, shw, slv, slp]
                     obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:9]
                 else:
                     s = Struct(b(self._endian + 'i8f4s4s'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n + ntotal]
 
@@ -3469,38 +3465,63 @@ class OES(OP2Common):
                     #self.binary_debug.write('  nelements=%i; nnodes=1 # centroid\n' % nelements)
 
 
-                s = Struct(b(self._endian + '2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f'))  # 2 + 6*8 + 1 = 51
-                for i in range(nelements):  # num_wide=51
-                    edata = data[n:n + 204]
-                    out = s.unpack(edata)
+                if self.use_vector and is_vectorized:
+                    n = nelements * self.num_wide * 4
+                    itotal = obj.itotal
+                    itotal2 = itotal + nlayers
 
-                    if self.is_debug_file:
-                        self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
-
-                    #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
-                    #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
-                    #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
-                    #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
-                    #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
-                    #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
-                    #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
-                    #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
-                    # A
-                    assert out[3-1] == b'   C', out[3-1]
-                    assert out[9-1] == b'   D', out[9-1]
-                    assert out[15-1] == b'   E', out[15-1]
-                    assert out[21-1] == b'   F', out[21-1]
-
-                    # B
-                    assert out[28-1] == b'   C', out[28-1]
-                    assert out[34-1] == b'   D', out[34-1]
-                    assert out[40-1] == b'   E', out[40-1]
-                    assert out[46-1] == b'   F', out[46-1]
+                    # [eid_device, gridA, 4*[loc, 5*value], gridB, 4*[loc, 5*value]]
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 51)
+                    obj._times[obj.itime] = dt
+                    if obj.itime == 0:
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 51)
+                        eids = ints[:, 0] // 10
+                        assert eids.min() > 0, eids.min()
+                        grids = ints[:, 1:].reshape(nelements, 2, 25)[:, :, 0]
+                        obj.element_node[itotal:itotal2, 0] = np.repeat(eids, 8)
+                        obj.element_node[itotal:itotal2, 1] = np.repeat(grids.ravel(), 4)
+                        obj.element_node[itotal:itotal2, 2] = np.tile(np.arange(8), nelements)
+
+                    #[long, eqs, te, eps, ecs]
+                    results = floats[:, 1:].reshape(nelements, 2, 25)[:, :, 1:]
+                    results = results.reshape(nlayers, 6)[:, 1:]
+                    obj.data[obj.itime, itotal:itotal2, :] = results
+                    obj.itotal = itotal2
+                    obj.ielement += nelements
+                else:
+                    s = Struct(b(self._endian + '2i 4s5f 4s5f 4s5f 4s5f i 4s5f 4s5f 4s5f 4s5f'))  # 2 + 6*8 + 1 = 51
+                    self._add_unvectorized_table(nelements)
+                    for i in range(nelements):  # num_wide=51
+                        edata = data[n:n + 204]
+                        out = s.unpack(edata)
 
-                    eid_device = out[0]
-                    eid = eid_device // 10
-                    obj.add_new_eid_sort1(dt, eid, out)
-                    n += 204
+                        if self.is_debug_file:
+                            self.binary_debug.write('BEAMNL-94 - %s\n' % str(out))
+
+                        #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
+                        #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
+                        #       EA, long_EA, eqS_EA, tE_EA, eps_EA, ecs_EA,
+                        #       FA, long_FA, eqS_FA, tE_FA, eps_FA, ecs_FA,
+                        #gridB, CB, long_CB, eqS_CB, tE_CB, eps_CB, ecs_CB,
+                        #       DB, long_DB, eqS_DB, tE_DB, eps_DB, ecs_DB,
+                        #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
+                        #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
+                        # A
+                        assert out[3-1] == b'   C', out[3-1]
+                        assert out[9-1] == b'   D', out[9-1]
+                        assert out[15-1] == b'   E', out[15-1]
+                        assert out[21-1] == b'   F', out[21-1]
+
+                        # B
+                        assert out[28-1] == b'   C', out[28-1]
+                        assert out[34-1] == b'   D', out[34-1]
+                        assert out[40-1] == b'   E', out[40-1]
+                        assert out[46-1] == b'   F', out[46-1]
+
+                        eid_device = out[0]
+                        eid = eid_device // 10
+                        obj.add_new_eid_sort1(dt, eid, out)
+                        n += 204
 
             elif self.format_code == 1 and self.num_wide == numwide_random:  # random
                 msg = self.code_information()
@@ -3555,31 +3576,12 @@ class OES(OP2Common):
                 #else:
                     #self.create_transient_object(self.nonlinearPlateStrain, NonlinearSolid)
 
-                n = 0
-                s1 = Struct(b(self._endian + 'i4s'))
-                s2 = Struct(b(self._endian + 'i15f'))
+                # the random nonlinear solid results aren't stored
+                #   [eid_device, ctype,
+                #    nnodes*[grid, sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
+                #            ex, ey, ez, exy, eyz, exz]]
                 nelements = ndata // ntotal
-                for i in range(nelements):  # 2+16*9 = 146 -> 146*4 = 584
-                    edata = data[n:n+8]
-                    n += 8
-
-                    out = s1.unpack(edata)
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
-                    (eid_device, ctype) = out
-                    eid = eid_device // 10
-
-                    for i in range(nnodes):
-                        edata = data[n:n+64]
-                        n += 64
-                        out = s2.unpack(edata)
-                        if self.is_debug_file:
-                            self.binary_debug.write('%s-%sB - %s\n' % (etype, self.element_type, str(out)))
-
-                        assert len(out) == 16
-                        (grid,
-                         sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
-                         ex, ey, ez, exy, eyz, exz) = out
+                n = nelements * ntotal
             else:
                 #msg = self.code_information()
                 msg = "format_code=%s numwide=%s numwide_real=%s numwide_random=%s" % (
@@ -3633,15 +3635,16 @@ class OES(OP2Common):
                     obj._times[obj.itime] = dt
 
                     if obj.itime == 0:
-                        ints = fromstring(data, dtype=self.idtype).reshape(nelements, 10)
+                        ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 10)
                         eids = ints[:, 0] // 10
                         obj.element[istart:iend] = eids
 
-                    floats = fromstring(data, dtype=self.fdtype).reshape(nelements, 10)
+                    floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 10)
                     #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
                     obj.data[obj.itime, istart:iend, :] = floats[:, 1:]
                 else:
                     s = Struct(b(self._endian + 'i9f'))
+                    self._add_unvectorized_table(nelements)
                     for i in range(nelements):
                         edata = data[n:n+ntotal]
                         out = s.unpack(edata)
@@ -3661,7 +3664,7 @@ class OES(OP2Common):
             # 140-HEXA8FD, 201-QUAD4FD
             return ndata
         elif self.element_type in [145, 146, 147]:
-            # TODO: vectorize
+            # the VU solid results aren't stored
             if self.read_mode == 1:
                 return ndata
             # 145-VUHEXA  (8 nodes)
@@ -3691,25 +3694,12 @@ class OES(OP2Common):
                 numwide_b = 2 + (9 - 2) * nnodes  # 30
                 numwide_c = 2 + 13 * nnodes  # 54
                 if self.num_wide == numwide_a:
+                    # [eid_device, parent_id,
+                    #  nnodes*[grid, xnorm, ynorm, znorm, txy, tyz, txz,
+                    #          prin1, prin2, prin3, smean, vono_roct]]
                     ntotal = numwide_a * 4
-                    s1 = self.struct_2i
-                    s2 = Struct(b(self._endian + 'i11f'))
-                    nelements = ndata // ntotal  # 2+16*9 = 146 -> 146*4 = 584
-                    for i in range(nelements):
-                        edata = data[n:n+8]
-                        out = s1.unpack(edata)
-                        (eid_device, parent_id) = out
-                        eid = eid_device // 10
-
-                        for i in range(nnodes):
-                            edata = data[n:n+48]
-                            out = s2.unpack(edata)
-                            if self.is_debug_file:
-                                self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
-                            assert len(out) == 12
-                            (grid, xnorm, ynorm, znorm, txy, tyz, txz,
-                             prin1, prin2, prin3, smean, vono_roct) = out
-                    return ndata
+                    nelements = ndata // ntotal
+                    n = nelements * ntotal
                 elif self.num_wide == numwide_b:
                     ntotal = numwide_b * 4
                     nelements = ndata // ntotal
@@ -3744,6 +3734,7 @@ class OES(OP2Common):
                 s2 = Struct(b(self._endian + 'i6f'))
                 nelements = ndata // ntotal
                 obj = self.obj
+                self._add_unvectorized_table(nelements)
                 for i in range(nelements):
                     edata = data[n:n+36]  # 4*9
                     out = s1.unpack(edata)
@@ -3801,37 +3792,13 @@ class OES(OP2Common):
             numwide_imag = 6 + (33 - 6) * nnodes  # imag???
 
             if self.format_code == 1 and self.num_wide == numwide_real:  # real???
+                # the VU plate results aren't stored
+                #   [eid_device, parent, coord, icord, theta, itype,
+                #    nnodes*[vuid, dummy, dummy2, msx, msy, mxy, dummy3, dummy4, dummy5,
+                #            bcx, bcy, bcxy, tyz, tzx, dummy6, dummy7, dummy8]]
                 ntotal = numwide_real * 4
-                s2 = Struct(b(self._endian + '3i4s2i'))
-                s3 = Struct(b(self._endian + 'i16f'))
                 nelements = ndata // ntotal
-                for i in range(nelements):
-                    out = s2.unpack(data[n:n + 24])
-                    (eid_device, parent, coord, icord, theta, itype) = out
-                    n += 24
-                    eid = eid_device // 10
-                    edata = data[n:n + 68]
-                    out = s3.unpack(edata)  # len=17*4
-                    n += 68
-
-                    if self.is_debug_file:
-                        self.binary_debug.write('%s-%s - %s\n' % (etype, self.element_type, str(out)))
-
-                    #obj.add_new_node(dt, eid, parent, coord, icord, theta, itype)
-                    #obj.add_new_eid(eType, dt, eid, parent, coord, icord, theta, itype)
-                    for node_id in range(nnodes - 1):  # nodes pts
-                        edata = data[n:n + 68]
-                        n += 68
-                        out = s3.unpack(edata)
-                        if self.is_debug_file:
-                            self.binary_debug.write('              %s\n' % (str(out)))
-
-                        (vuid, dummy, dummy2, msx, msy, mxy, dummy3, dummy4, dummy5,
-                         bcx, bcy, bcxy, tyz, tzx, dummy6, dummy7, dummy8) = out
-                        #obj.add(vuid, dummy, dummy2, msx, msy, mxy,
-                                     #dummy3, dummy4, dummy5,
-                                     #bcx, bcy, bcxy, tyz, tzx,
-                                     #dummy6, dummy7, dummy8)
+                n = nelements * ntotal
             elif self.num_wide == numwide_imag:
                 ntotal = numwide_imag * 4
                 nelements = ndata // ntotal
@@ -3941,15 +3908,15 @@ class OES(OP2Common):
                 obj._times[obj.itime] = dt
 
                 if obj.itime == 0:
-                    print(fromstring(data, dtype=self.idtype).size)
+                    print(frombuffer(data, dtype=self.idtype).size)
                     print('nelements=%s numwide=%s' % (nelements, numwide_real))
                     print('ndata=', ndata)
                     print('self.element_name=%s' % self.element_name)
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     eids = ints[:, 0] // 10
                     obj.element[istart:iend] = eids
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                 results = floats[:, 1:]
                 print('results.shape', results.shape)
 
@@ -4020,13 +3987,13 @@ class OES(OP2Common):
                 obj._times[obj.itime] = dt
 
                 if obj.itime == 0:
-                    print(fromstring(data, dtype=self.idtype).size)
+                    print(frombuffer(data, dtype=self.idtype).size)
                     print('nelements=%s numwide=%s' % (nelements, numwide_real))
-                    ints = fromstring(data, dtype=self.idtype).reshape(nelements, numwide_real)
+                    ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_real)
                     eids = ints[:, 0] // 10
                     #obj.element[istart:iend] = eids
 
-                floats = fromstring(data, dtype=self.fdtype).reshape(nelements, numwide_real)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)
                 print('floats[:, 2:].shape', floats[:, 2:].shape)
                 print('nnelements=%s nnodes=%s numwide//nodes=%s' % (nelements, nnodes, (numwide_real-2) / nnodes))
                 results = floats[:, 2:].reshape(nelements, nnodes * 6)
@@ -4048,32 +4015,6 @@ class OES(OP2Common):
         assert n > 0, "n = %s result_name=%s" % (n, result_name)
         return n
 
-    def OESRT_CQUAD4_95(self, data, ndata):
-        """unsupported element"""
-        assert self.num_wide == 9, "num_wide=%s not 9" % self.num_wide
-        ntotal = 36  # 4*9
-
-        n = 0
-        s = Struct(b(self._endian + 'i8si3fi4s'))
-        nelements = ndata // ntotal
-        obj = self.obj
-        for i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)  # num_wide=9
-            if self.is_debug_file:
-                self.binary_debug.write('CQUAD4-95 - %s\n' % str(out))
-            #eid, failure, ply, failureIndexPly, failureIndexBonding, failureIndexMax, flag
-            # 3,TSAIWU,1,8.5640,0.0,None
-
-            (eid, failure, ply, strength_ratio_ply, failure_index_bonding, strength_ratio_bonding, flag, flag2) = out
-            #strength_ratio_ply
-            #print("eid=%s failure=%r ply=%s failureIndexPly=%s  failure_index_bonding=%s strength_ratio_bonding=%s flag=%s flag2=%s" % (
-            #    eid, failure.strip(), ply, failureIndexPly, failure_index_bonding, strength_ratio_bonding, flag, flag2))
-            print("eid=%s strength_ratio_ply=%g failure_index_bonding=%s strength_ratio_bonding=%s" % (
-                eid, strength_ratio_ply, failure_index_bonding, strength_ratio_bonding))
-            #obj.add_new_eid(element_name, dt, eid, force, stress)
-            n += ntotal
-
     def _create_nodes_object(self, nnodes, result_name, slot, obj_vector):
         """same as _create_oes_object4 except it adds to the nnodes parameter"""
         auto_return = False
@@ -6,7 +6,7 @@ import numpy as np
 from numpy import zeros, searchsorted, ravel
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import write_floats_13e, write_f06_rows, _eigenvalue_header
 try:
     import pandas as pd
 except ImportError:
@@ -216,44 +216,23 @@ class RealBarArray(OES_Object):
         (ntimes, ntotal) = self.data.shape[:2]
         eids = self.element
         #print('CBAR ntimes=%s ntotal=%s' % (ntimes, ntotal))
+        fmt = ('0%8i   %13.6E  %13.6E  %13.6E  %13.6E  %13.6E  %13.6E  %13.6E %13.6E\n'
+               ' %8s   %13.6E  %13.6E  %13.6E  %13.6E  %-13s  %13.6E  %13.6E %13.6E\n')
+        args = np.empty((ntotal, 18), dtype='object')
+        args[:, 0] = eids
+        args[:, 9] = ''
+        args[:, 14] = ''
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
             f.write(''.join(header + msg))
 
-            s1a = self.data[itime, :, 0]
-            s2a = self.data[itime, :, 1]
-            s3a = self.data[itime, :, 2]
-            s4a = self.data[itime, :, 3]
-
-            axial = self.data[itime, :, 4]
-            smaxa = self.data[itime, :, 5]
-            smina = self.data[itime, :, 6]
-            MSt = self.data[itime, :, 7]
-
-            s1b = self.data[itime, :, 8]
-            s2b = self.data[itime, :, 9]
-            s3b = self.data[itime, :, 10]
-            s4b = self.data[itime, :, 11]
-
-            smaxb = self.data[itime, :, 12]
-            sminb = self.data[itime, :, 13]
-            MSc = self.data[itime, :, 14]
-
-            for (i, eid, s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                         s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci) in zip(
-                count(), eids, s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
-                               s1b, s2b, s3b, s4b,        smaxb, sminb, MSc):
-
-                vals = [s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                        s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci]
-                vals2 = write_floats_13e(vals)
-                [s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                 s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci] = vals2
-                f.write('0%8i   %-13s  %-13s  %-13s  %-13s  %-13s  %-13s  %-13s %s\n'
-                        ' %8s   %-13s  %-13s  %-13s  %-13s  %-13s  %-13s  %-13s %s\n'
-                        % (eid, s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                            '', s1bi, s2bi, s3bi, s4bi, '',     smaxbi, sminbi, MSci))
+            # [s1a, s2a, s3a, s4a, axial, smaxa, smina, MS_tension,
+            #  s1b, s2b, s3b, s4b, smaxb, sminb, MS_compression]
+            args[:, 1:9] = self.data[itime, :, :8]
+            args[:, 10:14] = self.data[itime, :, 8:12]
+            args[:, 15:18] = self.data[itime, :, 12:15]
+            write_f06_rows(f, fmt, args)
 
             f.write(page_stamp % page_num)
             page_num += 1
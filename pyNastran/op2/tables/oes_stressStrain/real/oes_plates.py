@@ -8,7 +8,7 @@ from itertools import count
 import numpy as np
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from pyNastran.f06.f06_formatting import write_floats_13e, writeFloats8p4F, _eigenvalue_header, get_key0
+from pyNastran.f06.f06_formatting import write_floats_13e, write_f06_rows, writeFloats8p4F, _eigenvalue_header, get_key0
 try:
     import pandas as pd
 except ImportError:
@@ -248,6 +248,35 @@ class RealPlateArray(OES_Object):
 
         #cen_word = 'CEN/%i' % nnodes
         cen_word = cen
+        nrows = len(eids)
+        ilayer = np.arange(nrows) % 2
+        if self.element_type in [33, 74]:  # CQUAD4, CTRIA3
+            # tria3
+            fmt = np.where(
+                ilayer == 0,
+                '0  %6i   %13.6E     %13.6E  %13.6E  %13.6E   %8.4f   %13.6E   %13.6E  %13.6E\n',
+                '   %6s   %13.6E     %13.6E  %13.6E  %13.6E   %8.4f   %13.6E   %13.6E  %13.6E\n')
+            args = np.empty((nrows, 9), dtype='object')
+            args[:, 0] = np.where(ilayer == 0, eids.astype('object'), '')
+            iresults = 1
+        elif self.element_type in [64, 70, 75, 82, 144]:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+            # bilinear
+            is_centroid = (nids == 0) & (ilayer == 0)
+            fmt = np.where(
+                is_centroid,
+                '0  %8i %8s  %13.6E  %13.6E %13.6E %13.6E   %8.4f  %13.6E %13.6E %13.6E\n',
+                np.where(
+                    ilayer == 0,
+                    '   %8s %8i  %13.6E  %13.6E %13.6E %13.6E   %8.4f  %13.6E %13.6E %13.6E\n',
+                    '   %8s %8s  %13.6E  %13.6E %13.6E %13.6E   %8.4f  %13.6E %13.6E %13.6E\n\n'))
+            args = np.empty((nrows, 10), dtype='object')
+            args[:, 0] = np.where(is_centroid, eids.astype('object'), '')
+            args[:, 1] = np.where(is_centroid, cen_word,
+                                  np.where(ilayer == 0, nids.astype('object'), ''))
+            iresults = 2
+        else:
+            raise NotImplementedError('element_name=%s self.element_type=%s' % (self.element_name, self.element_type))
+
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -256,37 +285,8 @@ class RealPlateArray(OES_Object):
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
 
             #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            majorP = self.data[itime, :, 5]
-            minorP = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
-
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if self.element_type in [33, 74]:  # CQUAD4, CTRIA3
-                    if ilayer == 0:
-                        f.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % ('', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif self.element_type in [64, 70, 75, 82, 144]:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % ('', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % ('', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:
-                    raise NotImplementedError('element_name=%s self.element_type=%s' % (self.element_name, self.element_type))
+            args[:, iresults:] = self.data[itime, :, :]
+            write_f06_rows(f, fmt, args)
 
             f.write(page_stamp % page_num)
             page_num += 1
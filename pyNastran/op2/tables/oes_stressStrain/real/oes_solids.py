@@ -11,7 +11,7 @@ from numpy import sqrt, zeros, where, searchsorted, array_equal
 from numpy.linalg import eigh
 
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.f06.f06_formatting import write_floats_13e, write_f06_rows, _eigenvalue_header
 try:
     import pandas as pd
 except ImportError:
@@ -256,6 +256,27 @@ class RealSolidArray(OES_Object):
         eids3 = self.element_cid[:, 0]
         cids3 = self.element_cid[:, 1]
 
+        # each element is written as a block of the CENTER + nnodes rows
+        cnnodes = nnodes + 1
+        nrows = len(eids2)
+        nelements = nrows // cnnodes
+        assert nelements * cnnodes == nrows, 'nrows=%s cnnodes=%s' % (nrows, cnnodes)
+        eids = eids2[::cnnodes]
+        isort = np.argsort(eids3)
+        cids = cids3[isort[searchsorted(eids3, eids, sorter=isort)]]
+
+        fmt_row = ('0              %8s  X  %13.6E  XY  %13.6E   A  %13.6E  LX%5.2f%5.2f%5.2f  %13.6E   %13.6E\n'
+                   '               %8s  Y  %13.6E  YZ  %13.6E   B  %13.6E  LY%5.2f%5.2f%5.2f\n'
+                   '               %8s  Z  %13.6E  ZX  %13.6E   C  %13.6E  LZ%5.2f%5.2f%5.2f\n')
+        fmt = '0  %8s    %8iGRID CS  %i GP\n' + fmt_row * cnnodes
+
+        node_labels = nodes.astype('object')
+        node_labels[::cnnodes] = 'CENTER'
+        args_header = np.empty((nelements, 3), dtype='object')
+        args_header[:, 0] = eids
+        args_header[:, 1] = cids
+        args_header[:, 2] = nnodes
+
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -274,40 +295,37 @@ class RealSolidArray(OES_Object):
             ovm = self.data[itime, :, 9]
             p = (o1 + o2 + o3) / -3.
 
-            cnnodes = nnodes + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm in zip(
-                count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, p, ovm):
-
-                j = where(eids3 == deid)[0]
-                cid = cids3[j]
-                A = [[doxx, dtxy, dtxz],
-                     [dtxy, doyy, dtyz],
-                     [dtxz, dtyz, dozz]]
-                (Lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
-
-                # o1-max
-                # o2-mid
-                # o3-min
-                assert do1 >= do2 >= do3, 'o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (deid, do1, do2, do3)
-                [oxxi, oyyi, ozzi, txyi, tyzi, txzi, o1i, o2i, o3i, pi, ovmi] = write_floats_13e(
-                    [doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm])
-
-                if i % cnnodes == 0:
-                    f.write('0  %8s    %8iGRID CS  %i GP\n' % (deid, cid, nnodes))
-                    f.write('0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                            '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                            '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                            % ('CENTER', oxxi, txyi, o1i, v[0, 1], v[0, 2], v[0, 0], pi, ovmi,
-                               '', oyyi, tyzi, o2i, v[1, 1], v[1, 2], v[1, 0],
-                               '', ozzi, txzi, o3i, v[2, 1], v[2, 2], v[2, 0]))
-                else:
-                    f.write('0              %8s  X  %-13s  XY  %-13s   A  %-13s  LX%5.2f%5.2f%5.2f  %-13s   %s\n'
-                            '               %8s  Y  %-13s  YZ  %-13s   B  %-13s  LY%5.2f%5.2f%5.2f\n'
-                            '               %8s  Z  %-13s  ZX  %-13s   C  %-13s  LZ%5.2f%5.2f%5.2f\n'
-                            % (node_id, oxxi, txyi, o1i, v[0, 1], v[0, 2], v[0, 0], pi, ovmi,
-                               '', oyyi, tyzi, o2i, v[1, 1], v[1, 2], v[1, 0],
-                               '', ozzi, txzi, o3i, v[2, 1], v[2, 2], v[2, 0]))
-                i += 1
+            # o1-max
+            # o2-mid
+            # o3-min
+            ibad = where(~((o1 >= o2) & (o2 >= o3)))[0]
+            if len(ibad):
+                i = ibad[0]
+                raise AssertionError('o1 >= o2 >= o3; eid=%s o1=%e o2=%e o3=%e' % (
+                    eids2[i], o1[i], o2[i], o3[i]))
+
+            # a hermitian matrix is a symmetric-real matrix
+            A = np.empty((nrows, 3, 3), dtype=self.data.dtype)
+            A[:, 0, 0] = oxx
+            A[:, 1, 1] = oyy
+            A[:, 2, 2] = ozz
+            A[:, 0, 1] = A[:, 1, 0] = txy
+            A[:, 1, 2] = A[:, 2, 1] = tyz
+            A[:, 0, 2] = A[:, 2, 0] = txz
+            (Lambda, v) = eigh(A)
+
+            args = np.empty((nrows, 23), dtype='object')
+            args[:, 0] = node_labels
+            args[:, 1:9] = np.column_stack([
+                oxx, txy, o1, v[:, 0, 1], v[:, 0, 2], v[:, 0, 0], p, ovm])
+            args[:, 9] = ''
+            args[:, 10:16] = np.column_stack([
+                oyy, tyz, o2, v[:, 1, 1], v[:, 1, 2], v[:, 1, 0]])
+            args[:, 16] = ''
+            args[:, 17:23] = np.column_stack([
+                ozz, txz, o3, v[:, 2, 1], v[:, 2, 2], v[:, 2, 0]])
+            args = np.hstack([args_header, args.reshape(nelements, cnnodes * 23)])
+            write_f06_rows(f, fmt, args, nrows_chunk=1000)
             f.write(page_stamp % page_num)
             page_num += 1
         return page_num - 1
@@ -13,6 +13,17 @@ except ImportError:
     pass
 
 
+def _get_index(ids, values, name):
+    """gets the index of the values in ids"""
+    isort = np.argsort(ids)
+    i = np.searchsorted(ids, values, sorter=isort).clip(max=len(ids) - 1)
+    index = isort[i]
+    is_missing = ids[index] != values
+    if is_missing.any():
+        raise RuntimeError('%s are missing; ids=%s' % (name, np.unique(values[is_missing])))
+    return index
+
+
 class RealGridPointForcesArray(ScalarObject):
     def __init__(self, data_code, is_sort1, isubcase, dt):
         ScalarObject.__init__(self, data_code, isubcase, apply_data_code=True)
@@ -466,23 +477,21 @@ class RealGridPointForcesArray(ScalarObject):
         raise NotImplementedError()
 
     def shear_moment_diagram(self, xyz_cid0, eids, nids, element_centroids_cid0,
-                             coord, coords, stations,
-                             idir=0, itime=0, debug=False, logger=None):
+                             coord_out, coords, nid_cd, i_transform, beta_transforms,
+                             stations, idir=0, itimes=None, debug=False, logger=None):
         """
         Computes a series of forces/moments at various stations along a structure.
 
         Parameters
         ----------
+        xyz_cid0 : (nnodes, 3) float ndarray
+            the xyz position of nids in the global frame
         eids : (nelements, ) int ndarray
             an array of element ids to consider
-        nids_eids : (nnodes, ) int ndarray
-            an array of node ids corresponding to eids
-        #nids_xyz : (nnodes, ) int ndarray
-        #    an array of node ids corresponding to xyz_cid0
-        xyz_cid0 : (nnodes, 3) float ndarray
-            all the nodes in the model xyz position in the global frame
+        nids : (nnodes, ) int ndarray
+            an array of node ids to consider
         element_centroids_cid0 : (nelements, 3) float ndarray
-            an array of element centroids
+            the centroids of eids in the global frame
         coord_out : CORD2R()
             the output coordinate system
         coords : dict[int] = CORDx
@@ -502,16 +511,36 @@ class RealGridPointForcesArray(ScalarObject):
             this list should be sorted (negative to positive)
         idir : int; default=0
             the axis of the coordinate system to consider
+        itimes : (ntimes, ) int ndarray; default=None -> all
+            the times to extract loads for
+        debug : bool; default=False
+            debugging flag
+        logger : logger; default=None
+            a logger object that gets used when debug=True
+
+        Returns
+        -------
+        force_moment_sum : (ntimes, nstations, 6) float ndarray
+            the forces/moments at each station in the coord_out frame;
+            the moments are about the station (coord_out.origin + station
+            along the idir axis)
 
         Procedure
         ---------
-        1.  Clip elements based on centroid.
-            Elements that are less than the ith station are kept.
-        2.  Get the nodes for those elements.
-        3a. Extract the freebody loads and sum them about the
-            summation point (todo).
-        3b. Extract the interface loads and sum them about the
-            summation point.
+        1.  A grid point force is part of the cut at a station when its
+            element centroid is on the lower side of the station and its
+            node is on the upper side:
+              x_centroid <= station <= x_node
+            so each grid point force is part of a range of stations.
+        2.  The grid point forces are transformed to coord_out for all
+            the times at once and the moments are summed about the
+            coord_out origin.
+        3.  The ranges are sorted once and the forces/moments are summed
+            for all the stations with a cumulative sum.
+        4.  The moments are moved from the origin to the stations.
+
+        The node/element layout of the first time is used for all the
+        times.
 
         Example
         -------
@@ -520,59 +549,81 @@ class RealGridPointForcesArray(ScalarObject):
         doesn't have to be perfectly at the root of the wing.
 
         Create stations from this point.
-
-        TODO
-        ----
-        Not Tested...Does 3b work?  Can 3a give the right answer?
         """
         assert coord_out.type in ['CORD2R', 'CORD1R'], coord_out.type
+        eids = np.asarray(eids)
+        nids = np.asarray(nids)
+        stations = np.asarray(stations, dtype='float64')
+        assert (np.diff(stations) >= 0.).all(), 'stations must be sorted; stations=%s' % stations
+        if itimes is None:
+            itimes = np.arange(self.data.shape[0])
+        itimes = np.atleast_1d(itimes)
+        ntimes = len(itimes)
+        nstations = len(stations)
+
+        # the position along the cut axis
         beta = coord_out.beta()
-        element_centroids_coord = np.dot(beta, element_centroids_cid0)  # TODO: verify
-        xyz_coord = np.dot(beta, xyz_cid0)  # TODO: verify
-        x_centroid = element_centroids_coord[:, idir]
-        x_coord = xyz_coord[:, idir]
-
-        eids = np.unique(eids)
-        force_sum = zeros((nstations, 3), dtype='float32')
-        moment_sum = zeros((nstations, 3), dtype='float32')
-
-        for istation, station in enumerate(stations):
-            # we're picking the elements on one side of the centroid
-            # and nodes on the other side
-
-            # Calculate the nodes on the boundary.
-            # If we make a cutting plane and find all the nodes on
-            # one side of the cutting plane, we can take all the
-            # nodes within some tolerance of the station direction and
-            # find the free nodes
-            i = np.where(x_centroid <= station)
-            j = np.where(x_coord >= station)
-
-            # summation point creation
-            offset = np.zeros(3, dtype='float64')
-            offset[idir] = station
-            summation_point = coord_out.origin + offset
-
-            if 0:
-                # I don't think this will work...
-                forcei, momenti = extract_freebody_loads(
-                    eids[i],
-                    coord_out, coords, nid_cd, i_transform, beta_transforms,
-                    xyz_cid0, summation_point, itime=itime, debug=debug, logger=logger)
-
-                force_sum[istation, :] = forcei.sum(axis=0)
-                # TODO: extract_freebody_loads doesn't sum forces/moments
-                #       sum loads about summation point
-                moment_sum[istation, :] = momenti.sum(axis=0)
-            else:
-                forcei, momenti, force_sumi, moment_sumi = self.extract_interface_loads(
-                    eids[i], nids[j],
-                    coord_out, coords, nid_cd, i_transform, beta_transforms,
-                    xyz_cid0, summation_point, itime=itime, debug=debug, logger=logger)
-
-                force_sum[istation, :] = forcei_sum
-                moment_sum[istation, :] = momenti_sum
-        return force_sum, moment_sum
+        axis = beta[idir, :]
+        x_centroid = np.dot(np.asarray(element_centroids_cid0) - coord_out.origin, axis)
+        x_coord = np.dot(np.asarray(xyz_cid0) - coord_out.origin, axis)
+
+        gpforce_nids = self.node_element[0, :, 0]
+        gpforce_eids = self.node_element[0, :, 1]
+        is_in = np.in1d(gpforce_nids, nids) & np.in1d(gpforce_eids, eids)
+        irange = np.where(is_in)[0]
+        if irange.size == 0:
+            msg = 'no nodes/elements found\n'
+            msg += 'eids=%s\n' % (eids)
+            msg += 'gpforce_eids=%s\n' % (gpforce_eids)
+            raise RuntimeError(msg)
+        nids_row = gpforce_nids[irange]
+        inode = _get_index(nids, nids_row, 'nids')
+        ielement = _get_index(eids, gpforce_eids[irange], 'eids')
+        icd = _get_index(nid_cd[:, 0], nids_row, 'nid_cd')
+
+        # the range of stations that each grid point force is part of
+        istart = np.searchsorted(stations, x_centroid[ielement], side='left')
+        iend = np.searchsorted(stations, x_coord[inode], side='right')
+        is_cut = istart < iend
+        irange = irange[is_cut]
+        istart = istart[is_cut]
+        iend = iend[is_cut]
+        nrows = len(irange)
+        if nrows == 0:
+            return zeros((ntimes, nstations, 6), dtype='float64')
+
+        # transform the grid point forces for all the times at once;
+        # the moments are about the origin of coord_out
+        data = self.data[itimes, :, :][:, irange, :].astype('float64').reshape(ntimes * nrows, 6)
+        force_out, moment_out = transform_force_moment_sum(
+            data[:, :3], data[:, 3:],
+            coord_out, coords, np.tile(nid_cd[icd[is_cut], :], (ntimes, 1)),
+            i_transform, beta_transforms,
+            np.tile(np.asarray(xyz_cid0)[inode[is_cut], :], (ntimes, 1)),
+            summation_point_cid0=coord_out.origin,
+            debug=debug, logger=logger)[:2]
+        values = np.hstack([force_out, moment_out]).reshape(ntimes, nrows, 6)
+        values = values.transpose(1, 0, 2).reshape(nrows, ntimes * 6)
+
+        # sum the grid point forces that start/end at each station
+        delta = zeros((nstations + 1, ntimes * 6), dtype='float64')
+        for index, sign in [(istart, 1.), (iend, -1.)]:
+            isort = np.argsort(index, kind='mergesort')
+            index_sorted = index[isort]
+            ifirst = np.where(np.hstack([True, index_sorted[1:] != index_sorted[:-1]]))[0]
+            delta[index_sorted[ifirst], :] += sign * np.add.reduceat(values[isort, :], ifirst, axis=0)
+        force_moment_sum = np.cumsum(delta[:-1, :], axis=0).reshape(
+            nstations, ntimes, 6).transpose(1, 0, 2)
+
+        # move the moments from the origin to the stations; the forces
+        # are flipped back to the global frame for the cross product
+        #   M_station = M_origin - (r_station x F)
+        beta_out = beta.T
+        force_global = np.dot(force_moment_sum[:, :, :3], beta_out.T)
+        r_station = stations[:, np.newaxis] * axis[np.newaxis, :]
+        rxf = np.cross(r_station[np.newaxis, :, :], force_global)
+        force_moment_sum[:, :, 3:] -= np.dot(rxf, beta_out)
+        return force_moment_sum
 
     def add(self, dt, node_id, eid, ename, t1, t2, t3, r1, r2, r3):
         assert isinstance(node_id, int), node_id
@@ -2,7 +2,7 @@ from __future__ import print_function
 import os
 import unittest
 import numpy as np
-from six import iteritems
+from six import iteritems, StringIO
 
 import pyNastran
 test_path = pyNastran.__path__[0]
@@ -16,7 +16,7 @@ from pyNastran.op2.test.test_op2 import run_op2
 from pyNastran.bdf.test.bdf_unit_tests import Tester
 from pyNastran.op2.tables.oef_forces.oef_forceObjects import RealPlateBilinearForceArray, RealPlateForceArray
 from pyNastran.op2.export_to_vtk import export_to_vtk_filename
-from pyNastran.op2.vector_utils import filter1d
+from pyNastran.op2.vector_utils import filter1d, transform_force_moment_sum
 
 
 class TestOP2(Tester):
@@ -71,6 +71,226 @@ class TestOP2(Tester):
         self.assertEqual(len(op2.ctetra_stress), 1, len(op2.ctetra_stress))
         self.assertEqual(len(op2.displacements), 1, len(op2.displacements))
 
+    def test_single_pass(self):
+        """single_pass=True gets the same results as the two pass read"""
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models'))
+        op2_filenames = [
+            os.path.join(folder, 'sol_101_elements', 'mode_solid_shell_bar.op2'),
+            os.path.join(folder, 'other', 'dofm12.op2'),
+            # the displacements span 2 tables, so they're grown
+            os.path.join(folder, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2a = read_op2(op2_filename, debug=False)
+            op2b = read_op2(op2_filename, debug=False, single_pass=True)
+            self.assertEqual(op2a.read_mode, op2b.read_mode)
+            self.assertFalse(op2b._single_pass)
+            assert op2a == op2b, op2_filename
+            self.assertEqual(op2a.get_op2_stats(), op2b.get_op2_stats())
+
+        disp_a = op2a.displacements[1]
+        disp_b = op2b.displacements[1]
+        self.assertEqual(disp_b.data.shape, (42, 25, 6))
+        self.assertTrue(array_equal(disp_a._times, disp_b._times))
+        self.assertTrue(array_equal(disp_a.node_gridtype, disp_b.node_gridtype))
+        self.assertTrue(array_equal(disp_a.data, disp_b.data))
+
+    def test_single_pass_bytes_read(self):
+        """single_pass=True reads the bytes of a table from the file once"""
+        import pyNastran.op2.op2_scalar as op2_scalar
+        from pyNastran.op2.fortran_format import RecordCache
+        nbytes = [0]
+
+        class CountingFile(object):
+            def __init__(self, f):
+                self.f = f
+            def tell(self):
+                return self.f.tell()
+            def seek(self, n, whence=0):
+                return self.f.seek(n, whence)
+            def read(self, n):
+                data = self.f.read(n)
+                nbytes[0] += len(data)
+                return data
+
+        class CountingRecordCache(RecordCache):
+            def __init__(self, f):
+                RecordCache.__init__(self, CountingFile(f))
+
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models'))
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        op2_scalar.RecordCache = CountingRecordCache
+        try:
+            read_op2(op2_filename, debug=False, single_pass=True)
+        finally:
+            op2_scalar.RecordCache = RecordCache
+        self.assertGreater(nbytes[0], 0)
+        self.assertLess(nbytes[0], os.path.getsize(op2_filename))
+
+    def test_use_mmap(self):
+        """use_mmap=True gets the same results as reading the file"""
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models'))
+        op2_filenames = [
+            os.path.join(folder, 'sol_101_elements', 'static_solid_shell_bar.op2'),
+            os.path.join(folder, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+            os.path.join(folder, 'other', 'bcell9p0.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2a = read_op2(op2_filename, debug=False)
+            op2b = read_op2(op2_filename, debug=False, use_mmap=True)
+            op2c = read_op2(op2_filename, debug=False, use_mmap=True, single_pass=True)
+            self.assertIsNone(op2b._mmap_view)
+            assert op2a == op2b, op2_filename
+            assert op2a == op2c, op2_filename
+
+    def test_lazy(self):
+        """lazy=True reads a result the first time it's used"""
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models'))
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2a = read_op2(op2_filename, debug=False)
+        op2b = read_op2(op2_filename, debug=False, lazy=True)
+
+        op2_index = op2b.get_op2_index()
+        records = op2_index.get_records(table_name='OES1X1', isubcase=1, element_name='CTETRA')
+        self.assertEqual(len(records), 1)
+
+        nlazy = len([obj for obj in op2_index.objs if '_lazy_loader' in obj.__dict__])
+        self.assertEqual(op2a.ctetra_stress[1].data.shape, op2b.ctetra_stress[1].data.shape)
+        nlazy2 = len([obj for obj in op2_index.objs if '_lazy_loader' in obj.__dict__])
+
+        # only the CTETRA records of the OES1X1 table are read
+        self.assertTrue(op2_index.tables[records[0].itable].is_seekable)
+        self.assertEqual(nlazy2, nlazy - 1)
+        self.assertIn('_lazy_loader', op2b.chexa_stress[1].__dict__)
+        assert np.array_equal(op2a.ctetra_stress[1].data, op2b.ctetra_stress[1].data)
+
+        op2b.load_lazy_results()
+        assert op2a == op2b
+
+        op2c = read_op2(os.path.join(folder, 'other', 'bcell9p0.op2'), debug=False, lazy=True)
+        op2c.load_lazy_results()
+        assert read_op2(os.path.join(folder, 'other', 'bcell9p0.op2'), debug=False) == op2c
+
+    def test_num_workers(self):
+        """the tables can be read with a pool of processes"""
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models'))
+        op2_filenames = [
+            os.path.join(folder, 'sol_101_elements', 'static_solid_shell_bar.op2'),
+            os.path.join(folder, 'sol_101_elements', 'freq_solid_shell_bar.op2'),
+            os.path.join(folder, 'other', 'bcell9p0.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2a = read_op2(op2_filename, debug=False)
+            op2b = read_op2(op2_filename, debug=False, num_workers=2)
+            assert op2a == op2b, op2_filename
+
+    def test_unvectorized_stats(self):
+        """the tables read with a Python loop are tracked"""
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models'))
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'freq_solid_shell_bar.op2')
+        op2a = read_op2(op2_filename, debug=False)
+        self.assertEqual(op2a.get_unvectorized_stats(), '')
+
+        op2b = OP2(debug=False)
+        op2b.use_vector = False
+        op2b.read_op2(op2_filename)
+        self.assertIn(('OEF1X', 'CBAR-34', 2, 1, 17), op2b.unvectorized_tables)
+        self.assertIn('CBAR-34', op2b.get_unvectorized_stats())
+
+        for result_type in ['cbar_force', 'cbush_force', 'cbeam_force']:
+            resulta = getattr(op2a, result_type)
+            resultb = getattr(op2b, result_type)
+            for key, obja in iteritems(resulta):
+                objb = resultb[key]
+                assert np.allclose(obja.data, objb.data), result_type
+
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2a = read_op2(op2_filename, debug=False)
+        op2b = OP2(debug=False)
+        op2b.use_vector = False
+        op2b.read_op2(op2_filename)
+        self.assertEqual(op2a.get_unvectorized_stats(), '')
+        assert np.array_equal(op2a.cbeam_stress[1].data, op2b.cbeam_stress[1].data)
+        assert np.array_equal(op2a.cbeam_stress[1].element_node, op2b.cbeam_stress[1].element_node)
+
+        # the magnitude/phase results are the same as the Struct path
+        op2_filename = os.path.join(folder, 'freq_sine', 'good_sine.op2')
+        op2a = read_op2(op2_filename, debug=False)
+        op2b = OP2(debug=False)
+        op2b.use_vector = False
+        op2b.read_op2(op2_filename)
+        for result_type in ['cbar_force', 'cbush_force']:
+            resulta = getattr(op2a, result_type)
+            resultb = getattr(op2b, result_type)
+            self.assertEqual(sorted(resulta), sorted(resultb))
+            for key, obja in iteritems(resulta):
+                objb = resultb[key]
+                assert np.array_equal(obja.data, objb.data), result_type
+                assert obja == objb, result_type
+
+    def test_sort2_vectorized(self):
+        """the vectorized SORT2 table readers match the unpack readers"""
+        from pyNastran.op2.tables.oug.oug_displacements import (
+            RealDisplacementArray, ComplexDisplacementArray)
+        nids = [10, 20, 30, 40]
+        freqs = np.array([1., 2., 5., 10., 20.], dtype='float32')
+        ntimes = len(freqs)
+        data_code = {
+            'is_msc': False, 'approach_code': 53, 'isubcase': 1, 'table_code': 1,
+            'sort_code': 3, 'device_code': 3, 'analysis_code': 5,
+            'sort_bits': [0, 1, 1], 'random_code': 0, 'format_code': 2,
+            'num_wide': 14, 'acoustic_flag': 0, 'thermal': 0,
+            'nonlinear_factor': nids[0], 'name': 'freq', 'freq': 1.,
+            'data_names': ['freq'], '_times_dtype': 'float32',
+            'thermal_bits': [0, 0, 0, 0, 0], 'subtitle': '', 'label': '',
+            'title': '', 'table_name': 'OUGV1',
+        }
+        records = []
+        for inid, nid in enumerate(nids):
+            ints = np.zeros((ntimes, 14), dtype='<i4')
+            floats = ints.view('<f4')
+            floats[:, 0] = freqs
+            ints[:, 1] = 1
+            floats[:, 2:] = np.arange(ntimes * 12).reshape(ntimes, 12) + 100. * inid
+            records.append(ints.tobytes())
+
+        def read_sort2(read_func, class_obj, use_vector, nwide):
+            op2 = OP2(debug=False)
+            op2._endian = '<'
+            op2._set_structs()
+            op2.is_debug_file = False
+            op2.use_vector = use_vector
+            op2._analysis_code_fmt = 'f'
+            op2.analysis_code = 5
+            op2.obj = obj = class_obj(data_code, False, 1, None)
+            assert obj.is_sort2()
+            obj.ntimes = len(nids)
+            obj.ntotal = ntimes
+            obj.build()
+            for nid, record in zip(nids, records):
+                op2.nonlinear_factor = nid
+                data = record if nwide == 14 else np.frombuffer(
+                    record, dtype='<i4').reshape(ntimes, 14)[:, :8].tobytes()
+                n = read_func(op2, data, True, ntimes, 'displacements', 'node')
+                self.assertEqual(n, len(data))
+                obj._reset_indices()
+                obj.itime += 1
+            return obj
+
+        for read_func, class_obj, nwide in [
+                (OP2._read_real_table_sort2, RealDisplacementArray, 8),
+                (OP2._read_complex_table_sort2_imag, ComplexDisplacementArray, 14),
+                (OP2._read_complex_table_sort2_mag, ComplexDisplacementArray, 14)]:
+            obj1 = read_sort2(read_func, class_obj, False, nwide)
+            obj2 = read_sort2(read_func, class_obj, True, nwide)
+            self.assertEqual(obj2.data.shape, (ntimes, len(nids), 6))
+            assert np.array_equal(obj1.node_gridtype, obj2.node_gridtype)
+            assert np.array_equal(obj1._times, freqs)
+            assert np.array_equal(obj1._times, obj2._times)
+            assert np.allclose(obj1.data, obj2.data), read_func.__name__
+            assert obj1 == obj2
+            obj2.write_f06(StringIO(), header=['', '', ''], is_sort1=False)
+
     def test_op2_solid_bending_01(self):
         op2_filename = os.path.join('solid_bending.op2')
         folder = os.path.abspath(os.path.join(test_path, '..', 'models', 'solid_bending'))
@@ -120,6 +340,33 @@ class TestOP2(Tester):
         op2_filename = os.path.join(folder, op2_filename)
         op2 = read_op2_geom(op2_filename, debug=False)
 
+    def test_op2_solid_shell_bar_01_geom_arrays_only(self):
+        """the vectorized cards are only decoded into arrays"""
+        op2_filename = os.path.join('static_solid_shell_bar.op2')
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models', 'sol_101_elements'))
+        op2_filename = os.path.join(folder, op2_filename)
+        op2 = read_op2_geom(op2_filename, debug=False)
+        op2_arrays = read_op2_geom(op2_filename, debug=False, geom_arrays_only=True)
+        self.assertEqual(len(op2_arrays.nodes), 0)
+        self.assertEqual(len(op2_arrays.elements), 2) # CBAR, CBEAM
+        self.assertEqual(op2_arrays.card_count['GRID'], 25)
+
+        grids = op2_arrays.get_geom_array('GRID')
+        self.assertEqual(grids['nid'].tolist(), sorted(op2.nodes))
+        xyz = np.array([op2.nodes[nid].xyz for nid in grids['nid']])
+        assert np.allclose(grids['xyz'], xyz)
+        ctria3s = op2_arrays.get_geom_array('CTRIA3')
+        self.assertEqual(ctria3s['nodes'].shape, (8, 3))
+        with self.assertRaises(KeyError):
+            op2_arrays.get_geom_array('CTRIA6')
+
+        op2_arrays.build_geom_cards()
+        for name in ['nodes', 'elements', 'properties']:
+            cards = getattr(op2, name)
+            cards_arrays = getattr(op2_arrays, name)
+            self.assertEqual(sorted(cards), sorted(cards_arrays))
+            for key, card in sorted(iteritems(cards)):
+                self.assertEqual(str(card), str(cards_arrays[key]))
 
     def test_gpforce_01(self):
         nids = np.array([1, 2, 3])
@@ -269,6 +516,60 @@ class TestOP2(Tester):
                 case, total_moment_local_expected, total_moment_local)
             self.assertTrue(np.allclose(total_moment_local_expected, total_moment_local, atol=0.005), msg), msg
 
+    def test_op2_transient_gpforce_shear_moment(self):
+        """the batched shear/moment diagram matches the station-by-station sums"""
+        folder = os.path.abspath(os.path.join(test_path, '..', 'models', 'sol_101_elements'))
+        op2_filename = os.path.join(folder, 'transient_solid_shell_bar.op2')
+        op2 = read_op2_geom(op2_filename, debug=False)
+        i_transform, beta_transforms = op2.get_displacement_index_transforms()
+        gpforce = op2.grid_point_forces[1]
+        op2.cross_reference(xref_elements=False,
+                            xref_nodes_with_elements=False,
+                            xref_properties=False,
+                            xref_masses=False,
+                            xref_materials=False,
+                            xref_loads=False,
+                            xref_constraints=False,
+                            xref_aero=False,
+                            xref_sets=False,
+                            xref_optimization=False)
+        nids = np.array(sorted(op2.nodes))
+        xyz_cid0 = op2.get_xyz_in_coord(cid=0, dtype='float64')
+        nid_cd = np.array([[nid, op2.nodes[nid].Cd()] for nid in nids])
+        eids = np.array(sorted(op2.elements))
+        element_centroids_cid0 = np.array([
+            xyz_cid0[np.searchsorted(nids, [nid for nid in op2.elements[eid].node_ids if nid]), :].mean(axis=0)
+            for eid in eids])
+
+        coord_out = op2.coords[0]
+        stations = np.linspace(-0.1, 1.1, 7)
+        force_moment_sum = gpforce.shear_moment_diagram(
+            xyz_cid0, eids, nids, element_centroids_cid0,
+            coord_out, op2.coords, nid_cd, i_transform, beta_transforms,
+            stations, idir=0, logger=op2.log)
+        self.assertEqual(force_moment_sum.shape, (gpforce.ntimes, 7, 6))
+
+        gpforce_nids = gpforce.node_element[0, :, 0]
+        gpforce_eids = gpforce.node_element[0, :, 1]
+        for itime in [0, 5, 20]:
+            for istation, station in enumerate(stations):
+                eidsi = eids[element_centroids_cid0[:, 0] <= station]
+                nidsi = nids[xyz_cid0[:, 0] >= station]
+                irange = np.where(np.in1d(gpforce_nids, nidsi) & np.in1d(gpforce_eids, eidsi))[0]
+                if len(irange) == 0:
+                    self.assertTrue(np.allclose(force_moment_sum[itime, istation, :], 0.))
+                    continue
+                inode = np.searchsorted(nids, gpforce_nids[irange])
+                summation_point = coord_out.origin + np.array([station, 0., 0.])
+                force_sum, moment_sum = transform_force_moment_sum(
+                    gpforce.data[itime, irange, :3].astype('float64'),
+                    gpforce.data[itime, irange, 3:].astype('float64'),
+                    coord_out, op2.coords, nid_cd[inode, :], i_transform, beta_transforms,
+                    xyz_cid0[inode, :], summation_point_cid0=summation_point,
+                    logger=op2.log)[2:]
+                self.assertTrue(np.allclose(force_moment_sum[itime, istation, :3], force_sum))
+                self.assertTrue(np.allclose(force_moment_sum[itime, istation, 3:], moment_sum))
+
     def test_op2_solid_shell_bar_01_gpforce_xyz(self):
         folder = os.path.abspath(os.path.join(test_path, '..', 'models', 'sol_101_elements'))
         bdf_filename = os.path.join(folder, 'solid_shell_bar_xyz.bdf')
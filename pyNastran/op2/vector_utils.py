@@ -550,7 +550,7 @@ def transform_force_moment(force_in_local, moment_in_local,
 
     #coord_out_cid = coord_out.cid
     beta_out = coord_out.beta().T
-    print('beta_out =\n%s' % beta_out)
+    #print('beta_out =\n%s' % beta_out)
 
     if debug:
         logger.debug(coord_out)
@@ -568,10 +568,10 @@ def transform_force_moment(force_in_local, moment_in_local,
         nidsi = nids[i]
         analysis_coord = coords[cd]
         beta_cd = analysis_coord.beta()
-        print('beta_cd =\n%s' % beta_cd)
+        #print('beta_cd =\n%s' % beta_cd)
 
-        print('i =', i)
-        print('force_in_local =', force_in_local)
+        #print('i =', i)
+        #print('force_in_local =', force_in_local)
         #force_in_locali.astype('float64')
         #moment_in_locali.astype('float64')
 
@@ -595,7 +595,7 @@ def transform_force_moment(force_in_local, moment_in_local,
         # with the local frame and with the same primary directions
         # as the global frame
         force_in_globali = dot(force_in_locali, beta_cd)
-        print('force_in_globali = %s' % force_in_globali)
+        #print('force_in_globali = %s' % force_in_globali)
         moment_in_globali = dot(moment_in_locali, beta_cd)
 
         # rotate the forces and moments into a coordinate system coincident
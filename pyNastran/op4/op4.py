@@ -9,15 +9,18 @@ import os
 import io
 from struct import pack, unpack, Struct
 
-from numpy import array, zeros, float32, float64, complex64, complex128, ndarray
-from scipy.sparse import coo_matrix
+from numpy import (array, zeros, float32, float64, complex64, complex128, ndarray,
+                   memmap, frombuffer, arange, repeat, cumsum, concatenate, diff,
+                   argsort, add)
+from numpy.lib.format import open_memmap
+from scipy.sparse import coo_matrix, csc_matrix, issparse
 
 from pyNastran.utils import is_binary_file as file_is_binary
 from pyNastran.utils.mathematics import print_matrix #, print_annotated_matrix
 
 
 def read_op4(op4_filename=None, matrix_names=None, precision='default',
-             debug=False):
+             memmap_dirname=None, debug=False):
     """
     Reads a NASTRAN OUTPUT4 file, and stores the
     matrices as the output arguments.  The number of
@@ -45,6 +48,11 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
       >>> matrices = op4.read_op4(op4_filename, matrix_names='A')
       >>> (formA, A) = matrices['A']
 
+      # or because A doesn't fit in memory
+      >>> matrices = op4.read_op4(op4_filename, matrix_names='A',
+      ...                         memmap_dirname='scratch')
+      >>> (formA, A) = matrices['A']
+
       # get all the matrices, but select the file using a file dialog
       >>> matrices = op4.read_op4()
       >>>
@@ -54,10 +62,15 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
     op4_filename : str / None
         an OP4 filename.  Type=STRING.
     matrix_names : List[str], str / None
-        matrix name(s) (None -> all)
+        matrix name(s) (None -> all); the other matrices in a binary
+        file are skipped without being read
     precision : str; {'default', 'single', 'double'}
         specifies if the matrices are in single or double precsion
         which means the format will be whatever the file is in
+    memmap_dirname : str; default=None
+        the directory to store the dense matrices of a binary file in
+        as ``<name>.npy`` files, which are returned as a ``numpy.memmap``
+        (None -> in memory)
 
     Returns
     -------
@@ -80,13 +93,15 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
         |  9   | Pseudoidentity |
         +------+----------------+
 
-        +--------+-------------------------+
-        |  Type  | Object                  |
-        +========+=========================+
-        | Dense  | NUMPY.NDARRAY           |
-        +--------+-------------------------+
-        | Sparse | SCIPY.SPARSE.COO_MATRIX |
-        +--------+-------------------------+
+        +---------------+-------------------------+
+        |  Type         | Object                  |
+        +===============+=========================+
+        | Dense         | NUMPY.NDARRAY           |
+        +---------------+-------------------------+
+        | Sparse ASCII  | SCIPY.SPARSE.COO_MATRIX |
+        +---------------+-------------------------+
+        | Sparse Binary | SCIPY.SPARSE.CSC_MATRIX |
+        +---------------+-------------------------+
 
     .. note:: based off the MATLAB code SAVEOP4 developed by ATA-E and
               later UCSD.
@@ -95,7 +110,7 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
               with sparse matrices.
     """
     op4 = OP4(log=None, debug=debug)
-    return op4.read_op4(op4_filename, matrix_names, precision)
+    return op4.read_op4(op4_filename, matrix_names, precision, memmap_dirname)
 
 
 class OP4(object):
@@ -109,8 +124,10 @@ class OP4(object):
         self._endian = ''
         self.debug = debug
         self.log = log
+        self.memmap_dirname = None
 
-    def read_op4(self, op4_filename=None, matrix_names=None, precision='default'):
+    def read_op4(self, op4_filename=None, matrix_names=None, precision='default',
+                 memmap_dirname=None):
         """
         See ``read_op4``
         """
@@ -132,6 +149,7 @@ class OP4(object):
 
         if isinstance(matrix_names, string_types):
             matrix_names = [matrix_names]
+        self.memmap_dirname = memmap_dirname
         #assert isinstance(matrix_names, list), 'type(matrix_names)=%s' % type(matrix_names)
 
         if file_is_binary(op4_filename):
@@ -490,21 +508,6 @@ class OP4(object):
             print('  IS=%s L=%s irow=%s' % (IS, L, irow))
         return irow
 
-    def _get_irow_small_binary(self, op4, data):
-        if len(data) == 0:
-            data = op4.read(4)
-            self.n += 4
-
-        IS, = unpack(self._endian + 'i', data)
-        L = IS // 65536 - 1
-        irow = IS - 65536 * (L + 1)
-        if self.debug:
-            print('small_mat-next row')
-            print("  IS=%s L=%s irow=%s" % (IS, L, irow))
-            assert IS > 0, IS
-            assert L > 0, L
-        return irow, L
-
     def _get_irow_big_ascii(self, op4, line, sline, irow):
         sline = line.strip().split()
         if len(sline) == 2:
@@ -518,16 +521,6 @@ class OP4(object):
             print("idummy=%s irow=%s" % (idummy, irow))
         return irow
 
-    def _get_irow_big_binary(self, op4, data):
-        if len(data) == 0:
-            data = op4.read(8)
-            self.n += 8
-        idummy, irow = unpack(self._endian + '2i', data)
-        if self.debug:
-            print("idummy=%s irow=%s" % (idummy, irow))
-            assert irow < 100, irow
-        return (irow, idummy - 1)
-
 #--------------------------------------------------------------------------
     def read_op4_binary(self, op4_filename, matrix_names=None, precision='default'):
         """matrix_names must be a list or None, but basically the same"""
@@ -623,6 +616,8 @@ class OP4(object):
             raise NotImplementedError(msg)
 
         name = name.strip()
+        if not PY2:
+            name = name.decode('latin1')
         if self.debug:
             if Type == 1:
                 print("Type = Real, Single Precision")
@@ -658,13 +653,17 @@ class OP4(object):
             is_sparse = True
 
         assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-        if Type in [1, 2]:  # real
-            A = self._read_real_binary(op4, nrows, ncols, Type, is_sparse, is_big_mat)
-        elif Type in [3, 4]:  # complex
-            A = self._read_complex_binary(op4, nrows, ncols, Type, is_sparse, is_big_mat)
-        else:
+        if Type not in [1, 2, 3, 4]:
             raise TypeError("Type=%s" % Type)
 
+        if matrix_names is not None and name not in matrix_names:
+            self._skip_matrix_binary(op4, ncols, is_sparse, is_big_mat)
+            A = None
+        elif is_sparse:
+            A = self._read_sparse_binary(op4, nrows, ncols, Type, is_big_mat)
+        else:
+            A = self._read_dense_binary(op4, name, nrows, ncols, Type)
+
         #try:
             #print_matrix(A.todense())
         #except:
@@ -712,158 +711,188 @@ class OP4(object):
             print('  dtype = %s ' % dtype)
         return (nwords_per_value, nbytes_per_value, data_format, dtype)
 
-    def _read_real_dense_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
+    def _get_value_dtype(self, matrix_type):
+        """gets the numpy dtype of the values in the file (e.g., '<f8')"""
+        if matrix_type == 1:
+            value_dtype = 'f4'
+        elif matrix_type == 2:
+            value_dtype = 'f8'
+        elif matrix_type == 3:
+            value_dtype = 'c8'
+        elif matrix_type == 4:
+            value_dtype = 'c16'
+        else:
+            raise RuntimeError("matrix_type=%s" % matrix_type)
+        return self._endian + value_dtype
+
+    def _read_dense_binary(self, op4, name, nrows, ncols, matrix_type):
+        """
+        Reads a dense real/complex binary matrix
+
+        Each column record is read in one call and viewed as a numpy
+        array.  If ``memmap_dirname`` is set, the matrix is stored in a
+        Fortran ordered ``<name>.npy`` file in that directory and returned
+        as a ``numpy.memmap``, so it doesn't have to fit in memory.
+        """
         if self.debug:
-            print('_read_real_dense_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, _nbytes_per_value, data_format, dtype) = out
-        A = zeros((nrows, ncols), dtype=dtype)
+            print('_read_dense_binary')
+        value_dtype = self._get_value_dtype(matrix_type)
+        dtype = get_dtype(matrix_type)
+        if self.memmap_dirname is None:
+            A = zeros((nrows, ncols), dtype=dtype)
+        else:
+            npy_filename = os.path.join(self.memmap_dirname, '%s.npy' % name)
+            A = open_memmap(npy_filename, mode='w+', dtype=dtype,
+                            shape=(nrows, ncols), fortran_order=True)
 
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
+        while 1:
             assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
             (icol, irow, nwords) = self.get_markers_dense(op4)
-            L = nwords
             if icol == ncols + 1:
                 break
-            if L == -1:
+            if nwords == -1:
                 break
 
             record_length = 4 * nwords
-            data = op4.read(record_length)
+            values = frombuffer(op4.read(record_length), dtype=value_dtype)
             self.n += record_length
-            nvalues = L // nwords_per_value
-            str_values = self._endian + '%i%s' % (nvalues, data_format)
-            A[irow-1:irow-1+nvalues, icol-1] = unpack(str_values, data)
+            A[irow-1:irow-1+len(values), icol-1] = values
             if self.debug:
                 print('A[%s:%s, %s] = %s' % (
-                    irow - 1,
-                    irow - 1 + nvalues,
-                    icol-1,
-                    A[irow-1:irow-1+nvalues, icol-1]))
-        #assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
+                    irow - 1, irow - 1 + len(values), icol - 1, values))
+
+        if isinstance(A, memmap):
+            A.flush()
         op4.read(4)
         self.n += 4
         return A
 
+    def _get_sparse_strings(self, words, is_big_mat):
+        """
+        Finds the strings in a sparse column record
 
-    def _read_real_binary(self, op4, nrows, ncols, matrix_type, is_sparse, is_big_mat):
-        if is_sparse:
-            A = self._read_real_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        else:
-            A = self._read_real_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        return A
-
-    def _read_real_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
-        if self.debug:
-            print('_read_real_sparse_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
-
-        data = ''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            L = nwords
-
-            if icol == ncols + 1:
-                if self.debug:
-                    print('breaking on icol=%s ncol+1=%s' % (icol, ncols + 1))
-                break
+        A string is a header (the number of words and the starting row)
+        followed by the values of consecutive rows.  Only the headers are
+        walked; they're decoded together.
 
+        Parameters
+        ----------
+        words : (nwords, ) int ndarray
+            the column record
+        is_big_mat : bool
+            the header is 2 words (L+1, irow) instead of 1 (IS)
+
+        Returns
+        -------
+        istart : (nstrings, ) int ndarray
+            the index of the first value word of each string
+        nwords : (nstrings, ) int ndarray
+            the number of value words in each string
+        irow : (nstrings, ) int ndarray
+            the 1-based row of the first value of each string
+
+        None is returned for an empty (L=-1) column, which ends the matrix
+        """
+        nheader = 2 if is_big_mat else 1
+        iheaders = []
+        i = 0
+        nwords_record = len(words)
+        while i < nwords_record:
             if is_big_mat:
-                irow, L = self._get_irow_big_binary(op4, data[:8])
-                data = data[8:]
+                nwords_string = int(words[i]) - 1
             else:
-                irow, L = self._get_irow_small_binary(op4, data[:4])
-                data = data[4:]
-
-            if L == -1:
-                if self.debug:
-                    print('breaking on L=-1')
+                nwords_string = int(words[i]) // 65536 - 1
+            if nwords_string < 0:
                 break
+            iheaders.append(i)
+            i += nheader + nwords_string
 
+        if len(iheaders) == 0:
             if self.debug:
-                print("  next icol")
-                print("    n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qd')
-                print('**************************************************')
+                print('breaking on L=-1')
+            return None
 
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
+        iheaders = array(iheaders)
+        if is_big_mat:
+            nwords = words[iheaders] - 1
+            irow = words[iheaders + 1]
+        else:
+            IS = words[iheaders]
+            nwords = IS // 65536 - 1
+            irow = IS - 65536 * (nwords + 1)
+        return iheaders + nheader, nwords, irow
 
-            record_length = 4 * nwords
-            data = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                print("  data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            #if icol == ncols + 1:
-                #break
+    def _read_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
+        """
+        Reads a sparse real/complex binary matrix into a csc_matrix
 
-            i = 0
-            while len(data) > 0:
-                if i > 0:
-                    if is_big_mat:
-                        (irow, L) = self._get_irow_big_binary(op4, data[0:8])
-                        data = data[8:]
-                    else:
-                        (irow, L) = self._get_irow_small_binary(op4, data[0:4])
-                        data = data[4:]
-                    assert irow > 0
-                nvalues = L // nwords_per_value
-                str_values = self._endian + '%i%s' % (nvalues, data_format)
+        Each column record is read in one call and the rows/values of the
+        strings are gathered with numpy.
+        """
+        if self.debug:
+            print('_read_sparse_binary')
+        nwords_per_value = self._get_matrix_info(matrix_type, debug=False)[0]
+        value_dtype = self._get_value_dtype(matrix_type)
+        dtype = get_dtype(matrix_type)
 
+        icols = []
+        indices = []
+        data = []
+        while 1:
+            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
+            (icol, irow, nwords) = self.read_start_marker(op4)[1:]
+            if icol == ncols + 1:
                 if self.debug:
-                    print('irow=%s L=%s nwords_per_value=%s nvalues=%s '
-                          'nbytes_per_value=%s' % (
-                              irow, L, nwords_per_value, nvalues, nbytes_per_value))
-                    print('str_values = %r' % str_values)
+                    print('breaking on icol=%s ncol+1=%s' % (icol, ncols + 1))
+                break
 
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
+            record_length = 4 * nwords
+            words = frombuffer(op4.read(record_length), dtype=self._endian + 'i4')
+            self.n += record_length
+            strings = self._get_sparse_strings(words, is_big_mat)
+            if strings is None:
+                break
+            (istart, nwords_string, irow) = strings
 
-                #irow -= 1
-                #icol -= 1
-                if self.debug:
-                    print('rows = %s' % list(i+irow-1 for i in range(nvalues)))
-                    print('cols = %s ' % ([icol-1] * nvalues))
-                    print('value_list = %s' % str(value_list))
+            # the offset of each value from the start of its string
+            nvalues = nwords_string // nwords_per_value
+            nvalues_total = nvalues.sum()
+            ioffset = arange(nvalues_total) - repeat(cumsum(nvalues) - nvalues, nvalues)
 
-                rows.extend([i+irow-1 for i in range(nvalues)])
-                irow += nvalues
-                cols.extend([icol-1] * nvalues)
-                entries.extend(value_list)
+            iwords = repeat(istart, nvalues) + ioffset * nwords_per_value
+            if nwords_per_value > 1:
+                iwords = (iwords[:, None] + arange(nwords_per_value)).ravel()
+            icols.append(icol - 1)
+            indices.append(repeat(irow - 1, nvalues) + ioffset)
+            data.append(words[iwords].view(value_dtype))
 
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                if self.debug:
-                    print("  record_length=%s nbytes_per_value=%s len(data)=%s" %
-                          (record_length, nbytes_per_value, len(data)))
-                    ##print(A)
-                    #print("********")  # ,data
-                    #print(self.print_block(data))
-                i += 1
-            #print "-------------------------------"
+        op4.read(4)
+        self.n += 4
+        return _build_csc_matrix(nrows, ncols, icols, indices, data, dtype)
 
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
+    def _skip_matrix_binary(self, op4, ncols, is_sparse, is_big_mat):
+        """seeks over the column records of a matrix, so they're not read"""
+        nheader = 2 if is_big_mat else 1
+        while 1:
+            (icol, irow, nwords) = self.read_start_marker(op4)[1:]
+            if icol == ncols + 1:
+                break
+            if nwords == -1:
+                break
 
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols),
-                       dtype=dtype)
+            record_length = 4 * nwords
+            if is_sparse and nwords == nheader:
+                # a lone string header may be an empty (L=-1) column
+                words = frombuffer(op4.read(record_length), dtype=self._endian + 'i4')
+                self.n += record_length
+                if self._get_sparse_strings(words, is_big_mat) is None:
+                    break
+                continue
+            self.n += record_length
+            op4.seek(self.n)
         op4.read(4)
         self.n += 4
 
-        return A
-
     def _show(self, op4, n, types='ifs', endian=None):
         """
         Shows binary data
@@ -975,245 +1004,6 @@ class OP4(object):
         f.seek(self.n)
         return self._write_data(f, data, types=types)
 
-    def _read_complex_dense_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
-        """reads a dense complex binary matrix"""
-        if self.debug:
-            print('_read_complex_dense_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-
-        A = zeros((nrows, ncols), dtype=dtype)
-        record_length = 0
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_dense(op4)
-            if self.debug:
-                print("N=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                print("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                if self.debug:
-                    print('breaking...icol=%s ncols+1=%s' % (
-                        icol, ncols + 1))
-                break
-
-            if L == -1:
-                if self.debug:
-                    print('breaking...nwords (L) = %s' % nwords)
-                break
-
-            if self.debug:
-                print("  n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -=4
-                #f.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                print("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            #nread = nwords // 4
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    print("inner while...")
-                    print("nwords  = %s" % nwords)
-                    print("nvalues = %s" % nvalues)
-                    print("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have more 2x values for complex numbers
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    print("str_values = %s" % str_values)
-                    print("nvalues*nbytes_per_value=%s len(data)=%s" %
-                          (nvalues * nbytes_per_value, len(data)))
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print self.print_block(data)
-                if self.debug:
-                    print("value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        if self.debug:
-                            print("A[%s,%s] = %s" % (irow, icol, complex(real_value, value)))
-                        A[irow, icol] = complex(real_value, value)
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                if self.debug:
-                    print("record_length=%s nbytes_per_value=%s" % (
-                        record_length, nbytes_per_value))
-                    print(print_matrix(A))
-                    print("********", data)
-
-        op4.read(4)
-        self.n += 4
-        return A
-
-    def _read_complex_binary(self, op4, nrows, ncols, matrix_type, is_sparse, is_big_mat):
-        """reads a complex binary matrix"""
-        if is_sparse:
-            A = self._read_complex_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        else:
-            A = self._read_complex_dense_binary(op4, nrows, ncols, matrix_type, is_big_mat)
-        return A
-
-    def _read_complex_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
-        """reads a sparse complex binary matrix"""
-        if self.debug:
-            print('_read_complex_sparse_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
-        record_length = 0
-        data = ''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length == 0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            if self.debug:
-                print("n=%s icol=%s irow=%s nwords=%s" % (self.n, icol, irow,
-                                                          nwords))
-                print("-----------")
-
-            L = nwords
-
-            if icol == ncols + 1:
-                break
-
-            if is_big_mat:
-                (irow, L) = self._get_irow_big_binary(op4, data[:8])
-                data = data[8:]
-            else:
-                (irow, L) = self._get_irow_small_binary(op4, data[:4])
-                data = data[4:]
-
-            if L == -1:
-                if self.debug:
-                    print('breaking on L=-1')
-                break
-
-            if self.debug:
-                print("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qf')
-                print('\n\n')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                print("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    print("inner while...")
-                    print("nwords  = %s" % nwords)
-                    print("nvalues = %s" % nvalues)
-                    print("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have 2x values for complex
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    print("  str_values = %s" % str_values)
-                    print("  nvalues*nbytes_per_value=%s len(data)=%s" %
-                          (nvalues * nbytes_per_value, len(data)))
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print(self.print_block(data))
-                if self.debug:
-                    print("  value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-
-                cols += [icol] * nvalues
-                rows += [i + irow for i in range(nvalues)]
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        if self.debug:
-                            print("  A[%s,%s] = %s" % (
-                                irow, icol, complex(real_value, value)))
-                        #A[irow, icol] = complex(real_value, value)
-                        entries.append(complex(real_value, value))
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                #print("record_length=%s nbytes_per_value=%s" % (record_length, nbytes_per_value))
-                #print(print_matrix(A))
-                #print("********", data)
-
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        op4.read(4)
-        self.n += 4
-        return A
-
-    def get_markers_sparse(self, op4, is_big_mat):
-        if is_big_mat:
-            (a, icol, irow, nwords) = self.read_start_marker(op4)
-            #irow = self._get_irow_big(op4)
-            nwords -= 2
-            #if nwords > 1:
-               #nwords -= 2
-            #else:
-               #print("nwords0 = %s" % nwords)
-               #nwords = 0
-        else:
-            a, icol, irow, nwords = self.read_start_marker(op4)
-            if irow != 0:
-                assert nwords == 1, 'nwords=%s' % nwords
-
-            #irow = self._get_irow_small(f)
-            nwords -= 1
-        return icol, irow, nwords
-
     def get_markers_dense(self, op4):
         a, icol, irow, nwords = self.read_start_marker(op4)
         if self.debug:
@@ -1286,13 +1076,13 @@ class OP4(object):
             if not form in (1, 2, 3, 6, 8, 9):
                 raise ValueError('form=%r and must be in [1, 2, 3, 6, 8, 9]' % form)
 
-            if isinstance(matrix, coo_matrix):
+            if issparse(matrix):
                 #write_DMIG(f, name, matrix, form, precision='default')
                 if is_binary:
                     raise NotImplementedError('sparse binary op4 writing not implemented')
                 else:
                     _write_sparse_matrix_ascii(
-                        op4, name, matrix, form=form,
+                        op4, name, matrix.tocoo(), form=form,
                         precision=precision, is_big_mat=is_big_mat)
             elif isinstance(matrix, ndarray):
                 if is_binary:
@@ -1303,7 +1093,7 @@ class OP4(object):
                         op4, name, matrix, form=form, precision=precision)
             else:
                 msg = ('Matrix type=%r is not supported.  '
-                       'types=[coo_matrix, ndarray]' % type(matrix))
+                       'types=[scipy.sparse matrix, ndarray]' % type(matrix))
                 raise NotImplementedError(msg)
 
 
@@ -1614,6 +1404,48 @@ def _write_sparse_matrix_ascii(op4, name, A, form=2, is_big_mat=False,
     op4.write('%8i%8i%8i\n' % (ncols + 1, 1, 1))
     op4.write(' 1.0000000000000000E+00\n')
 
+def _build_csc_matrix(nrows, ncols, icols, indices, data, dtype):
+    """
+    Builds a csc_matrix from the columns of a sparse matrix
+
+    Parameters
+    ----------
+    nrows / ncols : int
+        the shape of the matrix
+    icols : List[int]
+        the 0-based column of each block of rows/values
+    indices : List[(n, ) int ndarray]
+        the 0-based rows of each column
+    data : List[(n, ) ndarray]
+        the values of each column
+    dtype : str
+        the dtype of the matrix
+
+    Returns
+    -------
+    A : csc_matrix
+        the matrix
+    """
+    if len(icols) == 0:
+        return csc_matrix((nrows, ncols), dtype=dtype)
+
+    icols = array(icols)
+    if (diff(icols) < 0).any():
+        # the columns aren't in order
+        isort = argsort(icols, kind='mergesort')
+        icols = icols[isort]
+        indices = [indices[i] for i in isort]
+        data = [data[i] for i in isort]
+
+    nvalues = zeros(ncols, dtype='int64')
+    add.at(nvalues, icols, [len(rows) for rows in indices])
+    indptr = zeros(ncols + 1, dtype='int64')
+    cumsum(nvalues, out=indptr[1:])
+    A = csc_matrix((concatenate(data).astype(dtype), concatenate(indices), indptr),
+                   shape=(nrows, ncols))
+    return A
+
+
 def _determine_endian(op4):
     # get the endian
     data = op4.read(4)
@@ -2,7 +2,8 @@ from __future__ import print_function
 from six import iteritems, PY2
 import os
 
-from numpy import ndarray, eye, array_equal, complex64, complex128, zeros
+from numpy import (ndarray, eye, array_equal, allclose, complex64, complex128, zeros,
+                   memmap, load)
 import unittest
 from pyNastran.op4.op4 import OP4
 
@@ -74,6 +75,56 @@ class TestOP4(unittest.TestCase):
                     pass
                     #print(matrix)
 
+    def test_op4_binary_vs_ascii(self):
+        """the binary matrices are the same as the ascii matrices"""
+        for fname in ['mat_b_dn.op4',
+                      'mat_b_s1.op4',
+                      'mat_b_s2.op4',
+                      ]:
+            op4 = OP4()
+            matrices = op4.read_op4(os.path.join(op4Path, fname))
+            matrices_ascii = op4.read_op4(os.path.join(op4Path, fname.replace('_b_', '_t_')))
+            self.assertEqual(sorted(matrices), sorted(matrices_ascii))
+            for name, (form, A) in sorted(iteritems(matrices)):
+                (form_ascii, A_ascii) = matrices_ascii[name]
+                self.assertEqual(form, form_ascii)
+                if isinstance(A, ndarray):
+                    self.assertIsInstance(A_ascii, ndarray)
+                else:
+                    self.assertEqual(A.format, 'csc')
+                    A = A.toarray()
+                    A_ascii = A_ascii.toarray()
+                self.assertEqual(A.dtype, A_ascii.dtype)
+                self.assertTrue(allclose(A, A_ascii, rtol=1e-6), 'name=%s' % name)
+
+    def test_op4_binary_matrix_names(self):
+        """the other matrices are skipped"""
+        for fname in ['mat_b_dn.op4',
+                      'mat_b_s1.op4',
+                      'mat_b_s2.op4',
+                      ]:
+            op4 = OP4()
+            op4_filename = os.path.join(op4Path, fname)
+            matrices = op4.read_op4(op4_filename, matrix_names=['EYE5CD', 'LOW'])
+            self.assertEqual(sorted(matrices), ['EYE5CD', 'LOW'])
+            (form, A) = matrices['EYE5CD']
+            self.assertEqual(form, 6)
+            if 's' in fname:
+                A = A.toarray()
+            self.assertTrue(array_equal(A, -eye(5) + 1j*eye(5)))
+
+            matrices = op4.read_op4(op4_filename, matrix_names='STRINGS',
+                                    memmap_dirname=op4Path)
+            A = matrices['STRINGS'][1]
+            if 's' in fname:
+                self.assertEqual(A.shape, (30, 20))
+            else:
+                npy_filename = os.path.join(op4Path, 'STRINGS.npy')
+                self.assertIsInstance(A, memmap)
+                self.assertTrue(array_equal(A, load(npy_filename)))
+                del A, matrices
+                os.remove(npy_filename)
+
     def test_op4_ascii(self):
         for fname in ['mat_t_dn.op4',
                       'mat_t_s1.op4',
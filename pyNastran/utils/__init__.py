@@ -2,6 +2,7 @@
 from six import PY2, string_types
 from types import MethodType
 import os
+import sys
 from numpy import ndarray, array, loadtxt, int32, int64
 import io
 
@@ -130,6 +131,28 @@ def _filename(filename):
         return "\\\\?\\" + filename
     return filename
 
+def get_pool_context():
+    """
+    Gets the multiprocessing context that makes the process pools.
+    The fork context is used if it's supported, so the workers start
+    from the state of the parent.
+
+    Returns
+    -------
+    context : multiprocessing context or module
+        has a ``Pool(processes, initializer, initargs)`` method
+    is_fork : bool
+        do the workers inherit the state of the parent
+    """
+    import multiprocessing
+    if not hasattr(multiprocessing, 'get_context'):
+        # python 2 doesn't have contexts; the Pool forks except on Windows
+        return multiprocessing, sys.platform != 'win32'
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork'), True
+    return multiprocessing.get_context(), False
+
+
 def __object_attr(obj, mode, keys_to_skip, attr_type):
     """list object attributes of a given type"""
     #print('keys_to_skip=%s' % keys_to_skip)
@@ -2,6 +2,7 @@ def loadtxt_nice(filename:str, delimiter=',':str, skiprows=1:int, dtype=None) ->
 def is_binary_file(filename:str) -> bool:
 def print_bad_path(path:str)-> str:
 def _filename(filename:str) -> str:
+def get_pool_context() -> Tuple[Any, bool]:
 def __object_attr(obj, mode:str, keys_to_skip:List[str], attr_type:str) -> str:
 def object_methods(obj, mode="public":str, keys_to_skip=None:List[str]) -> str:
 def object_attributes(obj, mode="public":str, keys_to_skip=None:List[str]) -> str:
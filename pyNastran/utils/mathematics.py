@@ -9,9 +9,8 @@ from numpy import (float32, float64, complex64, complex128, array, cross,
                    allclose, zeros, matrix, insert, diag, eye, argmax, argmin, arange)
 from numpy.linalg import norm
 
-from scipy.linalg import solve_banded
-from scipy.interpolate import splrep, splev
-from scipy.integrate import quad
+# scipy is imported by the functions that use it, so importing the
+# cards (e.g., shell.py) doesn't import scipy
 
 
 # should future proof this as it handles 1.9.0.dev-d1dbf8e, 1.10.2, and 1.6.2
@@ -119,6 +118,8 @@ def integrate_line(x, y):
 
     :returns integrated_value: the area under the curve
     """
+    from scipy.interpolate import splev
+    from scipy.integrate import quad
     if len(set(y)) == 1:
         return y[0]  # (x1-x0 = 1., so yBar*1 = yBar)
     try:
@@ -147,6 +148,7 @@ def build_spline(x, y):
 
     .. note:: a 1st order spline is the same as linear interpolation
     """
+    from scipy.interpolate import splrep
     # build a linearly interpolated representation or cubic one
     return splrep(x, y, k=1) if len(x) < 3 else splrep(x, y)
 
@@ -164,6 +166,8 @@ def integrate_positive_line(x, y, minValue=0.):
 
     :returns integrated_value: the area under the curve
     """
+    from scipy.interpolate import splev
+    from scipy.integrate import quad
     if len(set(y)) == 1:
         return y[0]  # (x1-x0 = 1., so yBar*1 = yBar)
     try:
@@ -308,6 +312,7 @@ def solve_tridag(A, D):
     :param D: off diagonal (length=N-1)
     :returns: x
     """
+    from scipy.linalg import solve_banded
     # Find the diagonals
     ud = insert(diag(A, 1), 0, 0)  # upper diagonal
     d = diag(A)  # main diagonal
@@ -6,7 +6,8 @@ import unittest
 from numpy import matrix, array
 
 import pyNastran
-from pyNastran.utils import is_binary_file, object_methods, object_attributes
+from pyNastran.utils import (
+    is_binary_file, object_methods, object_attributes, get_pool_context)
 from pyNastran.utils.dev import list_print
 
 pkg_path = pyNastran.__path__[0]
@@ -119,5 +120,25 @@ class TestUtils(unittest.TestCase):
                 expected.append('__dir__')
             self.assertEqual(sorted(attributes), sorted(expected))
 
+    def test_get_pool_context(self):
+        """the process pools are made without contexts in python 2"""
+        import types
+        context, is_fork = get_pool_context()
+        self.assertTrue(hasattr(context, 'Pool'))
+        if is_fork:
+            self.assertEqual(context.get_start_method(), 'fork')
+
+        # python 2 multiprocessing, which has Pool, but no get_context
+        multiprocessing2 = types.ModuleType('multiprocessing')
+        multiprocessing2.Pool = object
+        multiprocessing = sys.modules['multiprocessing']
+        sys.modules['multiprocessing'] = multiprocessing2
+        try:
+            context, is_fork = get_pool_context()
+        finally:
+            sys.modules['multiprocessing'] = multiprocessing
+        self.assertIs(context, multiprocessing2)
+        self.assertEqual(is_fork, sys.platform != 'win32')
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file